@@ -0,0 +1,41 @@
+-- Create machine downtime tables for planned maintenance and other
+-- unavailability. Read by DatabaseLoader._load_machine_downtime() and
+-- OptimizedDatabaseLoader._load_machine_downtime() from
+-- {table_prefix}machine_downtime; the solver blocks each window on its machine.
+
+-- Test tables (use_test_tables=True)
+CREATE TABLE IF NOT EXISTS test_machine_downtime (
+    downtime_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    resource_id UUID NOT NULL REFERENCES test_resources(resource_id) ON DELETE CASCADE,
+    start_time TIMESTAMPTZ NOT NULL,
+    end_time TIMESTAMPTZ NOT NULL,
+    reason TEXT,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+
+    CONSTRAINT valid_downtime_range CHECK (end_time > start_time)
+);
+
+CREATE INDEX IF NOT EXISTS idx_test_machine_downtime_resource_id
+    ON test_machine_downtime(resource_id);
+
+-- Production table
+CREATE TABLE IF NOT EXISTS machine_downtime (
+    downtime_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    resource_id UUID NOT NULL REFERENCES machines(machine_resource_id) ON DELETE CASCADE,
+    start_time TIMESTAMPTZ NOT NULL,
+    end_time TIMESTAMPTZ NOT NULL,
+    reason TEXT,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+
+    CONSTRAINT valid_downtime_range CHECK (end_time > start_time)
+);
+
+CREATE INDEX IF NOT EXISTS idx_machine_downtime_resource_id
+    ON machine_downtime(resource_id);
+
+-- Add comments for documentation
+COMMENT ON TABLE machine_downtime IS 'Planned machine unavailability; the solver schedules no task on the machine inside a window';
+COMMENT ON COLUMN machine_downtime.resource_id IS 'Machine that is down';
+COMMENT ON COLUMN machine_downtime.start_time IS 'Start of the downtime window';
+COMMENT ON COLUMN machine_downtime.end_time IS 'End of the downtime window (exclusive)';
+COMMENT ON COLUMN machine_downtime.reason IS 'Optional: reason for the downtime, e.g. maintenance';
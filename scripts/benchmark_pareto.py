@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Benchmark sequential vs parallel Pareto frontier exploration.
+
+Explores a 10-point makespan/cost frontier with FreshSolver.solve_pareto_optimal(),
+once with a single worker process (points solved one after another) and once
+with one worker per core. Both runs share the same prebuilt base model, so the
+difference is the concurrency of the frontier solves.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from scripts.benchmark import BenchmarkDataGenerator
+from src.solver.core.solver import FreshSolver
+from src.solver.core.solver_config import SolverConfig
+from src.solver.models.problem import (
+    MultiObjectiveConfiguration,
+    ObjectiveType,
+    ObjectiveWeight,
+    OptimizationStrategy,
+)
+
+FRONTIER_POINTS = 10
+
+
+def run_frontier(
+    num_jobs: int, tasks_per_job: int, time_limit: int, max_workers: int
+) -> dict:
+    """Explore the frontier once and collect timing and frontier size."""
+    problem = BenchmarkDataGenerator.generate_problem(num_jobs, tasks_per_job, 5)
+    # Lateness is not part of this frontier; without due dates the model does
+    # not depend on the wall clock
+    for job in problem.jobs:
+        job.due_date = None
+
+    problem.multi_objective_config = MultiObjectiveConfiguration(
+        strategy=OptimizationStrategy.PARETO_OPTIMAL,
+        objectives=[
+            ObjectiveWeight(objective_type=ObjectiveType.MINIMIZE_MAKESPAN, weight=1.0),
+            ObjectiveWeight(
+                objective_type=ObjectiveType.MINIMIZE_TOTAL_COST, weight=1.0
+            ),
+        ],
+        pareto_iterations=FRONTIER_POINTS,
+    )
+
+    start = time.time()
+    solver = FreshSolver(
+        problem, solver_config=SolverConfig(parameters={"log_search_progress": False})
+    )
+    result = solver.solve_pareto_optimal(
+        time_limit_per_solve=time_limit, max_workers=max_workers
+    )
+    wall_time = time.time() - start
+
+    frontier = result.get("pareto_frontier", {})
+    return {
+        "workers": max_workers,
+        "wall_time": round(wall_time, 2),
+        "solutions": frontier.get("solution_count", 0),
+        "best_makespan": min(
+            (s["objectives"]["makespan"] for s in frontier.get("solutions", [])),
+            default=None,
+        ),
+        "best_cost": min(
+            (s["objectives"]["total_cost"] for s in frontier.get("solutions", [])),
+            default=None,
+        ),
+    }
+
+
+def print_results(results: list[dict]) -> None:
+    """Print a comparison table."""
+    print("\n" + "=" * 72)
+    print("PARETO FRONTIER BENCHMARK RESULTS")
+    print("=" * 72)
+    print(
+        f"{'Workers':<8} {'Wall(s)':<9} {'Speedup':<8} {'Solutions':<10} "
+        f"{'Best makespan':<14} {'Best cost':<10}"
+    )
+    print("-" * 72)
+
+    baseline = results[0]["wall_time"]
+    for r in results:
+        speedup = baseline / r["wall_time"] if r["wall_time"] else 0.0
+        print(
+            f"{r['workers']:<8} {r['wall_time']:<9} {speedup:<8.2f} "
+            f"{r['solutions']:<10} {str(r['best_makespan']):<14} "
+            f"{str(r['best_cost']):<10}"
+        )
+
+
+def main():
+    """Run the frontier with one worker and with one worker per core."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--time-limit", type=int, default=10, help="Seconds per frontier point"
+    )
+    parser.add_argument("--jobs", type=int, default=10, help="Number of jobs")
+    parser.add_argument("--tasks", type=int, default=10, help="Tasks per job")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for the parallel run",
+    )
+    args = parser.parse_args()
+
+    print("OR-Tools Scheduling Solver - Pareto Frontier Benchmark")
+    print("=" * 50)
+    print(f"Cores available: {os.cpu_count()}")
+
+    results = []
+    for workers in sorted({1, args.workers}):
+        print(
+            f"\nExploring {FRONTIER_POINTS}-point frontier with {workers} worker(s)..."
+        )
+        results.append(run_frontier(args.jobs, args.tasks, args.time_limit, workers))
+
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
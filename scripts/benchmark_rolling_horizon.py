@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Benchmark rolling-horizon decomposition against the monolithic solve.
+
+Solves template_generator problems with 50, 200 and 500 job instances once as a
+single model (FreshSolver.solve()) and once window by window
+(FreshSolver.solve_rolling_horizon()), comparing wall time, makespan, total
+lateness and model size.
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import UTC, datetime
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.solver.core.rolling_horizon import RollingHorizonConfig
+from src.solver.core.solver import FreshSolver
+from src.solver.core.solver_config import SolverConfig
+from src.solver.models.template_generator import (
+    create_manufacturing_job_optimized_pattern,
+    create_optimized_mode_problem,
+)
+
+# Due dates are converted against this fixed epoch inside the solver, so the
+# benchmark anchors them there to keep lateness terms inside the horizon
+SOLVER_REFERENCE_TIME = datetime(2024, 1, 1, tzinfo=UTC)
+
+PROBLEM_SIZES = {"Medium": 50, "Large": 200, "XLarge": 500}
+
+
+def run_solve(
+    num_instances: int, time_limit: int, config: RollingHorizonConfig | None
+) -> dict:
+    """Solve one problem monolithically (config=None) or by rolling horizon."""
+    problem = create_optimized_mode_problem(
+        create_manufacturing_job_optimized_pattern(),
+        num_instances,
+        reference_time=SOLVER_REFERENCE_TIME,
+    )
+    solver = FreshSolver(
+        problem, solver_config=SolverConfig(parameters={"log_search_progress": False})
+    )
+
+    start = time.time()
+    if config is None:
+        solution = solver.solve(time_limit=time_limit)
+        windows = 1
+        variables = len(solver.model.Proto().variables)
+    else:
+        solution = solver.solve_rolling_horizon(config)
+        windows = len(solution["rolling_horizon"]["windows"])
+        variables = None
+    wall_time = time.time() - start
+
+    return {
+        "status": solution.get("status", "UNKNOWN"),
+        "wall_time": round(wall_time, 2),
+        "windows": windows,
+        "variables": variables,
+        "makespan": solution.get("makespan"),
+        "total_lateness": solution.get("total_lateness_minutes"),
+    }
+
+
+def print_results(results: list[dict]) -> None:
+    """Print a comparison table."""
+    print("\n" + "=" * 86)
+    print("ROLLING HORIZON BENCHMARK RESULTS")
+    print("=" * 86)
+    print(
+        f"{'Problem':<8} {'Mode':<9} {'Status':<10} {'Wall(s)':<8} {'Windows':<8} "
+        f"{'Variables':<10} {'Makespan':<9} {'Lateness(min)':<13}"
+    )
+    print("-" * 86)
+
+    for r in results:
+        print(
+            f"{r['name']:<8} {r['mode']:<9} {r['status']:<10} {r['wall_time']:<8} "
+            f"{r['windows']:<8} {str(r['variables'] or '-'):<10} "
+            f"{str(r['makespan']):<9} {str(r['total_lateness']):<13}"
+        )
+
+
+def main():
+    """Run monolithic and rolling-horizon solves for each problem size."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--time-limit",
+        type=int,
+        default=120,
+        help="Seconds for the monolithic solve",
+    )
+    parser.add_argument(
+        "--window-size", type=int, default=20, help="Instances per window"
+    )
+    parser.add_argument(
+        "--overlap", type=int, default=5, help="Instances re-solved per window"
+    )
+    parser.add_argument(
+        "--window-time-limit", type=int, default=10, help="Seconds per window"
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        choices=list(PROBLEM_SIZES),
+        default=list(PROBLEM_SIZES),
+        help="Problem sizes to run",
+    )
+    args = parser.parse_args()
+
+    config = RollingHorizonConfig(
+        window_size=args.window_size,
+        overlap=args.overlap,
+        time_limit_per_window=args.window_time_limit,
+    )
+
+    print("OR-Tools Scheduling Solver - Rolling Horizon Benchmark")
+    print("=" * 50)
+
+    results = []
+    for name in args.sizes:
+        for mode, mode_config in (("monolith", None), ("rolling", config)):
+            print(f"\nRunning {name} ({PROBLEM_SIZES[name]} instances), {mode}...")
+            result = run_solve(PROBLEM_SIZES[name], args.time_limit, mode_config)
+            result.update({"name": name, "mode": mode})
+            results.append(result)
+
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,7 @@ from fastapi.responses import JSONResponse
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.api.rest.job_manager import get_job_manager
 from src.api.rest.solver_endpoints import router as solver_router
 from src.api.security import SecurityMiddleware
 from src.api.security.config import get_security_config, get_security_config_manager
@@ -67,6 +68,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down Fresh OR-Tools Solver API...")
+    get_job_manager().shutdown()
     performance_monitor.stop_monitoring()
     logger.info("API shutdown complete")
 
@@ -159,6 +161,8 @@ async def root():
             "health": "/api/v1/health",
             "patterns": "/api/v1/patterns",
             "solve": "/api/v1/solve",
+            "status": "/api/v1/status/{job_id}",
+            "cancel": "/api/v1/cancel/{job_id}",
             "validate": "/api/v1/validate",
             "security": "/api/v1/security",
             "docs": "/docs",
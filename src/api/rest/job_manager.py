@@ -0,0 +1,482 @@
+"""Process-pool backed job manager for asynchronous solves.
+
+CP-SAT solves run for up to the full time limit, so the REST API hands them to
+a SolveJobManager instead of solving inside the request handler. Each job is
+executed in a worker process; ``/solve`` returns the job ID immediately and
+``/status/{job_id}`` reads the queue position, the latest incumbent reported by
+the worker and, once finished, the result.
+
+Workers report progress and receive cancellation through a multiprocessing
+manager: the progress dict holds the latest incumbent per job and a per-job
+event stops the CP-SAT search in the worker. Finished jobs are kept for
+``result_ttl_seconds`` and then evicted.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.solver.core.streaming import IncumbentEvent
+
+logger = logging.getLogger(__name__)
+
+# Seconds between cancellation checks in the worker process
+CANCEL_POLL_INTERVAL = 0.2
+
+# Type aliases following TEMPLATES.md centralized patterns
+JobResult = dict[str, Any]
+JobProgress = dict[str, Any]
+SolveWorker = Callable[..., JobResult]
+
+
+class JobStatus(StrEnum):
+    """Lifecycle states of a solve job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+FINISHED_STATUSES = frozenset(
+    {JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED}
+)
+
+
+@dataclass
+class SolveJob:
+    """Bookkeeping for one submitted solve."""
+
+    job_id: str
+    pattern_id: str
+    instance_count: int
+    time_limit_seconds: int
+    future: Future
+    cancel_event: Any  # multiprocessing manager Event proxy
+    status: JobStatus = JobStatus.QUEUED
+    submitted_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    result: JobResult | None = None
+    error: str | None = None
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the job reached a terminal state."""
+        return self.status in FINISHED_STATUSES
+
+
+def solve_with_progress(
+    job_id: str,
+    problem: Any,
+    time_limit: int,
+    cancel_event: Any,
+    progress: Any,
+) -> JobResult:
+    """Solve a problem in the current process, publishing every incumbent.
+
+    The problem is solved with FreshSolver.solve(), the same (hierarchical for
+    optimized-mode problems) objective as a synchronous solve; the incumbents
+    of each phase only feed the progress dict.
+
+    Args:
+        job_id: Job identifier (key into ``progress``)
+        problem: SchedulingProblem to solve
+        time_limit: Maximum solving time in seconds
+        cancel_event: Event that stops the search when set
+        progress: Shared dict receiving the latest incumbent of the job
+
+    Returns:
+        Result dict with the final status, the solution and model statistics
+
+    """
+    from src.solver.core.solver import FreshSolver
+
+    solver = FreshSolver(problem)
+    started = time.time()
+    finished = threading.Event()
+    incumbents = 0
+
+    def publish(event: "IncumbentEvent") -> None:
+        nonlocal incumbents
+        incumbents += 1
+        progress[job_id] = {
+            **progress.get(job_id, {}),
+            "phase": event.phase,
+            "incumbents": incumbents,
+            "objective_value": event.objective_value,
+            "best_bound": event.best_bound,
+            "gap": event.gap,
+            "elapsed_seconds": time.time() - started,
+        }
+
+    def watch_cancellation() -> None:
+        while not cancel_event.wait(CANCEL_POLL_INTERVAL):
+            if finished.is_set():
+                return
+        logger.info(f"Job {job_id}: cancellation requested")
+        # Repeat until the solve returns: a cancel that arrives while the
+        # model is still being built, or between phases, has no CP-SAT search
+        # to stop yet
+        while not finished.wait(CANCEL_POLL_INTERVAL):
+            solver.stop_search()
+
+    watcher = threading.Thread(
+        target=watch_cancellation, name=f"cancel-{job_id}", daemon=True
+    )
+    watcher.start()
+
+    solver.incumbent_listener = publish
+    try:
+        solution = solver.solve(time_limit)
+    finally:
+        finished.set()
+        watcher.join()
+
+    status = solution.get("status", "UNKNOWN")
+    has_solution = status in ("OPTIMAL", "FEASIBLE") and solver.solver is not None
+    return {
+        "status": status,
+        "cancelled": cancel_event.is_set(),
+        # Objective of the last solve phase (cost for hierarchical solves)
+        "objective_value": solver.solver.ObjectiveValue() if has_solution else 0.0,
+        "solution": solution,
+        "solve_time": time.time() - started,
+        "variables": len(solver.model.Proto().variables),
+        "constraints": len(solver.model.Proto().constraints),
+    }
+
+
+def run_solve_job(
+    job_id: str,
+    pattern_id: str,
+    max_instances: int,
+    time_limit: int,
+    cancel_event: Any,
+    progress: Any,
+) -> JobResult:
+    """Worker entry point: load the problem from the database and solve it.
+
+    Args:
+        job_id: Job identifier
+        pattern_id: Optimized pattern to load
+        max_instances: Maximum number of instances to load
+        time_limit: Maximum solving time in seconds
+        cancel_event: Event that stops the search when set
+        progress: Shared dict receiving the latest incumbent of the job
+
+    Returns:
+        Result dict (see solve_with_progress)
+
+    """
+    from src.data.loaders.optimized_database import OptimizedDatabaseLoader
+
+    progress[job_id] = {
+        "state": JobStatus.RUNNING.value,
+        "started_at": datetime.now(UTC).isoformat(),
+        "time_limit_seconds": time_limit,
+    }
+    if cancel_event.is_set():
+        return {"status": "UNKNOWN", "cancelled": True, "solution": {}}
+
+    loader = OptimizedDatabaseLoader(use_test_tables=True)
+    problem = loader.load_optimized_problem(
+        pattern_id=pattern_id, max_instances=max_instances
+    )
+    return solve_with_progress(job_id, problem, time_limit, cancel_event, progress)
+
+
+class SolveJobManager:
+    """Queue of solve jobs executed by a pool of worker processes.
+
+    At most ``max_concurrent_jobs`` solves run at once; further jobs wait in
+    submission order. Finished jobs are evicted ``result_ttl_seconds`` after
+    they finish.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_jobs: int = 2,
+        result_ttl_seconds: float = 3600.0,
+        worker: SolveWorker = run_solve_job,
+    ):
+        """Initialize the job manager.
+
+        Args:
+            max_concurrent_jobs: Number of worker processes
+            result_ttl_seconds: How long finished jobs are retained
+            worker: Picklable function executed in the worker processes with
+                (job_id, pattern_id, max_instances, time_limit, cancel_event,
+                progress)
+
+        """
+        if max_concurrent_jobs <= 0:
+            raise ValueError(
+                f"max_concurrent_jobs must be positive: {max_concurrent_jobs}"
+            )
+
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.result_ttl_seconds = result_ttl_seconds
+        self.worker = worker
+
+        self._jobs: dict[str, SolveJob] = {}
+        # Re-entrant: Future.cancel() runs the done callback synchronously
+        self._lock = threading.RLock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._manager: Any = None
+        self._progress: Any = None
+
+    def _ensure_started(self) -> None:
+        """Start the worker pool and the progress manager on first use."""
+        if self._executor is not None:
+            return
+        # OR-Tools is not fork-safe once its threads are running
+        context = multiprocessing.get_context("spawn")
+        self._manager = context.Manager()
+        self._progress = self._manager.dict()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_concurrent_jobs, mp_context=context
+        )
+        logger.info(f"Started solve job pool with {self.max_concurrent_jobs} worker(s)")
+
+    def submit(self, pattern_id: str, instance_count: int, time_limit: int) -> str:
+        """Queue a solve and return its job ID.
+
+        Args:
+            pattern_id: Optimized pattern to solve
+            instance_count: Number of instances to load
+            time_limit: Maximum solving time in seconds
+
+        Returns:
+            Job identifier
+
+        """
+        with self._lock:
+            self._ensure_started()
+            self._evict_expired()
+
+            job_id = uuid.uuid4().hex
+            cancel_event = self._manager.Event()
+            future = self._executor.submit(
+                self.worker,
+                job_id,
+                pattern_id,
+                instance_count,
+                time_limit,
+                cancel_event,
+                self._progress,
+            )
+            job = SolveJob(
+                job_id=job_id,
+                pattern_id=pattern_id,
+                instance_count=instance_count,
+                time_limit_seconds=time_limit,
+                future=future,
+                cancel_event=cancel_event,
+            )
+            self._jobs[job_id] = job
+
+        future.add_done_callback(lambda f: self._on_job_done(job_id, f))
+        logger.info(
+            f"Queued solve job {job_id} ({pattern_id}, {instance_count} instances)"
+        )
+        return job_id
+
+    def get_status(self, job_id: str) -> dict[str, Any] | None:
+        """Describe a job: state, queue position, progress and result.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Status dictionary, or None for unknown or evicted jobs
+
+        """
+        with self._lock:
+            self._evict_expired()
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+
+            # Queue positions depend on which of the other jobs have started
+            self._refresh_states()
+            progress = self._read_progress(job)
+            return {
+                "job_id": job.job_id,
+                "status": job.status.value,
+                "pattern_id": job.pattern_id,
+                "instance_count": job.instance_count,
+                "queue_position": self._queue_position(job),
+                "progress": progress,
+                "submitted_at": job.submitted_at.isoformat(),
+                "started_at": job.started_at.isoformat() if job.started_at else None,
+                "finished_at": (
+                    job.finished_at.isoformat() if job.finished_at else None
+                ),
+                "result": job.result,
+                "error": job.error,
+            }
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued job or stop the search of a running one.
+
+        A running job keeps the best solution found before the search stopped.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            True if the job existed and was not finished yet
+
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.is_finished:
+                return False
+
+            # Queued jobs are dropped from the pool; a worker that already
+            # picked the job up stops its search when it sees the event
+            job.cancel_event.set()
+            self._read_progress(job)
+            if not job.future.cancel() and job.status is JobStatus.QUEUED:
+                # Already handed to a worker process, which returns as soon as
+                # it starts; report the cancellation now instead of keeping
+                # the job queued behind the running ones
+                job.status = JobStatus.CANCELLED
+                job.finished_at = datetime.now(UTC)
+
+        logger.info(f"Cancellation requested for solve job {job_id}")
+        return True
+
+    def get_stats(self) -> dict[str, Any]:
+        """Count jobs per state."""
+        with self._lock:
+            self._evict_expired()
+            self._refresh_states()
+            counts = {status.value: 0 for status in JobStatus}
+            for job in self._jobs.values():
+                counts[job.status.value] += 1
+            return {
+                "max_concurrent_jobs": self.max_concurrent_jobs,
+                "result_ttl_seconds": self.result_ttl_seconds,
+                "jobs": counts,
+            }
+
+    def shutdown(self, cancel_running: bool = True) -> None:
+        """Stop the worker pool.
+
+        Args:
+            cancel_running: Stop running searches instead of waiting for them
+
+        """
+        with self._lock:
+            if self._executor is None:
+                return
+            for job in self._jobs.values():
+                if not job.is_finished and cancel_running:
+                    job.cancel_event.set()
+            executor, manager = self._executor, self._manager
+            self._executor = None
+
+        executor.shutdown(wait=True, cancel_futures=cancel_running)
+        manager.shutdown()
+        logger.info("Solve job pool stopped")
+
+    def _on_job_done(self, job_id: str, future: Future) -> None:
+        """Record the outcome of a finished worker call."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.finished_at = job.finished_at or datetime.now(UTC)
+
+            if future.cancelled():
+                job.status = JobStatus.CANCELLED
+            elif (error := future.exception()) is not None:
+                job.status = JobStatus.FAILED
+                job.error = str(error)
+                logger.error(f"Solve job {job_id} failed: {error}")
+            else:
+                job.result = future.result()
+                job.status = (
+                    JobStatus.CANCELLED
+                    if job.result.get("cancelled")
+                    else JobStatus.COMPLETED
+                )
+                logger.info(f"Solve job {job_id} finished: {job.status.value}")
+
+            if self._progress is not None:
+                self._progress.pop(job_id, None)
+
+    def _read_progress(self, job: SolveJob) -> JobProgress:
+        """Fetch the worker-reported progress and note when the job started."""
+        if job.is_finished or self._progress is None:
+            return {}
+        progress = dict(self._progress.get(job.job_id, {}))
+        if progress.get("state") == JobStatus.RUNNING.value:
+            job.status = JobStatus.RUNNING
+            job.started_at = job.started_at or datetime.fromisoformat(
+                progress["started_at"]
+            )
+        return progress
+
+    def _refresh_states(self) -> None:
+        """Mark every job its worker has picked up as running."""
+        for job in self._jobs.values():
+            self._read_progress(job)
+
+    def _queue_position(self, job: SolveJob) -> int | None:
+        """1-based position among queued jobs, None once the job has started."""
+        if job.status is not JobStatus.QUEUED:
+            return None
+        queued = [j for j in self._jobs.values() if j.status is JobStatus.QUEUED]
+        queued.sort(key=lambda j: j.submitted_at)
+        return queued.index(job) + 1
+
+    def _evict_expired(self) -> None:
+        """Drop finished jobs older than the retention TTL."""
+        now = datetime.now(UTC)
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished_at is not None
+            and (now - job.finished_at).total_seconds() > self.result_ttl_seconds
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+        if expired:
+            logger.debug(f"Evicted {len(expired)} expired solve job(s)")
+
+
+# Global job manager instance
+_job_manager: SolveJobManager | None = None
+
+
+def get_job_manager() -> SolveJobManager:
+    """Get the global job manager, configured from the environment.
+
+    ``SOLVER_MAX_CONCURRENT_JOBS`` sets the number of worker processes and
+    ``SOLVER_JOB_RESULT_TTL_SECONDS`` how long finished jobs are retained.
+    """
+    global _job_manager
+    if _job_manager is None:
+        _job_manager = SolveJobManager(
+            max_concurrent_jobs=max(
+                1, int(os.getenv("SOLVER_MAX_CONCURRENT_JOBS", "2"))
+            ),
+            result_ttl_seconds=float(
+                os.getenv("SOLVER_JOB_RESULT_TTL_SECONDS", "3600")
+            ),
+        )
+    return _job_manager
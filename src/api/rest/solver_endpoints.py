@@ -4,16 +4,21 @@ Provides HTTP API for GUI integration with the constraint solver.
 Handles data transformation and validation for the 3-phase system.
 """
 
+import asyncio
+import json
 import logging
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from datetime import datetime
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from src.api.rest.job_manager import JobStatus, get_job_manager
 from src.data.loaders.optimized_database import OptimizedDatabaseLoader
-from src.solver.core.solver import main as solver_main
-from src.solver.models.problem import SchedulingProblem
+from src.solver.core.solver import FreshSolver
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +43,7 @@ class SolverJobRequest(BaseModel):
     pattern_id: str
     instances: list[JobInstanceRequest]
     constraints: ConstraintSettings | None = None
+    time_limit_seconds: int = Field(default=60, ge=1, le=3600)
 
 
 class TaskAssignment(BaseModel):
@@ -77,6 +83,28 @@ class SolverResponse(BaseModel):
     performance_metrics: PerformanceMetrics | None = None
 
 
+class SolveJobResponse(BaseModel):
+    success: bool
+    job_id: str | None = None
+    status: str | None = None
+    status_url: str | None = None
+    error: str | None = None
+
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    status: str
+    pattern_id: str
+    instance_count: int
+    queue_position: int | None = None
+    progress: dict[str, Any] = Field(default_factory=dict)
+    submitted_at: str
+    started_at: str | None = None
+    finished_at: str | None = None
+    result: SolverResponse | None = None
+    error: str | None = None
+
+
 class PatternInfo(BaseModel):
     pattern_id: str
     name: str
@@ -140,196 +168,171 @@ async def get_available_patterns():
         return PatternsResponse(success=False, patterns=[], error=str(e))
 
 
-@router.post("/solve", response_model=SolverResponse)
+@router.post("/solve", response_model=SolveJobResponse, status_code=202)
 async def solve_scheduling_problem(request: SolverJobRequest):
-    """Solve a scheduling problem using the constraint solver."""
-    try:
-        # Validate request
-        if not request.instances:
-            raise HTTPException(
-                status_code=400, detail="At least one job instance is required"
-            )
+    """Queue a scheduling problem for solving.
 
-        # Load problem from database
-        loader = OptimizedDatabaseLoader(use_test_tables=True)
-
-        # Create instances if they don't exist
-        existing_instances = []
-        for instance_req in request.instances:
-            try:
-                # Try to load existing instance
-                # In a real implementation, you'd check if the instance exists
-                existing_instances.append(instance_req.instance_id)
-            except:
-                # Create new instance if it doesn't exist
-                logger.info(
-                    f"Instance {instance_req.instance_id} not found, would create new one"
-                )
+    The solve runs in a worker process; poll ``/status/{job_id}`` for queue
+    position, progress and the result.
+    """
+    if not request.instances:
+        raise HTTPException(
+            status_code=400, detail="At least one job instance is required"
+        )
 
-        # Load the scheduling problem
-        problem = loader.load_optimized_problem(
-            pattern_id=request.pattern_id, max_instances=len(request.instances)
+    try:
+        job_id = await asyncio.to_thread(
+            get_job_manager().submit,
+            pattern_id=request.pattern_id,
+            instance_count=len(request.instances),
+            time_limit=request.time_limit_seconds,
+        )
+    except Exception as e:
+        logger.error(f"Failed to queue solve job: {e}")
+        return SolveJobResponse(success=False, error=str(e))
+
+    return SolveJobResponse(
+        success=True,
+        job_id=job_id,
+        status=JobStatus.QUEUED.value,
+        status_url=f"{router.prefix}/status/{job_id}",
+    )
+
+
+@router.post("/solve/stream")
+async def stream_scheduling_solution(
+    request: SolverJobRequest, include_schedule: bool = False
+):
+    """Solve a scheduling problem and stream improving incumbents.
+
+    Responds with server-sent events: one ``incumbent`` event per improving
+    solution (objective, bound, gap, wall time and optionally the schedule
+    delta) followed by a ``complete`` event carrying the final solution.
+    Disconnecting stops the CP-SAT search.
+    """
+    if not request.instances:
+        raise HTTPException(
+            status_code=400, detail="At least one job instance is required"
         )
 
-        # Apply constraint settings if provided
-        constraint_settings = request.constraints or ConstraintSettings()
-
-        # Solve the problem
-        solution_data = solve_problem_with_constraints(problem, constraint_settings)
-
-        if solution_data["success"]:
-            # Transform solution to API format
-            assignments = []
-            resource_util = []
-
-            # Extract task assignments from solution
-            for task_id, assignment in solution_data.get("assignments", {}).items():
-                assignments.append(
-                    TaskAssignment(
-                        instance_id=assignment.get("instance_id", ""),
-                        task_id=task_id,
-                        machine_id=assignment.get("machine_id", ""),
-                        start_time=assignment.get("start_time", 0),
-                        end_time=assignment.get("end_time", 0),
-                        mode_id=assignment.get("mode_id", ""),
-                    )
-                )
+    loader = OptimizedDatabaseLoader(use_test_tables=True)
+    problem = await asyncio.to_thread(
+        loader.load_optimized_problem,
+        pattern_id=request.pattern_id,
+        max_instances=len(request.instances),
+    )
+    solver = FreshSolver(problem)
 
-            # Calculate resource utilization
-            machine_usage = {}
-            for assignment in assignments:
-                machine_id = assignment.machine_id
-                duration = assignment.end_time - assignment.start_time
-                if machine_id not in machine_usage:
-                    machine_usage[machine_id] = 0
-                machine_usage[machine_id] += duration
-
-            total_time = max([a.end_time for a in assignments]) if assignments else 1
-            for machine_id, usage in machine_usage.items():
-                resource_util.append(
-                    ResourceUtilization(
-                        machine_id=machine_id,
-                        utilization_percent=min(100.0, (usage / total_time) * 100),
-                        total_runtime_minutes=usage,
-                    )
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            async with aclosing(
+                solver.astream_incumbents(
+                    request.time_limit_seconds, include_schedule=include_schedule
                 )
+            ) as incumbents:
+                async for event in incumbents:
+                    event_name = "complete" if event.is_final else "incumbent"
+                    yield _format_sse(event_name, event.to_dict())
+        except Exception as e:
+            logger.error(f"Streaming solve failed: {e}")
+            yield _format_sse("error", {"error": str(e)})
 
-            solution = SolutionResult(
-                status=solution_data.get("status", "FEASIBLE"),
-                objective_value=solution_data.get("objective_value", 0.0),
-                total_duration_minutes=solution_data.get("total_duration", 0),
-                assignments=assignments,
-                resource_utilization=resource_util,
-            )
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
 
-            performance = PerformanceMetrics(
-                solve_time_seconds=solution_data.get("solve_time", 0.0),
-                variables_count=solution_data.get("variables", 0),
-                constraints_count=solution_data.get("constraints", 0),
-                memory_usage_mb=solution_data.get("memory_mb", 0.0),
-            )
 
-            return SolverResponse(
-                success=True, solution=solution, performance_metrics=performance
-            )
-        else:
-            return SolverResponse(
-                success=False, error=solution_data.get("error", "Solver failed")
-            )
+def _format_sse(event_name: str, data: dict[str, Any]) -> str:
+    """Format one server-sent event."""
+    return f"event: {event_name}\ndata: {json.dumps(data, default=str)}\n\n"
 
-    except Exception as e:
-        logger.error(f"Solver API error: {e}")
-        return SolverResponse(success=False, error=str(e))
 
+def build_solver_response(result: dict[str, Any]) -> SolverResponse:
+    """Transform a job result into the API solution format."""
+    solution_data = result.get("solution") or {}
+    schedule = solution_data.get("schedule", [])
+    if not schedule:
+        return SolverResponse(
+            success=False, error=f"No solution found ({result.get('status')})"
+        )
 
-def solve_problem_with_constraints(
-    problem: SchedulingProblem, settings: ConstraintSettings
-) -> dict[str, Any]:
-    """Solve scheduling problem with specific constraint settings.
+    # Solver times are 15-minute units
+    assignments = [
+        TaskAssignment(
+            instance_id=task["job_id"],
+            task_id=task["task_id"],
+            machine_id=task.get("machine_id") or "",
+            start_time=task["start_time"] * 15,
+            end_time=task["end_time"] * 15,
+            mode_id=task.get("mode_id") or "",
+        )
+        for task in schedule
+    ]
+
+    # Calculate resource utilization
+    machine_usage: dict[str, int] = {}
+    for assignment in assignments:
+        duration = assignment.end_time - assignment.start_time
+        machine_usage[assignment.machine_id] = (
+            machine_usage.get(assignment.machine_id, 0) + duration
+        )
 
-    This is a simplified wrapper around the main solver.
-    In production, this would integrate with the full 3-phase system.
-    """
-    try:
-        import time
+    total_time = max(a.end_time for a in assignments) or 1
+    resource_util = [
+        ResourceUtilization(
+            machine_id=machine_id,
+            utilization_percent=min(100.0, (usage / total_time) * 100),
+            total_runtime_minutes=usage,
+        )
+        for machine_id, usage in machine_usage.items()
+    ]
+
+    solution = SolutionResult(
+        status=result.get("status", "FEASIBLE"),
+        objective_value=result.get("objective_value", 0.0),
+        total_duration_minutes=solution_data.get("makespan", 0) * 15,
+        assignments=assignments,
+        resource_utilization=resource_util,
+    )
+
+    performance = PerformanceMetrics(
+        solve_time_seconds=result.get("solve_time", 0.0),
+        variables_count=result.get("variables", 0),
+        constraints_count=result.get("constraints", 0),
+        memory_usage_mb=0.0,  # Would need actual memory tracking
+    )
+
+    return SolverResponse(
+        success=True, solution=solution, performance_metrics=performance
+    )
+
+
+@router.get("/status/{job_id}", response_model=JobStatusResponse)
+async def get_job_status(job_id: str):
+    """Get queue position, progress and result of a solver job."""
+    job = get_job_manager().get_status(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
 
-        start_time = time.time()
+    result = job.pop("result")
+    return JobStatusResponse(
+        **job, result=build_solver_response(result) if result else None
+    )
 
-        # For now, use the basic solver
-        # In production, this would use the 3-phase constraint system
-        # Using solver_main as a placeholder - this would be replaced with proper solver integration
-        try:
-            solver_result = solver_main()
-            # Create a mock solution object for now
-            solution = type(
-                "Solution",
-                (),
-                {
-                    "assignments": solver_result.get("assignments", {}),
-                    "optimal": solver_result.get("status") == "OPTIMAL",
-                    "objective_value": solver_result.get("objective_value", 0.0),
-                    "total_duration": solver_result.get("total_duration", 0),
-                    "variables_count": solver_result.get("variables", 0),
-                    "constraints_count": solver_result.get("constraints", 0),
-                },
-            )()
-        except Exception as e:
-            logger.warning(f"Solver execution failed, using mock solution: {e}")
-            # Return a mock solution for API testing
-            solution = type(
-                "Solution",
-                (),
-                {
-                    "assignments": {},
-                    "optimal": False,
-                    "objective_value": 0.0,
-                    "total_duration": 0,
-                    "variables_count": 0,
-                    "constraints_count": 0,
-                },
-            )()
-
-        solve_time = time.time() - start_time
-
-        # Transform solution to expected format
-        if hasattr(solution, "assignments") and solution.assignments:
-            assignments = {}
-            for task_id, assignment in solution.assignments.items():
-                assignments[task_id] = {
-                    "instance_id": assignment.get("job_id", ""),
-                    "machine_id": assignment.get("machine_id", ""),
-                    "start_time": assignment.get("start_time", 0),
-                    "end_time": assignment.get("end_time", 0),
-                    "mode_id": assignment.get("mode_id", ""),
-                }
-
-            return {
-                "success": True,
-                "status": "OPTIMAL" if solution.optimal else "FEASIBLE",
-                "objective_value": getattr(solution, "objective_value", 0.0),
-                "total_duration": getattr(solution, "total_duration", 0),
-                "assignments": assignments,
-                "solve_time": solve_time,
-                "variables": getattr(solution, "variables_count", 0),
-                "constraints": getattr(solution, "constraints_count", 0),
-                "memory_mb": 0.0,  # Would need actual memory tracking
-            }
-        else:
-            return {"success": False, "error": "No solution found"}
-    except Exception as e:
-        logger.error(f"Solver execution failed: {e}")
-        return {"success": False, "error": str(e)}
 
+@router.post("/cancel/{job_id}")
+async def cancel_job(job_id: str):
+    """Cancel a queued job or stop the search of a running one.
 
-@router.get("/status/{job_id}")
-async def get_job_status(job_id: str):
-    """Get the status of a solver job (for future async processing)."""
-    # Placeholder for async job status tracking
-    return {
-        "job_id": job_id,
-        "status": "completed",
-        "message": "Job completed successfully",
-    }
+    A running job keeps the best solution found before the search stopped.
+    """
+    if not get_job_manager().cancel(job_id):
+        raise HTTPException(
+            status_code=404, detail=f"No active job to cancel: {job_id}"
+        )
+    return {"success": True, "job_id": job_id}
 
 
 @router.post("/validate")
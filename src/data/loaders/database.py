@@ -9,12 +9,14 @@ import os
 from datetime import datetime
 
 from dotenv import load_dotenv
+from postgrest.exceptions import APIError
 from supabase import Client, create_client
 
 from src.solver.models.problem import (
     Job,
     JobOptimizedPattern,
     Machine,
+    MachineDowntime,
     Precedence,
     SchedulingProblem,
     Task,
@@ -22,7 +24,7 @@ from src.solver.models.problem import (
     WorkCell,
 )
 
-from .optimized_database import OptimizedDatabaseLoader
+from .optimized_database import OptimizedDatabaseLoader, is_missing_table
 
 logger = logging.getLogger(__name__)
 
@@ -118,6 +120,27 @@ class DatabaseLoader:
             pattern_id, max_instances, status_filter
         )
 
+    def load_multi_pattern_problem(
+        self,
+        pattern_ids: list[str],
+        max_instances: int | None = None,
+        status_filter: str = "scheduled",
+    ) -> SchedulingProblem:
+        """Load one optimized mode problem over several patterns.
+
+        Args:
+            pattern_ids: UUIDs of the job optimized patterns to load
+            max_instances: Maximum number of instances per pattern
+            status_filter: Instance status filter ('scheduled', 'all')
+
+        Returns:
+            SchedulingProblem with multi-pattern optimized mode structure
+
+        """
+        return self._optimized_loader.load_multi_pattern_problem(
+            pattern_ids, max_instances, status_filter
+        )
+
     def load_available_patterns(self) -> list[JobOptimizedPattern]:
         """Load all available job optimized patterns for selection."""
         if not self._has_optimized_tables():
@@ -299,6 +322,7 @@ class DatabaseLoader:
                 )
                 return []
 
+        downtime = self._load_machine_downtime()
         machines = []
         for row in response.data:
             machines.append(
@@ -310,11 +334,40 @@ class DatabaseLoader:
                     cost_per_hour=(
                         float(row["cost_per_hour"]) if row["cost_per_hour"] else 0.0
                     ),
+                    downtime=downtime.get(row["resource_id"], []),
                 )
             )
 
         return machines
 
+    def _load_machine_downtime(self) -> dict[str, list[MachineDowntime]]:
+        """Load planned machine downtime, keyed by machine resource ID."""
+        table_name = f"{self.table_prefix}machine_downtime"
+        try:
+            response = self.supabase.table(table_name).select("*").execute()
+        except APIError as e:
+            if not is_missing_table(e):
+                raise
+            # Databases without migration 005 have no downtime; machines
+            # without it are always available
+            logger.warning(f"No machine downtime loaded, {table_name} is missing")
+            return {}
+
+        downtime: dict[str, list[MachineDowntime]] = {}
+        for row in response.data:
+            downtime.setdefault(row["resource_id"], []).append(
+                MachineDowntime(
+                    start_time=datetime.fromisoformat(
+                        row["start_time"].replace("Z", "+00:00")
+                    ),
+                    end_time=datetime.fromisoformat(
+                        row["end_time"].replace("Z", "+00:00")
+                    ),
+                    reason=row.get("reason") or "",
+                )
+            )
+        return downtime
+
     def _load_jobs(self) -> list[Job]:
         """Load jobs from database."""
         table_name = f"{self.table_prefix}jobs"
@@ -420,6 +473,14 @@ def load_optimized_test_problem(
     return loader.load_optimized_problem(pattern_id, max_instances)
 
 
+def load_multi_pattern_test_problem(
+    pattern_ids: list[str], max_instances: int | None = None
+) -> SchedulingProblem:
+    """Load optimized mode test problem over several patterns."""
+    loader = DatabaseLoader(use_test_tables=True)
+    return loader.load_multi_pattern_problem(pattern_ids, max_instances)
+
+
 def load_unique_test_problem() -> SchedulingProblem:
     """Load test problem using unique job-based approach (force unique mode)."""
     loader = DatabaseLoader(use_test_tables=True, prefer_optimized_mode=False)
@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import Any
 
 from dotenv import load_dotenv
+from postgrest.exceptions import APIError
 
 from src.data.clients.secure_database_client import get_database_client
 from src.solver.models.problem import (
@@ -16,6 +17,7 @@ from src.solver.models.problem import (
     JobInstance,
     JobOptimizedPattern,
     Machine,
+    MachineDowntime,
     OptimizedPrecedence,
     OptimizedTask,
     Precedence,
@@ -27,6 +29,15 @@ from src.solver.models.problem import (
 
 logger = logging.getLogger(__name__)
 
+# Error codes for a table that does not exist: PostgreSQL undefined_table and
+# PostgREST's schema cache miss
+MISSING_TABLE_CODES = frozenset({"42P01", "PGRST205"})
+
+
+def is_missing_table(error: APIError) -> bool:
+    """Whether a PostgREST error means the queried table does not exist."""
+    return error.code in MISSING_TABLE_CODES
+
 
 class OptimizedDatabaseLoader:
     """Efficient optimized mode database loader for OR-Tools solver."""
@@ -117,6 +128,70 @@ class OptimizedDatabaseLoader:
 
         return problem
 
+    def load_multi_pattern_problem(
+        self,
+        pattern_ids: list[str],
+        max_instances: int | None = None,
+        status_filter: str = "scheduled",
+    ) -> SchedulingProblem:
+        """Load one optimized mode problem over several patterns.
+
+        Instances of every pattern share the machines and work cells, so they
+        are scheduled jointly while each pattern keeps its compact per-pattern
+        variables and constraints.
+
+        Args:
+            pattern_ids: UUIDs of the job optimized patterns to load
+            max_instances: Maximum number of instances per pattern (None = all)
+            status_filter: Instance status filter ('scheduled', 'all')
+
+        Returns:
+            SchedulingProblem with multi-pattern optimized mode structure
+
+        """
+        logger.info(f"Loading multi-pattern optimized problem for {pattern_ids}")
+
+        patterns = []
+        instances = []
+        for pattern_id in dict.fromkeys(pattern_ids):
+            pattern = self._load_job_optimized_pattern(pattern_id)
+            if not pattern:
+                raise ValueError(f"Optimized pattern {pattern_id} not found")
+            patterns.append(pattern)
+            instances.extend(
+                self._load_job_instances(pattern_id, max_instances, status_filter)
+            )
+        if not instances:
+            raise ValueError(f"No instances found for patterns {pattern_ids}")
+
+        work_cells = self._load_work_cells()
+        machines = self._load_machines()
+        self._associate_machines_with_cells(machines, work_cells)
+
+        problem = SchedulingProblem.create_from_optimized_patterns(
+            job_optimized_patterns=patterns,
+            job_instances=instances,
+            machines=machines,
+            work_cells=work_cells,
+        )
+
+        issues = problem.validate()
+        if issues:
+            logger.warning("Problem validation issues found:")
+            for issue in issues:
+                logger.warning(f"  - {issue}")
+
+        logger.info("Loaded multi-pattern optimized problem:")
+        for pattern in patterns:
+            logger.info(
+                f"  - Pattern: {pattern.name} ({pattern.task_count} tasks, "
+                f"{len(problem.pattern_instances(pattern))} instances)"
+            )
+        logger.info(f"  - Total tasks: {problem.total_task_count}")
+        logger.info(f"  - Machines: {len(machines)}")
+
+        return problem
+
     def load_available_patterns(self) -> list[JobOptimizedPattern]:
         """Load all available job optimized patterns for selection.
 
@@ -348,6 +423,7 @@ class OptimizedDatabaseLoader:
             .execute()
         )
 
+        downtime = self._load_machine_downtime()
         machines = []
         for row in response.data:
             machines.append(
@@ -359,11 +435,40 @@ class OptimizedDatabaseLoader:
                     cost_per_hour=(
                         float(row["cost_per_hour"]) if row["cost_per_hour"] else 0.0
                     ),
+                    downtime=downtime.get(row["resource_id"], []),
                 )
             )
 
         return machines
 
+    def _load_machine_downtime(self) -> dict[str, list[MachineDowntime]]:
+        """Load planned machine downtime, keyed by machine resource ID."""
+        table_name = f"{self.table_prefix}machine_downtime"
+        try:
+            response = self.supabase.table(table_name).select("*").execute()
+        except APIError as e:
+            if not is_missing_table(e):
+                raise
+            # Databases without migration 005 have no downtime; machines
+            # without it are always available
+            logger.warning(f"No machine downtime loaded, {table_name} is missing")
+            return {}
+
+        downtime: dict[str, list[MachineDowntime]] = {}
+        for row in response.data:
+            downtime.setdefault(row["resource_id"], []).append(
+                MachineDowntime(
+                    start_time=datetime.fromisoformat(
+                        row["start_time"].replace("Z", "+00:00")
+                    ),
+                    end_time=datetime.fromisoformat(
+                        row["end_time"].replace("Z", "+00:00")
+                    ),
+                    reason=row.get("reason") or "",
+                )
+            )
+        return downtime
+
     def _convert_instances_to_jobs(
         self, pattern: JobOptimizedPattern, instances: list[JobInstance]
     ) -> list[Job]:
@@ -427,6 +532,39 @@ class OptimizedDatabaseLoader:
         for cell in work_cells:
             cell.machines = machine_by_cell.get(cell.cell_id, [])
 
+    def load_solution_assignments(
+        self, instance_ids: list[str]
+    ) -> list[dict[str, Any]]:
+        """Load the last saved task assignments of job instances.
+
+        Args:
+            instance_ids: Job instances to load assignments for
+
+        Returns:
+            Rows as written by save_solution_assignments(); convert them with
+            src.solver.core.warm_start.assignments_from_rows() to warm start
+            a re-plan
+
+        """
+        if not instance_ids:
+            return []
+
+        response = (
+            self.supabase.table("instance_task_assignments")
+            .select(
+                "instance_id, optimized_task_id, selected_mode_id, "
+                "start_time_minutes, end_time_minutes, assigned_machine_id"
+            )
+            .in_("instance_id", instance_ids)
+            .execute()
+        )
+
+        logger.info(
+            f"Loaded {len(response.data)} saved task assignments for "
+            f"{len(instance_ids)} instances"
+        )
+        return response.data
+
     def save_solution_assignments(
         self, problem: SchedulingProblem, solution_data: dict[str, Any]
     ) -> None:
@@ -443,33 +581,46 @@ class OptimizedDatabaseLoader:
             )
             return
 
-        assignments = []
-        for job in problem.jobs:
-            instance_id = job.job_id
-
-            for task in job.tasks:
+        # Problems built from instances (multi-pattern loading) have no jobs
+        if problem.job_instances:
+            instance_tasks = [
+                (
+                    instance.instance_id,
+                    optimized_task.optimized_task_id,
+                    problem.get_instance_task_id(
+                        instance.instance_id, optimized_task.optimized_task_id
+                    ),
+                )
+                for instance in problem.job_instances
+                for optimized_task in problem.instance_pattern(instance).optimized_tasks
+            ]
+            instance_ids = [i.instance_id for i in problem.job_instances]
+        else:
+            instance_tasks = [
                 # Extract optimized task ID from composite task ID
-                optimized_task_id = task.task_id.split("_", 1)[
-                    1
-                ]  # Remove instance prefix
-
-                if task.task_id in solution_data:
-                    assignment_data = solution_data[task.task_id]
-
-                    assignment = {
-                        "instance_id": instance_id,
-                        "optimized_task_id": optimized_task_id,
-                        "selected_mode_id": assignment_data.get("mode_id"),
-                        "start_time_minutes": assignment_data.get("start_time"),
-                        "end_time_minutes": assignment_data.get("end_time"),
-                        "assigned_machine_id": assignment_data.get("machine_id"),
-                    }
-                    assignments.append(assignment)
+                (job.job_id, task.task_id.split("_", 1)[1], task.task_id)
+                for job in problem.jobs
+                for task in job.tasks
+            ]
+            instance_ids = [job.job_id for job in problem.jobs]
+
+        assignments = []
+        for instance_id, optimized_task_id, task_id in instance_tasks:
+            if task_id in solution_data:
+                assignment_data = solution_data[task_id]
+
+                assignment = {
+                    "instance_id": instance_id,
+                    "optimized_task_id": optimized_task_id,
+                    "selected_mode_id": assignment_data.get("mode_id"),
+                    "start_time_minutes": assignment_data.get("start_time"),
+                    "end_time_minutes": assignment_data.get("end_time"),
+                    "assigned_machine_id": assignment_data.get("machine_id"),
+                }
+                assignments.append(assignment)
 
         if assignments:
             # Use UPSERT for atomic save operation (safer than delete+insert)
-            instance_ids = [job.job_id for job in problem.jobs]
-
             try:
                 # First clear existing assignments for these instances in atomic
                 # operation
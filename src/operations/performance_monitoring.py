@@ -109,6 +109,8 @@ class PerformanceMonitor:
         self.health_history: list[SystemHealthMetrics] = []
         self.failure_count = 0
         self.last_health_check = datetime.now(UTC)
+        self.model_cache_hits = 0
+        self.model_cache_misses = 0
 
     def record_solve_performance(
         self,
@@ -265,6 +267,91 @@ class PerformanceMonitor:
             f"Memory {memory_percent:.1f}%, Disk {disk_usage_percent:.1f}%"
         )
 
+    def record_model_cache_access(
+        self,
+        hit: bool,
+        tier: str,
+        template_id: str | None = None,
+        instance_count: int | None = None,
+    ) -> None:
+        """Record a compiled-model cache lookup.
+
+        Args:
+            hit: Whether the lookup found a cached model
+            tier: Cache tier that served the lookup ("memory", "disk" or "none")
+            template_id: Template identifier
+            instance_count: Number of instances in the cached model
+
+        """
+        if hit:
+            self.model_cache_hits += 1
+        else:
+            self.model_cache_misses += 1
+
+        self.metrics.append(
+            PerformanceMetric(
+                name="model_cache_hit",
+                value=1.0 if hit else 0.0,
+                unit="boolean",
+                template_id=template_id,
+                instance_count=instance_count,
+                tags={"tier": tier},
+            )
+        )
+
+    def record_model_build(
+        self,
+        build_time: float,
+        proto_size_bytes: int,
+        template_id: str | None = None,
+        instance_count: int | None = None,
+    ) -> None:
+        """Record the cost of compiling a model on a cache miss.
+
+        Args:
+            build_time: Model construction time in seconds
+            proto_size_bytes: Size of the serialized CpModelProto
+            template_id: Template identifier
+            instance_count: Number of instances in the model
+
+        """
+        timestamp = datetime.now(UTC)
+
+        self.metrics.extend(
+            [
+                PerformanceMetric(
+                    name="model_build_time",
+                    value=build_time,
+                    unit="seconds",
+                    timestamp=timestamp,
+                    template_id=template_id,
+                    instance_count=instance_count,
+                ),
+                PerformanceMetric(
+                    name="model_proto_size",
+                    value=proto_size_bytes,
+                    unit="bytes",
+                    timestamp=timestamp,
+                    template_id=template_id,
+                    instance_count=instance_count,
+                ),
+            ]
+        )
+
+    def get_model_cache_stats(self) -> dict[str, float]:
+        """Get compiled-model cache hit/miss counters.
+
+        Returns:
+            Dictionary with hits, misses and hit rate
+
+        """
+        lookups = self.model_cache_hits + self.model_cache_misses
+        return {
+            "hits": self.model_cache_hits,
+            "misses": self.model_cache_misses,
+            "hit_rate": self.model_cache_hits / lookups if lookups else 0.0,
+        }
+
     def get_current_health(self) -> SystemHealthMetrics:
         """Get current system health assessment.
 
@@ -538,6 +625,8 @@ class PerformanceMonitor:
         self.metrics.clear()
         self.health_history.clear()
         self.failure_count = 0
+        self.model_cache_hits = 0
+        self.model_cache_misses = 0
         logger.info("All performance metrics reset")
 
     def export_metrics(
@@ -259,6 +259,7 @@ class BenchmarkRunner:
 
         from src.data.loaders.optimized_database import OptimizedDatabaseLoader
         from src.solver.core.solver import FreshSolver
+        from src.solver.core.solver_config import SolverConfig
 
         logger.debug(
             f"Running benchmark: {config.template_id}, {instance_count} instances"
@@ -285,14 +286,13 @@ class BenchmarkRunner:
                     f"Failed to generate problem for template {config.template_id}"
                 )
 
-            # 2. Create solver and configure parameters
-            solver = FreshSolver(problem)
-
-            # Configure solver parameters
-            if solver.solver:
-                for param_name, param_value in parameters.items():
-                    if hasattr(solver.solver.parameters, param_name):
-                        setattr(solver.solver.parameters, param_name, param_value)
+            # 2. Create solver; parameters are applied to every CP-SAT phase
+            solver = FreshSolver(
+                problem,
+                solver_config=SolverConfig(
+                    parameters=parameters, template_id=config.template_id
+                ),
+            )
 
             # 3. Measure solve time and memory usage
             start_time = time.time()
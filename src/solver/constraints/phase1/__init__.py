@@ -8,8 +8,10 @@ from .capacity import add_machine_capacity_constraints
 from .due_date_constraints import (
     add_due_date_enforcement_constraints,
     add_lateness_penalty_variables,
+    convert_due_date_to_time_units,
     create_total_lateness_objective_variable,
 )
+from .fixed_intervals import create_fixed_intervals, merge_time_spans
 from .optimized_constraints import (
     add_optimized_assignment_constraints,
     add_optimized_no_overlap_constraints,
@@ -59,10 +61,14 @@ __all__ = [
     "add_weekend_optimization_constraints",
     # WorkCell capacity constraints
     "add_workcell_capacity_constraints",
+    # Fixed machine occupancy (committed or blocked time)
+    "create_fixed_intervals",
+    "merge_time_spans",
     # Due date constraints (User Story 3)
     "add_due_date_enforcement_constraints",
     "add_lateness_penalty_variables",
     "create_total_lateness_objective_variable",
+    "convert_due_date_to_time_units",
     # WIP limit constraints (User Story 4)
     "add_wip_limit_constraints",
     "add_adaptive_wip_adjustment_constraints",
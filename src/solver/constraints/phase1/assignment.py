@@ -5,7 +5,10 @@ Handles task-to-machine assignments and no-overlap constraints.
 
 from ortools.sat.python import cp_model
 
+from src.solver.constraints.phase1.fixed_intervals import FixedOccupancy
+from src.solver.core.instance_task_table import InstanceTaskTable
 from src.solver.models.problem import SchedulingProblem
+from src.solver.models.problem_arrays import compile_problem_arrays
 
 
 def add_machine_assignment_constraints(
@@ -13,6 +16,7 @@ def add_machine_assignment_constraints(
     task_assigned: dict,
     task_durations: dict,
     problem: SchedulingProblem,
+    table: InstanceTaskTable | None = None,
 ) -> None:
     """Add machine assignment constraints.
 
@@ -21,41 +25,37 @@ def add_machine_assignment_constraints(
         task_assigned: Boolean variables for task-machine assignment
         task_durations: Task duration variables
         problem: The scheduling problem
+        table: Instance-task table (built from the dictionaries if omitted)
 
     Constraints Added:
         - Each task must be assigned to exactly one eligible machine
         - Task duration depends on assigned machine
 
     """
-    for job in problem.jobs:
-        for task in job.tasks:
-            task_key = (job.job_id, task.task_id)
-
-            # Collect assignment variables for this task
-            assignment_vars = []
-            for mode in task.modes:
-                machine_key = (job.job_id, task.task_id, mode.machine_resource_id)
-                if machine_key in task_assigned:
-                    assignment_vars.append(task_assigned[machine_key])
-
-            # Exactly one machine must be selected
-            if assignment_vars:
-                model.AddExactlyOne(assignment_vars)
-
-            # Link duration to machine selection
-            duration_options = []
-            for mode in task.modes:
-                machine_key = (job.job_id, task.task_id, mode.machine_resource_id)
-                if machine_key in task_assigned:
-                    # If this machine is selected, use its duration
-                    duration_in_units = mode.duration_time_units
-                    duration_options.append(
-                        task_assigned[machine_key] * duration_in_units
-                    )
-
-            # Sum of all duration options equals actual duration
-            if duration_options:
-                model.Add(task_durations[task_key] == sum(duration_options))
+    if table is None:
+        table = InstanceTaskTable.from_variables(
+            compile_problem_arrays(problem),
+            task_durations=task_durations,
+            task_assigned=task_assigned,
+        )
+
+    for task in range(table.task_count):
+        # Assignment literals of this task's eligible machines
+        modes = table.task_assignments(task)
+
+        # Exactly one machine must be selected
+        if modes:
+            model.AddExactlyOne(literal for _, literal in modes)
+
+            # If a machine is selected, use its duration: the sum of all
+            # duration options equals the actual duration
+            model.Add(
+                table.durations[task]
+                == sum(
+                    literal * table.arrays.duration(task, machine)
+                    for machine, literal in modes
+                )
+            )
 
 
 def add_machine_no_overlap_constraints(
@@ -64,6 +64,8 @@ def add_machine_no_overlap_constraints(
     task_assigned: dict,
     machine_intervals: dict,
     problem: SchedulingProblem,
+    table: InstanceTaskTable | None = None,
+    fixed: FixedOccupancy | None = None,
 ) -> None:
     """Add no-overlap constraints for machines.
 
@@ -73,38 +75,37 @@ def add_machine_no_overlap_constraints(
         task_assigned: Boolean variables for task-machine assignment
         machine_intervals: Lists of intervals per machine
         problem: The scheduling problem
+        table: Instance-task table (built from the dictionaries if omitted)
+        fixed: Fixed intervals of occupied machine time (create_fixed_intervals)
 
     Constraints Added:
-        - Tasks assigned to the same machine cannot overlap
+        - Tasks assigned to the same machine cannot overlap, nor overlap the
+          machine's fixed intervals
 
     """
-    # Create optional intervals for each task-machine combination
-    for job in problem.jobs:
-        for task in job.tasks:
-            task_key = (job.job_id, task.task_id)
-            base_interval = task_intervals[task_key]
-
-            for mode in task.modes:
-                machine_id = mode.machine_resource_id
-                machine_key = (job.job_id, task.task_id, machine_id)
-
-                if machine_key in task_assigned:
-                    # Create optional interval that exists only if assigned
-                    optional_interval = model.NewOptionalIntervalVar(
-                        base_interval.StartExpr(),
-                        base_interval.SizeExpr(),
-                        base_interval.EndExpr(),
-                        task_assigned[machine_key],
-                        f"optional_{job.job_id}_{task.task_id}_{machine_id}",
-                    )
-
-                    machine_intervals[machine_id].append(optional_interval)
+    if table is None:
+        table = InstanceTaskTable.from_variables(
+            compile_problem_arrays(problem),
+            task_intervals=task_intervals,
+            task_assigned=task_assigned,
+        )
+
+    # Create optional intervals for each task-machine combination; they are
+    # kept in the table, so the capacity constraints reuse them
+    for task in range(table.task_count):
+        for machine, _ in table.task_assignments(task):
+            optional_interval = table.optional_interval(model, task, machine)
+            machine_intervals[table.arrays.machine_ids[machine]].append(
+                optional_interval
+            )
 
     # Add no-overlap constraint for each machine
+    fixed = fixed or {}
     for machine_id, intervals in machine_intervals.items():
         if intervals:
             # Only add no-overlap for unit capacity machines
             # High-capacity machines use AddCumulative instead
             machine = problem.machine_lookup.get(machine_id)
             if machine and machine.capacity <= 1:
-                model.AddNoOverlap(intervals)
+                blocked = [interval for interval, _ in fixed.get(machine_id, [])]
+                model.AddNoOverlap(intervals + blocked)
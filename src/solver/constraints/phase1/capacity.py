@@ -5,7 +5,10 @@ Handles cumulative resource constraints for machines that can run multiple tasks
 
 from ortools.sat.python import cp_model
 
+from src.solver.constraints.phase1.fixed_intervals import FixedOccupancy
+from src.solver.core.instance_task_table import InstanceTaskTable
 from src.solver.models.problem import Machine, SchedulingProblem
+from src.solver.models.problem_arrays import compile_problem_arrays
 
 
 def add_machine_capacity_constraints(
@@ -14,6 +17,8 @@ def add_machine_capacity_constraints(
     task_assigned: dict[tuple[str, str, str], cp_model.IntVar],
     machines: list[Machine],
     problem: SchedulingProblem,
+    table: InstanceTaskTable | None = None,
+    fixed: FixedOccupancy | None = None,
 ) -> None:
     """Add cumulative capacity constraints for machines that can handle multiple tasks.
 
@@ -23,17 +28,28 @@ def add_machine_capacity_constraints(
         task_assigned: Dictionary of task assignment variables
         machines: List of machines with capacities
         problem: The scheduling problem
+        table: Instance-task table (built from the dictionaries if omitted)
+        fixed: Fixed intervals of occupied machine time (create_fixed_intervals)
 
     Constraints Added:
-        - CumulativeConstraint for machines with capacity > 1
+        - CumulativeConstraint for machines with capacity > 1, including their
+          fixed intervals with the demand they were created with
         - Only applied to high-capacity machines (capacity=1 uses no-overlap)
 
     Performance:
         - No-overlap is used for capacity=1 (more efficient)
         - AddCumulative only for capacity > 1 (necessary for parallel tasks)
-        - O(n × m) where n = tasks, m = high-capacity machines
+        - O(n × m) where n = eligible tasks, m = high-capacity machines
 
     """
+    if table is None:
+        table = InstanceTaskTable.from_variables(
+            compile_problem_arrays(problem),
+            task_intervals=task_intervals,
+            task_assigned=task_assigned,
+        )
+    fixed = fixed or {}
+
     for machine in machines:
         if machine.capacity <= 1:
             # Skip unit capacity - no-overlap constraint is more efficient
@@ -43,55 +59,21 @@ def add_machine_capacity_constraints(
         intervals = []
         demands = []
 
-        if problem.is_optimized_mode and problem.job_optimized_pattern:
-            # Optimized mode: iterate over instances and optimized tasks
-            for instance in problem.job_instances:
-                for optimized_task in problem.job_optimized_pattern.optimized_tasks:
-                    # Check if optimized task can run on this machine
-                    if machine.resource_id in optimized_task.eligible_machines:
-                        instance_task_id = problem.get_instance_task_id(
-                            instance.instance_id, optimized_task.optimized_task_id
-                        )
-                        task_key = (instance.instance_id, instance_task_id)
-                        assign_key = (
-                            instance.instance_id,
-                            instance_task_id,
-                            machine.resource_id,
-                        )
-
-                        if task_key in task_intervals and assign_key in task_assigned:
-                            # Create optional interval based on assignment
-                            optional_interval = model.NewOptionalIntervalVar(
-                                task_intervals[task_key].StartExpr(),
-                                task_intervals[task_key].SizeExpr(),
-                                task_intervals[task_key].EndExpr(),
-                                task_assigned[assign_key],
-                                f"optional_{instance.instance_id[:8]}_{optimized_task.optimized_task_id[:8]}_{machine.resource_id[:8]}",
-                            )
-
-                            intervals.append(optional_interval)
-                            demands.append(1)  # Each task consumes 1 unit of capacity
-        else:
-            # Unique mode: iterate over jobs and tasks
-            for job in problem.jobs:
-                for task in job.tasks:
-                    # Check if task can run on this machine
-                    if machine.resource_id in task.eligible_machines:
-                        task_key = (job.job_id, task.task_id)
-                        assign_key = (job.job_id, task.task_id, machine.resource_id)
-
-                        # Create optional interval based on assignment
-                        optional_interval = model.NewOptionalIntervalVar(
-                            task_intervals[task_key].StartExpr(),
-                            task_intervals[task_key].SizeExpr(),
-                            task_intervals[task_key].EndExpr(),
-                            task_assigned[assign_key],
-                            f"optional_{job.job_id[:8]}_{task.task_id[:8]}_{machine.resource_id[:8]}",
-                        )
-
-                        intervals.append(optional_interval)
-                        demands.append(1)  # Each task consumes 1 unit of capacity
+        # Only tasks eligible for this machine (jobs or optimized instances)
+        machine_index = table.arrays.machine_index.get(machine.resource_id)
+        eligible_tasks = (
+            [] if machine_index is None else table.arrays.machine_tasks(machine_index)
+        )
+        for task in eligible_tasks:
+            # Optional interval based on assignment, kept in the table
+            optional_interval = table.optional_interval(model, task, machine_index)
+            if optional_interval is not None:
+                intervals.append(optional_interval)
+                demands.append(1)  # Each task consumes 1 unit of capacity
 
         # Add cumulative constraint if machine has tasks
         if intervals:
+            for interval, demand in fixed.get(machine.resource_id, []):
+                intervals.append(interval)
+                demands.append(demand)
             model.AddCumulative(intervals, demands, machine.capacity)
@@ -9,6 +9,7 @@ from typing import Any
 
 from ortools.sat.python import cp_model
 
+from src.solver.core.lean_model import keeps_names
 from src.solver.models.problem import SchedulingProblem
 
 # Type aliases following TEMPLATES.md centralized patterns
@@ -89,7 +90,7 @@ def add_optimized_due_date_constraints(
 
     for instance in problem.job_instances:
         instance_end_times = _collect_instance_task_ends(
-            instance, problem.job_optimized_pattern, problem, task_ends
+            instance, problem.instance_pattern(instance), problem, task_ends
         )
 
         if instance_end_times:
@@ -177,6 +178,7 @@ def add_lateness_penalty_variables(
 
     """
     lateness_penalties = {}
+    named = keeps_names(model)
 
     if problem.is_optimized_mode:
         # Optimized mode lateness calculation
@@ -185,11 +187,11 @@ def add_lateness_penalty_variables(
                 instance.instance_id in completion_times
                 and instance.due_date is not None
             ):
-                due_date_units = _convert_due_date_to_time_units(instance.due_date)
+                due_date_units = convert_due_date_to_time_units(instance.due_date)
 
                 # Create lateness penalty variable (non-negative)
                 lateness_var = model.NewIntVar(
-                    0, horizon, f"lateness_{instance.instance_id}"
+                    0, horizon, f"lateness_{instance.instance_id}" if named else ""
                 )
 
                 # Lateness = max(0, completion - due_date)
@@ -197,7 +199,9 @@ def add_lateness_penalty_variables(
 
                 # Create auxiliary variable for completion - due_date
                 late_amount = model.NewIntVar(
-                    -horizon, horizon, f"late_amt_{instance.instance_id}"
+                    -horizon,
+                    horizon,
+                    f"late_amt_{instance.instance_id}" if named else "",
                 )
                 model.Add(late_amount == completion_var - due_date_units)
 
@@ -208,14 +212,16 @@ def add_lateness_penalty_variables(
         # Unique mode lateness calculation
         for job in problem.jobs:
             if job.job_id in completion_times and job.due_date is not None:
-                due_date_units = _convert_due_date_to_time_units(job.due_date)
+                due_date_units = convert_due_date_to_time_units(job.due_date)
 
-                lateness_var = model.NewIntVar(0, horizon, f"lateness_{job.job_id}")
+                lateness_var = model.NewIntVar(
+                    0, horizon, f"lateness_{job.job_id}" if named else ""
+                )
 
                 completion_var = completion_times[job.job_id]
 
                 late_amount = model.NewIntVar(
-                    -horizon, horizon, f"late_amt_{job.job_id}"
+                    -horizon, horizon, f"late_amt_{job.job_id}" if named else ""
                 )
                 model.Add(late_amount == completion_var - due_date_units)
 
@@ -338,7 +344,9 @@ def _create_completion_time_variable(
         Completion time variable representing max of end times
 
     """
-    completion_var = model.NewIntVar(0, horizon, f"completion_{entity_id}")
+    completion_var = model.NewIntVar(
+        0, horizon, f"completion_{entity_id}" if keeps_names(model) else ""
+    )
     model.AddMaxEquality(completion_var, end_times)
     return completion_var
 
@@ -357,11 +365,11 @@ def _add_hard_due_date_constraint(
 
     """
     if due_date is not None:
-        due_date_units = _convert_due_date_to_time_units(due_date)
+        due_date_units = convert_due_date_to_time_units(due_date)
         model.Add(completion_var <= due_date_units)
 
 
-def _convert_due_date_to_time_units(due_date: datetime) -> int:
+def convert_due_date_to_time_units(due_date: datetime) -> int:
     """Convert due date to solver time units (15-minute intervals).
 
     For past due dates, returns a reasonable minimum time to allow scheduling.
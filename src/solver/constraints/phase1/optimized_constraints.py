@@ -6,7 +6,10 @@ O(n³) precedence explosion and leverage optimized pattern structure.
 
 from ortools.sat.python import cp_model
 
+from src.solver.constraints.phase1.fixed_intervals import FixedOccupancy
+from src.solver.core.instance_task_table import InstanceTaskTable
 from src.solver.models.problem import SchedulingProblem
+from src.solver.models.problem_arrays import compile_problem_arrays
 
 
 def add_optimized_precedence_constraints(
@@ -14,6 +17,7 @@ def add_optimized_precedence_constraints(
     task_starts: dict,
     task_ends: dict,
     problem: SchedulingProblem,
+    table: InstanceTaskTable | None = None,
 ) -> None:
     """Add precedence constraints for optimized mode problems.
 
@@ -25,6 +29,7 @@ def add_optimized_precedence_constraints(
         task_starts: Dictionary of task start variables
         task_ends: Dictionary of task end variables
         problem: The scheduling problem (must be optimized mode)
+        table: Instance-task table (built from the dictionaries if omitted)
 
     Constraints Added:
         - Optimized pattern precedence constraints replicated across all instances
@@ -35,30 +40,21 @@ def add_optimized_precedence_constraints(
     if not problem.is_optimized_mode or not problem.job_optimized_pattern:
         return
 
-    pattern = problem.job_optimized_pattern
-    instances = problem.job_instances
+    if table is None:
+        table = InstanceTaskTable.from_variables(
+            compile_problem_arrays(problem),
+            task_starts=task_starts,
+            task_ends=task_ends,
+        )
 
-    # Add optimized pattern precedence constraints for each instance
-    for instance in instances:
-        for optimized_prec in pattern.optimized_precedences:
-            pred_optimized_task_id = optimized_prec.predecessor_optimized_task_id
-            succ_optimized_task_id = optimized_prec.successor_optimized_task_id
+    # Pattern precedences are already replicated per instance, in instance order
+    for pred, succ in table.arrays.precedence_pairs.tolist():
+        pred_end = table.ends[pred]
+        succ_start = table.starts[succ]
 
-            # Generate instance-specific task IDs
-            pred_instance_task_id = problem.get_instance_task_id(
-                instance.instance_id, pred_optimized_task_id
-            )
-            succ_instance_task_id = problem.get_instance_task_id(
-                instance.instance_id, succ_optimized_task_id
-            )
-
-            # Create constraint keys
-            pred_key = (instance.instance_id, pred_instance_task_id)
-            succ_key = (instance.instance_id, succ_instance_task_id)
-
-            # Add precedence constraint: successor starts after predecessor ends
-            if pred_key in task_ends and succ_key in task_starts:
-                model.Add(task_starts[succ_key] >= task_ends[pred_key])
+        # Add precedence constraint: successor starts after predecessor ends
+        if pred_end is not None and succ_start is not None:
+            model.Add(succ_start >= pred_end)
 
 
 def add_optimized_assignment_constraints(
@@ -66,6 +62,7 @@ def add_optimized_assignment_constraints(
     task_assigned: dict,
     task_durations: dict,
     problem: SchedulingProblem,
+    table: InstanceTaskTable | None = None,
 ) -> None:
     """Add machine assignment constraints for optimized mode problems.
 
@@ -77,6 +74,7 @@ def add_optimized_assignment_constraints(
         task_assigned: Dictionary of assignment variables
         task_durations: Dictionary of duration variables
         problem: The scheduling problem (must be optimized mode)
+        table: Instance-task table (built from the dictionaries if omitted)
 
     Constraints Added:
         - Each optimized task instance assigned to exactly one mode
@@ -86,44 +84,29 @@ def add_optimized_assignment_constraints(
     if not problem.is_optimized_mode or not problem.job_optimized_pattern:
         return
 
-    pattern = problem.job_optimized_pattern
-    instances = problem.job_instances
-
-    for instance in instances:
-        for optimized_task in pattern.optimized_tasks:
-            instance_task_id = problem.get_instance_task_id(
-                instance.instance_id, optimized_task.optimized_task_id
-            )
-            task_key = (instance.instance_id, instance_task_id)
-
-            # Collect assignment variables for this task
-            assignment_vars = []
-            for mode in optimized_task.modes:
-                machine_key = (
-                    instance.instance_id,
-                    instance_task_id,
-                    mode.machine_resource_id,
-                )
-                if machine_key in task_assigned:
-                    assignment_vars.append(task_assigned[machine_key])
-
-            # Exactly one mode must be selected
-            if assignment_vars:
-                model.AddExactlyOne(assignment_vars)
-
-            # Duration constraint based on selected mode
-            if task_key in task_durations:
-                for mode in optimized_task.modes:
-                    machine_key = (
-                        instance.instance_id,
-                        instance_task_id,
-                        mode.machine_resource_id,
-                    )
-                    if machine_key in task_assigned:
-                        # If this mode is selected, duration equals mode duration
-                        model.Add(
-                            task_durations[task_key] == mode.duration_time_units
-                        ).OnlyEnforceIf(task_assigned[machine_key])
+    if table is None:
+        table = InstanceTaskTable.from_variables(
+            compile_problem_arrays(problem),
+            task_durations=task_durations,
+            task_assigned=task_assigned,
+        )
+
+    for task in range(table.task_count):
+        # Assignment literals of this task's modes
+        modes = table.task_assignments(task)
+
+        # Exactly one mode must be selected
+        if modes:
+            model.AddExactlyOne(literal for _, literal in modes)
+
+        # Duration constraint based on selected mode
+        duration_var = table.durations[task]
+        if duration_var is not None:
+            for machine, literal in modes:
+                # If this mode is selected, duration equals mode duration
+                model.Add(
+                    duration_var == table.arrays.duration(task, machine)
+                ).OnlyEnforceIf(literal)
 
 
 def add_optimized_no_overlap_constraints(
@@ -132,6 +115,8 @@ def add_optimized_no_overlap_constraints(
     task_assigned: dict,
     machine_intervals: dict,
     problem: SchedulingProblem,
+    table: InstanceTaskTable | None = None,
+    fixed: FixedOccupancy | None = None,
 ) -> None:
     """Add no-overlap constraints for optimized mode problems on single machines.
 
@@ -144,112 +129,101 @@ def add_optimized_no_overlap_constraints(
         task_assigned: Dictionary of assignment variables
         machine_intervals: Dictionary to populate with machine interval lists
         problem: The scheduling problem (must be optimized mode)
+        table: Instance-task table (built from the dictionaries if omitted)
+        fixed: Fixed intervals of occupied machine time (create_fixed_intervals)
 
     Constraints Added:
-        - No overlap on single-capacity machines
+        - No overlap on single-capacity machines, including their fixed intervals
 
     """
     if not problem.is_optimized_mode or not problem.job_optimized_pattern:
         return
 
-    pattern = problem.job_optimized_pattern
-    instances = problem.job_instances
+    if table is None:
+        table = InstanceTaskTable.from_variables(
+            compile_problem_arrays(problem),
+            task_intervals=task_intervals,
+            task_assigned=task_assigned,
+        )
+    arrays = table.arrays
+    fixed = fixed or {}
 
     # Group intervals by machine for single-capacity machines
-    for machine in problem.machines:
-        if machine.capacity != 1:
+    for machine in range(arrays.known_machine_count):
+        if arrays.machine_capacity[machine] != 1:
             continue  # Skip high-capacity machines
 
         machine_task_intervals = []
 
-        for instance in instances:
-            for optimized_task in pattern.optimized_tasks:
-                # Check if this optimized task can run on this machine
-                if machine.resource_id not in optimized_task.eligible_machines:
-                    continue
-
-                instance_task_id = problem.get_instance_task_id(
-                    instance.instance_id, optimized_task.optimized_task_id
-                )
-                task_key = (instance.instance_id, instance_task_id)
-                machine_key = (
-                    instance.instance_id,
-                    instance_task_id,
-                    machine.resource_id,
-                )
-
-                if task_key in task_intervals and machine_key in task_assigned:
-                    # Create optional interval for this task on this machine
-                    optional_interval = model.NewOptionalIntervalVar(
-                        task_intervals[task_key].StartExpr(),
-                        task_intervals[task_key].SizeExpr(),
-                        task_intervals[task_key].EndExpr(),
-                        task_assigned[machine_key],
-                        f"optional_{instance.instance_id[:8]}_{optimized_task.optimized_task_id[:8]}_{machine.resource_id[:8]}",
-                    )
-                    machine_task_intervals.append(optional_interval)
+        # Only tasks eligible for this machine; the optional intervals are
+        # kept in the table for later builders
+        for task in arrays.machine_tasks(machine):
+            optional_interval = table.optional_interval(model, task, machine)
+            if optional_interval is not None:
+                machine_task_intervals.append(optional_interval)
 
         # Add no-overlap constraint for this machine
         if machine_task_intervals:
-            model.AddNoOverlap(machine_task_intervals)
-            machine_intervals[machine.resource_id] = machine_task_intervals
+            machine_id = arrays.machine_ids[machine]
+            blocked = [interval for interval, _ in fixed.get(machine_id, [])]
+            model.AddNoOverlap(machine_task_intervals + blocked)
+            machine_intervals[machine_id] = machine_task_intervals
 
 
 def add_symmetry_breaking_constraints(
     model: cp_model.CpModel,
     task_starts: dict,
     problem: SchedulingProblem,
+    table: InstanceTaskTable | None = None,
 ) -> None:
     """Add symmetry breaking constraints for identical job instances.
 
-    Since all job instances are identical, we can break symmetry by forcing
-    an ordering on instances. This dramatically reduces the search space.
+    Since all job instances of a pattern are identical, we can break symmetry
+    by forcing an ordering on them. This dramatically reduces the search space.
+    Instances of different patterns are never ordered against each other.
 
     Args:
         model: The CP-SAT model
         task_starts: Dictionary of task start variables
         problem: The scheduling problem (must be optimized mode)
+        table: Instance-task table (built from the dictionaries if omitted)
 
     Constraints Added:
-        - Lexicographic ordering of instance start times
+        - Lexicographic ordering of instance start times within each pattern
         - Instance 1 starts before Instance 2, etc.
 
     """
     if not problem.is_optimized_mode or not problem.job_optimized_pattern:
         return
 
-    pattern = problem.job_optimized_pattern
-    instances = problem.job_instances
+    if table is None:
+        table = InstanceTaskTable.from_variables(
+            compile_problem_arrays(problem), task_starts=task_starts
+        )
 
-    if len(instances) < 2:
+    if table.instance_count < 2 or not table.arrays.is_optimized_mode:
         return  # No symmetry to break
 
-    # Sort instances by ID for consistent ordering
-    sorted_instances = sorted(instances, key=lambda x: x.instance_id)
-
-    # For each pair of consecutive instances, ensure lexicographic ordering
-    for i in range(len(sorted_instances) - 1):
-        instance_a = sorted_instances[i]
-        instance_b = sorted_instances[i + 1]
-
-        # Find the first optimized task (assuming optimized tasks are ordered)
-        if pattern.optimized_tasks:
-            first_optimized_task = pattern.optimized_tasks[0]
-
-            # Generate task keys for both instances
-            task_id_a = problem.get_instance_task_id(
-                instance_a.instance_id, first_optimized_task.optimized_task_id
-            )
-            task_id_b = problem.get_instance_task_id(
-                instance_b.instance_id, first_optimized_task.optimized_task_id
-            )
+    unit_ids = table.arrays.unit_ids
+    for pattern in range(len(table.arrays.pattern_ids)):
+        # Sort instances by ID for consistent ordering
+        sorted_instances = sorted(
+            table.arrays.pattern_units(pattern), key=unit_ids.__getitem__
+        )
 
-            key_a = (instance_a.instance_id, task_id_a)
-            key_b = (instance_b.instance_id, task_id_b)
+        # For each pair of consecutive instances, ensure lexicographic ordering
+        # of their first optimized task (assuming optimized tasks are ordered)
+        for instance_a, instance_b in zip(
+            sorted_instances, sorted_instances[1:], strict=False
+        ):
+            if not table.instance_tasks(instance_a):
+                continue  # Empty pattern
+            start_a = table.starts[table.task(instance_a, 0)]
+            start_b = table.starts[table.task(instance_b, 0)]
 
-            # Instance A's first task must start no later than Instance B's first task
-            if key_a in task_starts and key_b in task_starts:
-                model.Add(task_starts[key_a] <= task_starts[key_b])
+            # Instance A's first task must start no later than Instance B's
+            if start_a is not None and start_b is not None:
+                model.Add(start_a <= start_b)
 
 
 def add_optimized_redundant_constraints(
@@ -258,6 +232,7 @@ def add_optimized_redundant_constraints(
     task_ends: dict,
     problem: SchedulingProblem,
     horizon: int,
+    table: InstanceTaskTable | None = None,
 ) -> None:
     """Add redundant constraints to help solver prune search space.
 
@@ -272,6 +247,7 @@ def add_optimized_redundant_constraints(
         task_ends: Dictionary of task end variables
         problem: The scheduling problem (must be optimized mode)
         horizon: Problem horizon (maximum time units)
+        table: Instance-task table (built from the dictionaries if omitted)
 
     Constraints Added:
         - Total work lower bound on makespan
@@ -281,33 +257,23 @@ def add_optimized_redundant_constraints(
     if not problem.is_optimized_mode or not problem.job_optimized_pattern:
         return
 
-    pattern = problem.job_optimized_pattern
-    instances = problem.job_instances
+    if table is None:
+        table = InstanceTaskTable.from_variables(
+            compile_problem_arrays(problem), task_ends=task_ends
+        )
 
     # Calculate total work required
-    pattern_min_work = sum(
-        min(mode.duration_time_units for mode in optimized_task.modes)
-        for optimized_task in pattern.optimized_tasks
-    )
-    total_min_work = pattern_min_work * len(instances)
+    total_min_work = int(table.arrays.min_duration.sum())
 
     # Calculate total machine capacity
-    total_capacity = sum(machine.capacity for machine in problem.machines)
+    total_capacity = int(table.arrays.machine_capacity.sum())
 
     if total_capacity > 0:
         # Theoretical minimum makespan based on work and capacity
         theoretical_min = (total_min_work + total_capacity - 1) // total_capacity
 
         # Find all task end times
-        all_ends = []
-        for instance in instances:
-            for optimized_task in pattern.optimized_tasks:
-                instance_task_id = problem.get_instance_task_id(
-                    instance.instance_id, optimized_task.optimized_task_id
-                )
-                task_key = (instance.instance_id, instance_task_id)
-                if task_key in task_ends:
-                    all_ends.append(task_ends[task_key])
+        all_ends = table.all_ends()
 
         # Add constraint: makespan >= theoretical minimum
         if all_ends and theoretical_min > 0:
@@ -5,7 +5,9 @@ Handles task ordering and dependencies.
 
 from ortools.sat.python import cp_model
 
+from src.solver.core.instance_task_table import InstanceTaskTable
 from src.solver.models.problem import SchedulingProblem
+from src.solver.models.problem_arrays import compile_problem_arrays
 
 
 def add_precedence_constraints(
@@ -13,6 +15,7 @@ def add_precedence_constraints(
     task_starts: dict,
     task_ends: dict,
     problem: SchedulingProblem,
+    table: InstanceTaskTable | None = None,
 ) -> None:
     """Add precedence constraints between tasks.
 
@@ -21,21 +24,22 @@ def add_precedence_constraints(
         task_starts: Dictionary of task start variables
         task_ends: Dictionary of task end variables
         problem: The scheduling problem
+        table: Instance-task table (built from the dictionaries if omitted)
 
     Constraints Added:
         - successor must start after predecessor ends
 
     """
-    for precedence in problem.precedences:
-        # Find the job IDs for each task
-        pred_task = problem.get_task(precedence.predecessor_task_id)
-        succ_task = problem.get_task(precedence.successor_task_id)
+    if table is None:
+        table = InstanceTaskTable.from_variables(
+            compile_problem_arrays(problem),
+            task_starts=task_starts,
+            task_ends=task_ends,
+        )
 
-        if pred_task and succ_task:
-            pred_key = (pred_task.job_id, pred_task.task_id)
-            succ_key = (succ_task.job_id, succ_task.task_id)
-
-            model.Add(task_starts[succ_key] >= task_ends[pred_key])
+    # Precedences between known tasks, in problem order
+    for pred, succ in table.arrays.precedence_pairs.tolist():
+        model.Add(table.starts[succ] >= table.ends[pred])
 
 
 def add_redundant_precedence_constraints(
@@ -43,6 +47,7 @@ def add_redundant_precedence_constraints(
     task_starts: dict,
     task_ends: dict,
     problem: SchedulingProblem,
+    table: InstanceTaskTable | None = None,
 ) -> None:
     """Add redundant transitive precedence constraints to help solver.
 
@@ -51,36 +56,23 @@ def add_redundant_precedence_constraints(
         task_starts: Dictionary of task start variables
         task_ends: Dictionary of task end variables
         problem: The scheduling problem
+        table: Instance-task table (built from the dictionaries if omitted)
 
     Constraints Added:
         - If A->B and B->C, add A->C constraint
 
     """
-    # Build adjacency lists for precedence graph
-    successors: dict[str, list[str]] = {}
-    for prec in problem.precedences:
-        if prec.predecessor_task_id not in successors:
-            successors[prec.predecessor_task_id] = []
-        successors[prec.predecessor_task_id].append(prec.successor_task_id)
+    if table is None:
+        table = InstanceTaskTable.from_variables(
+            compile_problem_arrays(problem),
+            task_starts=task_starts,
+            task_ends=task_ends,
+        )
+    arrays = table.arrays
 
     # Find transitive relationships (limited depth to avoid explosion)
-    for task_a_id in successors:
-        task_a = problem.get_task(task_a_id)
-        if not task_a:
-            continue
-
-        for task_b_id in successors.get(task_a_id, []):
-            task_b = problem.get_task(task_b_id)
-            if not task_b:
-                continue
-
-            for task_c_id in successors.get(task_b_id, []):
-                task_c = problem.get_task(task_c_id)
-                if not task_c:
-                    continue
-
+    for task_a in range(arrays.task_count):
+        for task_b in arrays.successors(task_a):
+            for task_c in arrays.successors(task_b):
                 # Add transitive constraint A -> C
-                key_a = (task_a.job_id, task_a.task_id)
-                key_c = (task_c.job_id, task_c.task_id)
-
-                model.Add(task_starts[key_c] >= task_ends[key_a])
+                model.Add(table.starts[task_c] >= table.ends[task_a])
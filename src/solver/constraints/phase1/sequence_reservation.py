@@ -8,7 +8,9 @@ from collections import defaultdict
 
 from ortools.sat.python import cp_model
 
+from src.solver.core.instance_task_table import InstanceTaskTable
 from src.solver.models.problem import SchedulingProblem
+from src.solver.models.problem_arrays import compile_problem_arrays
 
 # Type aliases from TEMPLATES.md
 TaskKey = tuple[str, str]  # (job_id, task_id)
@@ -25,6 +27,7 @@ def create_sequence_job_intervals(
     task_intervals: TaskIntervalDict | InstanceTaskIntervalDict,
     problem: SchedulingProblem,
     horizon: int,
+    table: InstanceTaskTable | None = None,
 ) -> SequenceJobIntervalDict:
     """Create sequence reservation intervals for each (sequence, job) pair.
 
@@ -42,6 +45,7 @@ def create_sequence_job_intervals(
         task_intervals: Dictionary of task interval variables (unique or optimized)
         problem: The scheduling problem with sequence information
         horizon: Maximum time horizon
+        table: Instance-task table (built from the dictionaries if omitted)
 
     Returns:
         Dictionary mapping (sequence_id, job_id) to reservation intervals
@@ -49,43 +53,41 @@ def create_sequence_job_intervals(
     Performance: O(tasks) - single pass through tasks to group by sequence
 
     """
-    # Group tasks by (sequence_id, job_id) for tasks with sequences
-    sequence_job_tasks: dict[SequenceJobKey, list[TaskKey | InstanceTaskKey]] = (
-        defaultdict(list)
-    )
-
+    # Sequence of every pattern task (optimized) or job task (unique mode)
     if problem.is_optimized_mode and problem.job_optimized_pattern:
-        # Optimized mode: iterate over instances and optimized tasks
-        for instance in problem.job_instances:
-            for optimized_task in problem.job_optimized_pattern.optimized_tasks:
-                if optimized_task.sequence_id:  # Only tasks that belong to sequences
-                    sequence_job_key = (
-                        optimized_task.sequence_id,
-                        instance.instance_id,
-                    )
-                    instance_task_id = problem.get_instance_task_id(
-                        instance.instance_id, optimized_task.optimized_task_id
-                    )
-                    task_key = (instance.instance_id, instance_task_id)
-                    sequence_job_tasks[sequence_job_key].append(task_key)
+        task_sequences = [
+            optimized_task.sequence_id
+            for instance in problem.job_instances
+            for optimized_task in problem.instance_pattern(instance).optimized_tasks
+        ]
     else:
-        # Unique mode: iterate over jobs and tasks
-        for job in problem.jobs:
-            for task in job.tasks:
-                if task.sequence_id:  # Only tasks that belong to sequences
-                    sequence_job_key = (task.sequence_id, job.job_id)
-                    task_key = (job.job_id, task.task_id)
-                    sequence_job_tasks[sequence_job_key].append(task_key)
+        task_sequences = [
+            task.sequence_id for job in problem.jobs for task in job.tasks
+        ]
+
+    if not any(task_sequences):
+        return {}
+
+    if table is None:
+        table = InstanceTaskTable.from_variables(
+            compile_problem_arrays(problem), task_intervals=task_intervals
+        )
+
+    # Group task intervals by (sequence_id, job_id) for tasks with sequences
+    sequence_job_tasks: dict[SequenceJobKey, list[cp_model.IntervalVar]] = defaultdict(
+        list
+    )
+    for task, sequence_id in enumerate(task_sequences):
+        if sequence_id:  # Only tasks that belong to sequences
+            unit_id = table.keys[task][0]
+            sequence_job_tasks[(sequence_id, unit_id)].append(table.intervals[task])
 
     sequence_intervals: SequenceJobIntervalDict = {}
 
-    for (seq_id, entity_id), task_keys in sequence_job_tasks.items():
-        if not task_keys:
+    for (seq_id, entity_id), task_interval_vars in sequence_job_tasks.items():
+        if not task_interval_vars:
             continue
 
-        # Get task intervals for this sequence-entity combination
-        task_interval_vars = [task_intervals[key] for key in task_keys]
-
         # Create variables for sequence reservation bounds
         # entity_id is either job_id (legacy) or instance_id (template)
         start_var = model.NewIntVar(0, horizon, f"seq_start_{entity_id}_{seq_id}")
@@ -1,22 +1,46 @@
 """Setup time constraints for OR-Tools solver.
 
 Handles sequence-dependent setup times between tasks on the same machine.
+
+Every machine with setup times gets one circuit over its candidate tasks. The
+arc literal ``i -> j`` is true when task j directly follows task i on the
+machine and then forces ``start_j >= end_i + setup(i, j)``, so the setup
+literals follow the actual task order. A task that is not assigned to the
+machine leaves the circuit through its self-loop. A machine of capacity c is
+split into c lanes by c depot nodes chained into the same circuit, so each
+lane is an ordered chain of tasks.
+
+Setup times come from a compiled SetupTable (family matrices plus explicit
+task-pair setup times), read as one task x task matrix per machine.
 """
 
+import logging
+from collections import defaultdict
+
+import numpy as np
 from ortools.sat.python import cp_model
 
+from src.solver.core.lean_model import keeps_names
 from src.solver.models.problem import SchedulingProblem
+from src.solver.models.setup_matrix import SetupTable, as_setup_table
+
+logger = logging.getLogger(__name__)
+
+# Type aliases following TEMPLATES.md centralized patterns
+TaskKey = tuple[str, str]  # (job_id/instance_id, task_id)
+TaskAssignmentKey = tuple[str, str, str]  # (job_id/instance_id, task_id, machine_id)
+SetupTimeDict = dict[tuple[str, str, str], int]  # (task_id, task_id, machine_id)
+SetupTerm = tuple[cp_model.IntVar, int]  # (arc literal, setup time)
 
 
 def add_setup_time_constraints(
     model: cp_model.CpModel,
-    task_starts: dict[tuple[str, str], cp_model.IntVar],
-    task_ends: dict[tuple[str, str], cp_model.IntVar],
-    task_assigned: dict[tuple[str, str, str], cp_model.IntVar],
-    setup_times: dict[tuple[str, str, str], int],
-    _problem: SchedulingProblem,  # Interface requirement, not used in
-    # current implementation
-) -> None:
+    task_starts: dict[TaskKey, cp_model.IntVar],
+    task_ends: dict[TaskKey, cp_model.IntVar],
+    task_assigned: dict[TaskAssignmentKey, cp_model.IntVar],
+    setup_times: SetupTimeDict | SetupTable,
+    problem: SchedulingProblem,
+) -> list[SetupTerm]:
     """Add sequence-dependent setup time constraints between tasks on same machine.
 
     Args:
@@ -24,53 +48,141 @@ def add_setup_time_constraints(
         task_starts: Dictionary of task start variables
         task_ends: Dictionary of task end variables
         task_assigned: Dictionary of task assignment variables
-        setup_times: Dictionary mapping (task1_id, task2_id, machine_id) to setup time
+        setup_times: Compiled SetupTable, or a dictionary mapping
+            (task1_id, task2_id, machine_id) to setup time
         problem: The scheduling problem
 
+    Returns:
+        (arc literal, setup time) for every arc with a positive setup time;
+        their weighted sum is the total setup time of the schedule
+
     Constraints Added:
-        - If task2 follows task1 on same machine: task2.start >= task1.end + setup_time
-        - Uses big-M method with conditional constraints
+        - One AddCircuit per machine that has setup times
+        - If task2 directly follows task1 on the machine:
+          task2.start >= task1.end + setup_time
 
     Performance:
-        - O(n² × m) where n = tasks, m = machines (worst case)
-        - Can be reduced by only considering feasible task sequences
+        - O(n² × m) arcs for n candidate tasks per machine, fewer when task
+          domains rule an order out
+        - No pairwise reified booleans beyond the arc literals
 
     """
-    # Group tasks by machine to reduce iterations
-    machine_tasks: dict[str, list[tuple[str, str]]] = {}
-    for (job_id, task_id, machine_id), _assigned in task_assigned.items():
-        if machine_id not in machine_tasks:
-            machine_tasks[machine_id] = []
-        machine_tasks[machine_id].append((job_id, task_id))
-
-    # For each machine, add setup constraints between task pairs
+    setup_table = as_setup_table(problem, setup_times)
+    setup_machines = setup_table.machine_ids
+
+    # Candidate tasks of every machine with setup times, in assignment order
+    machine_tasks: dict[str, list[TaskKey]] = defaultdict(list)
+    for job_id, task_id, machine_id in task_assigned:
+        if machine_id in setup_machines:
+            machine_tasks[machine_id].append((job_id, task_id))
+
+    setup_terms: list[SetupTerm] = []
+    arc_count = 0
     for machine_id, tasks in machine_tasks.items():
-        for i, (job1, task1) in enumerate(tasks):
-            for j, (job2, task2) in enumerate(tasks):
-                if i == j:  # Skip same task
-                    continue
-
-                # Get setup time for this sequence (default to 0)
-                setup_key = (task1, task2, machine_id)
-                setup_time = setup_times.get(setup_key, 0)
-
-                if setup_time > 0:
-                    # Create boolean for "task1 before task2 on this machine"
-                    before = model.NewBoolVar(f"before_{task1}_{task2}_{machine_id}")
-
-                    # If both assigned to machine AND task1 before task2
-                    both_assigned = model.NewBoolVar(
-                        f"both_{task1}_{task2}_{machine_id}"
-                    )
-                    model.Add(
-                        task_assigned[(job1, task1, machine_id)] >= 1
-                    ).OnlyEnforceIf(both_assigned)
-                    model.Add(
-                        task_assigned[(job2, task2, machine_id)] >= 1
-                    ).OnlyEnforceIf(both_assigned)
-
-                    # If both assigned and task1 before task2, enforce setup time
-                    model.Add(
-                        task_starts[(job2, task2)]
-                        >= task_ends[(job1, task1)] + setup_time
-                    ).OnlyEnforceIf([both_assigned, before])
+        machine = problem.get_machine(machine_id)
+        capacity = machine.capacity if machine else 1
+        terms, arcs = _add_machine_circuit(
+            model,
+            machine_id,
+            tasks,
+            max(1, min(capacity, len(tasks))),
+            task_starts,
+            task_ends,
+            task_assigned,
+            setup_table.pair_matrix(machine_id, [task_id for _, task_id in tasks]),
+        )
+        setup_terms.extend(terms)
+        arc_count += arcs
+
+    logger.info(
+        f"Setup times: {len(machine_tasks)} machine circuit(s), {arc_count} arcs, "
+        f"{len(setup_terms)} with setup"
+    )
+    return setup_terms
+
+
+def _add_machine_circuit(
+    model: cp_model.CpModel,
+    machine_id: str,
+    tasks: list[TaskKey],
+    lanes: int,
+    task_starts: dict[TaskKey, cp_model.IntVar],
+    task_ends: dict[TaskKey, cp_model.IntVar],
+    task_assigned: dict[TaskAssignmentKey, cp_model.IntVar],
+    setups: np.ndarray,
+) -> tuple[list[SetupTerm], int]:
+    """Order the tasks of one machine with a single circuit.
+
+    Nodes ``0 .. lanes - 1`` are depots, node ``lanes + i`` is ``tasks[i]``.
+    Depot k is followed by the first task of lane k, or directly by depot
+    k + 1 when the lane is empty; the last task of a lane returns to any depot.
+    ``setups[i, j]`` is the setup time when ``tasks[j]`` directly follows
+    ``tasks[i]``.
+    """
+    named = keeps_names(model)
+    label = machine_id[:8]
+    setup_rows = setups.tolist()
+    arcs: list[tuple[int, int, cp_model.IntVar]] = []
+    setup_terms: list[SetupTerm] = []
+
+    # Depot chain; for a single lane this is the "machine unused" self-loop
+    for depot in range(lanes):
+        arcs.append(
+            (
+                depot,
+                (depot + 1) % lanes,
+                model.NewBoolVar(f"lane_{label}_{depot}" if named else ""),
+            )
+        )
+
+    bounds = [
+        (_lower_bound(task_ends[task]), _upper_bound(task_starts[task]))
+        for task in tasks
+    ]
+
+    for i, (job_i, task_i) in enumerate(tasks):
+        node_i = lanes + i
+        assigned = task_assigned[(job_i, task_i, machine_id)]
+
+        # Tasks on other machines skip the circuit
+        arcs.append((node_i, node_i, assigned.Not()))
+
+        for depot in range(lanes):
+            first = model.NewBoolVar(f"first_{label}_{task_i[:8]}" if named else "")
+            last = model.NewBoolVar(f"last_{label}_{task_i[:8]}" if named else "")
+            arcs.append((depot, node_i, first))
+            arcs.append((node_i, depot, last))
+
+        earliest_end_i = bounds[i][0]
+        setup_row = setup_rows[i]
+        for j, (job_j, task_j) in enumerate(tasks):
+            if i == j:
+                continue
+            setup_time = setup_row[j]
+
+            # j can never directly follow i within the task domains
+            if earliest_end_i + setup_time > bounds[j][1]:
+                continue
+
+            arc = model.NewBoolVar(
+                f"next_{label}_{task_i[:8]}_{task_j[:8]}" if named else ""
+            )
+            arcs.append((node_i, lanes + j, arc))
+            model.Add(
+                task_starts[(job_j, task_j)] >= task_ends[(job_i, task_i)] + setup_time
+            ).OnlyEnforceIf(arc)
+            if setup_time > 0:
+                setup_terms.append((arc, setup_time))
+
+    model.AddCircuit(arcs)
+    return setup_terms, len(arcs)
+
+
+def _lower_bound(var: cp_model.IntVar) -> int:
+    """Smallest value in a variable's domain."""
+    return var.Proto().domain[0]
+
+
+def _upper_bound(var: cp_model.IntVar) -> int:
+    """Largest value in a variable's domain."""
+    return var.Proto().domain[-1]
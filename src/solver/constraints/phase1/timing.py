@@ -35,7 +35,7 @@ def add_task_duration_constraints(
     if problem.is_optimized_mode and problem.job_optimized_pattern:
         # Optimized mode: iterate over instances and optimized tasks
         for instance in problem.job_instances:
-            for optimized_task in problem.job_optimized_pattern.optimized_tasks:
+            for optimized_task in problem.instance_pattern(instance).optimized_tasks:
                 instance_task_id = problem.get_instance_task_id(
                     instance.instance_id, optimized_task.optimized_task_id
                 )
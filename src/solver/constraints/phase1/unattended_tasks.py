@@ -1,156 +1,68 @@
 """Constraints for unattended task scheduling.
 
-Handles dual resource modeling: labor setup during business hours + 24/7 execution.
+Handles dual resource modeling: labor setup during working time + 24/7 execution.
+Working time comes from the work cell calendars (see
+src.solver.models.working_calendar).
 """
 
+import logging
+
 from ortools.sat.python import cp_model
 
+from src.solver.core.lean_model import keeps_names
 from src.solver.models.problem import SchedulingProblem
+from src.solver.models.problem_arrays import ProblemArrays
+from src.solver.models.working_calendar import TaskCalendars
+
+logger = logging.getLogger(__name__)
 
 
 def add_business_hours_setup_constraints(
     model: cp_model.CpModel,
     task_starts: dict[tuple[str, str], cp_model.IntVar],
-    task_ends: dict[tuple[str, str], cp_model.IntVar],
-    problem: SchedulingProblem,
+    task_assigned: dict[tuple[str, str, str], cp_model.IntVar],
+    task_calendars: TaskCalendars,
+    arrays: ProblemArrays,
 ) -> None:
-    """Add business hours constraints for unattended task setup.
+    """Add working calendar constraints for unattended task setup.
 
     Mathematical formulation:
-        For unattended tasks with setup phase:
-        setup_start >= business_hours_start
-        setup_end <= business_hours_end
-        Where business hours: Mon-Fri 7am-4pm (28-68 time units daily)
+        For unattended tasks with setup phase on machine m:
+        setup_start in StartDomain(calendar(cell(m)), duration(m))
+        Where StartDomain holds every start whose setup fits in one working
+        window of the work cell's calendar (shifts minus holidays)
 
     Business logic:
-        Unattended tasks require operator setup during business hours only.
+        Unattended tasks require operator setup during working time only.
         Machine execution can continue 24/7 after setup completion.
 
     Constraints added:
-        - Setup tasks must start/end within business hours windows
-        - Business hours: Monday-Friday 7am-4pm (time units 28-68 per day)
-        - Weekend setup is prohibited (Saturday-Sunday)
+        - None when all machines of a task allow the same starts: the start
+          variable is created from TaskCalendar.start_domain
+        - Otherwise one enforced domain constraint per machine:
+          assigned(task, m) => setup_start in domain(m)
 
-    Performance: O(n) where n = number of unattended tasks with setup
+    Performance: O(n x m) for n setup tasks whose m machines follow
+    different calendars; no auxiliary booleans
     """
-    if problem.is_optimized_mode:
-        _add_optimized_business_hours_constraints(
-            model, task_starts, task_ends, problem
-        )
-    else:
-        _add_unique_business_hours_constraints(model, task_starts, task_ends, problem)
-
-
-def _add_optimized_business_hours_constraints(
-    model: cp_model.CpModel,
-    task_starts: dict[tuple[str, str], cp_model.IntVar],
-    task_ends: dict[tuple[str, str], cp_model.IntVar],
-    problem: SchedulingProblem,
-) -> None:
-    """Add business hours constraints for optimized mode problems."""
-    if not problem.job_optimized_pattern:
-        return
-
-    # Business hours: 7am-4pm = time units 28-68 (7*4 to 16*4) per day
-    # Daily cycle: 96 time units (24 hours * 4 units/hour)
-    business_start_offset = 28  # 7am
-    business_end_offset = 68  # 4pm
-    daily_cycle = 96  # 24 hours
-
-    for instance in problem.job_instances:
-        for optimized_task in problem.job_optimized_pattern.optimized_tasks:
-            # Only apply to setup tasks for unattended processes
-            if not (optimized_task.is_setup and optimized_task.is_unattended):
-                continue
-
-            instance_task_id = problem.get_instance_task_id(
-                instance.instance_id, optimized_task.optimized_task_id
-            )
-            task_key = (instance.instance_id, instance_task_id)
-
-            if task_key not in task_starts:
-                continue
-
-            start_var = task_starts[task_key]
-            end_var = task_ends[task_key]
-
-            # Create business day choice variables - exactly one must be true
-            business_day_choices = []
-
-            for day in range(5):  # Only weekdays (Monday-Friday)
-                day_start = day * daily_cycle
-                business_day_start = day_start + business_start_offset
-                business_day_end = day_start + business_end_offset
-
-                # Boolean variable for whether task is scheduled on this business day
-                scheduled_this_day = model.NewBoolVar(
-                    f"business_day_{day}_{instance.instance_id}_{optimized_task.optimized_task_id}"
-                )
-                business_day_choices.append(scheduled_this_day)
-
-                # If scheduled on this day, must be within business hours
-                model.Add(start_var >= business_day_start).OnlyEnforceIf(
-                    scheduled_this_day
-                )
-                model.Add(start_var < day_start + daily_cycle).OnlyEnforceIf(
-                    scheduled_this_day
-                )
-                model.Add(end_var <= business_day_end).OnlyEnforceIf(scheduled_this_day)
-
-            # Must be scheduled on exactly one business day
-            model.AddExactlyOne(business_day_choices)
-
-
-def _add_unique_business_hours_constraints(
-    model: cp_model.CpModel,
-    task_starts: dict[tuple[str, str], cp_model.IntVar],
-    task_ends: dict[tuple[str, str], cp_model.IntVar],
-    problem: SchedulingProblem,
-) -> None:
-    """Add business hours constraints for unique mode job-based problems."""
-    # Business hours: 7am-4pm = time units 28-68 per day
-    business_start_offset = 28
-    business_end_offset = 68
-    daily_cycle = 96
-
-    for job in problem.jobs:
-        for task in job.tasks:
-            # Only apply to setup tasks for unattended processes
-            if not (task.is_setup and task.is_unattended):
-                continue
-
-            task_key = (job.job_id, task.task_id)
-            if task_key not in task_starts:
+    enforced = 0
+    for task, calendar in task_calendars.items():
+        start_var = task_starts.get(arrays.task_keys[task])
+        if start_var is None:
+            continue
+
+        for machine, domain in calendar.machine_domains.items():
+            literal = task_assigned.get(arrays.assignment_key(task, machine))
+            if literal is None:
                 continue
+            model.AddLinearExpressionInDomain(start_var, domain).OnlyEnforceIf(literal)
+            enforced += 1
 
-            start_var = task_starts[task_key]
-            end_var = task_ends[task_key]
-
-            # Create business day choice variables - exactly one must be true
-            business_day_choices = []
-
-            for day in range(5):  # Only weekdays (Monday-Friday)
-                day_start = day * daily_cycle
-                business_day_start = day_start + business_start_offset
-                business_day_end = day_start + business_end_offset
-
-                # Boolean variable for whether task is scheduled on this business day
-                scheduled_this_day = model.NewBoolVar(
-                    f"business_day_{day}_{job.job_id}_{task.task_id}"
-                )
-                business_day_choices.append(scheduled_this_day)
-
-                # If scheduled on this day, must be within business hours
-                model.Add(start_var >= business_day_start).OnlyEnforceIf(
-                    scheduled_this_day
-                )
-                model.Add(start_var < day_start + daily_cycle).OnlyEnforceIf(
-                    scheduled_this_day
-                )
-                model.Add(end_var <= business_day_end).OnlyEnforceIf(scheduled_this_day)
-
-            # Must be scheduled on exactly one business day
-            model.AddExactlyOne(business_day_choices)
+    if task_calendars:
+        logger.info(
+            f"Calendar constraints: {len(task_calendars)} setup tasks, "
+            f"{enforced} machine-specific domains"
+        )
 
 
 def add_unattended_execution_constraints(
@@ -198,7 +110,7 @@ def _add_optimized_execution_constraints(
         setup_tasks = []
         execution_tasks = []
 
-        for optimized_task in problem.job_optimized_pattern.optimized_tasks:
+        for optimized_task in problem.instance_pattern(instance).optimized_tasks:
             instance_task_id = problem.get_instance_task_id(
                 instance.instance_id, optimized_task.optimized_task_id
             )
@@ -284,10 +196,11 @@ def add_weekend_optimization_constraints(
     """
     weekend_start_day_5 = 5 * 96  # Saturday start
     weekend_start_day_6 = 6 * 96  # Sunday start
+    named = keeps_names(model)
 
     if problem.is_optimized_mode and problem.job_optimized_pattern:
         for instance in problem.job_instances:
-            for optimized_task in problem.job_optimized_pattern.optimized_tasks:
+            for optimized_task in problem.instance_pattern(instance).optimized_tasks:
                 if not optimized_task.is_unattended or optimized_task.is_setup:
                     continue
 
@@ -310,9 +223,13 @@ def add_weekend_optimization_constraints(
                 # Create weekend start incentive variables
                 weekend_start_sat = model.NewBoolVar(
                     f"weekend_start_sat_{instance.instance_id}_{optimized_task.optimized_task_id}"
+                    if named
+                    else ""
                 )
                 weekend_start_sun = model.NewBoolVar(
                     f"weekend_start_sun_{instance.instance_id}_{optimized_task.optimized_task_id}"
+                    if named
+                    else ""
                 )
 
                 # Define weekend start conditions
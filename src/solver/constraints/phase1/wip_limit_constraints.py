@@ -6,7 +6,9 @@ monitoring capabilities and automatic flow balancing.
 
 from ortools.sat.python import cp_model
 
+from src.solver.core.instance_task_table import InstanceTaskTable
 from src.solver.models.problem import SchedulingProblem, WorkCell
+from src.solver.models.problem_arrays import compile_problem_arrays
 
 # Type aliases following TEMPLATES.md centralized patterns
 TaskKey = tuple[str, str]  # (job_id/instance_id, task_id)
@@ -22,6 +24,8 @@ def add_wip_limit_constraints(
     task_assigned: TaskAssignmentDict,
     problem: SchedulingProblem,
     wip_limits: dict[str, int] | None = None,
+    table: InstanceTaskTable | None = None,
+    monitoring_model: cp_model.CpModel | None = None,
 ) -> WipMonitoringDict:
     """Add configurable WIP limits per work cell for flow control.
 
@@ -39,6 +43,9 @@ def add_wip_limit_constraints(
         task_assigned: Dictionary of task assignment variables
         problem: The scheduling problem with work cell definitions
         wip_limits: Optional WIP limits per cell_id (defaults to capacity)
+        table: Instance-task table (built from the dictionaries if omitted)
+        monitoring_model: Model that receives the monitoring variables and the
+            flow balancing (default: model); see ModelManifest.building()
 
     Returns:
         Dictionary of monitoring variables for real-time WIP tracking
@@ -55,11 +62,23 @@ def add_wip_limit_constraints(
     """
     if problem.is_optimized_mode and problem.job_optimized_pattern:
         return add_optimized_wip_constraints(
-            model, task_intervals, task_assigned, problem, wip_limits
+            model,
+            task_intervals,
+            task_assigned,
+            problem,
+            wip_limits,
+            table,
+            monitoring_model,
         )
     else:
         return add_unique_wip_constraints(
-            model, task_intervals, task_assigned, problem, wip_limits
+            model,
+            task_intervals,
+            task_assigned,
+            problem,
+            wip_limits,
+            table,
+            monitoring_model,
         )
 
 
@@ -69,6 +88,8 @@ def add_optimized_wip_constraints(
     task_assigned: TaskAssignmentDict,
     problem: SchedulingProblem,
     wip_limits: dict[str, int] | None = None,
+    table: InstanceTaskTable | None = None,
+    monitoring_model: cp_model.CpModel | None = None,
 ) -> WipMonitoringDict:
     """Add WIP limits for optimized mode job instances.
 
@@ -78,11 +99,22 @@ def add_optimized_wip_constraints(
         task_assigned: Dictionary of task assignment variables
         problem: The scheduling problem with optimized pattern information
         wip_limits: Optional WIP limits per cell_id
+        table: Instance-task table (built from the dictionaries if omitted)
+        monitoring_model: Model that receives the monitoring variables and the
+            flow balancing (default: model); see ModelManifest.building()
 
     Returns:
         Dictionary of monitoring variables for WIP tracking
 
     """
+    if table is None:
+        table = InstanceTaskTable.from_variables(
+            compile_problem_arrays(problem),
+            task_intervals=task_intervals,
+            task_assigned=task_assigned,
+        )
+
+    monitoring_model = monitoring_model or model
     monitoring_vars = {}
 
     for work_cell in problem.work_cells:
@@ -92,7 +124,7 @@ def add_optimized_wip_constraints(
             continue
 
         cell_intervals, cell_demands = _collect_optimized_workcell_intervals(
-            work_cell, task_intervals, task_assigned, problem, model
+            work_cell, task_intervals, task_assigned, problem, model, table
         )
 
         if cell_intervals:
@@ -100,11 +132,11 @@ def add_optimized_wip_constraints(
                 model, cell_intervals, cell_demands, wip_limit
             )
             cell_monitoring = _create_wip_monitoring_variables(
-                model, work_cell.cell_id, cell_intervals, wip_limit
+                monitoring_model, work_cell.cell_id, cell_intervals, wip_limit
             )
             monitoring_vars[work_cell.cell_id] = cell_monitoring
 
-    _add_flow_balancing_constraints(model, monitoring_vars, problem)
+    _add_flow_balancing_constraints(monitoring_model, monitoring_vars, problem)
     return monitoring_vars
 
 
@@ -114,6 +146,8 @@ def add_unique_wip_constraints(
     task_assigned: TaskAssignmentDict,
     problem: SchedulingProblem,
     wip_limits: dict[str, int] | None = None,
+    table: InstanceTaskTable | None = None,
+    monitoring_model: cp_model.CpModel | None = None,
 ) -> WipMonitoringDict:
     """Add WIP limits for unique mode job structure.
 
@@ -123,11 +157,22 @@ def add_unique_wip_constraints(
         task_assigned: Dictionary of task assignment variables
         problem: The scheduling problem with job information
         wip_limits: Optional WIP limits per cell_id
+        table: Instance-task table (built from the dictionaries if omitted)
+        monitoring_model: Model that receives the monitoring variables and the
+            flow balancing (default: model); see ModelManifest.building()
 
     Returns:
         Dictionary of monitoring variables for WIP tracking
 
     """
+    if table is None:
+        table = InstanceTaskTable.from_variables(
+            compile_problem_arrays(problem),
+            task_intervals=task_intervals,
+            task_assigned=task_assigned,
+        )
+
+    monitoring_model = monitoring_model or model
     monitoring_vars = {}
 
     for work_cell in problem.work_cells:
@@ -137,7 +182,7 @@ def add_unique_wip_constraints(
             continue
 
         cell_intervals, cell_demands = _collect_unique_workcell_intervals(
-            work_cell, task_intervals, task_assigned, problem, model
+            work_cell, task_intervals, task_assigned, problem, model, table
         )
 
         if cell_intervals:
@@ -145,11 +190,11 @@ def add_unique_wip_constraints(
                 model, cell_intervals, cell_demands, wip_limit
             )
             cell_monitoring = _create_wip_monitoring_variables(
-                model, work_cell.cell_id, cell_intervals, wip_limit
+                monitoring_model, work_cell.cell_id, cell_intervals, wip_limit
             )
             monitoring_vars[work_cell.cell_id] = cell_monitoring
 
-    _add_flow_balancing_constraints(model, monitoring_vars, problem)
+    _add_flow_balancing_constraints(monitoring_model, monitoring_vars, problem)
     return monitoring_vars
 
 
@@ -335,6 +380,7 @@ def _collect_optimized_workcell_intervals(
     task_assigned: TaskAssignmentDict,
     problem: SchedulingProblem,
     model: cp_model.CpModel,
+    table: InstanceTaskTable | None = None,
 ) -> tuple[list[cp_model.IntervalVar], list[int]]:
     """Collect intervals for optimized mode instances in work cell.
 
@@ -344,37 +390,22 @@ def _collect_optimized_workcell_intervals(
         task_assigned: Dictionary of task assignment variables
         problem: The scheduling problem with optimized pattern data
         model: The CP-SAT model
+        table: Instance-task table (built from the dictionaries if omitted)
 
     Returns:
         Tuple of (intervals, demands) for the work cell
 
     """
-    cell_intervals: list[cp_model.IntervalVar] = []
-    cell_demands: list[int] = []
-
-    for instance in problem.job_instances:
-        if problem.job_optimized_pattern is None:
-            continue
-        for optimized_task in problem.job_optimized_pattern.optimized_tasks:
-            instance_task_id = problem.get_instance_task_id(
-                instance.instance_id, optimized_task.optimized_task_id
-            )
-            task_key = (instance.instance_id, instance_task_id)
-
-            if task_key in task_intervals:
-                _add_task_intervals_for_workcell_machines(
-                    work_cell,
-                    optimized_task.eligible_machines,
-                    task_key,
-                    task_intervals,
-                    task_assigned,
-                    cell_intervals,
-                    cell_demands,
-                    f"{instance.instance_id}_{optimized_task.optimized_task_id}",
-                    model,
-                )
-
-    return cell_intervals, cell_demands
+    if problem.job_optimized_pattern is None:
+        return [], []
+
+    if table is None:
+        table = InstanceTaskTable.from_variables(
+            compile_problem_arrays(problem),
+            task_intervals=task_intervals,
+            task_assigned=task_assigned,
+        )
+    return _collect_table_workcell_intervals(work_cell, table, model)
 
 
 def _collect_unique_workcell_intervals(
@@ -383,6 +414,7 @@ def _collect_unique_workcell_intervals(
     task_assigned: TaskAssignmentDict,
     problem: SchedulingProblem,
     model: cp_model.CpModel,
+    table: InstanceTaskTable | None = None,
 ) -> tuple[list[cp_model.IntervalVar], list[int]]:
     """Collect intervals for unique mode jobs in work cell.
 
@@ -392,6 +424,32 @@ def _collect_unique_workcell_intervals(
         task_assigned: Dictionary of task assignment variables
         problem: The scheduling problem with job data
         model: The CP-SAT model
+        table: Instance-task table (built from the dictionaries if omitted)
+
+    Returns:
+        Tuple of (intervals, demands) for the work cell
+
+    """
+    if table is None:
+        table = InstanceTaskTable.from_variables(
+            compile_problem_arrays(problem),
+            task_intervals=task_intervals,
+            task_assigned=task_assigned,
+        )
+    return _collect_table_workcell_intervals(work_cell, table, model)
+
+
+def _collect_table_workcell_intervals(
+    work_cell: WorkCell,
+    table: InstanceTaskTable,
+    model: cp_model.CpModel,
+) -> tuple[list[cp_model.IntervalVar], list[int]]:
+    """Collect intervals of the tasks (jobs or instances) of a work cell.
+
+    Args:
+        work_cell: The work cell to collect intervals for
+        table: Instance-task table holding task intervals and assignments
+        model: The CP-SAT model
 
     Returns:
         Tuple of (intervals, demands) for the work cell
@@ -400,22 +458,23 @@ def _collect_unique_workcell_intervals(
     cell_intervals: list[cp_model.IntervalVar] = []
     cell_demands: list[int] = []
 
-    for job in problem.jobs:
-        for task in job.tasks:
-            task_key = (job.job_id, task.task_id)
-
-            if task_key in task_intervals:
-                _add_task_intervals_for_workcell_machines(
-                    work_cell,
-                    task.eligible_machines,
-                    task_key,
-                    task_intervals,
-                    task_assigned,
-                    cell_intervals,
-                    cell_demands,
-                    f"{job.job_id}_{task.task_id}",
-                    model,
-                )
+    machine_index = table.arrays.machine_index
+    cell_machines = [
+        machine_index[machine.resource_id]
+        for machine in work_cell.machines
+        if machine.resource_id in machine_index
+    ]
+
+    for task in range(table.task_count):
+        if table.intervals[task] is not None:
+            _add_task_intervals_for_workcell_machines(
+                table,
+                task,
+                cell_machines,
+                cell_intervals,
+                cell_demands,
+                model,
+            )
 
     return cell_intervals, cell_demands
 
@@ -444,33 +503,22 @@ def _collect_workcell_task_intervals(
 
 
 def _add_task_intervals_for_workcell_machines(
-    work_cell: WorkCell,
-    eligible_machines: list[str],
-    task_key: TaskKey,
-    task_intervals: TaskIntervalDict,
-    task_assigned: TaskAssignmentDict,
+    table: InstanceTaskTable,
+    task: int,
+    cell_machines: list[int],
     cell_intervals: list[cp_model.IntervalVar],
     cell_demands: list[int],
-    task_name: str,
     model: cp_model.CpModel,
 ) -> None:
     """Add task intervals for machines in the work cell."""
-    for machine in work_cell.machines:
-        if machine.resource_id in eligible_machines:
-            assign_key = (task_key[0], task_key[1], machine.resource_id)
-
-            if assign_key in task_assigned:
-                # Create optional interval active only when assigned to this machine
-                optional_interval = model.NewOptionalIntervalVar(
-                    task_intervals[task_key].StartExpr(),
-                    task_intervals[task_key].SizeExpr(),
-                    task_intervals[task_key].EndExpr(),
-                    task_assigned[assign_key],
-                    f"wip_{work_cell.cell_id[:6]}_{task_name[:10]}_{machine.resource_id[:6]}",
-                )
-
-                cell_intervals.append(optional_interval)
-                cell_demands.append(1)  # Each task contributes 1 to WIP
+    for machine in cell_machines:
+        # Interval active only when assigned to this machine, shared via the
+        # table with the machine and work cell capacity constraints
+        optional_interval = table.optional_interval(model, task, machine)
+
+        if optional_interval is not None:
+            cell_intervals.append(optional_interval)
+            cell_demands.append(1)  # Each task contributes 1 to WIP
 
 
 def _create_wip_monitoring_variables(
@@ -7,7 +7,10 @@ machine capacities.
 
 from ortools.sat.python import cp_model
 
+from src.solver.constraints.phase1.fixed_intervals import FixedOccupancy
+from src.solver.core.instance_task_table import InstanceTaskTable
 from src.solver.models.problem import SchedulingProblem, WorkCell
+from src.solver.models.problem_arrays import compile_problem_arrays
 
 
 def add_workcell_capacity_constraints(
@@ -16,6 +19,8 @@ def add_workcell_capacity_constraints(
     task_assigned: dict[tuple[str, str, str], cp_model.IntVar],
     work_cells: list[WorkCell],
     problem: SchedulingProblem,
+    table: InstanceTaskTable | None = None,
+    fixed: FixedOccupancy | None = None,
 ) -> None:
     """Add WorkCell capacity constraints limiting simultaneous machine usage.
 
@@ -33,16 +38,28 @@ def add_workcell_capacity_constraints(
         task_assigned: Dictionary of task assignment variables
         work_cells: List of WorkCells with capacity limits
         problem: The scheduling problem
+        table: Instance-task table (built from the dictionaries if omitted)
+        fixed: Fixed intervals of occupied machine time (create_fixed_intervals)
 
     Constraints Added:
         - Cumulative constraint per WorkCell limiting active machines
-        - Each machine contributes 1 unit when any task is running on it
+        - Each machine contributes 1 unit when any task is running on it or
+          while one of its fixed intervals blocks it
 
     Performance:
         - Only applies to WorkCells with capacity < machine count
         - O(c × m × t) where c=cells, m=machines per cell, t=tasks
 
     """
+    if table is None:
+        table = InstanceTaskTable.from_variables(
+            compile_problem_arrays(problem),
+            task_intervals=task_intervals,
+            task_assigned=task_assigned,
+        )
+    arrays = table.arrays
+    fixed = fixed or {}
+
     for work_cell in work_cells:
         # Skip if WorkCell can accommodate all machines
         if work_cell.capacity >= work_cell.machine_count:
@@ -52,72 +69,35 @@ def add_workcell_capacity_constraints(
         workcell_intervals = []
         workcell_demands = []
 
-        if problem.is_optimized_mode and problem.job_optimized_pattern:
-            # Optimized mode: iterate over instances and optimized tasks
-            for instance in problem.job_instances:
-                for optimized_task in problem.job_optimized_pattern.optimized_tasks:
-                    instance_task_id = problem.get_instance_task_id(
-                        instance.instance_id, optimized_task.optimized_task_id
-                    )
-                    task_key = (instance.instance_id, instance_task_id)
-
-                    if task_key in task_intervals:
-                        # Check which machines in this WorkCell can run this task
-                        for machine in work_cell.machines:
-                            if machine.resource_id in optimized_task.eligible_machines:
-                                assign_key = (
-                                    instance.instance_id,
-                                    instance_task_id,
-                                    machine.resource_id,
-                                )
-
-                                if assign_key in task_assigned:
-                                    # Create optional interval active only when assigned
-                                    optional_interval = model.NewOptionalIntervalVar(
-                                        task_intervals[task_key].StartExpr(),
-                                        task_intervals[task_key].SizeExpr(),
-                                        task_intervals[task_key].EndExpr(),
-                                        task_assigned[assign_key],
-                                        f"wc_{work_cell.cell_id[:8]}_{instance.instance_id[:8]}_{optimized_task.optimized_task_id[:8]}_{machine.resource_id[:8]}",
-                                    )
-
-                                    workcell_intervals.append(optional_interval)
-                                    workcell_demands.append(
-                                        1
-                                    )  # Each task uses 1 machine
-        else:
-            # Unique mode: iterate over jobs and tasks
-            for job in problem.jobs:
-                for task in job.tasks:
-                    task_key = (job.job_id, task.task_id)
-
-                    if task_key in task_intervals:
-                        # Check which machines in this WorkCell can run this task
-                        for machine in work_cell.machines:
-                            if machine.resource_id in task.eligible_machines:
-                                assign_key = (
-                                    job.job_id,
-                                    task.task_id,
-                                    machine.resource_id,
-                                )
-
-                                if assign_key in task_assigned:
-                                    # Create optional interval active only when assigned
-                                    optional_interval = model.NewOptionalIntervalVar(
-                                        task_intervals[task_key].StartExpr(),
-                                        task_intervals[task_key].SizeExpr(),
-                                        task_intervals[task_key].EndExpr(),
-                                        task_assigned[assign_key],
-                                        f"wc_{work_cell.cell_id[:8]}_{job.job_id[:8]}_{task.task_id[:8]}_{machine.resource_id[:8]}",
-                                    )
-
-                                    workcell_intervals.append(optional_interval)
-                                    workcell_demands.append(
-                                        1
-                                    )  # Each task uses 1 machine
+        cell_machines = [
+            arrays.machine_index[machine.resource_id]
+            for machine in work_cell.machines
+            if machine.resource_id in arrays.machine_index
+        ]
+        cell_eligible = arrays.eligible[:, cell_machines]
+
+        # Tasks (jobs or optimized instances) that can run somewhere in the cell
+        for task in cell_eligible.any(axis=1).nonzero()[0].tolist():
+            interval = table.intervals[task]
+            if interval is None:
+                continue
+
+            # Check which machines in this WorkCell can run this task
+            for column in cell_eligible[task].nonzero()[0].tolist():
+                machine = cell_machines[column]
+                # Interval active only when assigned, shared via the table
+                optional_interval = table.optional_interval(model, task, machine)
+
+                if optional_interval is not None:
+                    workcell_intervals.append(optional_interval)
+                    workcell_demands.append(1)  # Each task uses 1 machine
 
         # Add WorkCell capacity constraint if there are intervals
         if workcell_intervals:
+            for machine in work_cell.machines:
+                for interval, _ in fixed.get(machine.resource_id, []):
+                    workcell_intervals.append(interval)
+                    workcell_demands.append(1)  # Blocked machine uses 1 slot
             model.AddCumulative(
                 workcell_intervals,
                 workcell_demands,
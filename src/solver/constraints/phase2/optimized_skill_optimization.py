@@ -9,7 +9,8 @@ import logging
 
 from ortools.sat.python import cp_model
 
-from src.solver.models.problem import SchedulingProblem
+from src.solver.core.lean_model import keeps_names
+from src.solver.models.problem import JobInstance, OptimizedTask, SchedulingProblem
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +28,25 @@ OptimizedTaskEndDict = dict[InstanceTaskKey, cp_model.IntVar]
 OptimizedTaskAssignmentDict = dict[OptimizedAssignmentKey, cp_model.IntVar]
 
 
+def _optimized_tasks_with_instances(
+    problem: SchedulingProblem,
+) -> list[tuple[OptimizedTask, list[JobInstance]]]:
+    """Every optimized task of every pattern with the instances that run it."""
+    return [
+        (optimized_task, instances)
+        for pattern in problem.job_optimized_patterns
+        for instances in [problem.pattern_instances(pattern)]
+        for optimized_task in pattern.optimized_tasks
+    ]
+
+
 def add_optimized_skill_optimization_constraints(
     model: cp_model.CpModel,
     _task_starts: OptimizedTaskStartDict,
     _task_ends: OptimizedTaskEndDict,
     task_operator_assigned: OptimizedTaskAssignmentDict,
     problem: SchedulingProblem,
+    monitoring_model: cp_model.CpModel | None = None,
 ) -> dict[str, cp_model.IntVar]:
     """Add optimized mode skill optimization constraints for 5-8x performance.
 
@@ -53,6 +67,8 @@ def add_optimized_skill_optimization_constraints(
         task_ends: Optimized task end time variables
         task_operator_assigned: Optimized assignment variables
         problem: Optimized mode scheduling problem
+        monitoring_model: Model that receives the operator utilization
+            balancing (default: model); see ModelManifest.building()
 
     Returns:
         Dictionary mapping optimized_task_id to optimization variables
@@ -76,13 +92,14 @@ def add_optimized_skill_optimization_constraints(
     logger.info("Adding optimized mode skill optimization constraints...")
 
     optimized_optimization_vars: dict[str, cp_model.IntVar] = {}
+    named = keeps_names(model)
     constraints_added = 0
 
     # Optimized task skill optimization
     if not problem.job_optimized_pattern:
         return optimized_optimization_vars
 
-    for optimized_task in problem.job_optimized_pattern.optimized_tasks:
+    for optimized_task, instances in _optimized_tasks_with_instances(problem):
         optimized_task_id = optimized_task.optimized_task_id
 
         # Create optimized pattern-level optimization variable
@@ -96,12 +113,14 @@ def add_optimized_skill_optimization_constraints(
         instance_assignments = []
         instance_efficiency_vars = []
 
-        for instance in problem.job_instances:
+        for instance in instances:
             # Create instance-level efficiency tracking
             instance_efficiency = model.NewIntVar(
                 0,
                 500,  # 0% to 500% per instance
-                f"inst_eff_{instance.instance_id[:8]}_{optimized_task_id[:8]}",
+                f"inst_eff_{instance.instance_id[:8]}_{optimized_task_id[:8]}"
+                if named
+                else "",
             )
             instance_efficiency_vars.append(instance_efficiency)
 
@@ -156,7 +175,7 @@ def add_optimized_skill_optimization_constraints(
 
     # Cross-pattern operator utilization balancing
     constraints_added += _add_operator_utilization_balancing(
-        model, task_operator_assigned, problem
+        monitoring_model or model, task_operator_assigned, problem
     )
 
     # Optimized mode symmetry breaking for identical instances
@@ -204,16 +223,11 @@ def _add_operator_utilization_balancing(
 
     # Create utilization variables for each operator
     operator_utilization = {}
-    optimized_task_count = (
-        len(problem.job_optimized_pattern.optimized_tasks)
-        if problem.job_optimized_pattern
-        else 0
-    )
 
     for operator in problem.operators:
         operator_utilization[operator.operator_id] = model.NewIntVar(
             0,
-            len(problem.job_instances) * optimized_task_count,
+            problem.total_task_count,
             f"op_util_{operator.operator_id[:12]}",
         )
 
@@ -264,14 +278,11 @@ def _add_optimized_symmetry_breaking(
     constraints_added = 0
 
     # Get identical instances (same pattern, same parameters)
-    instances = sorted(problem.job_instances, key=lambda x: x.instance_id)
+    for optimized_task, pattern_instances in _optimized_tasks_with_instances(problem):
+        instances = sorted(pattern_instances, key=lambda x: x.instance_id)
 
-    if len(instances) > 1:
         # Lexicographical ordering for operator assignments
-        if not problem.job_optimized_pattern:
-            return 0
-
-        for optimized_task in problem.job_optimized_pattern.optimized_tasks:
+        if len(instances) > 1:
             optimized_task_id = optimized_task.optimized_task_id
 
             for i in range(len(instances) - 1):
@@ -405,7 +416,7 @@ def add_optimized_cross_training_optimization(
     if not problem.job_optimized_pattern:
         return skill_gap_vars
 
-    for optimized_task in problem.job_optimized_pattern.optimized_tasks:
+    for optimized_task, instances in _optimized_tasks_with_instances(problem):
         optimized_task_id = optimized_task.optimized_task_id
         required_skills = problem.get_required_skills_for_optimized_task(
             optimized_task_id
@@ -414,15 +425,15 @@ def add_optimized_cross_training_optimization(
         for skill in required_skills:
             skill_gap_key = f"{optimized_task_id}_{skill.skill_id}"
             skill_gap_vars[skill_gap_key] = model.NewIntVar(
-                0, len(problem.job_instances), f"skill_gap_{skill_gap_key[:15]}"
+                0, len(instances), f"skill_gap_{skill_gap_key[:15]}"
             )
 
             # Calculate demand vs supply for this skill
-            demand = len(problem.job_instances)  # One per instance
+            demand = len(instances)  # One per instance
 
             # Count qualified operators for this optimized task + skill
             qualified_assignments = []
-            for instance in problem.job_instances:
+            for instance in instances:
                 for operator in problem.operators:
                     if problem.operator_has_skill(operator.operator_id, skill.skill_id):
                         assignment_key = (
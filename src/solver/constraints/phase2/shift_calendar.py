@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 
 from ortools.sat.python import cp_model
 
+from src.solver.core.lean_model import keeps_names
 from src.solver.models.problem import SchedulingProblem
 
 if TYPE_CHECKING:
@@ -63,6 +64,7 @@ def add_operator_shift_constraints(
         return
 
     constraints_added = 0
+    named = keeps_names(model)
 
     # Group shifts by operator for efficient lookup
     operator_shifts: dict[str, list[OperatorShift]] = {}
@@ -107,6 +109,8 @@ def add_operator_shift_constraints(
             # Create boolean variable for this shift compatibility
             shift_compat_var = model.NewBoolVar(
                 f"shift_compat_{operator_id[:6]}_{job_id[:6]}_{task_id[:6]}_{shift.shift_date.day}"
+                if named
+                else ""
             )
 
             # Task must fit within shift window
@@ -124,6 +128,8 @@ def add_operator_shift_constraints(
             # Create a boolean variable for "at least one shift compatible"
             any_shift_compatible = model.NewBoolVar(
                 f"any_shift_{operator_id[:6]}_{job_id[:6]}_{task_id[:6]}"
+                if named
+                else ""
             )
             model.Add(sum(shift_compatibility_vars) >= 1).OnlyEnforceIf(
                 any_shift_compatible
@@ -174,6 +180,7 @@ def add_overtime_constraints(
 
     overtime_vars: dict[str, cp_model.IntVar] = {}
     constraints_added = 0
+    named = keeps_names(model)
 
     if not problem.operator_shifts:
         logger.info("No operator shifts defined, skipping overtime constraints")
@@ -216,7 +223,11 @@ def add_overtime_constraints(
             if task_key in task_starts and task_key in task_ends:
                 # Create intermediate variable for task duration
                 task_duration_var = model.NewIntVar(
-                    0, 1000, f"task_duration_{op_id[:6]}_{job_id[:6]}_{task_id[:6]}"
+                    0,
+                    1000,
+                    f"task_duration_{op_id[:6]}_{job_id[:6]}_{task_id[:6]}"
+                    if named
+                    else "",
                 )
                 model.Add(
                     task_duration_var == task_ends[task_key] - task_starts[task_key]
@@ -224,7 +235,11 @@ def add_overtime_constraints(
 
                 # Create intermediate variable for work time contribution
                 work_contribution = model.NewIntVar(
-                    0, 1000, f"work_contrib_{op_id[:6]}_{job_id[:6]}_{task_id[:6]}"
+                    0,
+                    1000,
+                    f"work_contrib_{op_id[:6]}_{job_id[:6]}_{task_id[:6]}"
+                    if named
+                    else "",
                 )
                 model.Add(work_contribution == task_duration_var).OnlyEnforceIf(
                     assignment_var
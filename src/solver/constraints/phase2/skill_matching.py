@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 
 from ortools.sat.python import cp_model
 
+from src.solver.core.lean_model import keeps_names
 from src.solver.models.problem import SchedulingProblem
 
 if TYPE_CHECKING:
@@ -62,7 +63,7 @@ def add_skill_requirement_constraints(
     if problem.is_optimized_mode and problem.job_optimized_pattern:
         # Optimized mode tasks
         for instance in problem.job_instances:
-            for optimized_task in problem.job_optimized_pattern.optimized_tasks:
+            for optimized_task in problem.instance_pattern(instance).optimized_tasks:
                 task_id = problem.get_instance_task_id(
                     instance.instance_id, optimized_task.optimized_task_id
                 )
@@ -171,6 +172,8 @@ def add_operator_capacity_constraints(
 
     constraints_added = 0
 
+    named = keeps_names(model)
+
     # Group assignments by operator
     operator_intervals: dict[str, list[cp_model.IntervalVar]] = {}
 
@@ -187,7 +190,7 @@ def add_operator_capacity_constraints(
         if task_key in task_starts and task_key in task_ends:
             # Create a duration variable for this interval
             duration_var = model.NewIntVar(
-                1, 100, f"op_duration_{operator_id}_{job_id}_{task_id}"
+                1, 100, f"op_duration_{operator_id}_{job_id}_{task_id}" if named else ""
             )
             # Constrain duration to match task duration
             model.Add(duration_var == task_ends[task_key] - task_starts[task_key])
@@ -197,7 +200,7 @@ def add_operator_capacity_constraints(
                 duration_var,
                 task_ends[task_key],
                 assignment_var,
-                f"operator_interval_{operator_id}_{job_id}_{task_id}",
+                f"operator_interval_{operator_id}_{job_id}_{task_id}" if named else "",
             )
             operator_intervals[operator_id].append(interval)
 
@@ -251,7 +254,7 @@ def add_multi_operator_task_constraints(
     if problem.is_optimized_mode and problem.job_optimized_pattern:
         # Optimized mode tasks
         for instance in problem.job_instances:
-            for optimized_task in problem.job_optimized_pattern.optimized_tasks:
+            for optimized_task in problem.instance_pattern(instance).optimized_tasks:
                 task_id = problem.get_instance_task_id(
                     instance.instance_id, optimized_task.optimized_task_id
                 )
@@ -312,12 +315,13 @@ def add_skill_proficiency_optimization(
 
     task_efficiency_vars = {}
     constraints_added = 0
+    named = keeps_names(model)
 
     # Get all tasks
     task_ids = set()
     if problem.is_optimized_mode and problem.job_optimized_pattern:
         for instance in problem.job_instances:
-            for optimized_task in problem.job_optimized_pattern.optimized_tasks:
+            for optimized_task in problem.instance_pattern(instance).optimized_tasks:
                 task_id = problem.get_instance_task_id(
                     instance.instance_id, optimized_task.optimized_task_id
                 )
@@ -332,7 +336,7 @@ def add_skill_proficiency_optimization(
         task_efficiency_vars[task_id] = model.NewIntVar(
             0,
             500,  # 0% to 500% efficiency (5x with expert operators)
-            f"task_efficiency_{task_id[:12]}",
+            f"task_efficiency_{task_id[:12]}" if named else "",
         )
 
         # Calculate efficiency based on assigned operators
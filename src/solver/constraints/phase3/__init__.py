@@ -7,6 +7,7 @@ including lexicographical optimization, weighted sum, and Pareto-optimal solutio
 from .multi_objective_constraints import (
     add_epsilon_constraint_objective_constraints,
     add_lexicographical_objective_constraints,
+    add_objective_definitions,
     add_weighted_sum_objective_constraints,
     calculate_objective_values,
     create_multi_objective_variables,
@@ -21,6 +22,7 @@ __all__ = [
     "add_lexicographical_objective_constraints",
     "add_weighted_sum_objective_constraints",
     "add_epsilon_constraint_objective_constraints",
+    "add_objective_definitions",
     "calculate_objective_values",
     "create_multi_objective_variables",
     "find_pareto_frontier",
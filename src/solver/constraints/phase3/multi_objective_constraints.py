@@ -18,6 +18,9 @@ from src.solver.models.problem import (
 
 logger = logging.getLogger(__name__)
 
+# Type aliases following TEMPLATES.md centralized patterns
+SetupTerm = tuple[cp_model.IntVar, int]  # (arc literal, setup time)
+
 
 def create_multi_objective_variables(
     model: cp_model.CpModel,
@@ -124,6 +127,7 @@ def add_lexicographical_objective_constraints(
     task_assigned: dict[tuple[str, str, str], cp_model.IntVar],
     objective_vars: dict[str, cp_model.IntVar],
     horizon: int,
+    setup_terms: list[SetupTerm] | None = None,
 ) -> None:
     """Add lexicographical multi-objective constraints.
 
@@ -145,6 +149,8 @@ def add_lexicographical_objective_constraints(
         task_assigned: Task machine assignment variables
         objective_vars: Multi-objective decision variables
         horizon: Planning horizon
+        setup_terms: (arc literal, setup time) terms from
+            add_setup_time_constraints(), defining the total setup time
 
     Constraints added:
         - Objective value definitions for each objective type
@@ -164,7 +170,14 @@ def add_lexicographical_objective_constraints(
 
     # Define each objective variable based on its type
     _add_objective_definitions(
-        model, problem, task_starts, task_ends, task_assigned, objective_vars, horizon
+        model,
+        problem,
+        task_starts,
+        task_ends,
+        task_assigned,
+        objective_vars,
+        horizon,
+        setup_terms,
     )
 
     # Set primary objective for first optimization phase
@@ -191,6 +204,7 @@ def add_weighted_sum_objective_constraints(
     task_assigned: dict[tuple[str, str, str], cp_model.IntVar],
     objective_vars: dict[str, cp_model.IntVar],
     horizon: int,
+    setup_terms: list[SetupTerm] | None = None,
 ) -> None:
     """Add weighted sum multi-objective constraints.
 
@@ -208,6 +222,8 @@ def add_weighted_sum_objective_constraints(
         task_assigned: Task machine assignment variables
         objective_vars: Multi-objective decision variables
         horizon: Planning horizon
+        setup_terms: (arc literal, setup time) terms from
+            add_setup_time_constraints(), defining the total setup time
 
     Constraints added:
         - Objective value definitions for each objective type
@@ -227,7 +243,14 @@ def add_weighted_sum_objective_constraints(
 
     # Define each objective variable based on its type
     _add_objective_definitions(
-        model, problem, task_starts, task_ends, task_assigned, objective_vars, horizon
+        model,
+        problem,
+        task_starts,
+        task_ends,
+        task_assigned,
+        objective_vars,
+        horizon,
+        setup_terms,
     )
 
     # Create weighted sum objective
@@ -271,6 +294,7 @@ def add_epsilon_constraint_objective_constraints(
     task_assigned: dict[tuple[str, str, str], cp_model.IntVar],
     objective_vars: dict[str, cp_model.IntVar],
     horizon: int,
+    setup_terms: list[SetupTerm] | None = None,
 ) -> None:
     """Add epsilon-constraint multi-objective constraints.
 
@@ -288,6 +312,8 @@ def add_epsilon_constraint_objective_constraints(
         task_assigned: Task machine assignment variables
         objective_vars: Multi-objective decision variables
         horizon: Planning horizon
+        setup_terms: (arc literal, setup time) terms from
+            add_setup_time_constraints(), defining the total setup time
 
     Constraints added:
         - Objective value definitions for each objective type
@@ -308,7 +334,14 @@ def add_epsilon_constraint_objective_constraints(
 
     # Define each objective variable based on its type
     _add_objective_definitions(
-        model, problem, task_starts, task_ends, task_assigned, objective_vars, horizon
+        model,
+        problem,
+        task_starts,
+        task_ends,
+        task_assigned,
+        objective_vars,
+        horizon,
+        setup_terms,
     )
 
     # Add epsilon constraints for bounded objectives
@@ -357,6 +390,51 @@ def add_epsilon_constraint_objective_constraints(
         )
 
 
+def add_objective_definitions(
+    model: cp_model.CpModel,
+    problem: SchedulingProblem,
+    task_starts: dict[tuple[str, str], cp_model.IntVar],
+    task_ends: dict[tuple[str, str], cp_model.IntVar],
+    task_assigned: dict[tuple[str, str, str], cp_model.IntVar],
+    objective_vars: dict[str, cp_model.IntVar],
+    horizon: int,
+    setup_terms: list[SetupTerm] | None = None,
+) -> None:
+    """Define the multi-objective variables without setting an objective.
+
+    Pareto frontier exploration solves the same base model with different
+    objectives and epsilon bounds, so the definitions are added once and each
+    solve chooses its own objective.
+
+    Args:
+        model: The CP-SAT model
+        problem: The scheduling problem with multi-objective configuration
+        task_starts: Task start time variables
+        task_ends: Task end time variables
+        task_assigned: Task machine assignment variables
+        objective_vars: Multi-objective decision variables
+        horizon: Planning horizon
+        setup_terms: (arc literal, setup time) terms from
+            add_setup_time_constraints(), defining the total setup time
+
+    Constraints added:
+        - Objective value definitions for each objective type
+
+    Performance: O(objectives × tasks) for constraint creation
+
+    """
+    _add_objective_definitions(
+        model,
+        problem,
+        task_starts,
+        task_ends,
+        task_assigned,
+        objective_vars,
+        horizon,
+        setup_terms,
+    )
+
+
 def calculate_objective_values(
     solver: cp_model.CpSolver,
     problem: SchedulingProblem,
@@ -376,6 +454,8 @@ def calculate_objective_values(
         task_assigned: Task machine assignment variables
         objective_vars: Multi-objective decision variables
         horizon: Planning horizon
+        setup_terms: (arc literal, setup time) terms from
+            add_setup_time_constraints(), defining the total setup time
 
     Returns:
         ObjectiveSolution with calculated values for all objectives
@@ -444,6 +524,7 @@ def _add_objective_definitions(
     task_assigned: dict[tuple[str, str, str], cp_model.IntVar],
     objective_vars: dict[str, cp_model.IntVar],
     horizon: int,
+    setup_terms: list[SetupTerm] | None = None,
 ) -> None:
     """Add constraint definitions for each objective variable."""
     for var_name, var in objective_vars.items():
@@ -473,7 +554,7 @@ def _add_objective_definitions(
             )
 
         elif var_name == "total_setup_time":
-            _define_total_setup_time_objective(model, problem, task_assigned, var)
+            _define_total_setup_time_objective(model, setup_terms or [], var)
 
 
 def _define_makespan_objective(
@@ -502,7 +583,7 @@ def _define_total_lateness_objective(
         for instance in problem.job_instances:
             # Find last task end time for this instance
             instance_end_times = []
-            for optimized_task in problem.job_optimized_pattern.optimized_tasks:
+            for optimized_task in problem.instance_pattern(instance).optimized_tasks:
                 instance_task_id = problem.get_instance_task_id(
                     instance.instance_id, optimized_task.optimized_task_id
                 )
@@ -590,7 +671,7 @@ def _define_maximum_lateness_objective(
     if problem.is_optimized_mode and problem.job_optimized_pattern:
         for instance in problem.job_instances:
             instance_end_times = []
-            for optimized_task in problem.job_optimized_pattern.optimized_tasks:
+            for optimized_task in problem.instance_pattern(instance).optimized_tasks:
                 instance_task_id = problem.get_instance_task_id(
                     instance.instance_id, optimized_task.optimized_task_id
                 )
@@ -728,7 +809,7 @@ def _define_total_tardiness_objective(
     if problem.is_optimized_mode and problem.job_optimized_pattern:
         for instance in problem.job_instances:
             instance_end_times = []
-            for optimized_task in problem.job_optimized_pattern.optimized_tasks:
+            for optimized_task in problem.instance_pattern(instance).optimized_tasks:
                 instance_task_id = problem.get_instance_task_id(
                     instance.instance_id, optimized_task.optimized_task_id
                 )
@@ -808,7 +889,7 @@ def _define_weighted_completion_time_objective(
     if problem.is_optimized_mode and problem.job_optimized_pattern:
         for instance in problem.job_instances:
             instance_end_times = []
-            for optimized_task in problem.job_optimized_pattern.optimized_tasks:
+            for optimized_task in problem.instance_pattern(instance).optimized_tasks:
                 instance_task_id = problem.get_instance_task_id(
                     instance.instance_id, optimized_task.optimized_task_id
                 )
@@ -893,14 +974,13 @@ def _define_machine_utilization_objective(
 
 def _define_total_setup_time_objective(
     model: cp_model.CpModel,
-    _problem: SchedulingProblem,
-    _task_assigned: dict[tuple[str, str, str], cp_model.IntVar],
+    setup_terms: list[SetupTerm],
     setup_time_var: cp_model.IntVar,
 ) -> None:
-    """Define total setup time objective."""
-    # This would be implemented when setup times are available in the problem
-    # For now, set to 0
-    model.Add(setup_time_var == 0)
+    """Define total setup time as the setup of every taken circuit arc."""
+    model.Add(
+        setup_time_var == sum(setup_time * arc for arc, setup_time in setup_terms)
+    )
 
 
 def _calculate_missing_objectives(
@@ -971,11 +1051,12 @@ def _calculate_max_weighted_completion_time(
     return horizon * job_count * 100  # Scale by 100
 
 
-def _calculate_max_setup_time(problem: SchedulingProblem, _horizon: int) -> int:
+def _calculate_max_setup_time(problem: SchedulingProblem, horizon: int) -> int:
     """Calculate maximum possible setup time."""
-    # For now, return a reasonable upper bound
-    task_count = problem.total_task_count
-    return task_count * 10  # Assume max 10 time units setup per task
+    # Setups are gaps between consecutive tasks of a machine lane, so each
+    # lane holds at most one horizon of setup time
+    lanes = sum(max(1, machine.capacity) for machine in problem.machines)
+    return horizon * max(1, lanes)
 
 
 def _calculate_max_weighted_sum(
@@ -5,9 +5,20 @@ between competing objectives in production scheduling.
 """
 
 import logging
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
+from ortools.sat import cp_model_pb2
 from ortools.sat.python import cp_model
 
+from src.solver.constraints.phase3.multi_objective_constraints import (
+    _get_objective_variable_name,
+)
+from src.solver.core.model_snapshot import clone_model, snapshot_model
+from src.solver.core.solver_config import PHASE_PARETO, apply_solver_parameters
 from src.solver.models.problem import (
     MultiObjectiveConfiguration,
     ObjectiveSolution,
@@ -19,8 +30,52 @@ from src.solver.models.problem import (
     TradeOffAnalysis,
 )
 
+if TYPE_CHECKING:
+    from src.solver.core.solver_config import SolverConfig
+
 logger = logging.getLogger(__name__)
 
+# Objective variables stored as scaled integers (value x 100)
+_SCALED_OBJECTIVES = frozenset(
+    {"total_cost", "weighted_completion_time", "machine_utilization"}
+)
+
+# Base model shipped once to each frontier worker process
+_worker_base_model: dict[str, Any] = {}
+
+# CP-SAT search workers each concurrent frontier solve gets at least; fewer
+# CPUs per process make every solve weaker than solving the points in turn
+MIN_SEARCH_WORKERS_PER_POINT = 4
+
+# Below this many points, starting worker processes costs more than it saves
+MIN_PARALLEL_FRONTIER_POINTS = 4
+
+# Type aliases following TEMPLATES.md centralized patterns
+ObjectiveValues = dict[str, int]  # objective variable name -> raw value
+FrontierResult = dict[str, Any]
+
+
+@dataclass
+class FrontierPoint:
+    """One solve of the frontier: a primary objective plus epsilon bounds.
+
+    Bounds are expressed in objective-variable units (scaled integers).
+    """
+
+    label: str
+    primary: str
+    maximize: bool = False
+    upper_bounds: ObjectiveValues = field(default_factory=dict)
+    lower_bounds: ObjectiveValues = field(default_factory=dict)
+
+    def is_satisfied_by(self, values: ObjectiveValues) -> bool:
+        """Check whether objective values respect this point's epsilon bounds."""
+        return all(
+            values.get(name, 0) <= bound for name, bound in self.upper_bounds.items()
+        ) and all(
+            values.get(name, 0) >= bound for name, bound in self.lower_bounds.items()
+        )
+
 
 def find_pareto_frontier(
     problem: SchedulingProblem,
@@ -29,12 +84,30 @@ def find_pareto_frontier(
     task_assigned: dict[tuple[str, str, str], cp_model.IntVar],
     horizon: int,
     time_limit_per_solve: int = 30,
+    solver_config: "SolverConfig | None" = None,
+    model: cp_model.CpModel | None = None,
+    objective_variables: dict[str, cp_model.IntVar] | None = None,
+    max_workers: int | None = None,
 ) -> ParetoFrontier:
     """Find Pareto-optimal solutions using epsilon-constraint method.
 
     Generates multiple solutions by systematically varying epsilon bounds
     on objectives to explore the Pareto frontier.
 
+    When a prebuilt base model (constraints and objective definitions, no
+    objective) is passed, its proto is shipped once to a process pool and the
+    extreme and epsilon points are solved concurrently; each worker only sets
+    its objective and epsilon bounds and is hinted with the nearest frontier
+    point found so far. With a single worker (too few CPUs for
+    MIN_SEARCH_WORKERS_PER_POINT each, or fewer than
+    MIN_PARALLEL_FRONTIER_POINTS points) the same points are solved in-process,
+    one after another, with all CPUs. Without a base model every point is
+    built and solved in turn.
+
+    The process pool uses the "spawn" start method, which re-imports the
+    caller's main module in every worker: scripts that call this with a base
+    model must guard their entry point with ``if __name__ == "__main__":``.
+
     Algorithm:
         1. Find extreme solutions (optimize each objective individually)
         2. Generate intermediate points using epsilon-constraint method
@@ -47,16 +120,32 @@ def find_pareto_frontier(
         task_assigned: Task machine assignment variables
         horizon: Planning horizon
         time_limit_per_solve: Time limit for each individual solve
+        solver_config: CP-SAT parameters for each individual solve
+        model: Prebuilt objective-free base model (enables parallel exploration)
+        objective_variables: Objective variables defined in ``model``
+        max_workers: Worker processes for parallel exploration (default: CPUs
+            / MIN_SEARCH_WORKERS_PER_POINT; 1 solves in-process)
 
     Returns:
         ParetoFrontier containing non-dominated solutions
 
-    Performance: O(iterations × solve_time) where iterations = pareto_iterations
+    Performance: O(iterations × solve_time) where iterations = pareto_iterations;
+        divided by the worker count when a base model is given
 
     """
     if not problem.multi_objective_config:
         return ParetoFrontier()
 
+    if model is not None and objective_variables:
+        return _find_pareto_frontier_parallel(
+            problem,
+            model,
+            objective_variables,
+            time_limit_per_solve,
+            solver_config,
+            max_workers,
+        )
+
     logger.info("Finding Pareto frontier...")
 
     config = problem.multi_objective_config
@@ -67,7 +156,13 @@ def find_pareto_frontier(
     # Step 1: Find extreme solutions (optimize each objective individually)
     logger.info("Finding extreme solutions...")
     extreme_solutions = _find_extreme_solutions(
-        problem, task_starts, task_ends, task_assigned, horizon, time_limit_per_solve
+        problem,
+        task_starts,
+        task_ends,
+        task_assigned,
+        horizon,
+        time_limit_per_solve,
+        solver_config,
     )
 
     for solution in extreme_solutions:
@@ -89,6 +184,7 @@ def find_pareto_frontier(
             extreme_solutions,
             config.pareto_iterations - len(objective_types),
             time_limit_per_solve,
+            solver_config,
         )
 
         for solution in intermediate_solutions:
@@ -104,6 +200,324 @@ def find_pareto_frontier(
     return frontier
 
 
+def _find_pareto_frontier_parallel(
+    problem: SchedulingProblem,
+    model: cp_model.CpModel,
+    objective_variables: dict[str, cp_model.IntVar],
+    time_limit: int,
+    solver_config: "SolverConfig | None",
+    max_workers: int | None,
+) -> ParetoFrontier:
+    """Explore the frontier concurrently over a shared base model."""
+    config = problem.multi_objective_config
+    objective_types = {
+        _get_objective_variable_name(w.objective_type): w.objective_type
+        for w in config.objectives
+        if _get_objective_variable_name(w.objective_type) in objective_variables
+    }
+    frontier = ParetoFrontier(
+        objective_types=[w.objective_type for w in config.objectives]
+    )
+    if not objective_types:
+        logger.warning("No objective variables defined for Pareto exploration")
+        return frontier
+
+    # Base model without objective or hints; workers add their own
+    base = snapshot_model(model)
+    objective_indices = {
+        name: objective_variables[name].Index() for name in objective_types
+    }
+
+    extremes = [
+        FrontierPoint(
+            label=f"extreme_{obj_type.value}",
+            primary=name,
+            maximize=obj_type == ObjectiveType.MAXIMIZE_MACHINE_UTILIZATION,
+        )
+        for name, obj_type in objective_types.items()
+    ]
+    num_intermediate = max(0, config.pareto_iterations - len(extremes))
+    total_points = len(extremes) + (num_intermediate if len(extremes) > 1 else 0)
+
+    cpu_count = os.cpu_count() or 1
+    workers = max(
+        1,
+        min(
+            max_workers or cpu_count // MIN_SEARCH_WORKERS_PER_POINT,
+            total_points,
+        ),
+    )
+    if total_points < MIN_PARALLEL_FRONTIER_POINTS:
+        workers = 1
+    parameters = (
+        solver_config.parameters_for(PHASE_PARETO, time_limit=time_limit)
+        if solver_config
+        else {"max_time_in_seconds": time_limit}
+    )
+    if workers > 1:
+        # Split the cores between concurrent solves instead of oversubscribing
+        parameters["num_search_workers"] = max(
+            1,
+            min(parameters.get("num_search_workers", cpu_count), cpu_count // workers),
+        )
+
+    logger.info(
+        f"Exploring {total_points} Pareto points with {workers} worker process(es)"
+    )
+
+    found: list[FrontierResult] = []
+    if workers == 1:
+        # Same points and hints, solved in turn in this process
+        _init_frontier_worker(base.SerializeToString(), objective_indices)
+        try:
+            found.extend(_run_frontier_points(None, extremes, parameters, [], 1))
+            if num_intermediate and len(found) > 1:
+                grid = _epsilon_grid(extremes, found, num_intermediate)
+                found.extend(_run_frontier_points(None, grid, parameters, found, 1))
+        finally:
+            _worker_base_model.clear()
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            # CP-SAT is not fork-safe once its threads are running
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_frontier_worker,
+            initargs=(base.SerializeToString(), objective_indices),
+        ) as executor:
+            # Step 1: extreme solutions, all at once
+            found.extend(
+                _run_frontier_points(executor, extremes, parameters, [], workers)
+            )
+
+            # Step 2: epsilon grid between the extremes, hinted from neighbours
+            if num_intermediate and len(found) > 1:
+                grid = _epsilon_grid(extremes, found, num_intermediate)
+                found.extend(
+                    _run_frontier_points(executor, grid, parameters, found, workers)
+                )
+
+    # Equal points do not dominate each other; keep one of each
+    seen: set[tuple[tuple[str, int], ...]] = set()
+    for result in found:
+        key = tuple(sorted(result["values"].items()))
+        if key in seen:
+            continue
+        seen.add(key)
+        frontier.add_solution(
+            ParetoSolution(objectives=_to_objective_solution(result, objective_types))
+        )
+
+    logger.info(
+        f"Pareto frontier contains {frontier.solution_count} non-dominated solutions"
+    )
+    return frontier
+
+
+def _run_frontier_points(
+    executor: ProcessPoolExecutor | None,
+    points: list[FrontierPoint],
+    parameters: dict[str, Any],
+    neighbours: list[FrontierResult],
+    max_in_flight: int,
+) -> list[FrontierResult]:
+    """Solve frontier points, keeping at most ``max_in_flight`` submitted.
+
+    Points are submitted in order, so each one can be hinted with results
+    (including those of earlier points) that are already available. Without
+    an executor the points are solved in this process, whose base model must
+    be set with _init_frontier_worker().
+    """
+    if executor is None:
+        results = []
+        for point in points:
+            hint = _nearest_neighbour_hint(point, neighbours + results)
+            try:
+                result = _solve_frontier_point(point, hint, parameters)
+            except Exception as e:
+                logger.warning(f"Pareto point {point.label} failed: {e}")
+                continue
+            logger.info(
+                f"Pareto point {point.label}: {result['status']} "
+                f"in {result['solve_time']:.2f}s"
+            )
+            if result["status"] in ("OPTIMAL", "FEASIBLE"):
+                results.append(result)
+        return results
+
+    pending: dict[Future, FrontierPoint] = {}
+    results: list[FrontierResult] = []
+    queue = list(points)
+
+    while queue or pending:
+        while queue and len(pending) < max_in_flight:
+            point = queue.pop(0)
+            hint = _nearest_neighbour_hint(point, neighbours + results)
+            future = executor.submit(_solve_frontier_point, point, hint, parameters)
+            pending[future] = point
+
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            point = pending.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.warning(f"Pareto point {point.label} failed: {e}")
+                continue
+
+            logger.info(
+                f"Pareto point {point.label}: {result['status']} "
+                f"in {result['solve_time']:.2f}s"
+            )
+            if result["status"] in ("OPTIMAL", "FEASIBLE"):
+                results.append(result)
+
+    return results
+
+
+def _epsilon_grid(
+    extremes: list[FrontierPoint],
+    found: list[FrontierResult],
+    num_points: int,
+) -> list[FrontierPoint]:
+    """Epsilon-constraint points evenly spaced between the extreme solutions.
+
+    Every extreme takes a turn as the primary objective, round-robin, and the
+    other objectives are bounded inside the range the extremes span.
+    """
+    ranges = {}
+    for point in extremes:
+        values = [r["values"][point.primary] for r in found]
+        ranges[point.primary] = (min(values), max(values), point.maximize)
+
+    per_primary = [
+        len(range(k, num_points, len(extremes))) for k in range(len(extremes))
+    ]
+    grid = []
+    for i in range(num_points):
+        primary = extremes[i % len(extremes)]
+        step = i // len(extremes) + 1
+        # Deterministic spacing for reproducible results
+        spacing_factor = step / (per_primary[i % len(extremes)] + 1)
+        point = FrontierPoint(
+            label=f"epsilon_{i + 1}",
+            primary=primary.primary,
+            maximize=primary.maximize,
+        )
+        for name, (min_val, max_val, maximize) in ranges.items():
+            if name == primary.primary:
+                continue
+            bound = int(min_val + spacing_factor * (max_val - min_val))
+            if maximize:
+                point.lower_bounds[name] = bound
+            else:
+                point.upper_bounds[name] = bound
+        grid.append(point)
+
+    return grid
+
+
+def _nearest_neighbour_hint(
+    point: FrontierPoint, neighbours: list[FrontierResult]
+) -> list[int] | None:
+    """Pick the solution to hint a point with.
+
+    Prefers the neighbour that already satisfies the point's bounds with the
+    best primary value; otherwise the one closest to the bounds.
+    """
+    if not neighbours:
+        return None
+
+    feasible = [r for r in neighbours if point.is_satisfied_by(r["values"])]
+    if feasible:
+        sign = -1 if point.maximize else 1
+        best = min(feasible, key=lambda r: sign * r["values"][point.primary])
+        return best["solution"]
+
+    def violation(result: FrontierResult) -> int:
+        values = result["values"]
+        return sum(
+            max(0, values.get(name, 0) - bound)
+            for name, bound in point.upper_bounds.items()
+        ) + sum(
+            max(0, bound - values.get(name, 0))
+            for name, bound in point.lower_bounds.items()
+        )
+
+    return min(neighbours, key=violation)["solution"]
+
+
+def _init_frontier_worker(
+    proto_bytes: bytes, objective_indices: dict[str, int]
+) -> None:
+    """Process-pool initializer: keep the base model in the worker."""
+    proto = cp_model_pb2.CpModelProto()
+    proto.ParseFromString(proto_bytes)
+    _worker_base_model["proto"] = proto
+    _worker_base_model["objective_indices"] = objective_indices
+
+
+def _solve_frontier_point(
+    point: FrontierPoint,
+    hint: list[int] | None,
+    parameters: dict[str, Any],
+) -> FrontierResult:
+    """Solve one frontier point against the worker's copy of the base model."""
+    model = clone_model(_worker_base_model["proto"])
+    objective_vars = {
+        name: model.GetIntVarFromProtoIndex(index)
+        for name, index in _worker_base_model["objective_indices"].items()
+    }
+
+    for name, bound in point.upper_bounds.items():
+        model.Add(objective_vars[name] <= bound)
+    for name, bound in point.lower_bounds.items():
+        model.Add(objective_vars[name] >= bound)
+
+    if point.maximize:
+        model.Maximize(objective_vars[point.primary])
+    else:
+        model.Minimize(objective_vars[point.primary])
+
+    if hint:
+        solution_hint = model.Proto().solution_hint
+        solution_hint.vars.extend(range(len(hint)))
+        solution_hint.values.extend(hint)
+
+    solver = cp_model.CpSolver()
+    apply_solver_parameters(solver, parameters)
+    status = solver.Solve(model)
+
+    has_solution = status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+    return {
+        "label": point.label,
+        "primary": point.primary,
+        "status": solver.StatusName(status),
+        "solve_time": solver.WallTime(),
+        "values": (
+            {name: solver.Value(var) for name, var in objective_vars.items()}
+            if has_solution
+            else {}
+        ),
+        "solution": list(solver.ResponseProto().solution) if has_solution else [],
+    }
+
+
+def _to_objective_solution(
+    result: FrontierResult, objective_types: dict[str, ObjectiveType]
+) -> ObjectiveSolution:
+    """Convert raw objective-variable values into an ObjectiveSolution."""
+    solution = ObjectiveSolution(
+        solve_time=result["solve_time"], solver_status=result["status"]
+    )
+    for name, value in result["values"].items():
+        scaled = value / 100.0 if name in _SCALED_OBJECTIVES else value
+        solution.set_objective_value(objective_types[name], scaled)
+    solution.objective_value = solution.get_objective_value(
+        objective_types[result["primary"]]
+    )
+    return solution
+
+
 def analyze_trade_offs(frontier: ParetoFrontier) -> TradeOffAnalysis:
     """Analyze trade-offs in the Pareto frontier.
 
@@ -209,6 +623,7 @@ def _find_extreme_solutions(
     task_assigned: dict[tuple[str, str, str], cp_model.IntVar],
     horizon: int,
     time_limit: int,
+    solver_config: "SolverConfig | None" = None,
 ) -> list[ObjectiveSolution | None]:
     """Find extreme solutions by optimizing each objective individually."""
     config = problem.multi_objective_config
@@ -234,7 +649,13 @@ def _find_extreme_solutions(
 
         try:
             solution = _solve_single_objective(
-                problem, task_starts, task_ends, task_assigned, horizon, time_limit
+                problem,
+                task_starts,
+                task_ends,
+                task_assigned,
+                horizon,
+                time_limit,
+                solver_config,
             )
             extreme_solutions.append(solution)
 
@@ -261,6 +682,7 @@ def _generate_intermediate_solutions(
     extreme_solutions: list[ObjectiveSolution | None],
     num_intermediate: int,
     time_limit: int,
+    solver_config: "SolverConfig | None" = None,
 ) -> list[ObjectiveSolution | None]:
     """Generate intermediate solutions using epsilon-constraint method."""
     config = problem.multi_objective_config
@@ -315,7 +737,13 @@ def _generate_intermediate_solutions(
 
             try:
                 solution = _solve_single_objective(
-                    problem, task_starts, task_ends, task_assigned, horizon, time_limit
+                    problem,
+                    task_starts,
+                    task_ends,
+                    task_assigned,
+                    horizon,
+                    time_limit,
+                    solver_config,
                 )
                 intermediate_solutions.append(solution)
 
@@ -337,6 +765,7 @@ def _solve_single_objective(
     task_assigned: dict[tuple[str, str, str], cp_model.IntVar],  # noqa: ARG001
     horizon: int,
     time_limit: int,
+    solver_config: "SolverConfig | None" = None,
 ) -> ObjectiveSolution | None:
     """Solve for a single objective configuration using actual CP-SAT solving."""
     import time
@@ -348,15 +777,11 @@ def _solve_single_objective(
     start_time = time.time()
 
     try:
-        # Create solver instance with time limit
-        solver = FreshSolver(problem)
-
-        # Configure solver with time limit
-        if solver.solver:
-            solver.solver.parameters.max_time_in_seconds = time_limit
+        # Create solver instance; parameters are applied when the solve starts
+        solver = FreshSolver(problem, solver_config=solver_config)
 
         # Solve the problem using the existing solver infrastructure
-        solution_result = solver.solve()
+        solution_result = solver.solve(time_limit)
 
         solve_time = time.time() - start_time
 
@@ -0,0 +1,281 @@
+"""Decomposition of a problem into independent subproblems.
+
+Jobs (or job instances in optimized mode) are linked when they can compete for
+the same machine, work cell, operator or sequence, or when a precedence
+connects their tasks. The connected components of this resource-sharing graph
+never constrain each other, so each component is solved as its own problem,
+in parallel worker processes, and the component schedules are merged into a
+single solution dictionary with the layout of ``extract_solution``.
+
+Objectives that couple all jobs (makespan, total lateness, total cost) are
+separable over components: the merged makespan is the maximum and lateness
+and cost are the sums of the component values.
+"""
+
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from typing import Any
+
+from src.solver.core.rolling_horizon import create_window_problem, stitch_schedules
+from src.solver.core.solver import FreshSolver
+from src.solver.core.solver_config import SolverConfig
+from src.solver.models.problem import SchedulingProblem
+from src.solver.models.problem_arrays import compile_problem_arrays
+
+logger = logging.getLogger(__name__)
+
+# Type aliases following TEMPLATES.md centralized patterns
+JobId = str  # job_id or instance_id
+MachineId = str
+TimeSpan = tuple[int, int]  # (start, end) in time units
+
+
+def find_independent_components(problem: SchedulingProblem) -> list[list[JobId]]:
+    """Group jobs that share resources, directly or through other jobs.
+
+    Args:
+        problem: The scheduling problem
+
+    Returns:
+        Job IDs (instance IDs in optimized mode) per component, in problem
+        order; components are ordered by their first job
+
+    Performance: O(tasks x (modes + qualified operators)) with union-find
+
+    """
+    arrays = compile_problem_arrays(problem)
+    unit_count = len(arrays.unit_ids)
+    parent = list(range(unit_count))
+
+    def find(unit: int) -> int:
+        while parent[unit] != unit:
+            parent[unit] = parent[parent[unit]]
+            unit = parent[unit]
+        return unit
+
+    def union(a: int, b: int) -> None:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    # First unit seen on each shared resource; later units join its component
+    holder: dict[tuple[str, Any], int] = {}
+
+    def claim(resource: tuple[str, Any], unit: int) -> None:
+        first = holder.setdefault(resource, unit)
+        if first != unit:
+            union(first, unit)
+
+    task_units = arrays.task_unit.tolist()
+    machine_cells = arrays.machine_cell.tolist()
+    for task, unit in enumerate(task_units):
+        for machine in arrays.task_machines(task):
+            claim(("machine", machine), unit)
+            if machine_cells[machine] >= 0:
+                claim(("cell", machine_cells[machine]), unit)
+        for operator in arrays.qualified_operators(task):
+            claim(("operator", operator), unit)
+
+    for task, sequence_id in enumerate(_task_sequences(problem)):
+        if sequence_id is not None:
+            claim(("sequence", sequence_id), task_units[task])
+
+    # Cross-job precedences (unique mode)
+    for predecessor, successor in arrays.precedence_pairs.tolist():
+        union(task_units[predecessor], task_units[successor])
+
+    components: dict[int, list[JobId]] = {}
+    for unit, unit_id in enumerate(arrays.unit_ids):
+        components.setdefault(find(unit), []).append(unit_id)
+    return list(components.values())
+
+
+def _task_sequences(problem: SchedulingProblem) -> list[str | None]:
+    """Sequence of every task, in ProblemArrays task order."""
+    if problem.is_optimized_mode and problem.job_optimized_pattern:
+        return [
+            optimized_task.sequence_id
+            for instance in problem.job_instances
+            for optimized_task in problem.instance_pattern(instance).optimized_tasks
+        ]
+    return [task.sequence_id for job in problem.jobs for task in job.tasks]
+
+
+def create_component_problem(
+    problem: SchedulingProblem, unit_ids: list[JobId]
+) -> SchedulingProblem:
+    """Restrict a problem to one component, keeping its objective settings."""
+    component = create_window_problem(problem, unit_ids)
+    if problem.multi_objective_config is None:
+        return component
+    return replace(component, multi_objective_config=problem.multi_objective_config)
+
+
+def solve_decomposed(
+    problem: SchedulingProblem,
+    time_limit: int = 60,
+    max_workers: int | None = None,
+    setup_times: dict[tuple[str, str, str], int] | None = None,
+    solver_config: SolverConfig | None = None,
+    fixed_intervals: dict[MachineId, list[TimeSpan]] | None = None,
+) -> dict:
+    """Solve each independent component separately and merge the schedules.
+
+    Every component is solved by its own FreshSolver.solve() with the full
+    time limit, since the components run side by side. A problem with a single
+    component is solved in-process.
+
+    Args:
+        problem: The scheduling problem
+        time_limit: Seconds per component solve
+        max_workers: Worker processes (default: CPUs; 1 solves in-process)
+        setup_times: Setup times passed to every component solver
+        solver_config: CP-SAT parameters passed to every component solver
+        fixed_intervals: Machine time already occupied, passed to every
+            component solver
+
+    Returns:
+        Solution dictionary in extract_solution() layout with "total_cost" and
+        a "decomposition" entry holding per-component statistics. If a
+        component finds no solution, its status is returned with an empty
+        schedule.
+
+    """
+    started = time.time()
+    components = find_independent_components(problem)
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(components)))
+
+    logger.info(
+        f"Decomposition: {len(components)} independent component(s) of "
+        f"{[len(c) for c in components]} jobs, {workers} worker(s)"
+    )
+
+    tasks = [
+        (
+            create_component_problem(problem, unit_ids),
+            time_limit,
+            setup_times,
+            solver_config,
+            fixed_intervals,
+        )
+        for unit_ids in components
+    ]
+    if workers == 1:
+        results = [_solve_component(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            # CP-SAT is not fork-safe once its threads are running
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            results = list(executor.map(_solve_component, *zip(*tasks, strict=True)))
+
+    return merge_component_solutions(
+        problem, components, results, setup_times, time.time() - started
+    )
+
+
+def merge_component_solutions(
+    problem: SchedulingProblem,
+    components: list[list[JobId]],
+    results: list[dict],
+    setup_times: dict[tuple[str, str, str], int] | None = None,
+    total_time: float = 0.0,
+) -> dict:
+    """Combine component solutions into one solution dictionary.
+
+    Args:
+        problem: The full scheduling problem
+        components: Job IDs per component
+        results: Solution of every component, in component order
+        setup_times: Setup times used for the setup metrics
+        total_time: Wall time of the whole decomposed solve in seconds
+
+    Returns:
+        Merged solution; OPTIMAL only if every component is optimal
+
+    """
+    solver_stats = {"solve_time": 0.0, "branches": 0, "conflicts": 0}
+    component_stats = []
+    for index, (unit_ids, result) in enumerate(zip(components, results, strict=True)):
+        stats = result.get("solver_stats", {})
+        solver_stats["solve_time"] = max(
+            solver_stats["solve_time"], stats.get("solve_time", 0.0)
+        )
+        solver_stats["branches"] += stats.get("branches", 0)
+        solver_stats["conflicts"] += stats.get("conflicts", 0)
+        component_stats.append(
+            {
+                "index": index,
+                "jobs": len(unit_ids),
+                "tasks": len(result.get("schedule", [])),
+                "status": result.get("status", "UNKNOWN"),
+                "makespan": result.get("makespan", 0),
+                "solve_time": stats.get("solve_time", 0.0),
+            }
+        )
+
+    decomposition = {
+        "components": component_stats,
+        "total_time": total_time,
+    }
+
+    statuses = [stats["status"] for stats in component_stats]
+    failed = next((s for s in statuses if s not in ("OPTIMAL", "FEASIBLE")), None)
+    if failed is not None:
+        logger.warning(f"Decomposition: a component finished with status {failed}")
+        return {
+            "status": failed,
+            "schedule": [],
+            "makespan": 0,
+            "total_lateness_minutes": 0,
+            "solver_stats": {"status": failed, **solver_stats},
+            "decomposition": decomposition,
+        }
+
+    status = "OPTIMAL" if all(s == "OPTIMAL" for s in statuses) else "FEASIBLE"
+    schedule = [entry for result in results for entry in result["schedule"]]
+    solution = stitch_schedules(problem, schedule, setup_times)
+    solution["status"] = status
+    solution["total_cost"] = _schedule_cost(problem, schedule)
+    solution["solver_stats"] = {
+        "status": status,
+        **solver_stats,
+        "objective_value": None,
+    }
+    solution["decomposition"] = decomposition
+
+    logger.info(
+        f"Decomposition complete: {len(results)} components, status {status}, "
+        f"makespan {solution['makespan']}, {total_time:.2f}s"
+    )
+    return solution
+
+
+def _schedule_cost(problem: SchedulingProblem, schedule: list[dict]) -> float:
+    """Machine cost of a schedule (cost per hour x hours on the machine)."""
+    total = 0.0
+    for entry in schedule:
+        machine = problem.get_machine(entry.get("machine_id"))
+        if machine is not None:
+            hours = (entry["end_time"] - entry["start_time"]) * 15 / 60
+            total += machine.cost_per_hour * hours
+    return round(total, 2)
+
+
+def _solve_component(
+    problem: SchedulingProblem,
+    time_limit: int,
+    setup_times: dict[tuple[str, str, str], int] | None,
+    solver_config: SolverConfig | None,
+    fixed_intervals: dict[MachineId, list[TimeSpan]] | None,
+) -> dict:
+    """Solve one component; runs in a worker process."""
+    solver = FreshSolver(problem, setup_times=setup_times, solver_config=solver_config)
+    if fixed_intervals:
+        solver.fixed_intervals = {m: list(s) for m, s in fixed_intervals.items()}
+    return solver.solve(time_limit)
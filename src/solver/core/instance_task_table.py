@@ -0,0 +1,217 @@
+"""Instance-task table shared by variable creation and constraint builders.
+
+In optimized mode every module used to regenerate instance task IDs with
+``problem.get_instance_task_id()`` for each (instance, pattern task) pair and
+then look the variables up by string key. InstanceTaskTable is filled while the
+variables are created and indexes them by the dense task index of
+ProblemArrays, so builders reach a task's variables, its assignment literals and
+its optional machine intervals without deriving a key.
+
+Task ``unit_indptr[instance] + position`` is pattern task ``position`` of job
+instance ``instance``, whichever pattern the instance uses. Legacy problems use
+the same table with jobs in place of instances; only ``task(instance,
+position)`` requires optimized mode.
+
+The optional intervals are the model's single registry of (task, machine)
+intervals: FreshSolver creates one per mode with add_optional_intervals() right
+after the assignment literals, and the no-overlap, machine capacity, work cell
+capacity, WIP and fixed-interval builders all read them through
+optional_interval() instead of creating their own copy.
+
+The solver's string-keyed variable dictionaries hold the same variables and
+remain the interface of the model cache, the solve paths and extract_solution.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+from ortools.sat.python import cp_model
+
+from src.solver.core.lean_model import keeps_names
+from src.solver.models.problem_arrays import ProblemArrays, TaskKey
+
+# Type aliases following TEMPLATES.md centralized patterns
+TaskMachine = tuple[int, int]  # (task index, machine index)
+
+
+@dataclass
+class InstanceTaskTable:
+    """Variables of every task, indexed by dense task index.
+
+    Args:
+        arrays: Compiled problem arrays defining task and machine indices
+
+    """
+
+    arrays: ProblemArrays
+
+    starts: list[cp_model.IntVar | None] = field(init=False)
+    ends: list[cp_model.IntVar | None] = field(init=False)
+    durations: list[cp_model.IntVar | None] = field(init=False)
+    intervals: list[cp_model.IntervalVar | None] = field(init=False)
+    assigned: dict[TaskMachine, cp_model.IntVar] = field(init=False)
+    optional_intervals: dict[TaskMachine, cp_model.IntervalVar] = field(init=False)
+    unit_indptr: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        task_count = self.arrays.task_count
+        self.starts = [None] * task_count
+        self.ends = [None] * task_count
+        self.durations = [None] * task_count
+        self.intervals = [None] * task_count
+        self.assigned = {}
+        self.optional_intervals = {}
+        self.unit_indptr = self.arrays.unit_indptr
+
+    @classmethod
+    def from_variables(
+        cls,
+        arrays: ProblemArrays,
+        *,
+        task_starts: dict | None = None,
+        task_ends: dict | None = None,
+        task_durations: dict | None = None,
+        task_intervals: dict | None = None,
+        task_assigned: dict | None = None,
+        optional_intervals: dict | None = None,
+    ) -> "InstanceTaskTable":
+        """Build a table from string-keyed variable dictionaries.
+
+        Used after a model-cache hit and by builders called without a table.
+        Tasks missing from a dictionary keep None.
+        """
+        table = cls(arrays)
+        for task, task_key in enumerate(arrays.task_keys):
+            if task_starts is not None:
+                table.starts[task] = task_starts.get(task_key)
+            if task_ends is not None:
+                table.ends[task] = task_ends.get(task_key)
+            if task_durations is not None:
+                table.durations[task] = task_durations.get(task_key)
+            if task_intervals is not None:
+                table.intervals[task] = task_intervals.get(task_key)
+            if task_assigned is not None:
+                for machine in arrays.task_machines(task):
+                    literal = task_assigned.get(arrays.assignment_key(task, machine))
+                    if literal is not None:
+                        table.assigned[(task, machine)] = literal
+            if optional_intervals is not None:
+                for machine in arrays.task_machines(task):
+                    optional = optional_intervals.get(
+                        arrays.assignment_key(task, machine)
+                    )
+                    if optional is not None:
+                        table.optional_intervals[(task, machine)] = optional
+        return table
+
+    @property
+    def task_count(self) -> int:
+        """Number of tasks."""
+        return self.arrays.task_count
+
+    @property
+    def instance_count(self) -> int:
+        """Number of job instances (jobs in legacy mode)."""
+        return len(self.arrays.unit_ids)
+
+    @property
+    def keys(self) -> list[TaskKey]:
+        """String task keys by task index."""
+        return self.arrays.task_keys
+
+    def task(self, instance: int, position: int) -> int:
+        """Task index of pattern task ``position`` of ``instance``."""
+        if not self.arrays.is_optimized_mode:
+            raise ValueError("task(instance, position) requires optimized mode")
+        return int(self.unit_indptr[instance]) + position
+
+    def instance_tasks(self, instance: int) -> range:
+        """Task indices of one instance (or job), in pattern order."""
+        return range(self.unit_indptr[instance], self.unit_indptr[instance + 1])
+
+    def instance_ends(self, instance: int) -> list[cp_model.IntVar]:
+        """End variables of one instance's tasks."""
+        return [
+            self.ends[task]
+            for task in self.instance_tasks(instance)
+            if self.ends[task] is not None
+        ]
+
+    def all_ends(self) -> list[cp_model.IntVar]:
+        """End variables of all tasks."""
+        return [end for end in self.ends if end is not None]
+
+    def task_assignments(self, task: int) -> list[tuple[int, cp_model.IntVar]]:
+        """(machine index, literal) of a task's modes, in mode order."""
+        return [
+            (machine, self.assigned[(task, machine)])
+            for machine in self.arrays.task_machines(task)
+            if (task, machine) in self.assigned
+        ]
+
+    def add_task(
+        self,
+        task: int,
+        start: cp_model.IntVar,
+        end: cp_model.IntVar,
+        duration: cp_model.IntVar,
+        interval: cp_model.IntervalVar,
+    ) -> None:
+        """Record the timing variables of a task."""
+        self.starts[task] = start
+        self.ends[task] = end
+        self.durations[task] = duration
+        self.intervals[task] = interval
+
+    def optional_interval(
+        self, model: cp_model.CpModel, task: int, machine: int
+    ) -> cp_model.IntervalVar | None:
+        """Interval of ``task`` that is present iff it runs on ``machine``.
+
+        Created on first use and reused by later callers. None if the task has
+        no interval or no assignment literal for the machine.
+        """
+        cached = self.optional_intervals.get((task, machine))
+        if cached is not None:
+            return cached
+
+        interval = self.intervals[task]
+        literal = self.assigned.get((task, machine))
+        if interval is None or literal is None:
+            return None
+
+        name = ""
+        if keeps_names(model):
+            unit_id = self.arrays.task_keys[task][0]
+            machine_id = self.arrays.machine_ids[machine]
+            name = f"optional_{unit_id[:8]}_{task}_{machine_id[:8]}"
+        optional = model.NewOptionalIntervalVar(
+            interval.StartExpr(),
+            interval.SizeExpr(),
+            interval.EndExpr(),
+            literal,
+            name,
+        )
+        self.optional_intervals[(task, machine)] = optional
+        return optional
+
+    def add_optional_intervals(
+        self, model: cp_model.CpModel
+    ) -> dict[TaskMachine, cp_model.IntervalVar]:
+        """Create the optional interval of every mode on a known machine.
+
+        Machines outside problem.machines get no machine constraint; their
+        intervals are still created on demand by optional_interval().
+
+        Returns:
+            The registry, keyed by (task index, machine index)
+
+        Performance: one interval per assignment literal, O(modes)
+
+        """
+        known = self.arrays.known_machine_count
+        for task in range(self.task_count):
+            for machine in self.arrays.task_machines(task):
+                if machine < known:
+                    self.optional_interval(model, task, machine)
+        return self.optional_intervals
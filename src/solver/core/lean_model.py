@@ -0,0 +1,129 @@
+"""Lean CP-SAT models without per-variable names.
+
+Constraint builders name every variable and interval with formatted UUID
+slices. The names are never read by the solver, but they are stored in the
+``CpModelProto`` and make up most of its size, which is copied for snapshots,
+cached models and every worker process. LeanCpModel keeps the builders'
+signatures and drops the names.
+
+Formatting a name costs about as much as a function call, so the per-task
+builders check keeps_names() once and only format names when it is True.
+
+For debugging, build_variable_labels() maps proto indices back to the solver
+variable dictionaries that hold them (e.g. ``task_starts[(job, task)]``).
+"""
+
+from typing import Any
+
+from ortools.sat.python import cp_model
+
+# Type aliases following TEMPLATES.md centralized patterns
+VariableLabels = dict[int, str]  # proto variable index -> semantic label
+
+
+class LeanCpModel(cp_model.CpModel):
+    """CpModel whose variables and intervals are created unnamed.
+
+    Both the snake_case methods and their CamelCase aliases are overridden,
+    since the aliases are bound to the base-class functions.
+    """
+
+    def new_int_var(self, lb, ub, name: str = "") -> cp_model.IntVar:  # noqa: ARG002
+        """Create an unnamed integer variable."""
+        return super().new_int_var(lb, ub, "")
+
+    def new_int_var_from_domain(self, domain, name: str = "") -> cp_model.IntVar:  # noqa: ARG002
+        """Create an unnamed integer variable from a domain."""
+        return super().new_int_var_from_domain(domain, "")
+
+    def new_bool_var(self, name: str = "") -> cp_model.IntVar:  # noqa: ARG002
+        """Create an unnamed Boolean variable."""
+        return super().new_bool_var("")
+
+    def new_interval_var(
+        self,
+        start,
+        size,
+        end,
+        name: str = "",  # noqa: ARG002
+    ) -> cp_model.IntervalVar:
+        """Create an unnamed interval."""
+        return super().new_interval_var(start, size, end, "")
+
+    def new_fixed_size_interval_var(
+        self,
+        start,
+        size,
+        name: str = "",  # noqa: ARG002
+    ) -> cp_model.IntervalVar:
+        """Create an unnamed fixed-size interval."""
+        return super().new_fixed_size_interval_var(start, size, "")
+
+    def new_optional_interval_var(
+        self,
+        start,
+        size,
+        end,
+        is_present,
+        name: str = "",  # noqa: ARG002
+    ) -> cp_model.IntervalVar:
+        """Create an unnamed optional interval."""
+        return super().new_optional_interval_var(start, size, end, is_present, "")
+
+    def new_optional_fixed_size_interval_var(
+        self,
+        start,
+        size,
+        is_present,
+        name: str = "",  # noqa: ARG002
+    ) -> cp_model.IntervalVar:
+        """Create an unnamed optional fixed-size interval."""
+        return super().new_optional_fixed_size_interval_var(start, size, is_present, "")
+
+    NewIntVar = new_int_var
+    NewIntVarFromDomain = new_int_var_from_domain
+    NewBoolVar = new_bool_var
+    NewIntervalVar = new_interval_var
+    NewFixedSizeIntervalVar = new_fixed_size_interval_var
+    NewOptionalIntervalVar = new_optional_interval_var
+    NewOptionalFixedSizeIntervalVar = new_optional_fixed_size_interval_var
+
+
+def keeps_names(model: cp_model.CpModel) -> bool:
+    """Whether variables created in ``model`` keep their names.
+
+    Builders check this once and pass ``f"..." if named else ""`` per variable,
+    so lean builds skip the string formatting as well as the storage.
+    """
+    return not isinstance(model, LeanCpModel)
+
+
+def build_variable_labels(containers: dict[str, Any]) -> VariableLabels:
+    """Label integer variables by the container entry that holds them.
+
+    Args:
+        containers: Attribute name -> variable container (dict/list/variable),
+            e.g. {"task_starts": solver.task_starts}
+
+    Returns:
+        Proto variable index -> label such as "task_starts[('job_1', 't_1')]".
+        Variables held by several containers keep the first label.
+
+    """
+    labels: VariableLabels = {}
+
+    def visit(label: str, value: Any) -> None:
+        if isinstance(value, cp_model.IntervalVar):
+            return
+        if isinstance(value, cp_model.IntVar):
+            labels.setdefault(value.Index(), label)
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                visit(f"{label}[{key!r}]", item)
+        elif isinstance(value, list):
+            for position, item in enumerate(value):
+                visit(f"{label}[{position}]", item)
+
+    for name, container in containers.items():
+        visit(name, container)
+    return labels
@@ -0,0 +1,432 @@
+"""Large Neighbourhood Search (LNS) improvement on top of FreshSolver.
+
+Starting from an incumbent schedule, the driver repeatedly picks a
+neighbourhood of tasks, fixes the start, duration, machine and operator
+choices of every other task to their incumbent values, and re-solves the
+model for a short time with the incumbent as hint and its objective as upper
+bound. Improving solutions replace the incumbent.
+
+Neighbourhoods:
+    - random_machines: tasks on a random subset of machines
+    - time_window: tasks starting in a window of the incumbent schedule
+    - work_cell: tasks on the machines of random work cells
+    - late_jobs: all tasks of the jobs (instances) with the highest lateness,
+      or the latest completion when there are no due dates
+
+Neighbourhoods are solved in worker processes that clone the base model once
+(see model_snapshot), so each solve only changes variable domains.
+"""
+
+import logging
+import multiprocessing
+import os
+import random
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from ortools.sat import cp_model_pb2
+from ortools.sat.python import cp_model
+
+from src.solver.core.model_snapshot import clone_model
+from src.solver.core.solver_config import apply_solver_parameters
+
+if TYPE_CHECKING:
+    from src.solver.core.solver import FreshSolver
+
+logger = logging.getLogger(__name__)
+
+NEIGHBOURHOOD_RANDOM_MACHINES = "random_machines"
+NEIGHBOURHOOD_TIME_WINDOW = "time_window"
+NEIGHBOURHOOD_WORK_CELL = "work_cell"
+NEIGHBOURHOOD_LATE_JOBS = "late_jobs"
+
+# Base model shipped once to each LNS worker process
+_worker_base_model: dict[str, Any] = {}
+
+# Type aliases following TEMPLATES.md centralized patterns
+TaskKey = tuple[str, str]  # (job_id/instance_id, task_id)
+Solution = list[int]  # Value of every model variable, by proto index
+NeighbourhoodResult = dict[str, Any]
+
+
+@dataclass
+class LnsConfig:
+    """Settings of the LNS improvement loop.
+
+    Args:
+        neighbourhoods: Neighbourhood kinds, used round-robin
+        relax_fraction: Share of tasks released per neighbourhood
+        neighbourhood_time_limit: Seconds per neighbourhood solve
+        initial_time_limit: Seconds for the first feasible schedule
+        max_workers: Worker processes (default: CPUs; 1 solves in-process)
+        seed: Random seed for neighbourhood selection
+
+    """
+
+    neighbourhoods: tuple[str, ...] = (
+        NEIGHBOURHOOD_RANDOM_MACHINES,
+        NEIGHBOURHOOD_TIME_WINDOW,
+        NEIGHBOURHOOD_WORK_CELL,
+        NEIGHBOURHOOD_LATE_JOBS,
+    )
+    relax_fraction: float = 0.2
+    neighbourhood_time_limit: float = 2.0
+    initial_time_limit: float = 10.0
+    max_workers: int | None = None
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        unknown = set(self.neighbourhoods) - set(_SELECTORS)
+        if unknown or not self.neighbourhoods:
+            raise ValueError(f"Unknown or missing LNS neighbourhoods: {unknown}")
+        if not 0 < self.relax_fraction <= 1:
+            raise ValueError("relax_fraction must be in (0, 1]")
+
+
+@dataclass
+class TaskVariables:
+    """Proto indices of the variables describing one task."""
+
+    start: int
+    end: int
+    duration: int
+    machines: dict[str, int] = field(default_factory=dict)  # machine -> literal
+    operators: list[int] = field(default_factory=list)
+
+    def indices(self) -> list[int]:
+        """All indices fixed when the task is outside the neighbourhood."""
+        return [
+            self.start,
+            self.end,
+            self.duration,
+            *self.machines.values(),
+            *self.operators,
+        ]
+
+    def machine(self, solution: Solution) -> str | None:
+        """Machine the task is assigned to in a solution."""
+        return next((m for m, i in self.machines.items() if solution[i]), None)
+
+
+@dataclass
+class LnsResult:
+    """Outcome of the LNS loop."""
+
+    solution: Solution
+    objective: int
+    trajectory: list[dict[str, Any]] = field(default_factory=list)
+    neighbourhood_stats: dict[str, dict[str, int]] = field(default_factory=dict)
+    workers: int = 1
+
+
+class NeighbourhoodSelector:
+    """Chooses the tasks to release for each neighbourhood kind.
+
+    Args:
+        solver: Built FreshSolver whose variables index the model
+        relax_fraction: Share of tasks released per neighbourhood
+        seed: Random seed
+
+    """
+
+    def __init__(self, solver: "FreshSolver", relax_fraction: float, seed: int):
+        self.rng = random.Random(seed)
+        self.target = max(1, int(len(solver.task_starts) * relax_fraction))
+
+        self.tasks: dict[TaskKey, TaskVariables] = {
+            task_key: TaskVariables(
+                start=start.Index(),
+                end=solver.task_ends[task_key].Index(),
+                duration=solver.task_durations[task_key].Index(),
+            )
+            for task_key, start in solver.task_starts.items()
+        }
+        for (job_id, task_id, machine_id), var in solver.task_assigned.items():
+            self.tasks[(job_id, task_id)].machines[machine_id] = var.Index()
+        for (job_id, task_id, _), var in solver.task_operator_assigned.items():
+            self.tasks[(job_id, task_id)].operators.append(var.Index())
+
+        self.machine_cells = {m.resource_id: m.cell_id for m in solver.problem.machines}
+        self.lateness = {
+            job_id: var.Index() for job_id, var in solver.lateness_penalties.items()
+        }
+
+    def select(self, kind: str, solution: Solution) -> set[TaskKey]:
+        """Tasks released by one neighbourhood of the given kind."""
+        released = _SELECTORS[kind](self, solution)
+        if not released:
+            released = self._random_machines(solution)
+        return released
+
+    def fixed_indices(self, released: set[TaskKey]) -> list[int]:
+        """Variables fixed to their incumbent value for a neighbourhood."""
+        return [
+            index
+            for task_key, variables in self.tasks.items()
+            if task_key not in released
+            for index in variables.indices()
+        ]
+
+    def _fill(self, groups: list[list[TaskKey]]) -> set[TaskKey]:
+        """Take whole groups in order until the target size is reached."""
+        released: set[TaskKey] = set()
+        for group in groups:
+            if len(released) >= self.target:
+                break
+            released.update(group)
+        return released
+
+    def _tasks_by(
+        self, group_of: Callable[[TaskKey], str | None]
+    ) -> list[list[TaskKey]]:
+        """Tasks grouped by a key, groups in random order."""
+        groups: dict[str, list[TaskKey]] = {}
+        for task_key in self.tasks:
+            group = group_of(task_key)
+            if group is not None:
+                groups.setdefault(group, []).append(task_key)
+        ordered = list(groups.values())
+        self.rng.shuffle(ordered)
+        return ordered
+
+    def _random_machines(self, solution: Solution) -> set[TaskKey]:
+        return self._fill(
+            self._tasks_by(lambda task_key: self.tasks[task_key].machine(solution))
+        )
+
+    def _work_cell(self, solution: Solution) -> set[TaskKey]:
+        def cell_of(task_key: TaskKey) -> str | None:
+            machine_id = self.tasks[task_key].machine(solution)
+            return self.machine_cells.get(machine_id) if machine_id else None
+
+        return self._fill(self._tasks_by(cell_of))
+
+    def _time_window(self, solution: Solution) -> set[TaskKey]:
+        by_start = sorted(self.tasks, key=lambda k: solution[self.tasks[k].start])
+        first = self.rng.randrange(max(1, len(by_start) - self.target + 1))
+        return set(by_start[first : first + self.target])
+
+    def _late_jobs(self, solution: Solution) -> set[TaskKey]:
+        jobs: dict[str, list[TaskKey]] = {}
+        completion: dict[str, int] = {}
+        for task_key, variables in self.tasks.items():
+            jobs.setdefault(task_key[0], []).append(task_key)
+            completion[task_key[0]] = max(
+                completion.get(task_key[0], 0), solution[variables.end]
+            )
+
+        def urgency(job_id: str) -> tuple[int, int, float]:
+            lateness = solution[self.lateness[job_id]] if job_id in self.lateness else 0
+            # Random tie-break so repeated picks do not release the same jobs
+            return (lateness, completion[job_id], self.rng.random())
+
+        ranked = sorted(jobs, key=urgency, reverse=True)
+        # Sample from the most urgent jobs rather than always taking the top ones
+        candidates = ranked[: max(1, 2 * len(ranked) * self.target // len(self.tasks))]
+        self.rng.shuffle(candidates)
+        return self._fill([jobs[job_id] for job_id in candidates])
+
+
+_SELECTORS: dict[str, Callable[[NeighbourhoodSelector, Solution], set[TaskKey]]] = {
+    NEIGHBOURHOOD_RANDOM_MACHINES: NeighbourhoodSelector._random_machines,
+    NEIGHBOURHOOD_TIME_WINDOW: NeighbourhoodSelector._time_window,
+    NEIGHBOURHOOD_WORK_CELL: NeighbourhoodSelector._work_cell,
+    NEIGHBOURHOOD_LATE_JOBS: NeighbourhoodSelector._late_jobs,
+}
+
+
+def run_lns(
+    solver: "FreshSolver",
+    objective: cp_model.IntVar,
+    incumbent: Solution,
+    time_limit: float,
+    config: LnsConfig,
+    parameters: dict[str, Any],
+    lower_bound: float = 0,
+) -> LnsResult:
+    """Improve an incumbent by re-solving neighbourhoods until time runs out.
+
+    Args:
+        solver: Built FreshSolver whose model minimizes ``objective``
+        objective: Objective variable of the model
+        incumbent: Full solution of the model to start from
+        time_limit: Seconds for the whole loop
+        config: LNS settings
+        parameters: CP-SAT parameters for each neighbourhood solve
+        lower_bound: Proven objective bound; the loop stops when reached
+
+    Returns:
+        LnsResult with the best solution and the improvement trajectory
+
+    """
+    started = time.time()
+    deadline = started + time_limit
+    selector = NeighbourhoodSelector(solver, config.relax_fraction, config.seed)
+    objective_index = objective.Index()
+
+    result = LnsResult(
+        solution=list(incumbent),
+        objective=incumbent[objective_index],
+        neighbourhood_stats={
+            kind: {"tried": 0, "improved": 0} for kind in config.neighbourhoods
+        },
+    )
+    result.trajectory.append(
+        {"elapsed": 0.0, "objective": result.objective, "neighbourhood": "initial"}
+    )
+
+    cpu_count = os.cpu_count() or 1
+    result.workers = max(1, config.max_workers or cpu_count)
+    parameters = dict(parameters)
+    # Split the cores between concurrent solves instead of oversubscribing
+    parameters["num_search_workers"] = max(
+        1,
+        min(
+            parameters.get("num_search_workers", cpu_count), cpu_count // result.workers
+        ),
+    )
+    # Workers add their own hint; the objective stays in the shipped model
+    base = cp_model_pb2.CpModelProto()
+    base.CopyFrom(solver.model.Proto())
+    base.ClearField("solution_hint")
+    proto_bytes = base.SerializeToString()
+    kinds = iter(_cycle(config.neighbourhoods))
+
+    def next_neighbourhood() -> tuple[str, list[int], Solution, int, dict[str, Any]]:
+        kind = next(kinds)
+        released = selector.select(kind, result.solution)
+        neighbourhood_parameters = dict(parameters)
+        neighbourhood_parameters["max_time_in_seconds"] = max(
+            0.1, min(config.neighbourhood_time_limit, deadline - time.time())
+        )
+        return (
+            kind,
+            selector.fixed_indices(released),
+            result.solution,
+            result.objective,
+            neighbourhood_parameters,
+        )
+
+    def accept(outcome: NeighbourhoodResult) -> None:
+        stats = result.neighbourhood_stats[outcome["neighbourhood"]]
+        stats["tried"] += 1
+        if outcome["solution"] and outcome["objective"] < result.objective:
+            stats["improved"] += 1
+            result.solution = outcome["solution"]
+            result.objective = outcome["objective"]
+            result.trajectory.append(
+                {
+                    "elapsed": round(time.time() - started, 3),
+                    "objective": result.objective,
+                    "neighbourhood": outcome["neighbourhood"],
+                }
+            )
+            logger.info(
+                f"LNS improvement via {outcome['neighbourhood']}: "
+                f"objective {result.objective}"
+            )
+
+    def keep_going() -> bool:
+        return time.time() < deadline - 0.05 and result.objective > lower_bound
+
+    logger.info(
+        f"LNS: {len(selector.tasks)} tasks, {selector.target} released per "
+        f"neighbourhood, {result.workers} worker(s), {time_limit:.1f}s"
+    )
+
+    if result.workers == 1:
+        _init_lns_worker(proto_bytes, objective_index)
+        while keep_going():
+            accept(_solve_neighbourhood(*next_neighbourhood()))
+        _worker_base_model.clear()
+        return result
+
+    with ProcessPoolExecutor(
+        max_workers=result.workers,
+        # CP-SAT is not fork-safe once its threads are running
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_lns_worker,
+        initargs=(proto_bytes, objective_index),
+    ) as executor:
+        pending: set[Future] = set()
+        while pending or keep_going():
+            while keep_going() and len(pending) < result.workers:
+                pending.add(
+                    executor.submit(_solve_neighbourhood, *next_neighbourhood())
+                )
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    accept(future.result())
+                except Exception as e:
+                    logger.warning(f"LNS neighbourhood failed: {e}")
+
+    return result
+
+
+def _cycle(kinds: tuple[str, ...]):
+    """Yield neighbourhood kinds round-robin."""
+    while True:
+        yield from kinds
+
+
+def _init_lns_worker(proto_bytes: bytes, objective_index: int) -> None:
+    """Process-pool initializer: keep the model in the worker."""
+    proto = cp_model_pb2.CpModelProto()
+    proto.ParseFromString(proto_bytes)
+    _worker_base_model["proto"] = proto
+    _worker_base_model["objective_index"] = objective_index
+
+
+def _solve_neighbourhood(
+    kind: str,
+    fixed_indices: list[int],
+    incumbent: Solution,
+    incumbent_objective: int,
+    parameters: dict[str, Any],
+) -> NeighbourhoodResult:
+    """Re-solve one neighbourhood against the worker's copy of the model."""
+    model = clone_model(_worker_base_model["proto"])
+    proto = model.Proto()
+
+    for index in fixed_indices:
+        domain = proto.variables[index].domain
+        del domain[:]
+        domain.extend([incumbent[index], incumbent[index]])
+
+    # Only strictly better solutions are of interest
+    objective_index = _worker_base_model["objective_index"]
+    objective_domain = proto.variables[objective_index].domain
+    lower = objective_domain[0]
+    upper = min(objective_domain[-1], incumbent_objective - 1)
+    if upper < lower:
+        return {
+            "neighbourhood": kind,
+            "status": "INFEASIBLE",
+            "solve_time": 0.0,
+            "objective": incumbent_objective,
+            "solution": [],
+        }
+    del objective_domain[:]
+    objective_domain.extend([lower, upper])
+
+    proto.solution_hint.vars.extend(range(len(incumbent)))
+    proto.solution_hint.values.extend(incumbent)
+
+    solver = cp_model.CpSolver()
+    apply_solver_parameters(solver, parameters)
+    status = solver.Solve(model)
+
+    improved = status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+    solution = list(solver.ResponseProto().solution) if improved else []
+    return {
+        "neighbourhood": kind,
+        "status": solver.StatusName(status),
+        "solve_time": solver.WallTime(),
+        "objective": solution[objective_index] if improved else incumbent_objective,
+        "solution": solution,
+    }
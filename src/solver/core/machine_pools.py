@@ -0,0 +1,338 @@
+"""Pool interchangeable machines into one cumulative resource.
+
+Work cells often hold several machines that no task can tell apart: same work
+cell, same cost and the same mode (duration) for every task. Modelled one by
+one, each of them gets an assignment BoolVar per task and its own no-overlap,
+and CP-SAT explores every permutation of tasks over the copies.
+
+find_machine_pools groups such machines into equivalence classes, and
+pool_problem replaces every class by a single machine whose capacity is the
+class's total capacity, so the existing capacity builder models it with one
+AddCumulative. After the solve, assign_pool_machines turns each pool task back
+into a concrete machine with an interval-partitioning pass: tasks are taken in
+start order and put on the lowest free lane, which never needs more lanes than
+the cumulative allows.
+
+Machines with setup times or fixed intervals are never pooled, since both tie
+time to one concrete machine, and neither are machines of work cells whose
+capacity is below their machine count.
+"""
+
+import dataclasses
+import heapq
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+
+from src.solver.models.problem import Machine, SchedulingProblem, TaskMode
+from src.solver.models.setup_matrix import SetupTable, as_setup_table
+
+logger = logging.getLogger(__name__)
+
+# Type aliases following TEMPLATES.md centralized patterns
+FixedIntervals = dict[str, list[tuple[int, int]]]  # machine_id -> (start, end)
+SetupTimes = dict[tuple[str, str, str], int] | SetupTable  # (pred, succ, machine_id)
+MachineSignature = tuple  # (cell_id, cost_per_hour, cells, ((task, duration), ...))
+
+
+@dataclass
+class MachinePool:
+    """Interchangeable machines modelled as one resource.
+
+    Args:
+        pool_id: Resource ID of the pooled machine in the pooled problem
+        machine_ids: Member machine IDs, in problem order
+        machine_names: Member machine names, in problem order
+        capacities: Capacity of every member
+
+    """
+
+    pool_id: str
+    machine_ids: list[str]
+    machine_names: list[str]
+    capacities: list[int]
+
+    def __post_init__(self) -> None:
+        if len(self.machine_ids) < 2:
+            raise ValueError(f"Machine pool {self.pool_id} needs at least 2 machines")
+        if not (
+            len(self.machine_ids) == len(self.machine_names) == len(self.capacities)
+        ):
+            raise ValueError("MachinePool lists need one entry per machine")
+
+    @property
+    def capacity(self) -> int:
+        """Total capacity of the pool."""
+        return sum(self.capacities)
+
+    @property
+    def lane_machines(self) -> list[int]:
+        """Member index of every unit of pool capacity."""
+        return [
+            member
+            for member, capacity in enumerate(self.capacities)
+            for _ in range(capacity)
+        ]
+
+
+@dataclass
+class MachinePooling:
+    """A problem and the pools its pooled copy was built with.
+
+    Args:
+        problem: The problem as given, with every machine
+        pooled_problem: The problem with each pool as one machine
+        pools: Pools found in the problem
+
+    """
+
+    problem: SchedulingProblem
+    pooled_problem: SchedulingProblem
+    pools: list[MachinePool]
+
+    def to_dict(self) -> dict:
+        """Summary for the solution dictionary."""
+        return {
+            "machines_before": len(self.problem.machines),
+            "machines_after": len(self.pooled_problem.machines),
+            "pools": {pool.pool_id: pool.machine_ids for pool in self.pools},
+        }
+
+
+def _machine_signatures(problem: SchedulingProblem) -> dict[str, MachineSignature]:
+    """Signature of every listed machine; equal signatures are interchangeable."""
+    if problem.is_optimized_mode and problem.job_optimized_pattern:
+        tasks = [
+            (task.optimized_task_id, task.modes)
+            for pattern in problem.job_optimized_patterns
+            for task in pattern.optimized_tasks
+        ]
+    else:
+        tasks = [
+            (task.task_id, task.modes) for job in problem.jobs for task in job.tasks
+        ]
+
+    machine_modes: dict[str, list[tuple[str, int]]] = defaultdict(list)
+    for task_id, modes in tasks:
+        seen: set[str] = set()
+        for mode in modes:
+            # A repeated machine keeps its first mode, like compile_problem_arrays
+            if mode.machine_resource_id not in seen:
+                seen.add(mode.machine_resource_id)
+                machine_modes[mode.machine_resource_id].append(
+                    (task_id, mode.duration_time_units)
+                )
+
+    memberships: dict[str, list[str]] = defaultdict(list)
+    for cell in problem.work_cells:
+        for machine in cell.machines:
+            memberships[machine.resource_id].append(cell.cell_id)
+
+    return {
+        machine.resource_id: (
+            machine.cell_id,
+            machine.cost_per_hour,
+            tuple(sorted(memberships[machine.resource_id])),
+            tuple(machine_modes[machine.resource_id]),
+        )
+        for machine in problem.machines
+    }
+
+
+def find_machine_pools(
+    problem: SchedulingProblem,
+    fixed_intervals: FixedIntervals | None = None,
+    setup_times: SetupTimes | None = None,
+) -> list[MachinePool]:
+    """Group interchangeable machines of a problem.
+
+    Args:
+        problem: The scheduling problem
+        fixed_intervals: Machine time occupied outside the model
+        setup_times: Setup times between tasks on machines
+
+    Returns:
+        One MachinePool per class of two or more interchangeable machines
+
+    Performance: O(machines + tasks x modes)
+
+    """
+    excluded = {
+        *(fixed_intervals or {}),
+        *as_setup_table(problem, setup_times).machine_ids,
+        # Downtime blocks a single machine, so the pool members differ
+        *(machine.resource_id for machine in problem.machines if machine.downtime),
+    }
+    for cell in problem.work_cells:
+        if cell.capacity < cell.machine_count:
+            # workcell_capacity limits these cells by machine count
+            excluded.update(machine.resource_id for machine in cell.machines)
+
+    signatures = _machine_signatures(problem)
+    classes: dict[MachineSignature, list[Machine]] = defaultdict(list)
+    for machine in problem.machines:
+        signature = signatures[machine.resource_id]
+        if (
+            machine.resource_id not in excluded
+            and machine.capacity > 0
+            and signature[3]  # Machines no task can use are left alone
+        ):
+            classes[signature].append(machine)
+
+    return [
+        MachinePool(
+            pool_id=f"{members[0].resource_id}_pool",
+            machine_ids=[m.resource_id for m in members],
+            machine_names=[m.name for m in members],
+            capacities=[m.capacity for m in members],
+        )
+        for members in classes.values()
+        if len(members) > 1
+    ]
+
+
+def _pooled_modes(
+    modes: list[TaskMode], pool_of: dict[str, MachinePool]
+) -> list[TaskMode]:
+    """Modes with every pool member replaced by one mode on the pool."""
+    pooled = []
+    seen: set[str] = set()
+    for mode in modes:
+        pool = pool_of.get(mode.machine_resource_id)
+        if pool is None:
+            pooled.append(mode)
+        elif pool.pool_id not in seen:
+            seen.add(pool.pool_id)
+            pooled.append(dataclasses.replace(mode, machine_resource_id=pool.pool_id))
+    return pooled
+
+
+def pool_problem(
+    problem: SchedulingProblem, pools: list[MachinePool]
+) -> SchedulingProblem:
+    """Copy of a problem with each pool as a single machine.
+
+    Args:
+        problem: The scheduling problem
+        pools: Pools found by find_machine_pools
+
+    Returns:
+        New problem; jobs, tasks, the pattern and work cells are copied where
+        they reference pool members, the original problem is left untouched
+
+    """
+    pool_of = {m: pool for pool in pools for m in pool.machine_ids}
+    pool_machines: dict[str, Machine] = {}
+    machines = []
+    for machine in problem.machines:
+        pool = pool_of.get(machine.resource_id)
+        if pool is None:
+            machines.append(machine)
+        elif pool.pool_id not in pool_machines:
+            pool_machines[pool.pool_id] = dataclasses.replace(
+                machine,
+                resource_id=pool.pool_id,
+                name=f"{machine.name} pool",
+                capacity=pool.capacity,
+            )
+            machines.append(pool_machines[pool.pool_id])
+
+    work_cells = []
+    for cell in problem.work_cells:
+        cell_machines = []
+        for machine in cell.machines:
+            pool = pool_of.get(machine.resource_id)
+            if pool is None:
+                cell_machines.append(machine)
+            elif pool_machines[pool.pool_id] not in cell_machines:
+                cell_machines.append(pool_machines[pool.pool_id])
+        work_cells.append(dataclasses.replace(cell, machines=cell_machines))
+
+    # Precedence links are rebuilt by the new pattern and problem
+    replacements: dict = {"machines": machines, "work_cells": work_cells}
+    if problem.is_optimized_mode and problem.job_optimized_pattern:
+        patterns = [
+            dataclasses.replace(
+                pattern,
+                optimized_tasks=[
+                    dataclasses.replace(
+                        task,
+                        modes=_pooled_modes(task.modes, pool_of),
+                        precedence_successors=[],
+                        precedence_predecessors=[],
+                    )
+                    for task in pattern.optimized_tasks
+                ],
+            )
+            for pattern in problem.job_optimized_patterns
+        ]
+        replacements["job_optimized_pattern"] = patterns[0]
+        replacements["job_optimized_patterns"] = patterns
+    else:
+        replacements["jobs"] = [
+            dataclasses.replace(
+                job,
+                tasks=[
+                    dataclasses.replace(
+                        task,
+                        modes=_pooled_modes(task.modes, pool_of),
+                        precedence_successors=[],
+                        precedence_predecessors=[],
+                    )
+                    for task in job.tasks
+                ],
+            )
+            for job in problem.jobs
+        ]
+
+    return dataclasses.replace(problem, **replacements)
+
+
+def assign_pool_machines(schedule: list[dict], pools: list[MachinePool]) -> int:
+    """Replace pool IDs in a schedule by concrete member machines.
+
+    Tasks of a pool are taken in start order and placed on the lowest lane
+    that is free at their start; a member of capacity c provides c lanes.
+
+    Args:
+        schedule: Schedule entries in extract_solution() layout, updated in
+            place
+        pools: Pools the schedule was solved with
+
+    Returns:
+        Number of schedule entries moved to a concrete machine
+
+    Performance: O(n log n) for n pool tasks
+
+    """
+    by_pool: dict[str, list[dict]] = defaultdict(list)
+    pool_by_id = {pool.pool_id: pool for pool in pools}
+    for entry in schedule:
+        if entry.get("machine_id") in pool_by_id:
+            by_pool[entry["machine_id"]].append(entry)
+
+    for pool_id, entries in by_pool.items():
+        pool = pool_by_id[pool_id]
+        lane_machines = pool.lane_machines
+        free_lanes = list(range(len(lane_machines)))
+        busy_lanes: list[tuple[int, int]] = []  # (end_time, lane)
+        entries.sort(key=lambda entry: (entry["start_time"], entry["end_time"]))
+
+        for entry in entries:
+            while busy_lanes and busy_lanes[0][0] <= entry["start_time"]:
+                heapq.heappush(free_lanes, heapq.heappop(busy_lanes)[1])
+            if free_lanes:
+                lane = heapq.heappop(free_lanes)
+            else:
+                # More overlapping tasks than the cumulative allows
+                logger.warning(
+                    f"Pool {pool_id} over capacity at time {entry['start_time']}"
+                )
+                lane = heapq.heappop(busy_lanes)[1]
+            heapq.heappush(busy_lanes, (entry["end_time"], lane))
+
+            member = lane_machines[lane]
+            entry["machine_id"] = pool.machine_ids[member]
+            entry["machine_name"] = pool.machine_names[member]
+
+    return sum(len(entries) for entries in by_pool.values())
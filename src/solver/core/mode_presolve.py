@@ -0,0 +1,356 @@
+"""Presolve pass that prunes dominated and infeasible task modes.
+
+Every mode of a task becomes an assignment BoolVar plus optional intervals in
+the machine, work cell and WIP builders. prune_task_modes removes modes that no
+optimal schedule needs before any variable is created:
+
+- duplicate: a task lists the same machine twice. compile_problem_arrays
+  already keeps the first mode only; the pass records the dropped ones.
+- infeasible: the task cannot finish on the machine before its job's hard due
+  date, given the critical path through the precedence DAG.
+- dominated: another mode of the task runs on a machine in the same work cells
+  that is no slower and no more expensive, and that machine is uncontended
+  (its capacity covers every task that can run on it, no fixed intervals, no
+  downtime and no setup times). Moving a task from the dominated mode to that machine keeps
+  every constraint satisfied and no objective worse.
+
+Dominance is only claimed against uncontended machines: a faster mode on a
+machine other tasks compete for can still be worse for the schedule as a
+whole.
+"""
+
+import dataclasses
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from src.solver.core.task_bounds import critical_path_lengths
+from src.solver.models.problem import ObjectiveType, SchedulingProblem
+from src.solver.models.problem_arrays import (
+    INELIGIBLE,
+    ProblemArrays,
+    TaskKey,
+    duration_bounds,
+)
+from src.solver.models.setup_matrix import SetupTable, as_setup_table
+
+logger = logging.getLogger(__name__)
+
+# Type aliases following TEMPLATES.md centralized patterns
+FixedIntervals = dict[str, list[tuple[int, int]]]  # machine_id -> (start, end)
+SetupTimes = dict[tuple[str, str, str], int] | SetupTable  # (pred, succ, machine_id)
+
+# Objectives under which machine costs decide between modes
+_COST_OBJECTIVES = {ObjectiveType.MINIMIZE_TOTAL_COST}
+
+# Objectives that can prefer a slower mode; dominance is not sound under them
+_NON_REGULAR_OBJECTIVES = {ObjectiveType.MAXIMIZE_MACHINE_UTILIZATION}
+
+
+@dataclass
+class PrunedMode:
+    """A task mode removed by the presolve pass.
+
+    Args:
+        task_key: (job_id, task_id), or (instance_id, instance_task_id)
+        machine_id: Machine of the removed mode
+        reason: "duplicate", "infeasible" or "dominated"
+        dominated_by: Machine of the mode that dominates it
+
+    """
+
+    task_key: TaskKey
+    machine_id: str
+    reason: str
+    dominated_by: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.reason not in ("duplicate", "infeasible", "dominated"):
+            raise ValueError(f"Unknown pruning reason: {self.reason}")
+        if self.reason == "dominated" and self.dominated_by is None:
+            raise ValueError("A dominated mode needs its dominating machine")
+
+
+@dataclass
+class ModePresolveResult:
+    """Outcome of prune_task_modes.
+
+    Args:
+        arrays: Problem arrays without the pruned modes
+        pruned: Every removed mode with the reason it was removed
+        modes_before: Modes (assignment variables) before the pass
+        modes_after: Modes (assignment variables) after the pass
+        build_time: Time spent in the pass in seconds
+
+    """
+
+    arrays: ProblemArrays
+    pruned: list[PrunedMode] = field(default_factory=list)
+    modes_before: int = 0
+    modes_after: int = 0
+    build_time: float = 0.0
+
+    @property
+    def variables_removed(self) -> int:
+        """Assignment variables no longer created."""
+        return self.modes_before - self.modes_after
+
+    def to_dict(self) -> dict:
+        """Summary for the solution dictionary."""
+        return {
+            "modes_before": self.modes_before,
+            "modes_after": self.modes_after,
+            "variables_removed": self.variables_removed,
+            "pruned_by_reason": dict(Counter(mode.reason for mode in self.pruned)),
+            "build_time": round(self.build_time, 4),
+            "pruned": [dataclasses.asdict(mode) for mode in self.pruned],
+        }
+
+
+def active_objectives(problem: SchedulingProblem) -> set[ObjectiveType]:
+    """Objectives the solver optimizes for a problem.
+
+    Optimized-mode problems use the hierarchical lateness, makespan and cost
+    objective; problems with a multi-objective configuration use its
+    objectives; everything else minimizes makespan.
+    """
+    if problem.multi_objective_config is not None:
+        return {
+            weight.objective_type
+            for weight in problem.multi_objective_config.objectives
+        }
+    if problem.is_optimized_mode and problem.job_optimized_pattern:
+        return {
+            ObjectiveType.MINIMIZE_TOTAL_LATENESS,
+            ObjectiveType.MINIMIZE_MAKESPAN,
+            ObjectiveType.MINIMIZE_TOTAL_COST,
+        }
+    return {ObjectiveType.MINIMIZE_MAKESPAN}
+
+
+def _duplicate_modes(
+    problem: SchedulingProblem, arrays: ProblemArrays
+) -> list[PrunedMode]:
+    """Modes that repeat a machine already listed for the same task."""
+    if problem.is_optimized_mode and problem.job_optimized_pattern:
+        task_machine_ids = [
+            [
+                m.machine_resource_id
+                for m in problem.get_optimized_task(optimized_task_id).modes
+            ]
+            for optimized_task_id in arrays.optimized_task_ids
+        ]
+    else:
+        task_machine_ids = [
+            [m.machine_resource_id for m in task.modes]
+            for job in problem.jobs
+            for task in job.tasks
+        ]
+
+    duplicates = []
+    for task, machine_ids in enumerate(task_machine_ids):
+        if len(set(machine_ids)) == len(machine_ids):
+            continue
+        seen: set[str] = set()
+        for machine_id in machine_ids:
+            if machine_id in seen:
+                duplicates.append(
+                    PrunedMode(arrays.task_keys[task], machine_id, "duplicate")
+                )
+            seen.add(machine_id)
+    return duplicates
+
+
+def _uncontended_machines(
+    arrays: ProblemArrays,
+    fixed_intervals: FixedIntervals,
+    busy_machines: set[str],
+) -> np.ndarray:
+    """Machines whose capacity never makes tasks wait for each other.
+
+    busy_machines are contended regardless of capacity (setup times, downtime).
+    """
+    eligible_count = arrays.eligible.sum(axis=0)
+    uncontended = arrays.machine_capacity >= eligible_count
+    # Machines outside problem.machines get no machine constraint
+    uncontended[arrays.known_machine_count :] = True
+    for machine_id in {*fixed_intervals, *busy_machines}:
+        machine = arrays.machine_index.get(machine_id)
+        if machine is not None:
+            uncontended[machine] = False
+    return uncontended
+
+
+def _cell_signatures(arrays: ProblemArrays) -> list[tuple[int, tuple[int, ...]]]:
+    """Work cell and work cell memberships of every machine."""
+    memberships: list[list[int]] = [[] for _ in range(arrays.machine_count)]
+    for cell in range(len(arrays.cell_ids)):
+        for machine in arrays.cell_machine_indices(cell):
+            memberships[machine].append(cell)
+    return [
+        (int(arrays.machine_cell[machine]), tuple(sorted(cells)))
+        for machine, cells in enumerate(memberships)
+    ]
+
+
+def _infeasible_modes(
+    arrays: ProblemArrays, unit_deadlines: list[int | None]
+) -> np.ndarray:
+    """Task x machine mask of modes that cannot meet their hard due date."""
+    infeasible = np.zeros_like(arrays.eligible)
+    lengths = critical_path_lengths(arrays)
+    if lengths is None or not any(due is not None for due in unit_deadlines):
+        return infeasible
+
+    head, tail = (np.asarray(values, dtype=np.int64) for values in lengths)
+    deadline = np.asarray(
+        [np.iinfo(np.int64).max if due is None else due for due in unit_deadlines],
+        dtype=np.int64,
+    )[arrays.task_unit]
+    # Longest chain through the task without the task's own duration
+    chain = head + tail - arrays.min_duration
+    # A task whose critical path already misses the deadline is infeasible in
+    # every mode; leave it to the due date constraint to report
+    reachable = head + tail <= deadline
+    finish = chain[:, None] + arrays.durations
+    return arrays.eligible & (finish > deadline[:, None]) & reachable[:, None]
+
+
+def prune_task_modes(
+    arrays: ProblemArrays,
+    problem: SchedulingProblem,
+    unit_deadlines: list[int | None] | None = None,
+    fixed_intervals: FixedIntervals | None = None,
+    setup_times: SetupTimes | None = None,
+    objectives: set[ObjectiveType] | None = None,
+) -> ModePresolveResult:
+    """Remove duplicate, infeasible and dominated modes from problem arrays.
+
+    Args:
+        arrays: Compiled problem arrays
+        problem: The scheduling problem the arrays were compiled from
+        unit_deadlines: Hard completion deadline per job (instance in optimized
+            mode) in time units; None disables infeasible-mode pruning
+        fixed_intervals: Machine time occupied outside the model
+        setup_times: Setup times between tasks on machines
+        objectives: Objectives the model will optimize; derived from the
+            problem with active_objectives() if omitted. Callers that build a
+            model without problem.multi_objective_config but optimize its
+            objectives later (Pareto) must pass them.
+
+    Returns:
+        ModePresolveResult with the pruned arrays. A task always keeps at least
+        one mode.
+
+    Performance: O(tasks x modes²), run once per solver before variable creation
+
+    """
+    started = time.perf_counter()
+    fixed_intervals = fixed_intervals or {}
+    setup_machines = as_setup_table(problem, setup_times).machine_ids
+    if objectives is None:
+        objectives = active_objectives(problem)
+
+    pruned = _duplicate_modes(problem, arrays)
+    keep = arrays.eligible.copy()
+
+    # Infeasible modes: the task would finish after its job's due date
+    infeasible = _infeasible_modes(arrays, unit_deadlines or [])
+    for task in np.flatnonzero(infeasible.any(axis=1)).tolist():
+        remaining = keep[task] & ~infeasible[task]
+        if not remaining.any():
+            continue
+        for machine in np.flatnonzero(infeasible[task]).tolist():
+            keep[task, machine] = False
+            pruned.append(
+                PrunedMode(
+                    arrays.task_keys[task], arrays.machine_ids[machine], "infeasible"
+                )
+            )
+
+    # Dominated modes: an uncontended machine in the same cells does no worse
+    if not objectives & _NON_REGULAR_OBJECTIVES:
+        down_machines = {m.resource_id for m in problem.machines if m.downtime}
+        uncontended = _uncontended_machines(
+            arrays, fixed_intervals, {*setup_machines, *down_machines}
+        )
+        signature = _cell_signatures(arrays)
+        rate = np.zeros(arrays.machine_count)
+        if objectives & _COST_OBJECTIVES:
+            rate[: arrays.known_machine_count] = [
+                machine.cost_per_hour for machine in problem.machines
+            ]
+        for task in range(arrays.task_count):
+            modes = [m for m in arrays.task_machines(task) if keep[task, m]]
+            if len(modes) < 2 or not uncontended[modes].any():
+                continue
+            durations = arrays.durations[task]
+            for position, machine in enumerate(modes):
+                # The setup builder reads these assignment variables directly
+                if arrays.machine_ids[machine] in setup_machines:
+                    continue
+                cost = durations[machine] * rate[machine]
+                for other_position, other in enumerate(modes):
+                    if (
+                        other == machine
+                        or not keep[task, other]
+                        or not uncontended[other]
+                        or signature[other] != signature[machine]
+                    ):
+                        continue
+                    other_cost = durations[other] * rate[other]
+                    if durations[other] > durations[machine] or other_cost > cost:
+                        continue
+                    # Equivalent modes: the one listed first survives
+                    if (
+                        durations[other] == durations[machine]
+                        and other_cost == cost
+                        and other_position > position
+                    ):
+                        continue
+                    keep[task, machine] = False
+                    pruned.append(
+                        PrunedMode(
+                            arrays.task_keys[task],
+                            arrays.machine_ids[machine],
+                            "dominated",
+                            dominated_by=arrays.machine_ids[other],
+                        )
+                    )
+                    break
+
+    modes_before = len(arrays.mode_machines)
+    if keep.sum() == modes_before:
+        pruned_arrays = arrays
+    else:
+        mode_tasks = np.repeat(
+            np.arange(arrays.task_count), np.diff(arrays.mode_indptr)
+        )
+        kept = keep[mode_tasks, arrays.mode_machines]
+        mode_indptr = np.zeros(arrays.task_count + 1, dtype=np.int32)
+        mode_indptr[1:] = np.cumsum(
+            np.bincount(mode_tasks[kept], minlength=arrays.task_count)
+        )
+        pruned_arrays = dataclasses.replace(
+            arrays,
+            durations=np.where(keep, arrays.durations, INELIGIBLE).astype(np.int32),
+            eligible=keep,
+            mode_indptr=mode_indptr,
+            mode_machines=arrays.mode_machines[kept],
+        )
+        # Duration variable domains, task bounds and dispatch read these; they
+        # must describe the surviving modes, not the pruned ones
+        pruned_arrays.min_duration, pruned_arrays.max_duration = duration_bounds(
+            pruned_arrays.durations, keep
+        )
+
+    return ModePresolveResult(
+        arrays=pruned_arrays,
+        pruned=pruned,
+        modes_before=modes_before,
+        modes_after=len(pruned_arrays.mode_machines),
+        build_time=time.perf_counter() - started,
+    )
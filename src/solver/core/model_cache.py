@@ -0,0 +1,613 @@
+"""Compiled-model cache for FreshSolver.
+
+Building the CP-SAT model for an optimized-mode pattern is often slower than
+solving it. Structurally identical problems (same pattern, instance count,
+machines, work cells and constraint options) compile to the same constraint
+graph, so the structural part of the model is cached as a serialized
+``CpModelProto`` together with an index of the solver's variable dictionaries.
+A cache hit rebinds the variables against a copy of the proto; only the
+instance-specific layer (due dates) is added on top of it.
+
+Instance identifiers are stored by ordinal (rank of the instance ID) so that a
+cached model can be replayed for a different set of instances of the same size.
+
+The on-disk tier never executes what it reads: each entry is the serialized
+proto (``<fingerprint>.pb``) plus a JSON file with the variable index and
+metadata (``<fingerprint>.json``), checked against the requested fingerprint
+and the proto's SHA-256 before use.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field, fields, is_dataclass
+from datetime import UTC, date, datetime
+from datetime import time as dt_time
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import ortools
+from ortools.sat.python import cp_model
+
+from src.solver.models.problem import SchedulingProblem
+
+if TYPE_CHECKING:
+    from src.operations.performance_monitoring import PerformanceMonitor
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the structure of the cached variable index changes
+CACHE_FORMAT_VERSION = 2
+
+# Horizons are rounded up to whole days (96 x 15-minute units) so that problems
+# whose due dates move by a few hours still share a compiled model
+HORIZON_BUCKET_UNITS = 96
+
+# Dataclass fields that change on every load and never affect the model
+_VOLATILE_FIELDS = frozenset({"created_at", "updated_at"})
+
+# Type aliases following TEMPLATES.md centralized patterns
+EncodedKey = tuple[Any, ...]
+VariableIndex = dict[str, Any]
+FixedIntervalDict = dict[str, list[tuple[int, int]]]  # (start, end) per machine
+
+
+@dataclass
+class CompiledModel:
+    """Serialized structural model plus the index needed to rebind variables."""
+
+    fingerprint: str
+    proto_bytes: bytes
+    variable_index: VariableIndex
+    horizon: int
+    build_time: float
+    instance_count: int
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    @property
+    def proto_size_bytes(self) -> int:
+        """Size of the serialized model in bytes."""
+        return len(self.proto_bytes)
+
+    def metadata(self) -> dict[str, Any]:
+        """JSON-serializable fields of the on-disk tier, proto excluded."""
+        return {
+            "format_version": CACHE_FORMAT_VERSION,
+            "fingerprint": self.fingerprint,
+            "proto_sha256": hashlib.sha256(self.proto_bytes).hexdigest(),
+            "variable_index": self.variable_index,
+            "horizon": self.horizon,
+            "build_time": self.build_time,
+            "instance_count": self.instance_count,
+            "created_at": self.created_at.isoformat(),
+        }
+
+    @classmethod
+    def from_metadata(
+        cls, metadata: dict[str, Any], proto_bytes: bytes
+    ) -> "CompiledModel":
+        """Rebuild an entry from metadata() and the serialized proto.
+
+        Raises:
+            ValueError: If the metadata does not belong to this format or proto
+
+        """
+        if metadata.get("format_version") != CACHE_FORMAT_VERSION:
+            raise ValueError(
+                f"Cache format {metadata.get('format_version')} is not "
+                f"{CACHE_FORMAT_VERSION}"
+            )
+        if metadata["proto_sha256"] != hashlib.sha256(proto_bytes).hexdigest():
+            raise ValueError("Proto does not match its recorded SHA-256")
+        return cls(
+            fingerprint=metadata["fingerprint"],
+            proto_bytes=proto_bytes,
+            # JSON turns the index's tuples into lists; keys must be hashable
+            variable_index=_as_tuples(metadata["variable_index"]),
+            horizon=int(metadata["horizon"]),
+            build_time=float(metadata["build_time"]),
+            instance_count=int(metadata["instance_count"]),
+            created_at=datetime.fromisoformat(metadata["created_at"]),
+        )
+
+
+def _as_tuples(value: Any) -> Any:
+    """Convert the lists of a JSON-decoded value back to tuples."""
+    if isinstance(value, list):
+        return tuple(_as_tuples(v) for v in value)
+    if isinstance(value, dict):
+        return {k: _as_tuples(v) for k, v in value.items()}
+    return value
+
+
+def bucket_horizon(horizon: int, bucket_units: int = HORIZON_BUCKET_UNITS) -> int:
+    """Round a horizon up to the next cache bucket boundary.
+
+    A larger horizon only widens variable domains, so a model compiled with the
+    bucketed horizon is valid for every horizon inside the bucket.
+
+    Args:
+        horizon: Horizon in time units
+        bucket_units: Bucket width in time units
+
+    Returns:
+        Horizon rounded up to a multiple of bucket_units
+
+    """
+    if bucket_units <= 0:
+        return horizon
+    return -(-horizon // bucket_units) * bucket_units
+
+
+def is_cacheable(problem: SchedulingProblem) -> bool:
+    """Check whether a problem's structural model can be cached.
+
+    Only optimized-mode problems share structure across requests. Multi-objective
+    configurations embed due dates in the structural constraints and are excluded.
+    """
+    return bool(
+        problem.is_optimized_mode
+        and problem.job_optimized_pattern
+        and problem.job_instances
+        and not problem.multi_objective_config
+    )
+
+
+def compute_problem_fingerprint(
+    problem: SchedulingProblem,
+    horizon: int,
+    setup_times: dict[tuple[str, str, str], int] | None = None,
+    monitoring: Iterable[str] = (),
+    fixed_intervals: FixedIntervalDict | None = None,
+    downtime: FixedIntervalDict | None = None,
+    presolve_modes: bool = False,
+    pool_machines: bool = False,
+    lean_model: bool = False,
+    objectives: Iterable[str] = (),
+) -> str:
+    """Fingerprint the parts of a problem that determine the structural model.
+
+    Args:
+        problem: Optimized-mode scheduling problem
+        horizon: (Bucketed) horizon the model is compiled with
+        setup_times: Setup times passed to the solver
+        monitoring: Monitoring constructs built into the model
+        fixed_intervals: Occupied machine spans blocked in the model
+        downtime: Compiled machine downtime spans blocked in the model
+        presolve_modes: Whether task modes were pruned before the build
+        pool_machines: Whether interchangeable machines were pooled
+        lean_model: Whether variables and intervals were created unnamed
+        objectives: Objectives mode presolve judged dominance under
+
+    Returns:
+        Hex digest identifying the compiled model
+
+    """
+    payload = (
+        CACHE_FORMAT_VERSION,
+        ortools.__version__,
+        _canonical(problem.job_optimized_patterns),
+        # Pattern of each instance ordinal (instances are keyed by sorted ID)
+        tuple(
+            problem.instance_pattern(instance).optimized_pattern_id
+            for instance in sorted(problem.job_instances, key=lambda i: i.instance_id)
+        ),
+        _canonical(problem.jobs),
+        _canonical(problem.machines),
+        _canonical(problem.work_cells),
+        # Constraint options
+        horizon,
+        _canonical(setup_times or {}),
+        _canonical(problem.setup_matrices),
+        _canonical(problem.calendars),
+        problem.default_calendar_id,
+        _canonical(problem.calendar_origin),
+        _canonical(problem.operators),
+        _canonical(problem.skills),
+        _canonical(problem.task_skill_requirements),
+        _canonical(problem.operator_shifts),
+        tuple(sorted(monitoring)),
+        # Blocked machine time; downtime depends on the solve time, so the
+        # compiled spans are hashed rather than Machine.downtime alone
+        _canonical(fixed_intervals or {}),
+        _canonical(downtime or {}),
+        # Solver options that change the model built from the same problem
+        presolve_modes,
+        pool_machines,
+        lean_model,
+        tuple(sorted(objectives)),
+    )
+    return hashlib.sha256(repr(payload).encode()).hexdigest()
+
+
+def _canonical(value: Any) -> Any:
+    """Convert a problem component to a deterministic, hashable representation."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return (
+            type(value).__name__,
+            tuple(
+                (f.name, _canonical(getattr(value, f.name)))
+                for f in fields(value)
+                if f.init and f.name not in _VOLATILE_FIELDS
+            ),
+        )
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime | date | dt_time):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return tuple(
+            sorted((repr(_canonical(k)), _canonical(v)) for k, v in value.items())
+        )
+    if isinstance(value, set | frozenset):
+        return tuple(sorted(repr(_canonical(v)) for v in value))
+    if isinstance(value, list | tuple):
+        return tuple(_canonical(v) for v in value)
+    return value
+
+
+class _InstanceKeyMapper:
+    """Translate instance-specific keys to ordinal form and back."""
+
+    def __init__(self, problem: SchedulingProblem):
+        self.problem = problem
+        self.instance_ids = sorted(i.instance_id for i in problem.job_instances)
+        self.instance_ordinals = {iid: n for n, iid in enumerate(self.instance_ids)}
+        self.instance_task_ordinals: dict[str, tuple[int, str]] = {}
+
+        if problem.job_optimized_pattern:
+            for instance in problem.job_instances:
+                ordinal = self.instance_ordinals[instance.instance_id]
+                pattern = problem.instance_pattern(instance)
+                for optimized_task in pattern.optimized_tasks:
+                    instance_task_id = problem.get_instance_task_id(
+                        instance.instance_id, optimized_task.optimized_task_id
+                    )
+                    self.instance_task_ordinals[instance_task_id] = (
+                        ordinal,
+                        optimized_task.optimized_task_id,
+                    )
+
+    def encode(self, key: Any) -> EncodedKey:
+        if isinstance(key, tuple):
+            return ("tuple", tuple(self._encode_part(part) for part in key))
+        return self._encode_part(key)
+
+    def decode(self, encoded: EncodedKey) -> Any:
+        if encoded[0] == "tuple":
+            return tuple(self._decode_part(part) for part in encoded[1])
+        return self._decode_part(encoded)
+
+    def _encode_part(self, part: Any) -> EncodedKey:
+        if isinstance(part, str):
+            if part in self.instance_ordinals:
+                return ("instance", self.instance_ordinals[part])
+            if part in self.instance_task_ordinals:
+                return ("instance_task", *self.instance_task_ordinals[part])
+        return ("value", part)
+
+    def _decode_part(self, part: EncodedKey) -> Any:
+        if part[0] == "instance":
+            return self.instance_ids[part[1]]
+        if part[0] == "instance_task":
+            return self.problem.get_instance_task_id(
+                self.instance_ids[part[1]], part[2]
+            )
+        return part[1]
+
+
+def load_model(
+    compiled: CompiledModel, model: cp_model.CpModel | None = None
+) -> cp_model.CpModel:
+    """Create a CpModel from a cached CompiledModel.
+
+    Args:
+        compiled: Cached model
+        model: Empty model to load into (default: a new CpModel)
+
+    Returns:
+        New model with the cached structural constraints and variables
+
+    """
+    model = model or cp_model.CpModel()
+    model.Proto().ParseFromString(compiled.proto_bytes)
+    # Registers the proto variables with the Python wrapper (as CpModel.clone())
+    model.rebuild_var_and_constant_map()
+    return model
+
+
+def capture_variables(
+    variables: dict[str, Any], problem: SchedulingProblem
+) -> VariableIndex:
+    """Build a proto-index map of the solver's variable dictionaries.
+
+    Args:
+        variables: Attribute name -> variable container (dict/list/variable)
+        problem: Problem the variables were created for
+
+    Returns:
+        Variable index that can be replayed with restore_variables()
+
+    """
+    mapper = _InstanceKeyMapper(problem)
+    return {name: _encode_value(value, mapper) for name, value in variables.items()}
+
+
+def restore_variables(
+    model: cp_model.CpModel, index: VariableIndex, problem: SchedulingProblem
+) -> dict[str, Any]:
+    """Rebind cached variable containers against a model built from the proto.
+
+    Args:
+        model: Model whose proto was copied from the cached CompiledModel
+        index: Variable index produced by capture_variables()
+        problem: Problem being solved (supplies the new instance IDs)
+
+    Returns:
+        Attribute name -> variable container bound to ``model``
+
+    """
+    mapper = _InstanceKeyMapper(problem)
+    return {
+        name: _decode_value(encoded, model, mapper) for name, encoded in index.items()
+    }
+
+
+def _encode_value(value: Any, mapper: _InstanceKeyMapper) -> Any:
+    if isinstance(value, cp_model.IntervalVar):
+        return ("interval", value.Index())
+    if isinstance(value, cp_model.IntVar):
+        return ("int", value.Index())
+    if isinstance(value, dict):
+        return (
+            "dict",
+            [(mapper.encode(k), _encode_value(v, mapper)) for k, v in value.items()],
+        )
+    if isinstance(value, list):
+        return ("list", [_encode_value(v, mapper) for v in value])
+    if isinstance(value, tuple):
+        return ("tuple", [_encode_value(v, mapper) for v in value])
+    if isinstance(value, int):
+        return ("const", value)
+    raise TypeError(f"Cannot cache solver value of type {type(value).__name__}")
+
+
+def _decode_value(
+    encoded: Any, model: cp_model.CpModel, mapper: _InstanceKeyMapper
+) -> Any:
+    kind, payload = encoded
+    if kind == "interval":
+        return model.GetIntervalVarFromProtoIndex(payload)
+    if kind == "int":
+        return model.GetIntVarFromProtoIndex(payload)
+    if kind == "dict":
+        return {mapper.decode(k): _decode_value(v, model, mapper) for k, v in payload}
+    if kind == "tuple":
+        return tuple(_decode_value(v, model, mapper) for v in payload)
+    if kind == "const":
+        return payload
+    return [_decode_value(v, model, mapper) for v in payload]
+
+
+class ModelCache:
+    """LRU cache of compiled structural models with an optional on-disk tier.
+
+    The in-memory tier holds up to ``max_entries`` models and evicts the least
+    recently used one. When ``cache_dir`` is set, every compiled model is also
+    written to disk and memory misses fall back to the disk tier.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 16,
+        cache_dir: Path | None = None,
+        performance_monitor: "PerformanceMonitor | None" = None,
+    ):
+        """Initialize the model cache.
+
+        Args:
+            max_entries: Maximum number of models kept in memory
+            cache_dir: Directory for the on-disk tier (disabled when None)
+            performance_monitor: Monitor receiving hit/miss events
+
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive: {max_entries}")
+
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.performance_monitor = performance_monitor
+        self._entries: OrderedDict[str, CompiledModel] = OrderedDict()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return fingerprint in self._entries or self._disk_path(fingerprint) is not None
+
+    def get(
+        self, fingerprint: str, template_id: str | None = None
+    ) -> CompiledModel | None:
+        """Look up a compiled model, promoting disk hits into memory.
+
+        Args:
+            fingerprint: Problem fingerprint
+            template_id: Template ID used to tag monitoring events
+
+        Returns:
+            The cached model or None on a miss
+
+        """
+        entry = self._entries.get(fingerprint)
+        tier = "memory"
+
+        if entry is not None:
+            self._entries.move_to_end(fingerprint)
+        else:
+            entry = self._load_from_disk(fingerprint)
+            tier = "disk"
+            if entry is not None:
+                self._store_in_memory(entry)
+
+        if entry is None:
+            self.misses += 1
+            self._record(hit=False, tier="none", template_id=template_id)
+            logger.debug(f"Model cache miss: {fingerprint[:12]}")
+            return None
+
+        self.hits += 1
+        if tier == "disk":
+            self.disk_hits += 1
+        self._record(
+            hit=True,
+            tier=tier,
+            template_id=template_id,
+            instance_count=entry.instance_count,
+        )
+        logger.info(f"Model cache hit ({tier}): {fingerprint[:12]}")
+        return entry
+
+    def put(self, entry: CompiledModel, template_id: str | None = None) -> None:
+        """Store a compiled model in memory and, if configured, on disk.
+
+        Args:
+            entry: Compiled model to store
+            template_id: Template ID used to tag monitoring events
+
+        """
+        self._store_in_memory(entry)
+
+        if self.cache_dir is not None:
+            proto_path, metadata_path = self._disk_files(entry.fingerprint)
+            try:
+                proto_path.write_bytes(entry.proto_bytes)
+                # Written last: an entry counts as stored once its JSON exists
+                metadata_path.write_text(json.dumps(entry.metadata()))
+            except (OSError, TypeError, ValueError) as e:
+                logger.error(f"Failed to write cached model to {metadata_path}: {e}")
+
+        if self.performance_monitor is not None:
+            self.performance_monitor.record_model_build(
+                build_time=entry.build_time,
+                proto_size_bytes=entry.proto_size_bytes,
+                template_id=template_id,
+                instance_count=entry.instance_count,
+            )
+
+    def clear(self, include_disk: bool = False) -> None:
+        """Drop all in-memory entries (and optionally the on-disk tier)."""
+        self._entries.clear()
+        if include_disk and self.cache_dir is not None:
+            for pattern in ("*.pb", "*.json"):
+                for path in self.cache_dir.glob(pattern):
+                    path.unlink(missing_ok=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _store_in_memory(self, entry: CompiledModel) -> None:
+        self._entries[entry.fingerprint] = entry
+        self._entries.move_to_end(entry.fingerprint)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self.evictions += 1
+            logger.debug(f"Evicted cached model: {evicted[:12]}")
+
+    def _disk_files(self, fingerprint: str) -> tuple[Path, Path]:
+        """Proto and metadata paths of an on-disk entry."""
+        return (
+            self.cache_dir / f"{fingerprint}.pb",
+            self.cache_dir / f"{fingerprint}.json",
+        )
+
+    def _disk_path(self, fingerprint: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        proto_path, metadata_path = self._disk_files(fingerprint)
+        if proto_path.exists() and metadata_path.exists():
+            return metadata_path
+        return None
+
+    def _load_from_disk(self, fingerprint: str) -> CompiledModel | None:
+        path = self._disk_path(fingerprint)
+        if path is None:
+            return None
+        try:
+            metadata = json.loads(path.read_text())
+            proto_bytes = path.with_suffix(".pb").read_bytes()
+            if metadata.get("fingerprint") != fingerprint:
+                raise ValueError(f"entry is for {metadata.get('fingerprint')}")
+            entry = CompiledModel.from_metadata(metadata, proto_bytes)
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring invalid cached model file {path}: {e}")
+            return None
+        return entry
+
+    def _record(
+        self,
+        hit: bool,
+        tier: str,
+        template_id: str | None,
+        instance_count: int | None = None,
+    ) -> None:
+        if self.performance_monitor is not None:
+            self.performance_monitor.record_model_cache_access(
+                hit=hit,
+                tier=tier,
+                template_id=template_id,
+                instance_count=instance_count,
+            )
+
+
+def compile_model(
+    model: cp_model.CpModel,
+    fingerprint: str,
+    variables: dict[str, Any],
+    problem: SchedulingProblem,
+    horizon: int,
+    build_started: float,
+) -> CompiledModel:
+    """Snapshot a freshly built structural model for the cache.
+
+    Args:
+        model: Model containing only the structural constraints
+        fingerprint: Problem fingerprint
+        variables: Attribute name -> variable container to index
+        problem: Problem the model was built for
+        horizon: Horizon the model was built with
+        build_started: ``time.perf_counter()`` value when the build began
+
+    Returns:
+        CompiledModel ready to be stored in a ModelCache
+
+    """
+    return CompiledModel(
+        fingerprint=fingerprint,
+        proto_bytes=model.Proto().SerializeToString(),
+        variable_index=capture_variables(variables, problem),
+        horizon=horizon,
+        build_time=time.perf_counter() - build_started,
+        instance_count=len(problem.job_instances),
+    )
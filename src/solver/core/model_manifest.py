@@ -0,0 +1,175 @@
+"""Manifest of the monitoring constructs a model actually needs.
+
+Several builders add variables that only monitor the schedule: WIP levels per
+work cell and the cross-cell WIP spread, the adaptive WIP adjustment booleans,
+the flow balance max/min levels and the operator utilization gaps. None of
+them is part of any objective, and nothing reads them after the solve unless a
+caller asks for them, yet every model carried them into presolve.
+
+build_model_manifest() decides from the active objectives and the requested
+reports which constructs are needed. FreshSolver builds only those into the
+solve model; the others are built into a detached model that is counted and
+dropped, so the log states exactly what was eliminated.
+"""
+
+import logging
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+
+from ortools.sat.python import cp_model
+
+from src.solver.core.mode_presolve import active_objectives
+from src.solver.models.problem import ObjectiveType, SchedulingProblem
+
+logger = logging.getLogger(__name__)
+
+
+class MonitoringConstruct(Enum):
+    """Model constructs that only monitor the schedule."""
+
+    WIP_MONITORING = "wip_monitoring"  # WIP level, utilization, queue, spread
+    WIP_ADJUSTMENT = "wip_adjustment"  # Adaptive WIP adjustment booleans
+    FLOW_BALANCE = "flow_balance"  # Cross-cell flow imbalance levels
+    OPERATOR_BALANCING = "operator_balancing"  # Operator utilization gaps
+
+
+# Type aliases following TEMPLATES.md centralized patterns
+ModelSize = tuple[int, int]  # (variables, constraints)
+
+# Objectives whose terms read a construct. No objective reads one yet; an
+# objective built on a construct must be listed here to keep it in the model
+CONSTRUCT_OBJECTIVES: dict[MonitoringConstruct, set[ObjectiveType]] = {
+    construct: set() for construct in MonitoringConstruct
+}
+
+# Constructs built on the variables of another construct
+_REQUIRES: dict[MonitoringConstruct, set[MonitoringConstruct]] = {
+    MonitoringConstruct.WIP_ADJUSTMENT: {MonitoringConstruct.WIP_MONITORING},
+}
+
+
+@dataclass
+class ModelManifest:
+    """Monitoring constructs kept in the model and those eliminated from it.
+
+    Args:
+        needed: Constructs built into the solve model
+        eliminated: (variables, constraints) of each construct left out
+
+    """
+
+    needed: frozenset[MonitoringConstruct] = frozenset()
+    eliminated: dict[MonitoringConstruct, ModelSize] = field(default_factory=dict)
+
+    # Receives the constructs that are not needed; never solved
+    _detached: cp_model.CpModel = field(
+        default_factory=cp_model.CpModel, init=False, repr=False
+    )
+
+    def needs(self, construct: MonitoringConstruct) -> bool:
+        """Whether the construct is built into the solve model."""
+        return construct in self.needed
+
+    @contextmanager
+    def building(
+        self, construct: MonitoringConstruct, model: cp_model.CpModel
+    ) -> Iterator[cp_model.CpModel]:
+        """Model a construct's builder should add to.
+
+        Yields ``model`` for needed constructs and the detached model for the
+        others, and records the size of what was added to the detached model.
+        Variables built into the detached model must be discarded.
+        """
+        if self.needs(construct):
+            yield model
+            return
+
+        proto = self._detached.Proto()
+        variables, constraints = len(proto.variables), len(proto.constraints)
+        yield self._detached
+        variables = len(proto.variables) - variables
+        constraints = len(proto.constraints) - constraints
+        if variables or constraints:
+            eliminated = self.eliminated.get(construct, (0, 0))
+            self.eliminated[construct] = (
+                eliminated[0] + variables,
+                eliminated[1] + constraints,
+            )
+
+    def keep(self, construct: MonitoringConstruct, variables: dict) -> dict:
+        """The construct's variables if they are in the solve model, else {}."""
+        return variables if self.needs(construct) else {}
+
+    @property
+    def variables_eliminated(self) -> int:
+        """Variables left out of the solve model."""
+        return sum(variables for variables, _ in self.eliminated.values())
+
+    @property
+    def constraints_eliminated(self) -> int:
+        """Constraints left out of the solve model."""
+        return sum(constraints for _, constraints in self.eliminated.values())
+
+    def log_eliminated(self) -> None:
+        """Log how much the manifest removed from the model."""
+        if not self.eliminated:
+            return
+        details = ", ".join(
+            f"{construct.value} {variables}/{constraints}"
+            for construct, (variables, constraints) in self.eliminated.items()
+        )
+        logger.info(
+            f"Model manifest: eliminated {self.variables_eliminated} variables "
+            f"and {self.constraints_eliminated} constraints ({details})"
+        )
+
+    def to_dict(self) -> dict:
+        """Summary for the solution dictionary."""
+        return {
+            "needed": sorted(construct.value for construct in self.needed),
+            "variables_eliminated": self.variables_eliminated,
+            "constraints_eliminated": self.constraints_eliminated,
+            "eliminated": {
+                construct.value: {"variables": variables, "constraints": constraints}
+                for construct, (variables, constraints) in self.eliminated.items()
+            },
+        }
+
+
+def build_model_manifest(
+    problem: SchedulingProblem,
+    report: Iterable[MonitoringConstruct] = (),
+    objectives: set[ObjectiveType] | None = None,
+) -> ModelManifest:
+    """Decide which monitoring constructs a problem's model needs.
+
+    Args:
+        problem: The scheduling problem
+        report: Constructs the caller reads after the solve
+        objectives: Objectives the model optimizes (default: derived from the
+            problem with active_objectives())
+
+    Returns:
+        ModelManifest with the constructs read by an active objective or
+        reported, plus the constructs they are built on
+
+    """
+    if objectives is None:
+        objectives = active_objectives(problem)
+    needed = {
+        construct
+        for construct, readers in CONSTRUCT_OBJECTIVES.items()
+        if readers & objectives
+    }
+    needed.update(report)
+
+    pending = list(needed)
+    while pending:
+        for required in _REQUIRES.get(pending.pop(), set()):
+            if required not in needed:
+                needed.add(required)
+                pending.append(required)
+
+    return ModelManifest(needed=frozenset(needed))
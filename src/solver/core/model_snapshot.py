@@ -0,0 +1,51 @@
+"""Snapshots of the objective-free base model.
+
+Building the variables and constraints of a large problem is expensive, while
+the solve paths that follow (lexicographic phases, the makespan fallback,
+Pareto points) only differ in their objective and a few phase constraints.
+A snapshot keeps a copy of the ``CpModelProto`` right after constraint
+construction; cloning it gives a fresh ``CpModel`` with the same variables
+at the same proto indices, so the solver's variable dictionaries stay valid
+on every clone.
+"""
+
+from ortools.sat import cp_model_pb2
+from ortools.sat.python import cp_model
+
+
+def snapshot_model(model: cp_model.CpModel) -> cp_model_pb2.CpModelProto:
+    """Copy a model without its objective and solution hints.
+
+    Args:
+        model: Model to snapshot
+
+    Returns:
+        Detached proto that later changes to ``model`` do not affect
+
+    """
+    snapshot = cp_model_pb2.CpModelProto()
+    snapshot.CopyFrom(model.Proto())
+    snapshot.ClearField("objective")
+    snapshot.ClearField("floating_point_objective")
+    snapshot.ClearField("solution_hint")
+    return snapshot
+
+
+def clone_model(
+    snapshot: cp_model_pb2.CpModelProto, model: cp_model.CpModel | None = None
+) -> cp_model.CpModel:
+    """Create a new model from a snapshot.
+
+    Args:
+        snapshot: Proto returned by snapshot_model()
+        model: Empty model to copy into (default: a new CpModel)
+
+    Returns:
+        Model whose variables have the same indices as in the snapshot
+
+    """
+    model = model or cp_model.CpModel()
+    model.Proto().CopyFrom(snapshot)
+    # Registers the proto variables with the Python wrapper (as CpModel.clone())
+    model.rebuild_var_and_constant_map()
+    return model
@@ -0,0 +1,314 @@
+"""Rolling-horizon decomposition for problems with many jobs or instances.
+
+Instead of one monolithic model, jobs (or job instances in optimized mode) are
+sorted by due date and solved in overlapping windows of ``window_size``. After
+each window the first ``window_size - overlap`` jobs are committed: their tasks
+become fixed intervals on the machines (and work cells) of every later window,
+while the overlapping jobs are solved again together with the next ones. The
+committed windows are stitched into a single solution dictionary with the same
+layout as ``extract_solution``.
+
+Committed work only blocks machine time. Setup times between a committed task
+and a task of a later window, operator assignments and sequence reservations
+are not carried across windows.
+"""
+
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from src.solver.core.solver import FreshSolver
+from src.solver.core.solver_config import SolverConfig
+from src.solver.models.problem import SchedulingProblem
+from src.solver.models.setup_matrix import SetupTable, as_setup_table
+from src.solver.utils.time_utils import (
+    calculate_horizon,
+    calculate_setup_time_metrics,
+)
+
+logger = logging.getLogger(__name__)
+
+# Type aliases following TEMPLATES.md centralized patterns
+JobId = str  # job_id or instance_id
+MachineId = str
+TimeSpan = tuple[int, int]  # (start, end) in time units
+ScheduleEntry = dict[str, Any]  # One task of an extract_solution() schedule
+
+
+@dataclass
+class RollingHorizonConfig:
+    """Window settings for rolling-horizon solving.
+
+    Args:
+        window_size: Jobs (or job instances) per window
+        overlap: Jobs of a window that are re-solved with the next window
+            instead of being committed
+        time_limit_per_window: CP-SAT time budget per window in seconds
+
+    """
+
+    window_size: int = 20
+    overlap: int = 5
+    time_limit_per_window: int = 10
+
+    def __post_init__(self) -> None:
+        if self.window_size < 1:
+            raise ValueError("window_size must be at least 1")
+        if not 0 <= self.overlap < self.window_size:
+            raise ValueError("overlap must be between 0 and window_size - 1")
+        if self.time_limit_per_window <= 0:
+            raise ValueError("time_limit_per_window must be positive")
+
+    @property
+    def commit_size(self) -> int:
+        """Jobs committed per window (except the last one)."""
+        return self.window_size - self.overlap
+
+
+def order_by_due_date(problem: SchedulingProblem) -> list[JobId]:
+    """Job or instance IDs by due date; jobs without due date come last."""
+    if problem.is_optimized_mode:
+        units = [(i.instance_id, i.due_date) for i in problem.job_instances]
+    else:
+        units = [(job.job_id, job.due_date) for job in problem.jobs]
+
+    # sorted() is stable, so ties keep the problem's order
+    return [
+        unit_id
+        for unit_id, due_date in sorted(
+            units, key=lambda unit: (unit[1] is None, unit[1] or datetime.min)
+        )
+    ]
+
+
+def create_window_problem(
+    problem: SchedulingProblem, unit_ids: list[JobId]
+) -> SchedulingProblem:
+    """Restrict a problem to the given jobs or instances.
+
+    Machines, work cells and operators are shared with the original problem.
+    Multi-objective settings are not copied; windows use the default objective
+    of their mode.
+
+    Args:
+        problem: The full scheduling problem
+        unit_ids: Job IDs (or instance IDs in optimized mode), in solve order
+
+    Returns:
+        SchedulingProblem containing only the given jobs
+
+    """
+    jobs = [problem.job_lookup[u] for u in unit_ids if u in problem.job_lookup]
+    task_ids = {task.task_id for job in jobs for task in job.tasks}
+
+    return SchedulingProblem(
+        jobs=jobs,
+        machines=problem.machines,
+        work_cells=problem.work_cells,
+        precedences=[
+            prec
+            for prec in problem.precedences
+            if prec.predecessor_task_id in task_ids
+            and prec.successor_task_id in task_ids
+        ],
+        operators=problem.operators,
+        skills=problem.skills,
+        task_skill_requirements=problem.task_skill_requirements,
+        operator_shifts=problem.operator_shifts,
+        job_optimized_pattern=problem.job_optimized_pattern,
+        job_optimized_patterns=problem.job_optimized_patterns,
+        job_instances=[
+            problem.job_instance_lookup[u]
+            for u in unit_ids
+            if u in problem.job_instance_lookup
+        ],
+        is_optimized_mode=problem.is_optimized_mode,
+        setup_matrices=problem.setup_matrices,
+        calendars=problem.calendars,
+        default_calendar_id=problem.default_calendar_id,
+        calendar_origin=problem.calendar_origin,
+    )
+
+
+def stitch_schedules(
+    problem: SchedulingProblem,
+    schedule: list[ScheduleEntry],
+    setup_times: dict[tuple[str, str, str], int] | SetupTable | None = None,
+) -> dict:
+    """Build an extract_solution()-style result from committed tasks.
+
+    Datetimes, makespan, lateness and setup metrics are recomputed over the
+    whole schedule because every window measured them on its own.
+
+    Args:
+        problem: The full scheduling problem
+        schedule: Committed schedule entries of all windows
+        setup_times: Setup times used for the setup metrics
+
+    Returns:
+        Solution dictionary (without solver_stats)
+
+    """
+    now = datetime.now(UTC)
+    job_ends: dict[JobId, int] = defaultdict(int)
+
+    for entry in schedule:
+        entry["start_datetime"] = (
+            now + timedelta(minutes=entry["start_time"] * 15)
+        ).isoformat()
+        entry["end_datetime"] = (
+            now + timedelta(minutes=entry["end_time"] * 15)
+        ).isoformat()
+        job_ends[entry["job_id"]] = max(job_ends[entry["job_id"]], entry["end_time"])
+
+    total_lateness = 0
+    for unit_id, end_time in job_ends.items():
+        unit = (
+            problem.get_job_instance(unit_id)
+            if problem.is_optimized_mode
+            else problem.get_job(unit_id)
+        )
+        end_datetime = now + timedelta(minutes=end_time * 15)
+        if unit and unit.due_date is not None and end_datetime > unit.due_date:
+            total_lateness += int((end_datetime - unit.due_date).total_seconds() / 60)
+
+    makespan = max(job_ends.values(), default=0)
+    return {
+        "schedule": sorted(
+            schedule, key=lambda x: (x["start_time"], x["job_id"], x["task_id"])
+        ),
+        "makespan": makespan,
+        "makespan_hours": makespan * 15 / 60,
+        "total_lateness_minutes": total_lateness,
+        "setup_time_metrics": calculate_setup_time_metrics(
+            schedule, as_setup_table(problem, setup_times)
+        ),
+    }
+
+
+def solve_rolling_horizon(
+    problem: SchedulingProblem,
+    config: RollingHorizonConfig | None = None,
+    setup_times: dict[tuple[str, str, str], int] | None = None,
+    solver_config: SolverConfig | None = None,
+) -> dict:
+    """Solve a problem window by window and stitch the committed windows.
+
+    Each window is solved by its own FreshSolver (hierarchical optimization in
+    optimized mode, makespan otherwise) with the committed tasks of earlier
+    windows blocked as fixed intervals. The window horizon starts at the end of
+    the committed work.
+
+    Args:
+        problem: The scheduling problem
+        config: Window settings (default: RollingHorizonConfig())
+        setup_times: Setup times passed to every window solver
+        solver_config: CP-SAT parameters passed to every window solver
+
+    Returns:
+        Solution dictionary in extract_solution() layout plus a
+        "rolling_horizon" entry with per-window statistics. If a window finds
+        no solution, its status is returned with an empty schedule.
+
+    """
+    config = config or RollingHorizonConfig()
+    order = order_by_due_date(problem)
+    started = time.time()
+
+    logger.info(
+        f"Rolling horizon: {len(order)} jobs, window {config.window_size}, "
+        f"overlap {config.overlap}, {config.time_limit_per_window}s per window"
+    )
+
+    committed: list[ScheduleEntry] = []
+    occupied: dict[MachineId, list[TimeSpan]] = defaultdict(list)
+    committed_end = 0
+    windows: list[dict[str, Any]] = []
+    solver_stats = {"solve_time": 0.0, "branches": 0, "conflicts": 0}
+
+    window_start = 0
+    while window_start < len(order):
+        window_ids = order[window_start : window_start + config.window_size]
+        is_last = window_start + config.window_size >= len(order)
+        commit_ids = set(window_ids if is_last else window_ids[: config.commit_size])
+
+        window_problem = create_window_problem(problem, window_ids)
+        window_solver = FreshSolver(
+            window_problem, setup_times=setup_times, solver_config=solver_config
+        )
+        window_solver.horizon = committed_end + calculate_horizon(window_problem)
+        window_solver.fixed_intervals = {m: list(s) for m, s in occupied.items()}
+
+        window_solution = window_solver.solve(config.time_limit_per_window)
+        status = window_solution.get("status", "UNKNOWN")
+        stats = window_solution.get("solver_stats", {})
+        for key in solver_stats:
+            solver_stats[key] += stats.get(key, 0)
+
+        windows.append(
+            {
+                "index": len(windows),
+                "jobs": len(window_ids),
+                "committed_jobs": len(commit_ids),
+                "status": status,
+                "makespan": window_solution.get("makespan", 0),
+                "solve_time": stats.get("solve_time", 0.0),
+            }
+        )
+        logger.info(
+            f"Window {len(windows)}: {len(window_ids)} jobs, status {status}, "
+            f"makespan {window_solution.get('makespan', 0)}"
+        )
+
+        if status not in ("OPTIMAL", "FEASIBLE"):
+            logger.warning(f"Rolling horizon stopped: window {len(windows)} {status}")
+            return {
+                "status": status,
+                "schedule": [],
+                "makespan": 0,
+                "total_lateness_minutes": 0,
+                "solver_stats": {"status": status, **solver_stats},
+                "rolling_horizon": {
+                    "window_size": config.window_size,
+                    "overlap": config.overlap,
+                    "windows": windows,
+                    "committed_jobs": len({e["job_id"] for e in committed}),
+                },
+            }
+
+        for entry in window_solution["schedule"]:
+            if entry["job_id"] not in commit_ids:
+                continue
+            committed.append(entry)
+            committed_end = max(committed_end, entry["end_time"])
+            if entry["machine_id"] is not None:
+                occupied[entry["machine_id"]].append(
+                    (entry["start_time"], entry["end_time"])
+                )
+
+        window_start += len(commit_ids)
+
+    solution = stitch_schedules(problem, committed, setup_times)
+    solution["status"] = "FEASIBLE"
+    solution["solver_stats"] = {
+        "status": "FEASIBLE",
+        **solver_stats,
+        "objective_value": None,
+    }
+    solution["rolling_horizon"] = {
+        "window_size": config.window_size,
+        "overlap": config.overlap,
+        "time_limit_per_window": config.time_limit_per_window,
+        "windows": windows,
+        "total_time": time.time() - started,
+    }
+
+    logger.info(
+        f"Rolling horizon complete: {len(windows)} windows, "
+        f"makespan {solution['makespan']}, "
+        f"{solution['rolling_horizon']['total_time']:.2f}s"
+    )
+    return solution
@@ -3,8 +3,14 @@
 Handles basic scheduling with timing, precedence, and machine assignment.
 """
 
+import asyncio
 import logging
+import queue
+import threading
+import time
 from collections import defaultdict
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import TYPE_CHECKING
 
 from ortools.sat.python import cp_model
 
@@ -32,6 +38,8 @@ from src.solver.constraints.phase1 import (
     # User Story 4: WIP limit constraints
     add_wip_limit_constraints,
     add_workcell_capacity_constraints,
+    convert_due_date_to_time_units,
+    create_fixed_intervals,
     create_flow_balance_monitoring_variables,
     create_total_lateness_objective_variable,
 )
@@ -50,6 +58,7 @@ from src.solver.constraints.phase2 import (
 from src.solver.constraints.phase3 import (
     add_epsilon_constraint_objective_constraints,
     add_lexicographical_objective_constraints,
+    add_objective_definitions,
     add_weighted_sum_objective_constraints,
     analyze_trade_offs,
     calculate_objective_values,
@@ -57,6 +66,72 @@ from src.solver.constraints.phase3 import (
     find_pareto_frontier,
     recommend_solution,
 )
+from src.solver.core.dispatch import (
+    DispatchRule,
+    DispatchSchedule,
+    best_dispatch_schedule,
+    dispatch_solution,
+)
+from src.solver.core.instance_task_table import InstanceTaskTable
+from src.solver.core.lean_model import (
+    LeanCpModel,
+    build_variable_labels,
+    keeps_names,
+)
+from src.solver.core.machine_downtime import (
+    compile_machine_downtime,
+    downtime_origin,
+)
+from src.solver.core.machine_pools import (
+    MachinePooling,
+    assign_pool_machines,
+    find_machine_pools,
+    pool_problem,
+)
+from src.solver.core.mode_presolve import (
+    ModePresolveResult,
+    active_objectives,
+    prune_task_modes,
+)
+from src.solver.core.model_cache import (
+    ModelCache,
+    bucket_horizon,
+    compile_model,
+    compute_problem_fingerprint,
+    is_cacheable,
+    load_model,
+    restore_variables,
+)
+from src.solver.core.model_manifest import (
+    ModelManifest,
+    MonitoringConstruct,
+    build_model_manifest,
+)
+from src.solver.core.model_snapshot import clone_model, snapshot_model
+from src.solver.core.solver_config import (
+    PHASE_COST,
+    PHASE_FALLBACK,
+    PHASE_HIERARCHICAL,
+    PHASE_LATENESS,
+    PHASE_LEXICOGRAPHIC,
+    PHASE_LNS,
+    PHASE_MAKESPAN,
+    PHASE_SOLVE,
+    PHASE_STREAM,
+    SolverConfig,
+)
+from src.solver.core.streaming import (
+    IncumbentEvent,
+    IncumbentStreamCallback,
+    relative_gap,
+)
+from src.solver.core.task_bounds import TaskBounds, compute_task_bounds
+from src.solver.core.warm_start import (
+    MACHINE_CHANGE_PENALTY,
+    PreviousAssignment,
+    WarmStart,
+    map_previous_assignments,
+)
 
 # Type imports - using Any for now as OR-Tools types aren't directly importable
 from src.solver.models.problem import (
@@ -64,15 +139,45 @@ from src.solver.models.problem import (
     ObjectiveType,
     SchedulingProblem,
 )
+from src.solver.models.problem_arrays import ProblemArrays, compile_problem_arrays
+from src.solver.models.setup_matrix import compile_setup_table
+from src.solver.models.working_calendar import TaskCalendars, compile_task_calendars
 from src.solver.utils.time_utils import (
     calculate_horizon,
-    calculate_latest_start,
     extract_solution,
     print_solution_summary,
 )
 
+if TYPE_CHECKING:
+    from ortools.sat import cp_model_pb2
+
+    from src.solver.constraints.phase1.fixed_intervals import FixedOccupancy
+    from src.solver.core.lns import LnsConfig
+    from src.solver.core.rolling_horizon import RollingHorizonConfig
+
 logger = logging.getLogger(__name__)
 
+# Seconds between stop requests while astream_incumbents() waits for its search
+# thread to finish
+STREAM_STOP_POLL_INTERVAL = 0.05
+
+# Variable containers restored from a compiled-model cache hit
+_CACHED_VARIABLE_ATTRIBUTES = (
+    "task_starts",
+    "task_ends",
+    "task_durations",
+    "task_intervals",
+    "task_assigned",
+    "optional_intervals",
+    "machine_intervals",
+    "task_operator_assigned",
+    "wip_monitoring_vars",
+    "wip_adjustment_vars",
+    "flow_balance_vars",
+    "sequence_job_intervals",
+    "setup_terms",
+)
+
 
 class FreshSolver:
     """Main solver class for OR-Tools scheduling."""
@@ -81,6 +186,13 @@ class FreshSolver:
         self,
         problem: SchedulingProblem,
         setup_times: dict[tuple[str, str, str], int] | None = None,
+        model_cache: ModelCache | None = None,
+        solver_config: SolverConfig | None = None,
+        lean_model: bool = False,
+        dispatch_heuristic: bool = False,
+        presolve_modes: bool = True,
+        pool_machines: bool = False,
+        report_monitoring: bool = False,
     ):
         """Initialize solver with problem definition.
 
@@ -89,11 +201,62 @@ class FreshSolver:
             setup_times: Optional dictionary of setup times between tasks on machines
                         Key: (predecessor_task_id, successor_task_id, machine_id)
                         Value: Setup time in time units (15-minute intervals)
+                        Overrides the family matrices in problem.setup_matrices
+            model_cache: Optional compiled-model cache shared between solver
+                        instances. Only optimized-mode problems are cached.
+            solver_config: CP-SAT parameters for every solve path. Defaults are
+                        resolved from the ParameterManager on first solve.
+            lean_model: Create variables and intervals without names, which
+                        shrinks the model proto. With DEBUG logging enabled,
+                        variable_labels maps proto indices back to variables.
+            dispatch_heuristic: Build a dispatch-rule schedule before the model.
+                        It sets the horizon, hints the search and is available
+                        at once through solve_dispatch() and iter_incumbents().
+            presolve_modes: Drop duplicate, infeasible and dominated task modes
+                        before variables are created. The pruned modes are
+                        kept in mode_presolve and reported with the solution.
+            pool_machines: Model each class of interchangeable machines as one
+                        cumulative resource and assign concrete machines after
+                        the solve. The pools are kept in machine_pooling.
+            report_monitoring: Keep the WIP monitoring, adaptive WIP
+                        adjustment and flow balance variables in the model
+                        for reading after the solve. Otherwise the model
+                        manifest leaves out monitoring no objective reads.
 
         """
         self.problem = problem
-        self.model = cp_model.CpModel()
+        self.lean_model = lean_model
+        self.dispatch_heuristic = dispatch_heuristic
+        self.presolve_modes = presolve_modes
+        self.pool_machines = pool_machines
+        self.report_monitoring = report_monitoring
+        # Dense integer view used by variable creation and constraint builders
+        self.arrays: ProblemArrays = compile_problem_arrays(problem)
+        # Variables by dense task index; filled when variables are created
+        self.task_table = InstanceTaskTable(self.arrays)
+        # Critical-path start/end bounds; computed when variables are created
+        self.task_bounds: TaskBounds | None = None
+        # Start domains of calendar-bound setup tasks; set with task_bounds
+        self.task_calendars: TaskCalendars = {}
+        # Dispatch-rule schedule used for the horizon and solution hints
+        self.dispatch_schedule: DispatchSchedule | None = None
+        # Modes pruned from self.arrays; set on the first model build
+        self.mode_presolve: ModePresolveResult | None = None
+        # Interchangeable machines pooled in self.problem; set with mode_presolve
+        self.machine_pooling: MachinePooling | None = None
+        # Objectives the model is built for; None derives them from the
+        # problem. Set when multi_objective_config is cleared for a build whose
+        # objectives are added afterwards (Pareto)
+        self.model_objectives: set[ObjectiveType] | None = None
+        # Monitoring constructs built into the model; renewed on every build
+        self.model_manifest: ModelManifest = self._new_model_manifest()
+        self._presolved = False
+        self.model = self._new_model()
         self.setup_times = setup_times or {}
+        # Family matrices and setup_times, compiled once for every consumer
+        self.setup_table = compile_setup_table(problem, self.setup_times)
+        self.model_cache = model_cache
+        self.solver_config = solver_config
 
         # Decision variables - will be populated during solve
         self.task_starts: dict[tuple[str, str], cp_model.IntVar] = {}
@@ -101,6 +264,9 @@ class FreshSolver:
         self.task_durations: dict[tuple[str, str], cp_model.IntVar] = {}
         self.task_intervals: dict[tuple[str, str], cp_model.IntervalVar] = {}
         self.task_assigned: dict[tuple[str, str, str], cp_model.IntVar] = {}
+        # Interval of each mode, present iff the task runs on the machine; one
+        # per task_assigned literal, shared by every machine and cell builder
+        self.optional_intervals: dict[tuple[str, str, str], cp_model.IntervalVar] = {}
         self.machine_intervals: dict[str, list[cp_model.IntervalVar]] = defaultdict(
             list
         )
@@ -123,19 +289,525 @@ class FreshSolver:
         # Sequence resource reservation variables
         self.sequence_job_intervals: dict[tuple[str, str], cp_model.IntervalVar] = {}
 
+        # (arc literal, setup time) of every setup-time circuit arc; their
+        # weighted sum is the total setup time
+        self.setup_terms: list[tuple[cp_model.IntVar, int]] = []
+
+        # Machine time occupied outside this model: (start, end) spans per
+        # machine, e.g. tasks committed by an earlier rolling-horizon window
+        self.fixed_intervals: dict[str, list[tuple[int, int]]] = {}
+        # Machine downtime spans and the fixed intervals blocking them and
+        # fixed_intervals in the model, rebuilt by build_model()
+        self.machine_downtime: dict[str, list[tuple[int, int]]] = {}
+        self.fixed_occupancy: FixedOccupancy = {}
+
+        # Previous schedule used for hints and the stability term; see
+        # set_warm_start()
+        self.previous_assignments: list[PreviousAssignment] = []
+        self.warm_start_shift = 0
+        self.stability_weight = 0
+        self.warm_start: WarmStart | None = None
+        self.perturbation: cp_model.IntVar | None = None
+
         # Solver parameters
+        # Time unit 0 of machine downtime; fixed once so that dispatch and the
+        # model block the same spans
+        self.downtime_origin = downtime_origin(problem)
         self.horizon = calculate_horizon(problem)
+        if self.model_cache is not None and is_cacheable(problem):
+            # Bucket the horizon so that re-planned due dates hit the cache
+            self.horizon = bucket_horizon(self.horizon)
         self.solver: cp_model.CpSolver | None = None
+        self.model_cache_hit = False
+
+        # Objective-free model taken after constraint construction; solve
+        # paths clone it instead of rebuilding the constraints
+        self.base_model: cp_model_pb2.CpModelProto | None = None
+        self._base_objective_variables: dict[str, cp_model.IntVar] = {}
+
+        # Lean models only: proto variable index -> solver container entry
+        self.variable_labels: dict[int, str] = {}
+
+        # Parameters applied per solve phase, reported in the solution dict
+        self.solver_parameters_used: dict[str, dict] = {}
+
+        # Set to stop a streaming solve at the next incumbent
+        self._stop_requested = threading.Event()
+
+        # Receives every improving incumbent of solve() phases, called from
+        # the CP-SAT search thread; iter_incumbents() streams its own
+        self.incumbent_listener: Callable[[IncumbentEvent], None] | None = None
+
+    def _get_solver_config(self, solver_config: SolverConfig | None) -> SolverConfig:
+        """Resolve the config for a solve call.
+
+        Args:
+            solver_config: Config passed to the solve method (takes precedence)
+
+        Returns:
+            The config to use, resolving ParameterManager defaults if needed
+
+        """
+        if solver_config is not None:
+            return solver_config
+
+        if self.solver_config is None:
+            template_id = (
+                self.problem.job_optimized_pattern.optimized_pattern_id
+                if self.problem.is_optimized_mode and self.problem.job_optimized_pattern
+                else "default"
+            )
+            self.solver_config = SolverConfig.from_parameter_manager(template_id)
+
+        return self.solver_config
+
+    def _new_phase_solver(
+        self,
+        solver_config: SolverConfig,
+        phase_name: str,
+        *profiles: str,
+        time_limit: float,
+    ) -> cp_model.CpSolver:
+        """Create a CP-SAT solver configured for one solve phase.
+
+        Args:
+            solver_config: Config providing base and per-phase parameters
+            phase_name: Key under which the applied parameters are recorded
+            profiles: Phase profile names layered over the base parameters
+            time_limit: Time limit for this phase in seconds
+
+        Returns:
+            Configured CpSolver
+
+        """
+        phase_solver = cp_model.CpSolver()
+        self.solver_parameters_used[phase_name] = solver_config.configure(
+            phase_solver, *profiles, time_limit=time_limit
+        )
+        return phase_solver
+
+    def build_model(self) -> None:
+        """Create variables and constraints, reusing a cached model if possible.
+
+        On a cache hit the structural model is copied from the cached
+        CpModelProto and only the due date layer is added. On a miss the model is
+        built normally and its structural part is stored before due dates are
+        added. Either way the finished model is kept as the base snapshot.
+        """
+        # Containers that accumulate across builds must not leak stale variables
+        # from a previous model
+        self.model = self._new_model()
+        self.model_manifest = self._new_model_manifest()
+        self.machine_intervals = defaultdict(list)
+        self.objective_variables = {}
+        self.setup_terms = []
+        self.fixed_occupancy = {}
+        self.machine_downtime = compile_machine_downtime(
+            self.problem, self.horizon, self.downtime_origin
+        )
+        self._presolve()
+        self.task_table = InstanceTaskTable(self.arrays)
+
+        if self.dispatch_heuristic and self.dispatch_schedule is None:
+            self.run_dispatch_heuristic()
+
+        if self.model_cache is None or not is_cacheable(self.problem):
+            self.create_variables()
+            self.add_constraints()
+            self._finish_build()
+            return
+
+        pattern_id = self.problem.job_optimized_pattern.optimized_pattern_id
+        objectives = (
+            active_objectives(self.problem)
+            if self.model_objectives is None
+            else self.model_objectives
+        )
+        fingerprint = compute_problem_fingerprint(
+            self.problem,
+            self.horizon,
+            self.setup_times,
+            monitoring=[construct.value for construct in self.model_manifest.needed],
+            fixed_intervals=self.fixed_intervals,
+            downtime=self.machine_downtime,
+            presolve_modes=self.presolve_modes,
+            pool_machines=self.pool_machines,
+            lean_model=self.lean_model,
+            objectives=[objective.value for objective in objectives],
+        )
+
+        compiled = self.model_cache.get(fingerprint, template_id=pattern_id)
+        if compiled is not None and not compiled.variable_index.keys() >= set(
+            _CACHED_VARIABLE_ATTRIBUTES
+        ):
+            # Every container, monitoring included, must come from the entry;
+            # rebuild rather than leave one empty or stale from a previous build
+            logger.warning(
+                f"Cached model {fingerprint[:12]} lacks variable containers, rebuilding"
+            )
+            compiled = None
+        if compiled is not None:
+            self.model = load_model(compiled, self._new_model())
+            restored = restore_variables(
+                self.model, compiled.variable_index, self.problem
+            )
+            for name, value in restored.items():
+                setattr(self, name, value)
+            self.machine_intervals = defaultdict(list, self.machine_intervals)
+            self.task_table = InstanceTaskTable.from_variables(
+                self.arrays,
+                task_starts=self.task_starts,
+                task_ends=self.task_ends,
+                task_durations=self.task_durations,
+                task_intervals=self.task_intervals,
+                task_assigned=self.task_assigned,
+                optional_intervals=self.optional_intervals,
+            )
+            self.model_cache_hit = True
+        else:
+            build_started = time.perf_counter()
+            self.create_variables()
+            self._add_template_structural_constraints()
+            self.model_cache.put(
+                compile_model(
+                    self.model,
+                    fingerprint,
+                    {name: getattr(self, name) for name in _CACHED_VARIABLE_ATTRIBUTES},
+                    self.problem,
+                    self.horizon,
+                    build_started,
+                ),
+                template_id=pattern_id,
+            )
+
+        self._add_due_date_constraints()
+        self._finish_build()
+
+    def _new_model(self) -> cp_model.CpModel:
+        """Create an empty model, unnamed in lean mode."""
+        return LeanCpModel() if self.lean_model else cp_model.CpModel()
+
+    def _new_model_manifest(self) -> ModelManifest:
+        """Monitoring constructs the objective and report_monitoring need."""
+        report = (
+            [
+                MonitoringConstruct.WIP_MONITORING,
+                MonitoringConstruct.WIP_ADJUSTMENT,
+                MonitoringConstruct.FLOW_BALANCE,
+            ]
+            if self.report_monitoring
+            else []
+        )
+        return build_model_manifest(self.problem, report, self.model_objectives)
+
+    def _finish_build(self) -> None:
+        """Add the layers shared by every build path and snapshot the model."""
+        self._add_warm_start()
+
+        if self.lean_model and logger.isEnabledFor(logging.DEBUG):
+            self.variable_labels = build_variable_labels(
+                {
+                    name: getattr(self, name)
+                    for name in (
+                        *_CACHED_VARIABLE_ATTRIBUTES,
+                        "completion_times",
+                        "lateness_penalties",
+                        "objective_variables",
+                    )
+                }
+            )
+            logger.debug(f"Recorded labels for {len(self.variable_labels)} variables")
+
+        self.snapshot_base_model()
+
+    def variable_label(self, index: int) -> str:
+        """Describe a model variable by proto index (name, label or index)."""
+        name = self.model.Proto().variables[index].name
+        return name or self.variable_labels.get(index, f"var_{index}")
+
+    def snapshot_base_model(self) -> None:
+        """Keep a copy of the current model without objective or hints."""
+        self.base_model = snapshot_model(self.model)
+        self._base_objective_variables = dict(self.objective_variables)
+
+    def restore_base_model(self) -> bool:
+        """Replace the model with a clone of the base snapshot.
+
+        Objectives, phase constraints, hints and search strategies added since
+        the snapshot are dropped; variable dictionaries stay valid because the
+        clone keeps every variable at its proto index.
+
+        Returns:
+            False if no snapshot has been taken yet
+
+        """
+        if self.base_model is None:
+            return False
+
+        self.model = clone_model(self.base_model, self._new_model())
+        self.objective_variables = dict(self._base_objective_variables)
+        return True
+
+    def run_dispatch_heuristic(
+        self, rules: list[DispatchRule] | None = None
+    ) -> DispatchSchedule | None:
+        """Build a dispatch-rule schedule and derive the horizon from it.
+
+        The best schedule over ``rules`` (total lateness, then makespan) replaces
+        the total-work estimate of calculate_horizon() and is hinted to CP-SAT by
+        add_search_strategy(). Call before build_model(); fixed_intervals and
+        setup_times are taken into account.
+
+        Args:
+            rules: Dispatch rules to try (default: all)
+
+        Returns:
+            The chosen schedule, or None if no rule produced one
+
+        """
+        self._presolve()
+        start_orders = None
+        if self.arrays.is_optimized_mode:
+            # Same instance order as add_symmetry_breaking_constraints, one
+            # chain per pattern
+            unit_ids = self.arrays.unit_ids
+            start_orders = [
+                [
+                    int(self.arrays.unit_indptr[instance])
+                    for instance in sorted(
+                        self.arrays.pattern_units(pattern), key=unit_ids.__getitem__
+                    )
+                    if self.arrays.unit_tasks(instance)
+                ]
+                for pattern in range(len(self.arrays.pattern_ids))
+            ]
+
+        self.dispatch_schedule = best_dispatch_schedule(
+            self.arrays,
+            self.horizon,
+            rules,
+            unit_deadlines=self._due_date_units(),
+            fixed_intervals=self.fixed_intervals,
+            setup_times=self.setup_table,
+            start_orders=start_orders,
+            downtime=compile_machine_downtime(
+                self.problem, self.horizon, self.downtime_origin
+            ),
+        )
+        if self.dispatch_schedule is None:
+            return None
+
+        horizon = calculate_horizon(self.problem, self.dispatch_schedule.makespan)
+        # Lateness variables are bounded by the horizon, so it has to reach the
+        # latest due date
+        due_units = [due for due in self._due_date_units() if due is not None]
+        horizon = max([horizon, *due_units])
+        if self.model_cache is not None and is_cacheable(self.problem):
+            horizon = bucket_horizon(horizon)
+        logger.info(
+            f"Dispatch horizon: {horizon} time units (was {self.horizon}), "
+            f"schedule built in {self.dispatch_schedule.build_time:.3f}s"
+        )
+        self.horizon = horizon
+        return self.dispatch_schedule
+
+    def solve_dispatch(self, rules: list[DispatchRule] | None = None) -> dict:
+        """Return the dispatch-rule schedule as a provisional solution.
+
+        No CP-SAT search is run, so this answers in milliseconds; the schedule
+        respects modes, capacities, precedences and work cells but not every
+        constraint of the full model (see src.solver.core.dispatch).
+
+        Args:
+            rules: Dispatch rules to try (default: all)
+
+        Returns:
+            Solution dictionary in extract_solution() layout with status
+            "HEURISTIC", or status "UNKNOWN" and an empty schedule if no
+            schedule could be built
+
+        """
+        schedule = self.dispatch_schedule or self.run_dispatch_heuristic(rules)
+        if schedule is None:
+            return {"status": "UNKNOWN", "schedule": [], "makespan": 0}
+        solution = dispatch_solution(
+            schedule, self.problem, self.arrays, self.setup_table
+        )
+        self._annotate_solution(solution)
+        return solution
+
+    def set_warm_start(
+        self,
+        assignments: list[PreviousAssignment],
+        time_shift: int = 0,
+        stability_weight: int = 0,
+    ) -> None:
+        """Start the next solve from a previous schedule.
+
+        Call before build_model() or a solve method. Matching tasks are hinted
+        with their previous start and machine; unmatched tasks keep the
+        dispatch hints, if any.
+
+        Args:
+            assignments: Previous schedule, e.g. from assignments_from_rows()
+                on OptimizedDatabaseLoader.load_solution_assignments()
+            time_shift: Time units elapsed since the previous plan
+            stability_weight: Objective weight of the schedule perturbation
+                (start shift plus MACHINE_CHANGE_PENALTY per moved task);
+                0 only hints
+
+        """
+        if stability_weight < 0:
+            raise ValueError(f"Stability weight cannot be negative: {stability_weight}")
+        self.previous_assignments = list(assignments)
+        self.warm_start_shift = time_shift
+        self.stability_weight = stability_weight
+
+    def _add_warm_start(self) -> None:
+        """Map the previous schedule onto the model and build its perturbation."""
+        self.warm_start = None
+        self.perturbation = None
+        if not self.previous_assignments:
+            return
+
+        machine_alias = {}
+        if self.machine_pooling is not None:
+            machine_alias = {
+                machine_id: pool.pool_id
+                for pool in self.machine_pooling.pools
+                for machine_id in pool.machine_ids
+            }
+        self.warm_start = map_previous_assignments(
+            self.arrays, self.previous_assignments, self.warm_start_shift, machine_alias
+        )
+        warm_start = self.warm_start
+        logger.info(
+            f"Warm start: {len(warm_start.hinted_tasks)} tasks matched, "
+            f"{warm_start.unmatched} previous assignments unmatched, "
+            f"{warm_start.reassigned} previous machines no longer eligible"
+        )
+        if not self.stability_weight:
+            return
+
+        table = self.task_table
+        named = keeps_names(self.model)
+        shifts = []
+        changes = []
+        for task in warm_start.hinted_tasks:
+            if table.starts[task] is None:
+                continue
+            previous_start = int(warm_start.start[task])
+            if previous_start >= 0:
+                shift = self.model.NewIntVar(
+                    0, self.horizon, f"start_shift_{task}" if named else ""
+                )
+                self.model.AddAbsEquality(shift, table.starts[task] - previous_start)
+                shifts.append(shift)
+            literal = table.assigned.get((task, int(warm_start.machine[task])))
+            if literal is not None:
+                changes.append(1 - literal)
+
+        self.perturbation = self.model.NewIntVar(
+            0,
+            len(shifts) * self.horizon + len(changes) * MACHINE_CHANGE_PENALTY,
+            "perturbation",
+        )
+        self.model.Add(
+            self.perturbation == sum(shifts) + MACHINE_CHANGE_PENALTY * sum(changes)
+        )
+
+    def _with_stability(self, objective: cp_model.LinearExprT) -> cp_model.LinearExprT:
+        """Objective plus the weighted schedule perturbation, if configured."""
+        if self.perturbation is None:
+            return objective
+        return objective + self.stability_weight * self.perturbation
+
+    def _add_warm_start_hints(self) -> set[int]:
+        """Hint tasks with their previous start and machine.
+
+        Returns:
+            Tasks that received a hint
+
+        """
+        warm_start = self.warm_start
+        if warm_start is None:
+            return set()
+
+        table = self.task_table
+        hinted = set()
+        for task in warm_start.hinted_tasks:
+            if table.starts[task] is None:
+                continue
+            start = int(warm_start.start[task])
+            machine = int(warm_start.machine[task])
+            if machine >= 0:
+                for mode_machine, literal in table.task_assignments(task):
+                    self.model.AddHint(literal, mode_machine == machine)
+            if start >= 0:
+                self.model.AddHint(table.starts[task], start)
+                if machine >= 0:
+                    duration = self.arrays.duration(task, machine)
+                    self.model.AddHint(table.ends[task], start + duration)
+                    self.model.AddHint(table.durations[task], duration)
+            hinted.add(task)
+
+        logger.info(f"Hinted {len(hinted)} tasks from the previous schedule")
+        return hinted
+
+    def _add_dispatch_hints(self, skip: set[int] | None = None) -> None:
+        """Hint task starts, ends and machine assignments from the dispatch run.
+
+        Args:
+            skip: Tasks already hinted from another source
+
+        """
+        schedule = self.dispatch_schedule
+        if schedule is None:
+            return
+
+        skip = skip or set()
+        table = self.task_table
+        starts = schedule.start.tolist()
+        ends = schedule.end.tolist()
+        machines = schedule.machine.tolist()
+        for task in range(table.task_count):
+            if table.starts[task] is None or task in skip:
+                continue
+            self.model.AddHint(table.starts[task], starts[task])
+            self.model.AddHint(table.ends[task], ends[task])
+            self.model.AddHint(table.durations[task], ends[task] - starts[task])
+            for machine, literal in table.task_assignments(task):
+                self.model.AddHint(literal, machine == machines[task])
+
+        logger.info(
+            f"Hinted {table.task_count - len(skip)} tasks from the dispatch schedule"
+        )
 
     def create_variables(self) -> None:
         """Create all decision variables for the model."""
         logger.info("Creating decision variables...")
 
+        self._presolve()
+        self.task_bounds = compute_task_bounds(
+            self.arrays, self.horizon, self._unit_deadlines()
+        )
+        self.task_calendars = compile_task_calendars(
+            self.problem, self.arrays, self.horizon
+        )
+
         if self.problem.is_optimized_mode:
             self._create_optimized_variables()
         else:
             self._create_unique_variables()
 
+        # Shared (task, machine) interval registry, see InstanceTaskTable
+        self.optional_intervals = {
+            self.arrays.assignment_key(task, machine): interval
+            for (task, machine), interval in self.task_table.add_optional_intervals(
+                self.model
+            ).items()
+        }
+
         # Phase 3: Create multi-objective variables if configured
         if self.problem.multi_objective_config:
             self.objective_variables = create_multi_objective_variables(
@@ -149,11 +821,12 @@ class FreshSolver:
 
         # Create sequence job intervals for sequence resource reservation
         self.sequence_job_intervals = create_sequence_job_intervals(
-            self.model, self.task_intervals, self.problem, self.horizon
+            self.model, self.task_intervals, self.problem, self.horizon, self.task_table
         )
 
         logger.info(f"Created {len(self.task_starts)} task timing variables")
         logger.info(f"Created {len(self.task_assigned)} assignment variables")
+        logger.info(f"Created {len(self.optional_intervals)} optional intervals")
         if self.sequence_job_intervals:
             logger.info(
                 f"Created {len(self.sequence_job_intervals)} sequence reservation "
@@ -164,162 +837,263 @@ class FreshSolver:
                 f"Created {len(self.objective_variables)} multi-objective variables"
             )
 
+    def _presolve(self) -> None:
+        """Pool machines and prune task modes once, before variables exist.
+
+        Runs after fixed_intervals and setup_times are final, since both decide
+        which machines can be pooled and which are free of contention. Later
+        builds reuse the pooled problem and pruned arrays, so a cached model
+        always matches them.
+        """
+        if self._presolved:
+            return
+        self._presolved = True
+
+        if self.pool_machines:
+            pools = find_machine_pools(
+                self.problem, self.fixed_intervals, self.setup_table
+            )
+            if pools:
+                self.machine_pooling = MachinePooling(
+                    problem=self.problem,
+                    pooled_problem=pool_problem(self.problem, pools),
+                    pools=pools,
+                )
+                self.problem = self.machine_pooling.pooled_problem
+                self.arrays = compile_problem_arrays(self.problem)
+                self.task_table = InstanceTaskTable(self.arrays)
+                logger.info(
+                    f"Pooled {sum(len(p.machine_ids) for p in pools)} "
+                    f"interchangeable machines into {len(pools)} cumulative pools"
+                )
+
+        if not self.presolve_modes:
+            return
+
+        self.mode_presolve = prune_task_modes(
+            self.arrays,
+            self.problem,
+            unit_deadlines=self._unit_deadlines(),
+            fixed_intervals=self.fixed_intervals,
+            setup_times=self.setup_table,
+            objectives=self.model_objectives,
+        )
+        self.arrays = self.mode_presolve.arrays
+        self.task_table = InstanceTaskTable(self.arrays)
+
+        result = self.mode_presolve
+        if result.pruned:
+            reasons = result.to_dict()["pruned_by_reason"]
+            logger.info(
+                f"Mode presolve: {result.modes_before} -> {result.modes_after} "
+                f"assignment variables ({result.variables_removed} removed), "
+                f"pruned {reasons} in {result.build_time:.3f}s"
+            )
+
+    def _annotate_solution(self, solution: dict) -> None:
+        """Map pools back to machines and record presolve and warm start data."""
+        if self.warm_start is not None:
+            solution["warm_start"] = {
+                "hinted_tasks": len(self.warm_start.hinted_tasks),
+                "unmatched": self.warm_start.unmatched,
+                "reassigned": self.warm_start.reassigned,
+                "stability_weight": self.stability_weight,
+                **self.warm_start.perturbation(
+                    solution.get("schedule", []), self.arrays.machine_ids
+                ),
+            }
+        if self.machine_pooling is not None:
+            assign_pool_machines(
+                solution.get("schedule", []), self.machine_pooling.pools
+            )
+            solution["machine_pools"] = self.machine_pooling.to_dict()
+        if self.mode_presolve is not None:
+            solution["mode_presolve"] = self.mode_presolve.to_dict()
+        solution["model_manifest"] = self.model_manifest.to_dict()
+
+    def _unit_deadlines(self) -> list[int | None] | None:
+        """Hard due dates per job (instance in optimized mode) in time units.
+
+        Returns None when the structural model is cached, since a cached model
+        is replayed for instances with other due dates.
+        """
+        if self.model_cache is not None and is_cacheable(self.problem):
+            return None
+        return self._due_date_units()
+
+    def _due_date_units(self) -> list[int | None]:
+        """Due date per job (instance in optimized mode) in time units."""
+        units = (
+            self.problem.job_instances
+            if self.problem.is_optimized_mode and self.problem.job_optimized_pattern
+            else self.problem.jobs
+        )
+        return [
+            convert_due_date_to_time_units(unit.due_date)
+            if unit.due_date is not None
+            else None
+            for unit in units
+        ]
+
     def _create_optimized_variables(self) -> None:
         """Create variables for optimized mode problems."""
         if not self.problem.job_optimized_pattern or not self.problem.job_instances:
             logger.warning("Optimized mode problem missing pattern or instances")
             return
 
-        pattern = self.problem.job_optimized_pattern
         instances = self.problem.job_instances
+        patterns = self.problem.job_optimized_patterns
 
         logger.info(
             f"Creating optimized variables for {len(instances)} instances of "
-            f"{pattern.task_count} tasks"
+            f"{len(patterns)} pattern(s) with {self.arrays.task_count} tasks"
         )
 
-        # For each job instance, create variables for each optimized task
-        for instance in instances:
-            for optimized_task in pattern.optimized_tasks:
-                # Generate task key for this instance-pattern combination
-                instance_task_id = self.problem.get_instance_task_id(
-                    instance.instance_id, optimized_task.optimized_task_id
-                )
-                task_key = (instance.instance_id, instance_task_id)
-
-                # Calculate bounds
-                earliest_start = 0
-                # For optimized tasks, we use a simplified latest start calculation
-                # Could be enhanced with optimized precedence analysis
-                latest_start = max(0, self.horizon - optimized_task.min_duration // 15)
-
-                # Timing variables
-                self.task_starts[task_key] = self.model.NewIntVar(
-                    earliest_start,
-                    latest_start,
-                    f"start_{instance.instance_id[:8]}_{optimized_task.optimized_task_id[:8]}",
-                )
+        arrays = self.arrays
+        table = self.task_table
+        bounds = self.task_bounds
+        optimized_task_ids = arrays.optimized_task_ids
+        named = keeps_names(self.model)
+        min_durations = arrays.min_duration.tolist()
+        max_durations = arrays.max_duration.tolist()
+
+        # One task per (instance, optimized task), numbered instance by instance
+        for task, task_key in enumerate(arrays.task_keys):
+            label = f"{task_key[0][:8]}_{optimized_task_ids[task][:8]}" if named else ""
+
+            # Critical-path bounds over the pattern precedences
+            earliest_start, latest_start = bounds.start_domain(task)
+            earliest_end, latest_end = bounds.end_domain(task)
+
+            # Timing variables
+            self.task_starts[task_key] = self._new_start_var(
+                task, earliest_start, latest_start, f"start_{label}" if named else ""
+            )
 
-                # Duration variable (constrained by machine mode selection)
-                min_duration = min(
-                    mode.duration_time_units for mode in optimized_task.modes
-                )
-                max_duration = max(
-                    mode.duration_time_units for mode in optimized_task.modes
-                )
+            # Duration variable (constrained by machine mode selection)
+            min_duration = min_durations[task]
+            max_duration = max_durations[task]
 
-                self.task_durations[task_key] = self.model.NewIntVar(
-                    min_duration,
-                    max_duration,
-                    f"duration_{instance.instance_id[:8]}_{optimized_task.optimized_task_id[:8]}",
-                )
+            self.task_durations[task_key] = self.model.NewIntVar(
+                min_duration, max_duration, f"duration_{label}" if named else ""
+            )
 
-                # End variable
-                self.task_ends[task_key] = self.model.NewIntVar(
-                    earliest_start + min_duration,
-                    min(self.horizon, latest_start + max_duration),
-                    f"end_{instance.instance_id[:8]}_{optimized_task.optimized_task_id[:8]}",
-                )
+            # End variable
+            self.task_ends[task_key] = self.model.NewIntVar(
+                earliest_end, latest_end, f"end_{label}" if named else ""
+            )
 
-                # Interval variable
-                self.task_intervals[task_key] = self.model.NewIntervalVar(
-                    self.task_starts[task_key],
-                    self.task_durations[task_key],
-                    self.task_ends[task_key],
-                    f"interval_{instance.instance_id[:8]}_{optimized_task.optimized_task_id[:8]}",
-                )
+            # Interval variable
+            self.task_intervals[task_key] = self.model.NewIntervalVar(
+                self.task_starts[task_key],
+                self.task_durations[task_key],
+                self.task_ends[task_key],
+                f"interval_{label}" if named else "",
+            )
+            table.add_task(
+                task,
+                self.task_starts[task_key],
+                self.task_ends[task_key],
+                self.task_durations[task_key],
+                self.task_intervals[task_key],
+            )
 
-                # Machine assignment variables for each mode
-                for mode in optimized_task.modes:
-                    machine_key = (
-                        instance.instance_id,
-                        instance_task_id,
-                        mode.machine_resource_id,
-                    )
-                    self.task_assigned[machine_key] = self.model.NewBoolVar(
-                        f"assigned_{instance.instance_id[:8]}_{optimized_task.optimized_task_id[:8]}_{mode.machine_resource_id[:8]}"
+            # Machine assignment variables for each mode
+            for machine in arrays.task_machines(task):
+                machine_id = arrays.machine_ids[machine]
+                literal = self.model.NewBoolVar(
+                    f"assigned_{label}_{machine_id[:8]}" if named else ""
+                )
+                self.task_assigned[arrays.assignment_key(task, machine)] = literal
+                table.assigned[(task, machine)] = literal
+
+            # Phase 2: Operator assignment variables for qualified operators only
+            for operator in arrays.qualified_operators(task):
+                operator_id = arrays.operator_ids[operator]
+                self.task_operator_assigned[(*task_key, operator_id)] = (
+                    self.model.NewBoolVar(
+                        f"op_assigned_{label}_{operator_id[:8]}" if named else ""
                     )
+                )
 
-                # Phase 2: Operator assignment variables for qualified operators only
-                if self.problem.operators:
-                    # Get qualified operators for this optimized task
-                    qualified_operators = self.problem.get_qualified_operators(
-                        instance_task_id
-                    )
-                    for operator in qualified_operators:
-                        operator_key = (
-                            instance.instance_id,
-                            instance_task_id,
-                            operator.operator_id,
-                        )
-                        self.task_operator_assigned[operator_key] = (
-                            self.model.NewBoolVar(
-                                f"op_assigned_{instance.instance_id[:8]}_{optimized_task.optimized_task_id[:8]}_{operator.operator_id[:8]}"
-                            )
-                        )
+    def _new_start_var(
+        self, task: int, earliest_start: int, latest_start: int, name: str
+    ) -> cp_model.IntVar:
+        """Start variable of a task, restricted to its calendar if it has one."""
+        calendar = self.task_calendars.get(task)
+        if calendar is None:
+            return self.model.NewIntVar(earliest_start, latest_start, name)
+        domain = cp_model.Domain(earliest_start, latest_start).intersection_with(
+            calendar.start_domain
+        )
+        return self.model.NewIntVarFromDomain(domain, name)
 
     def _create_unique_variables(self) -> None:
         """Create variables for unique mode job-based problems."""
-        for job in self.problem.jobs:
-            for task in job.tasks:
-                task_key = (job.job_id, task.task_id)
-
-                # Calculate bounds
-                earliest_start = 0
-                latest_start = calculate_latest_start(task, job, self.horizon)
-
-                # Timing variables
-                self.task_starts[task_key] = self.model.NewIntVar(
-                    earliest_start,
-                    latest_start,
-                    f"start_{job.job_id[:8]}_{task.task_id[:8]}",
-                )
-
-                # Duration variable (will be constrained by machine selection)
-                min_duration = min(mode.duration_time_units for mode in task.modes)
-                max_duration = max(mode.duration_time_units for mode in task.modes)
+        named = keeps_names(self.model)
+        arrays = self.arrays
+        table = self.task_table
+        bounds = self.task_bounds
+        min_durations = arrays.min_duration.tolist()
+        max_durations = arrays.max_duration.tolist()
+
+        for task, task_key in enumerate(arrays.task_keys):
+            label = f"{task_key[0][:8]}_{task_key[1][:8]}" if named else ""
+
+            # Critical-path bounds over the job precedences
+            earliest_start, latest_start = bounds.start_domain(task)
+            earliest_end, latest_end = bounds.end_domain(task)
+
+            # Timing variables
+            self.task_starts[task_key] = self._new_start_var(
+                task, earliest_start, latest_start, f"start_{label}" if named else ""
+            )
 
-                self.task_durations[task_key] = self.model.NewIntVar(
-                    min_duration,
-                    max_duration,
-                    f"duration_{job.job_id[:8]}_{task.task_id[:8]}",
-                )
+            # Duration variable (will be constrained by machine selection)
+            min_duration = min_durations[task]
+            max_duration = max_durations[task]
 
-                # End variable
-                self.task_ends[task_key] = self.model.NewIntVar(
-                    earliest_start + min_duration,
-                    min(self.horizon, latest_start + max_duration),
-                    f"end_{job.job_id[:8]}_{task.task_id[:8]}",
-                )
+            self.task_durations[task_key] = self.model.NewIntVar(
+                min_duration, max_duration, f"duration_{label}" if named else ""
+            )
 
-                # Interval variable
-                self.task_intervals[task_key] = self.model.NewIntervalVar(
-                    self.task_starts[task_key],
-                    self.task_durations[task_key],
-                    self.task_ends[task_key],
-                    f"interval_{job.job_id[:8]}_{task.task_id[:8]}",
-                )
+            # End variable
+            self.task_ends[task_key] = self.model.NewIntVar(
+                earliest_end, latest_end, f"end_{label}" if named else ""
+            )
 
-                # Machine assignment variables
-                for mode in task.modes:
-                    machine_key = (job.job_id, task.task_id, mode.machine_resource_id)
-                    self.task_assigned[machine_key] = self.model.NewBoolVar(
-                        f"assigned_{job.job_id[:8]}_{task.task_id[:8]}_{mode.machine_resource_id[:8]}"
-                    )
+            # Interval variable
+            self.task_intervals[task_key] = self.model.NewIntervalVar(
+                self.task_starts[task_key],
+                self.task_durations[task_key],
+                self.task_ends[task_key],
+                f"interval_{label}" if named else "",
+            )
+            table.add_task(
+                task,
+                self.task_starts[task_key],
+                self.task_ends[task_key],
+                self.task_durations[task_key],
+                self.task_intervals[task_key],
+            )
 
-                # Phase 2: Operator assignment variables for qualified operators only
-                if self.problem.operators:
-                    # Get qualified operators for this task
-                    qualified_operators = self.problem.get_qualified_operators(
-                        task.task_id
+            # Machine assignment variables
+            for machine in arrays.task_machines(task):
+                machine_id = arrays.machine_ids[machine]
+                literal = self.model.NewBoolVar(
+                    f"assigned_{label}_{machine_id[:8]}" if named else ""
+                )
+                self.task_assigned[arrays.assignment_key(task, machine)] = literal
+                table.assigned[(task, machine)] = literal
+
+            # Phase 2: Operator assignment variables for qualified operators only
+            for operator in arrays.qualified_operators(task):
+                operator_id = arrays.operator_ids[operator]
+                self.task_operator_assigned[(*task_key, operator_id)] = (
+                    self.model.NewBoolVar(
+                        f"op_assigned_{label}_{operator_id[:8]}" if named else ""
                     )
-                    for operator in qualified_operators:
-                        operator_key = (job.job_id, task.task_id, operator.operator_id)
-                        self.task_operator_assigned[operator_key] = (
-                            self.model.NewBoolVar(
-                                f"op_assigned_{job.job_id[:8]}_{task.task_id[:8]}_{operator.operator_id[:8]}"
-                            )
-                        )
+                )
 
     def add_constraints(self) -> None:
         """Add all Phase 1 constraints to the model."""
@@ -334,7 +1108,18 @@ class FreshSolver:
 
     def _add_template_constraints(self) -> None:
         """Add optimized constraints for template-based problems."""
+        self._add_template_structural_constraints()
+
+        # User Story 3: Due date constraints and lateness penalties
+        self._add_due_date_constraints()
+
+    def _add_template_structural_constraints(self) -> None:
+        """Add template constraints that do not depend on instance due dates.
+
+        This is the part of the model that the compiled-model cache stores.
+        """
         logger.info("Adding template-optimized constraints...")
+        self._create_fixed_intervals()
 
         # Task duration constraints (legacy function works for template too)
         add_task_duration_constraints(
@@ -348,12 +1133,16 @@ class FreshSolver:
 
         # Optimized mode precedence constraints
         add_optimized_precedence_constraints(
-            self.model, self.task_starts, self.task_ends, self.problem
+            self.model, self.task_starts, self.task_ends, self.problem, self.task_table
         )
 
         # Optimized mode machine assignment constraints
         add_optimized_assignment_constraints(
-            self.model, self.task_assigned, self.task_durations, self.problem
+            self.model,
+            self.task_assigned,
+            self.task_durations,
+            self.problem,
+            self.task_table,
         )
 
         # Optimized mode no overlap constraints (ONLY for capacity=1 machines)
@@ -363,6 +1152,8 @@ class FreshSolver:
             self.task_assigned,
             self.machine_intervals,
             self.problem,
+            self.task_table,
+            fixed=self.fixed_occupancy,
         )
 
         # Machine capacity constraints (ONLY for machines with capacity > 1)
@@ -373,6 +1164,8 @@ class FreshSolver:
             self.task_assigned,
             self.problem.machines,
             self.problem,
+            self.task_table,
+            fixed=self.fixed_occupancy,
         )
 
         # WorkCell capacity constraints (physical workspace limitations)
@@ -382,25 +1175,34 @@ class FreshSolver:
             self.task_assigned,
             self.problem.work_cells,
             self.problem,
+            self.task_table,
+            fixed=self.fixed_occupancy,
         )
 
         # Setup time constraints (if any setup times are defined)
-        if self.setup_times:
-            add_setup_time_constraints(
+        if self.setup_table:
+            self.setup_terms = add_setup_time_constraints(
                 self.model,
                 self.task_starts,
                 self.task_ends,
                 self.task_assigned,
-                self.setup_times,
+                self.setup_table,
                 self.problem,
             )
 
         # Symmetry breaking constraints for identical jobs
-        add_symmetry_breaking_constraints(self.model, self.task_starts, self.problem)
+        add_symmetry_breaking_constraints(
+            self.model, self.task_starts, self.problem, self.task_table
+        )
 
         # Optimized mode redundant constraints for better performance
         add_optimized_redundant_constraints(
-            self.model, self.task_starts, self.task_ends, self.problem, self.horizon
+            self.model,
+            self.task_starts,
+            self.task_ends,
+            self.problem,
+            self.horizon,
+            self.task_table,
         )
 
         # Sequence resource reservation constraints (exclusive sequence access)
@@ -409,9 +1211,13 @@ class FreshSolver:
                 self.model, self.sequence_job_intervals
             )
 
-        # Unattended task constraints for business hours setup and 24/7 execution
+        # Unattended task constraints for working-time setup and 24/7 execution
         add_business_hours_setup_constraints(
-            self.model, self.task_starts, self.task_ends, self.problem
+            self.model,
+            self.task_starts,
+            self.task_assigned,
+            self.task_calendars,
+            self.arrays,
         )
         add_unattended_execution_constraints(
             self.model, self.task_starts, self.task_ends, self.problem
@@ -442,7 +1248,60 @@ class FreshSolver:
                     self.problem,
                 )
 
-        # User Story 3: Due date constraints and lateness penalties
+        # User Story 4: WIP limit constraints with adaptive adjustment
+        self._add_wip_constraints()
+
+    def _add_wip_constraints(self) -> None:
+        """Add WIP limits and the WIP and flow monitoring the manifest needs.
+
+        Monitoring constructs the manifest does not need are built into its
+        detached model, counted and dropped.
+        """
+        manifest = self.model_manifest
+        wip_limits = {
+            cell.cell_id: cell.effective_wip_limit for cell in self.problem.work_cells
+        }
+        with manifest.building(
+            MonitoringConstruct.WIP_MONITORING, self.model
+        ) as monitoring_model:
+            wip_monitoring_vars = add_wip_limit_constraints(
+                self.model,
+                self.task_intervals,
+                self.task_assigned,
+                self.problem,
+                wip_limits,
+                self.task_table,
+                monitoring_model,
+            )
+
+        # Adaptive WIP adjustment based on work cell utilization
+        utilization_targets = {
+            cell.cell_id: cell.target_utilization for cell in self.problem.work_cells
+        }
+        with manifest.building(MonitoringConstruct.WIP_ADJUSTMENT, self.model) as model:
+            wip_adjustment_vars = add_adaptive_wip_adjustment_constraints(
+                model, wip_monitoring_vars, self.problem, utilization_targets
+            )
+
+        # Flow balance monitoring for cross-cell optimization
+        with manifest.building(MonitoringConstruct.FLOW_BALANCE, self.model) as model:
+            flow_balance_vars = create_flow_balance_monitoring_variables(
+                model, self.problem, self.horizon
+            )
+
+        self.wip_monitoring_vars = manifest.keep(
+            MonitoringConstruct.WIP_MONITORING, wip_monitoring_vars
+        )
+        self.wip_adjustment_vars = manifest.keep(
+            MonitoringConstruct.WIP_ADJUSTMENT, wip_adjustment_vars
+        )
+        self.flow_balance_vars = manifest.keep(
+            MonitoringConstruct.FLOW_BALANCE, flow_balance_vars
+        )
+        manifest.log_eliminated()
+
+    def _add_due_date_constraints(self) -> None:
+        """Add due date enforcement and lateness penalty variables."""
         self.completion_times = add_due_date_enforcement_constraints(
             self.model, self.task_ends, self.problem, self.horizon
         )
@@ -451,42 +1310,27 @@ class FreshSolver:
             self.model, self.completion_times, self.problem, self.horizon
         )
 
-        # Add total lateness objective variable for template hierarchical optimization
+        # Add total lateness objective variable for hierarchical/multi-objective use
         if self.lateness_penalties:
             total_lateness_var = create_total_lateness_objective_variable(
                 self.model, self.lateness_penalties, self.horizon
             )
             self.objective_variables["total_lateness_enhanced"] = total_lateness_var
 
-        # User Story 4: WIP limit constraints with adaptive adjustment
-        wip_limits = {
-            cell.cell_id: cell.effective_wip_limit for cell in self.problem.work_cells
-        }
-
-        self.wip_monitoring_vars = add_wip_limit_constraints(
-            self.model,
-            self.task_intervals,
-            self.task_assigned,
-            self.problem,
-            wip_limits,
-        )
-
-        # Add adaptive WIP adjustment based on work cell utilization
-        utilization_targets = {
-            cell.cell_id: cell.target_utilization for cell in self.problem.work_cells
-        }
-        self.wip_adjustment_vars = add_adaptive_wip_adjustment_constraints(
-            self.model, self.wip_monitoring_vars, self.problem, utilization_targets
-        )
+    def _create_fixed_intervals(self) -> None:
+        """Create the intervals blocking fixed_intervals and machine downtime.
 
-        # Add flow balance monitoring for cross-cell optimization
-        self.flow_balance_vars = create_flow_balance_monitoring_variables(
-            self.model, self.problem, self.horizon
+        The no-overlap and capacity builders add them to their constraints, so
+        call this before those builders.
+        """
+        self.fixed_occupancy = create_fixed_intervals(
+            self.model, self.fixed_intervals, self.problem, self.machine_downtime
         )
 
     def _add_legacy_constraints(self) -> None:
         """Add constraints for legacy job-based problems."""
         logger.info("Adding legacy constraints...")
+        self._create_fixed_intervals()
 
         # Task duration constraints
         add_task_duration_constraints(
@@ -500,12 +1344,16 @@ class FreshSolver:
 
         # Precedence constraints
         add_precedence_constraints(
-            self.model, self.task_starts, self.task_ends, self.problem
+            self.model, self.task_starts, self.task_ends, self.problem, self.task_table
         )
 
         # Machine assignment constraints
         add_machine_assignment_constraints(
-            self.model, self.task_assigned, self.task_durations, self.problem
+            self.model,
+            self.task_assigned,
+            self.task_durations,
+            self.problem,
+            self.task_table,
         )
 
         # No overlap constraints (ONLY for capacity=1 machines)
@@ -516,6 +1364,8 @@ class FreshSolver:
             self.task_assigned,
             self.machine_intervals,
             self.problem,
+            self.task_table,
+            fixed=self.fixed_occupancy,
         )
 
         # Machine capacity constraints (ONLY for machines with capacity > 1)
@@ -527,6 +1377,8 @@ class FreshSolver:
             self.task_assigned,
             self.problem.machines,
             self.problem,
+            self.task_table,
+            fixed=self.fixed_occupancy,
         )
 
         # WorkCell capacity constraints (physical workspace limitations)
@@ -536,22 +1388,24 @@ class FreshSolver:
             self.task_assigned,
             self.problem.work_cells,
             self.problem,
+            self.task_table,
+            fixed=self.fixed_occupancy,
         )
 
         # Setup time constraints (if any setup times are defined)
-        if self.setup_times:
-            add_setup_time_constraints(
+        if self.setup_table:
+            self.setup_terms = add_setup_time_constraints(
                 self.model,
                 self.task_starts,
                 self.task_ends,
                 self.task_assigned,
-                self.setup_times,
+                self.setup_table,
                 self.problem,
             )
 
         # Redundant constraints for better performance
         add_redundant_precedence_constraints(
-            self.model, self.task_starts, self.task_ends, self.problem
+            self.model, self.task_starts, self.task_ends, self.problem, self.task_table
         )
 
         # Sequence resource reservation constraints (exclusive sequence access)
@@ -560,9 +1414,13 @@ class FreshSolver:
                 self.model, self.sequence_job_intervals
             )
 
-        # Unattended task constraints for business hours setup and 24/7 execution
+        # Unattended task constraints for working-time setup and 24/7 execution
         add_business_hours_setup_constraints(
-            self.model, self.task_starts, self.task_ends, self.problem
+            self.model,
+            self.task_starts,
+            self.task_assigned,
+            self.task_calendars,
+            self.arrays,
         )
         add_unattended_execution_constraints(
             self.model, self.task_starts, self.task_ends, self.problem
@@ -594,46 +1452,10 @@ class FreshSolver:
                 )
 
         # User Story 3: Due date constraints and lateness penalties (legacy mode)
-        self.completion_times = add_due_date_enforcement_constraints(
-            self.model, self.task_ends, self.problem, self.horizon
-        )
-
-        self.lateness_penalties = add_lateness_penalty_variables(
-            self.model, self.completion_times, self.problem, self.horizon
-        )
-
-        # Add total lateness objective variable for multi-objective optimization
-        if self.lateness_penalties:
-            total_lateness_var = create_total_lateness_objective_variable(
-                self.model, self.lateness_penalties, self.horizon
-            )
-            self.objective_variables["total_lateness_enhanced"] = total_lateness_var
+        self._add_due_date_constraints()
 
         # User Story 4: WIP limit constraints with adaptive adjustment (legacy mode)
-        wip_limits = {
-            cell.cell_id: cell.effective_wip_limit for cell in self.problem.work_cells
-        }
-
-        self.wip_monitoring_vars = add_wip_limit_constraints(
-            self.model,
-            self.task_intervals,
-            self.task_assigned,
-            self.problem,
-            wip_limits,
-        )
-
-        # Add adaptive WIP adjustment based on work cell utilization
-        utilization_targets = {
-            cell.cell_id: cell.target_utilization for cell in self.problem.work_cells
-        }
-        self.wip_adjustment_vars = add_adaptive_wip_adjustment_constraints(
-            self.model, self.wip_monitoring_vars, self.problem, utilization_targets
-        )
-
-        # Add flow balance monitoring for cross-cell optimization
-        self.flow_balance_vars = create_flow_balance_monitoring_variables(
-            self.model, self.problem, self.horizon
-        )
+        self._add_wip_constraints()
 
         # Phase 3: Multi-objective constraints
         if self.problem.multi_objective_config and self.objective_variables:
@@ -658,6 +1480,7 @@ class FreshSolver:
                 self.task_assigned,
                 self.objective_variables,
                 self.horizon,
+                setup_terms=self.setup_terms,
             )
         elif config.strategy == OptimizationStrategy.WEIGHTED_SUM:
             add_weighted_sum_objective_constraints(
@@ -668,6 +1491,7 @@ class FreshSolver:
                 self.task_assigned,
                 self.objective_variables,
                 self.horizon,
+                setup_terms=self.setup_terms,
             )
         elif config.strategy == OptimizationStrategy.EPSILON_CONSTRAINT:
             add_epsilon_constraint_objective_constraints(
@@ -678,6 +1502,7 @@ class FreshSolver:
                 self.task_assigned,
                 self.objective_variables,
                 self.horizon,
+                setup_terms=self.setup_terms,
             )
         else:
             raise ValueError(
@@ -718,6 +1543,27 @@ class FreshSolver:
                 f"Added optimality constraint: {obj_var_name} = {optimal_value}"
             )
 
+    def _warm_start_from_incumbent(self, solver: cp_model.CpSolver) -> None:
+        """Hint the model with the incumbent found by the previous phase.
+
+        The hint covers every model variable (starts, ends, assignments, operator
+        choices and auxiliary variables), so the next phase starts from a complete
+        feasible schedule instead of searching for a first solution again.
+
+        Args:
+            solver: Solver holding the previous phase's incumbent
+
+        """
+        solution = solver.ResponseProto().solution
+        if not solution:
+            return
+
+        self.model.ClearHints()
+        hint = self.model.Proto().solution_hint
+        hint.vars.extend(range(len(solution)))
+        hint.values.extend(solution)
+        logger.info(f"Warm start: hinted {len(solution)} variables from incumbent")
+
     def _get_objective_variable_name(self, objective_type: ObjectiveType) -> str:
         """Get the variable name for an objective type."""
         mapping = {
@@ -753,27 +1599,8 @@ class FreshSolver:
 
     def _set_makespan_objective(self) -> None:
         """Set single-objective makespan minimization (Phase 1 behavior)."""
-        # Find the maximum end time across all tasks
-        all_ends = []
-
-        if self.problem.is_optimized_mode and self.problem.job_optimized_pattern:
-            # Optimized mode: collect all instance task end times
-            for instance in self.problem.job_instances:
-                for (
-                    optimized_task
-                ) in self.problem.job_optimized_pattern.optimized_tasks:
-                    instance_task_id = self.problem.get_instance_task_id(
-                        instance.instance_id, optimized_task.optimized_task_id
-                    )
-                    task_key = (instance.instance_id, instance_task_id)
-                    if task_key in self.task_ends:
-                        all_ends.append(self.task_ends[task_key])
-        else:
-            # Unique mode: collect all job task end times
-            for job in self.problem.jobs:
-                for task in job.tasks:
-                    task_key = (job.job_id, task.task_id)
-                    all_ends.append(self.task_ends[task_key])
+        # Find the maximum end time across all tasks (jobs or optimized instances)
+        all_ends = self.task_table.all_ends()
 
         # Create makespan variable
         makespan = self.model.NewIntVar(0, self.horizon, "makespan")
@@ -785,22 +1612,7 @@ class FreshSolver:
 
         if has_high_capacity:
             # Calculate theoretical minimum for informational purposes
-            if self.problem.is_optimized_mode and self.problem.job_optimized_pattern:
-                # Optimized mode calculation
-                pattern_min_work = sum(
-                    min(mode.duration_time_units for mode in optimized_task.modes)
-                    for optimized_task in (
-                        self.problem.job_optimized_pattern.optimized_tasks
-                    )
-                )
-                total_work = pattern_min_work * len(self.problem.job_instances)
-            else:
-                # Unique mode calculation
-                total_work = sum(
-                    min(mode.duration_time_units for mode in task.modes)
-                    for job in self.problem.jobs
-                    for task in job.tasks
-                )
+            total_work = int(self.arrays.min_duration.sum())
 
             total_capacity = sum(m.capacity for m in self.problem.machines)
             theoretical_min = (total_work + total_capacity - 1) // total_capacity
@@ -817,12 +1629,17 @@ class FreshSolver:
 
             # Add a hint to the solver about the expected makespan
             # This guides the search without making the problem infeasible
-            self.model.AddHint(makespan, theoretical_min)
+            if self.dispatch_schedule is None:
+                self.model.AddHint(makespan, theoretical_min)
         else:
             logger.info("Objective: minimize makespan")
 
+        if self.dispatch_schedule is not None:
+            # Consistent with the task hints of the dispatch schedule
+            self.model.AddHint(makespan, self.dispatch_schedule.makespan)
+
         # Minimize makespan
-        self.model.Minimize(makespan)
+        self.model.Minimize(self._with_stability(makespan))
 
     def _set_template_hierarchical_objective(self) -> None:
         """Set hierarchical objective: total lateness > makespan > cost."""
@@ -845,7 +1662,9 @@ class FreshSolver:
 
         # Set primary objective (highest priority: minimize total lateness)
         if "total_lateness" in self.objective_variables:
-            self.model.Minimize(self.objective_variables["total_lateness"])
+            self.model.Minimize(
+                self._with_stability(self.objective_variables["total_lateness"])
+            )
             logger.info(
                 "Primary objective: minimize total lateness across all job instances"
             )
@@ -890,25 +1709,18 @@ class FreshSolver:
     def _define_template_total_lateness(self) -> None:
         """Define total lateness as sum of job instance lateness values."""
         lateness_terms = []
+        named = keeps_names(self.model)
 
-        for instance in self.problem.job_instances:
+        for index, instance in enumerate(self.problem.job_instances):
             # Find last task end time for this instance
-            instance_end_times = []
-            if self.problem.job_optimized_pattern:
-                for (
-                    optimized_task
-                ) in self.problem.job_optimized_pattern.optimized_tasks:
-                    instance_task_id = self.problem.get_instance_task_id(
-                        instance.instance_id, optimized_task.optimized_task_id
-                    )
-                    task_key = (instance.instance_id, instance_task_id)
-                    if task_key in self.task_ends:
-                        instance_end_times.append(self.task_ends[task_key])
+            instance_end_times = self.task_table.instance_ends(index)
 
             if instance_end_times:
                 # Create job completion time variable
                 job_completion = self.model.NewIntVar(
-                    0, self.horizon, f"completion_{instance.instance_id}"
+                    0,
+                    self.horizon,
+                    f"completion_{instance.instance_id}" if named else "",
                 )
                 self.model.AddMaxEquality(job_completion, instance_end_times)
 
@@ -927,7 +1739,9 @@ class FreshSolver:
 
                 # Create lateness variable (can be negative for early completion)
                 job_lateness = self.model.NewIntVar(
-                    -self.horizon, self.horizon, f"lateness_{instance.instance_id}"
+                    -self.horizon,
+                    self.horizon,
+                    f"lateness_{instance.instance_id}" if named else "",
                 )
                 self.model.Add(job_lateness == job_completion - due_date_units)
 
@@ -944,19 +1758,7 @@ class FreshSolver:
 
     def _define_template_makespan(self) -> None:
         """Define makespan as maximum task end time across all template instances."""
-        all_ends = []
-
-        for instance in self.problem.job_instances:
-            if self.problem.job_optimized_pattern:
-                for (
-                    optimized_task
-                ) in self.problem.job_optimized_pattern.optimized_tasks:
-                    instance_task_id = self.problem.get_instance_task_id(
-                        instance.instance_id, optimized_task.optimized_task_id
-                    )
-                    task_key = (instance.instance_id, instance_task_id)
-                    if task_key in self.task_ends:
-                        all_ends.append(self.task_ends[task_key])
+        all_ends = self.task_table.all_ends()
 
         if all_ends and "makespan" in self.objective_variables:
             makespan_var = self.objective_variables["makespan"]
@@ -970,8 +1772,11 @@ class FreshSolver:
         """Define total cost including machine costs for template-based scheduling."""
         cost_terms = []
 
+        table = self.task_table
+        named = keeps_names(self.model)
+
         # Machine costs based on usage time
-        for machine in self.problem.machines:
+        for machine_index, machine in enumerate(self.problem.machines):
             if machine.cost_per_hour > 0:
                 machine_usage_time = self.model.NewIntVar(
                     0,
@@ -981,21 +1786,17 @@ class FreshSolver:
 
                 # Sum usage time for this machine across all assigned template tasks
                 usage_terms = []
-                for task_key, assign_var in self.task_assigned.items():
-                    job_id, task_id, machine_id = task_key
-                    if (
-                        machine_id == machine.resource_id
-                        and task_key[:2] in self.task_ends
-                    ):
-                        task_duration = (
-                            self.task_ends[task_key[:2]]
-                            - self.task_starts[task_key[:2]]
-                        )
+                for task in self.arrays.machine_tasks(machine_index):
+                    assign_var = table.assigned.get((task, machine_index))
+                    if assign_var is not None and table.ends[task] is not None:
+                        task_duration = table.ends[task] - table.starts[task]
                         # Only count duration if task is assigned to this machine
                         usage_contribution = self.model.NewIntVar(
                             0,
                             self.horizon,
-                            f"usage_contrib_{job_id}_{task_id}_{machine_id}",
+                            f"usage_contrib_{task}_{machine.resource_id}"
+                            if named
+                            else "",
                         )
                         self.model.Add(
                             usage_contribution == task_duration
@@ -1062,34 +1863,38 @@ class FreshSolver:
         else:
             self._add_legacy_search_strategy()
 
+        self._add_dispatch_hints(skip=self._add_warm_start_hints())
+
     def _add_template_search_strategy(self) -> None:
         """Add optimized search strategy for template-based problems."""
         if not self.problem.job_optimized_pattern:
             return
 
         has_high_capacity = any(m.capacity > 1 for m in self.problem.machines)
-        has_precedences = (
-            len(self.problem.job_optimized_pattern.optimized_precedences) > 0
+        has_precedences = any(
+            pattern.optimized_precedences
+            for pattern in self.problem.job_optimized_patterns
         )
 
         # For template-based problems, prioritize scheduling by template task order
         # This takes advantage of identical structure across instances
 
-        # Group variables by template task, then by instance
+        # Group variables by template task, then by instance; each pattern
+        # contributes its own groups
         optimized_task_groups = []
 
-        for optimized_task in self.problem.job_optimized_pattern.optimized_tasks:
-            task_group = []
-            for instance in self.problem.job_instances:
-                instance_task_id = self.problem.get_instance_task_id(
-                    instance.instance_id, optimized_task.optimized_task_id
-                )
-                task_key = (instance.instance_id, instance_task_id)
-                if task_key in self.task_starts:
-                    task_group.append(self.task_starts[task_key])
+        table = self.task_table
+        for pattern_index, pattern in enumerate(self.problem.job_optimized_patterns):
+            instances = self.arrays.pattern_units(pattern_index)
+            for position in range(pattern.task_count):
+                task_group = [
+                    table.starts[table.task(instance, position)]
+                    for instance in instances
+                    if table.starts[table.task(instance, position)] is not None
+                ]
 
-            if task_group:
-                optimized_task_groups.append(task_group)
+                if task_group:
+                    optimized_task_groups.append(task_group)
 
         # Strategy: Schedule template tasks in order, with symmetry breaking
         for _i, task_group in enumerate(optimized_task_groups):
@@ -1168,11 +1973,14 @@ class FreshSolver:
 
             logger.info("Search strategy: standard sequential scheduling")
 
-    def solve(self, time_limit: int = 60) -> dict:
+    def solve(
+        self, time_limit: int = 60, solver_config: SolverConfig | None = None
+    ) -> dict:
         """Solve the scheduling problem.
 
         Args:
             time_limit: Maximum solving time in seconds
+            solver_config: CP-SAT parameters (default: the solver's config)
 
         Returns:
             Solution dictionary with schedule and statistics
@@ -1183,23 +1991,26 @@ class FreshSolver:
         # Optimized mode problems use hierarchical optimization
         # (lateness > makespan > cost)
         if self.problem.is_optimized_mode:
-            return self.solve_optimized_hierarchical(time_limit)
+            return self.solve_optimized_hierarchical(
+                time_limit, solver_config=solver_config
+            )
+
+        config = self._get_solver_config(solver_config)
+        self.solver_parameters_used = {}
 
         # Create variables and constraints
-        self.create_variables()
-        self.add_constraints()
+        self.build_model()
         self.set_objective()
         self.add_search_strategy()
 
         # Configure solver
-        self.solver = cp_model.CpSolver()
-        self.solver.parameters.max_time_in_seconds = time_limit
-        self.solver.parameters.num_search_workers = 8  # Use parallel search
-        self.solver.parameters.log_search_progress = True
+        self.solver = self._new_phase_solver(
+            config, PHASE_SOLVE, PHASE_SOLVE, time_limit=time_limit
+        )
 
         # Solve
         logger.info("\nStarting solver...")
-        status = self.solver.Solve(self.model)
+        status = self._run_search(PHASE_SOLVE)
 
         logger.info(f"\nSolver status: {self.solver.StatusName(status)}")
 
@@ -1211,7 +2022,7 @@ class FreshSolver:
             self.task_starts,
             self.task_ends,
             self.task_assigned,
-            setup_times=self.setup_times,
+            setup_times=self.setup_table,
         )
 
         # Add multi-objective values if configured
@@ -1240,9 +2051,204 @@ class FreshSolver:
                 "strategy": self.problem.multi_objective_config.strategy.value,
             }
 
+        solution["solver_parameters"] = self.solver_parameters_used
+        self._annotate_solution(solution)
         return solution
 
-    def solve_lexicographic(self, time_limit_per_phase: int = 60) -> dict:
+    def iter_incumbents(
+        self,
+        time_limit: int = 60,
+        include_schedule: bool = False,
+        solver_config: SolverConfig | None = None,
+    ) -> Iterator[IncumbentEvent]:
+        """Solve while yielding every improving incumbent.
+
+        The model is solved with the same objective as a single-phase solve()
+        while CP-SAT runs in a background thread. Each improving solution is
+        yielded as it is found; the last event has ``is_final=True`` and carries
+        the extracted solution dict. Closing the iterator stops the search.
+
+        With ``dispatch_heuristic`` enabled, the dispatch schedule is yielded
+        first (status "HEURISTIC", objective_value is its makespan) before the
+        model is built.
+
+        Args:
+            time_limit: Maximum solving time in seconds
+            include_schedule: Attach the schedule delta to each incumbent
+            solver_config: CP-SAT parameters (profile "stream")
+
+        Yields:
+            IncumbentEvent for each improving solution, then a final event
+
+        """
+        config = self._get_solver_config(solver_config)
+        self.solver_parameters_used = {}
+        self._stop_requested.clear()
+
+        if self.dispatch_heuristic and self.run_dispatch_heuristic() is not None:
+            yield IncumbentEvent(
+                solution_index=0,
+                objective_value=float(self.dispatch_schedule.makespan),
+                best_bound=0.0,
+                gap=1.0,
+                wall_time=self.dispatch_schedule.build_time,
+                status="HEURISTIC",
+                solution=self.solve_dispatch(),
+            )
+
+        self.build_model()
+        self.set_objective()
+        self.add_search_strategy()
+
+        self.solver = self._new_phase_solver(
+            config, PHASE_STREAM, PHASE_STREAM, time_limit=time_limit
+        )
+        events: queue.Queue[IncumbentEvent | None] = queue.Queue()
+        callback = IncumbentStreamCallback(
+            self.task_starts,
+            self.task_ends,
+            self.task_assigned,
+            events.put,
+            include_schedule=include_schedule,
+            stop_event=self._stop_requested,
+        )
+
+        result: dict[str, int] = {}
+
+        def run_search() -> None:
+            try:
+                result["status"] = self.solver.Solve(self.model, callback)
+            finally:
+                events.put(None)
+
+        search_thread = threading.Thread(
+            target=run_search, name="cp-sat-stream", daemon=True
+        )
+        search_thread.start()
+
+        try:
+            while (event := events.get()) is not None:
+                yield event
+        finally:
+            if search_thread.is_alive():
+                self.stop_search()
+                search_thread.join()
+
+        status = result.get("status", cp_model.UNKNOWN)
+        solution = extract_solution(
+            self.solver,
+            self.model,
+            self.problem,
+            self.task_starts,
+            self.task_ends,
+            self.task_assigned,
+            setup_times=self.setup_table,
+        )
+        solution["solver_parameters"] = self.solver_parameters_used
+        self._annotate_solution(solution)
+
+        has_solution = status in [cp_model.OPTIMAL, cp_model.FEASIBLE]
+        objective_value = self.solver.ObjectiveValue() if has_solution else 0.0
+        best_bound = self.solver.BestObjectiveBound() if has_solution else 0.0
+        yield IncumbentEvent(
+            solution_index=callback.solution_count,
+            objective_value=objective_value,
+            best_bound=best_bound,
+            gap=relative_gap(objective_value, best_bound),
+            wall_time=self.solver.WallTime(),
+            status=self.solver.StatusName(status),
+            is_final=True,
+            solution=solution,
+        )
+
+    async def astream_incumbents(
+        self,
+        time_limit: int = 60,
+        include_schedule: bool = False,
+        solver_config: SolverConfig | None = None,
+    ) -> AsyncIterator[IncumbentEvent]:
+        """Async generator version of iter_incumbents().
+
+        iter_incumbents() runs to completion in one dedicated thread that hands
+        its events to the event loop through a queue, so the loop stays
+        responsive and the generator is only ever advanced by that thread.
+        Closing or cancelling the async generator stops the search and waits
+        for the thread to finish.
+
+        Args:
+            time_limit: Maximum solving time in seconds
+            include_schedule: Attach the schedule delta to each incumbent
+            solver_config: CP-SAT parameters (profile "stream")
+
+        Yields:
+            IncumbentEvent for each improving solution, then a final event
+
+        """
+        loop = asyncio.get_running_loop()
+        # None marks the end of the stream; an exception is re-raised here
+        events: asyncio.Queue[IncumbentEvent | BaseException | None] = asyncio.Queue()
+
+        def produce() -> None:
+            try:
+                for event in self.iter_incumbents(
+                    time_limit,
+                    include_schedule=include_schedule,
+                    solver_config=solver_config,
+                ):
+                    loop.call_soon_threadsafe(events.put_nowait, event)
+            except Exception as e:
+                loop.call_soon_threadsafe(events.put_nowait, e)
+            else:
+                loop.call_soon_threadsafe(events.put_nowait, None)
+
+        producer = threading.Thread(target=produce, name="cp-sat-astream", daemon=True)
+        producer.start()
+        try:
+            while (event := await events.get()) is not None:
+                if isinstance(event, BaseException):
+                    raise event
+                yield event
+        finally:
+            # Repeat until the thread is done: a stop that arrives while the
+            # model is still being built has no search to stop yet
+            while producer.is_alive():
+                self.stop_search()
+                await asyncio.sleep(STREAM_STOP_POLL_INTERVAL)
+
+    def _run_search(self, phase: str) -> int:
+        """Solve the model with self.solver, publishing to incumbent_listener.
+
+        Args:
+            phase: Phase name recorded on the published incumbents
+
+        Returns:
+            CP-SAT status
+
+        """
+        if self.incumbent_listener is None:
+            return self.solver.Solve(self.model)
+        callback = IncumbentStreamCallback(
+            self.task_starts,
+            self.task_ends,
+            self.task_assigned,
+            self.incumbent_listener,
+            stop_event=self._stop_requested,
+            phase=phase,
+        )
+        return self.solver.Solve(self.model, callback)
+
+    def stop_search(self) -> None:
+        """Stop a running search; the best solution found so far is kept."""
+        self._stop_requested.set()
+        if self.solver is not None:
+            self.solver.StopSearch()
+
+    def solve_lexicographic(
+        self,
+        time_limit_per_phase: int = 60,
+        warm_start: bool = True,
+        solver_config: SolverConfig | None = None,
+    ) -> dict:
         """Solve using lexicographic multi-objective optimization.
 
         Optimizes objectives in priority order: each objective is optimized subject
@@ -1255,6 +2261,10 @@ class FreshSolver:
 
         Args:
             time_limit_per_phase: Time limit for each optimization phase in seconds
+            warm_start: Hint each phase with the previous phase's incumbent and
+                bound its objective by the incumbent value
+            solver_config: CP-SAT parameters; phases use the "lexicographic"
+                profile and a profile named after the phase's objective type
 
         Returns:
             Solution dictionary with lexicographic optimization results
@@ -1275,9 +2285,11 @@ class FreshSolver:
 
         logger.info("\nSolving with lexicographic multi-objective optimization...")
 
+        solver_config = self._get_solver_config(solver_config)
+        self.solver_parameters_used = {}
+
         # Create variables and constraints (shared across all phases)
-        self.create_variables()
-        self.add_constraints()
+        self.build_model()
         self.add_search_strategy()
 
         # Get objectives sorted by priority (1 = highest priority)
@@ -1288,12 +2300,20 @@ class FreshSolver:
         # Storage for optimal values from each phase
         optimal_values: dict[ObjectiveType, int] = {}
         phase_solutions: dict[int, ObjectiveSolution] = {}
+        previous_solver: cp_model.CpSolver | None = None
 
         # Solve each objective in priority order
         for phase, obj_weight in enumerate(sorted_objectives, 1):
             logger.info(
                 f"\n=== Phase {phase}: Optimizing {obj_weight.objective_type.value} ==="
             )
+            obj_var_name = self._get_objective_variable_name(obj_weight.objective_type)
+
+            # Later phases start from a clone of the base model, so each one
+            # only carries its own objective and the previous phases' bounds
+            if phase > 1:
+                self.restore_base_model()
+                self.add_search_strategy()
 
             # Add constraints from previous phases to maintain optimality
             for prev_obj_type, prev_optimal_value in optimal_values.items():
@@ -1304,12 +2324,17 @@ class FreshSolver:
                     prev_obj_type, prev_optimal_value
                 )
 
+            # Carry the previous incumbent into this phase
+            if warm_start and previous_solver is not None:
+                self._warm_start_from_incumbent(previous_solver)
+                if obj_var_name in self.objective_variables:
+                    self._add_optimality_constraint_to_main_model(
+                        obj_weight.objective_type,
+                        previous_solver.Value(self.objective_variables[obj_var_name]),
+                    )
+
             # Set the objective for this phase
-            obj_var_name = self._get_objective_variable_name(obj_weight.objective_type)
             if obj_var_name in self.objective_variables:
-                # Clear any previous objective
-                self.model.ClearObjective()
-
                 if (
                     obj_weight.objective_type
                     == ObjectiveType.MAXIMIZE_MACHINE_UTILIZATION
@@ -1319,10 +2344,13 @@ class FreshSolver:
                     self.model.Minimize(self.objective_variables[obj_var_name])
 
             # Solve this phase
-            phase_solver = cp_model.CpSolver()
-            phase_solver.parameters.max_time_in_seconds = time_limit_per_phase
-            phase_solver.parameters.num_search_workers = 8
-            phase_solver.parameters.log_search_progress = True
+            phase_solver = self._new_phase_solver(
+                solver_config,
+                f"phase{phase}_{obj_weight.objective_type.value}",
+                PHASE_LEXICOGRAPHIC,
+                obj_weight.objective_type.value,
+                time_limit=time_limit_per_phase,
+            )
 
             logger.info(f"Solving phase {phase}...")
             status = phase_solver.Solve(self.model)
@@ -1360,6 +2388,7 @@ class FreshSolver:
 
             # Update the main solver with the final solution
             self.solver = phase_solver
+            previous_solver = phase_solver
 
         # Extract the final solution
         if self.solver:
@@ -1370,7 +2399,7 @@ class FreshSolver:
                 self.task_starts,
                 self.task_ends,
                 self.task_assigned,
-                setup_times=self.setup_times,
+                setup_times=self.setup_table,
             )
 
             # Add lexicographic multi-objective results
@@ -1411,11 +2440,18 @@ class FreshSolver:
                     "lexicographic_optimality": True,
                 }
 
+            solution["solver_parameters"] = self.solver_parameters_used
+            self._annotate_solution(solution)
             return solution
 
         return {"error": "No solution found in any phase"}
 
-    def solve_optimized_hierarchical(self, time_limit: int = 60) -> dict:
+    def solve_optimized_hierarchical(
+        self,
+        time_limit: int = 60,
+        warm_start: bool = True,
+        solver_config: SolverConfig | None = None,
+    ) -> dict:
         """Solve template-based problems with hierarchical optimization.
 
         Objective order: total lateness > makespan > cost.
@@ -1425,6 +2461,10 @@ class FreshSolver:
 
         Args:
             time_limit: Total time limit in seconds (divided among 3 phases)
+            warm_start: Hint phases 2 and 3 with the previous phase's incumbent and
+                bound their objective by the incumbent value
+            solver_config: CP-SAT parameters; phases use the "hierarchical"
+                profile plus "lateness", "makespan" or "cost"
 
         Returns:
             Solution dictionary with hierarchical optimization results
@@ -1442,9 +2482,11 @@ class FreshSolver:
             int(time_limit * 0.2),  # Phase 3: Cost
         ]
 
+        solver_config = self._get_solver_config(solver_config)
+        self.solver_parameters_used = {}
+
         # Create variables and constraints once
-        self.create_variables()
-        self.add_constraints()
+        self.build_model()
         self.add_search_strategy()
 
         solutions = {}
@@ -1460,15 +2502,20 @@ class FreshSolver:
         self._add_template_objective_definitions()
 
         if "total_lateness" in self.objective_variables:
-            self.model.Minimize(self.objective_variables["total_lateness"])
+            self.model.Minimize(
+                self._with_stability(self.objective_variables["total_lateness"])
+            )
 
             # Configure and solve
-            self.solver = cp_model.CpSolver()
-            self.solver.parameters.max_time_in_seconds = phase_times[0]
-            self.solver.parameters.num_search_workers = 8
-            self.solver.parameters.log_search_progress = True
+            self.solver = self._new_phase_solver(
+                solver_config,
+                "phase1",
+                PHASE_HIERARCHICAL,
+                PHASE_LATENESS,
+                time_limit=phase_times[0],
+            )
 
-            status = self.solver.Solve(self.model)
+            status = self._run_search("phase1")
             logger.info(f"Phase 1 status: {self.solver.StatusName(status)}")
 
             if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
@@ -1488,6 +2535,13 @@ class FreshSolver:
                     "solve_time": self.solver.WallTime(),
                 }
 
+                if warm_start and "makespan" in self.objective_variables:
+                    self._warm_start_from_incumbent(self.solver)
+                    self.model.Add(
+                        self.objective_variables["makespan"]
+                        <= self.solver.Value(self.objective_variables["makespan"])
+                    )
+
                 # Phase 2: Minimize makespan subject to optimal lateness
                 logger.info(
                     f"\n=== PHASE 2: Minimize Makespan "
@@ -1496,15 +2550,20 @@ class FreshSolver:
                 logger.info(f"Subject to: total lateness <= {optimal_lateness}")
 
                 if "makespan" in self.objective_variables:
-                    self.model.Minimize(self.objective_variables["makespan"])
+                    self.model.Minimize(
+                        self._with_stability(self.objective_variables["makespan"])
+                    )
 
                     # Configure and solve
-                    self.solver = cp_model.CpSolver()
-                    self.solver.parameters.max_time_in_seconds = phase_times[1]
-                    self.solver.parameters.num_search_workers = 8
-                    self.solver.parameters.log_search_progress = True
+                    self.solver = self._new_phase_solver(
+                        solver_config,
+                        "phase2",
+                        PHASE_HIERARCHICAL,
+                        PHASE_MAKESPAN,
+                        time_limit=phase_times[1],
+                    )
 
-                    status = self.solver.Solve(self.model)
+                    status = self._run_search("phase2")
                     logger.info(f"Phase 2 status: {self.solver.StatusName(status)}")
 
                     if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
@@ -1524,6 +2583,15 @@ class FreshSolver:
                             "solve_time": self.solver.WallTime(),
                         }
 
+                        if warm_start and "total_cost" in self.objective_variables:
+                            self._warm_start_from_incumbent(self.solver)
+                            self.model.Add(
+                                self.objective_variables["total_cost"]
+                                <= self.solver.Value(
+                                    self.objective_variables["total_cost"]
+                                )
+                            )
+
                         # Phase 3: Minimize cost subject to optimal lateness/makespan
                         logger.info(
                             f"\n=== PHASE 3: Minimize Cost "
@@ -1535,15 +2603,22 @@ class FreshSolver:
                         )
 
                         if "total_cost" in self.objective_variables:
-                            self.model.Minimize(self.objective_variables["total_cost"])
+                            self.model.Minimize(
+                                self._with_stability(
+                                    self.objective_variables["total_cost"]
+                                )
+                            )
 
                             # Configure and solve
-                            self.solver = cp_model.CpSolver()
-                            self.solver.parameters.max_time_in_seconds = phase_times[2]
-                            self.solver.parameters.num_search_workers = 8
-                            self.solver.parameters.log_search_progress = True
+                            self.solver = self._new_phase_solver(
+                                solver_config,
+                                "phase3",
+                                PHASE_HIERARCHICAL,
+                                PHASE_COST,
+                                time_limit=phase_times[2],
+                            )
 
-                            status = self.solver.Solve(self.model)
+                            status = self._run_search("phase3")
                             logger.info(
                                 f"Phase 3 status: {self.solver.StatusName(status)}"
                             )
@@ -1571,7 +2646,7 @@ class FreshSolver:
                                     self.task_starts,
                                     self.task_ends,
                                     self.task_assigned,
-                                    setup_times=self.setup_times,
+                                    setup_times=self.setup_table,
                                 )
 
                                 # Add hierarchical objective values
@@ -1587,6 +2662,10 @@ class FreshSolver:
                                         "total_cost",
                                     ],
                                 }
+                                solution["solver_parameters"] = (
+                                    self.solver_parameters_used
+                                )
+                                self._annotate_solution(solution)
 
                                 logger.info(
                                     "\n=== HIERARCHICAL OPTIMIZATION COMPLETE ==="
@@ -1603,45 +2682,62 @@ class FreshSolver:
         logger.warning(
             "Hierarchical optimization failed - falling back to makespan minimization"
         )
-        return self._solve_fallback_makespan(time_limit)
+        return self._solve_fallback_makespan(time_limit, solver_config=solver_config)
 
-    def _solve_fallback_makespan(self, time_limit: int) -> dict:
+    def _solve_fallback_makespan(
+        self, time_limit: int, solver_config: SolverConfig | None = None
+    ) -> dict:
         """Fallback to simple makespan minimization for templates."""
-        # Clear any previous objectives
-        self.model = cp_model.CpModel()
+        solver_config = self._get_solver_config(solver_config)
 
-        # Recreate basic model
-        self.create_variables()
-        self.add_constraints()
+        # Start from the objective-free base model, dropping the failed phases'
+        # objectives and bounds; only build if no model exists yet
+        if not self.restore_base_model():
+            self.build_model()
         self._set_makespan_objective()
         self.add_search_strategy()
 
         # Solve with makespan objective
-        self.solver = cp_model.CpSolver()
-        self.solver.parameters.max_time_in_seconds = time_limit
-        self.solver.parameters.num_search_workers = 8
-        self.solver.parameters.log_search_progress = True
+        self.solver = self._new_phase_solver(
+            solver_config, PHASE_FALLBACK, PHASE_FALLBACK, time_limit=time_limit
+        )
 
         status = self.solver.Solve(self.model)
         logger.info(f"Fallback status: {self.solver.StatusName(status)}")
 
-        return extract_solution(
+        solution = extract_solution(
             self.solver,
             self.model,
             self.problem,
             self.task_starts,
             self.task_ends,
             self.task_assigned,
-            setup_times=self.setup_times,
+            setup_times=self.setup_table,
         )
+        solution["solver_parameters"] = self.solver_parameters_used
+        self._annotate_solution(solution)
+        return solution
 
-    def solve_pareto_optimal(self, time_limit_per_solve: int = 30) -> dict:
+    def solve_pareto_optimal(
+        self,
+        time_limit_per_solve: int = 30,
+        solver_config: SolverConfig | None = None,
+        max_workers: int | None = None,
+    ) -> dict:
         """Solve for Pareto-optimal solutions.
 
         Finds multiple non-dominated solutions exploring trade-offs between objectives.
+        The base model (constraints plus objective definitions) is built once and
+        the frontier points are solved concurrently in worker processes, or in
+        turn in this process when there are few CPUs or points (see
+        find_pareto_frontier()). Worker processes are spawned, so scripts must
+        call this under ``if __name__ == "__main__":``.
 
         Args:
             time_limit_per_solve: Time limit for each individual solve in seconds
+            solver_config: CP-SAT parameters for each individual solve
+            max_workers: Worker processes solving frontier points (default: CPUs
+                / MIN_SEARCH_WORKERS_PER_POINT; 1 solves in-process)
 
         Returns:
             Dictionary containing Pareto frontier and trade-off analysis
@@ -1653,9 +2749,39 @@ class FreshSolver:
 
         logger.info("\nSolving for Pareto-optimal solutions...")
 
-        # Create variables and constraints (but don't set objective yet)
-        self.create_variables()
-        self.add_constraints()
+        # Create variables and constraints without any strategy objective;
+        # each frontier point sets its own objective and epsilon bounds
+        config = self.problem.multi_objective_config
+        # Presolve must still see the objectives of the frontier, e.g. to keep
+        # cheap slow modes when cost is one of them
+        self.model_objectives = active_objectives(self.problem)
+        self.problem.multi_objective_config = None
+        try:
+            self.build_model()
+        finally:
+            self.problem.multi_objective_config = config
+            self.model_objectives = None
+
+        pareto_objectives = create_multi_objective_variables(
+            self.model,
+            self.problem,
+            self.task_starts,
+            self.task_ends,
+            self.task_assigned,
+            self.horizon,
+        )
+        add_objective_definitions(
+            self.model,
+            self.problem,
+            self.task_starts,
+            self.task_ends,
+            self.task_assigned,
+            pareto_objectives,
+            self.horizon,
+            setup_terms=self.setup_terms,
+        )
+        self.objective_variables.update(pareto_objectives)
+        self.snapshot_base_model()
         self.add_search_strategy()
 
         # Find Pareto frontier
@@ -1666,6 +2792,10 @@ class FreshSolver:
             self.task_assigned,
             self.horizon,
             time_limit_per_solve,
+            solver_config=self._get_solver_config(solver_config),
+            model=self.model,
+            objective_variables=pareto_objectives,
+            max_workers=max_workers,
         )
 
         # Analyze trade-offs
@@ -1719,6 +2849,221 @@ class FreshSolver:
             ),
         }
 
+    def solve_rolling_horizon(
+        self,
+        config: "RollingHorizonConfig | None" = None,
+        solver_config: SolverConfig | None = None,
+    ) -> dict:
+        """Solve the problem in overlapping due-date windows.
+
+        Jobs (instances in optimized mode) are solved in windows of
+        ``config.window_size``; committed windows block machine time for the
+        following ones and are stitched into one solution. Use this instead of
+        solve() when a single model over all jobs is too large.
+
+        Args:
+            config: Window size, overlap and per-window time limit
+            solver_config: CP-SAT parameters for every window solve
+
+        Returns:
+            Solution dictionary in extract_solution() layout with an additional
+            "rolling_horizon" entry holding per-window statistics
+
+        """
+        from src.solver.core.rolling_horizon import solve_rolling_horizon
+
+        return solve_rolling_horizon(
+            self.problem,
+            config,
+            setup_times=self.setup_times,
+            solver_config=self._get_solver_config(solver_config),
+        )
+
+    def solve_decomposed(
+        self,
+        time_limit: int = 60,
+        max_workers: int | None = None,
+        solver_config: SolverConfig | None = None,
+    ) -> dict:
+        """Solve independent groups of jobs as separate problems.
+
+        Jobs (instances in optimized mode) that share no machine, work cell,
+        operator or sequence are split into components, which are solved in
+        parallel worker processes and merged into one solution. Use this
+        instead of solve() for data of several unrelated departments.
+
+        Args:
+            time_limit: Seconds per component solve
+            max_workers: Worker processes (default: CPUs; 1 solves in-process)
+            solver_config: CP-SAT parameters for every component solve
+
+        Returns:
+            Solution dictionary in extract_solution() layout with an additional
+            "total_cost" and a "decomposition" entry holding per-component
+            statistics
+
+        """
+        from src.solver.core.decomposition import solve_decomposed
+
+        return solve_decomposed(
+            self.problem,
+            time_limit,
+            max_workers=max_workers,
+            setup_times=self.setup_times,
+            solver_config=self._get_solver_config(solver_config),
+            fixed_intervals=self.fixed_intervals,
+        )
+
+    def solve_lns(
+        self,
+        time_limit: int = 60,
+        config: "LnsConfig | None" = None,
+        solver_config: SolverConfig | None = None,
+    ) -> dict:
+        """Find a first schedule, then improve it with Large Neighbourhood Search.
+
+        The objective is total lateness before makespan in optimized mode and
+        makespan otherwise, combined into one weighted variable so every
+        neighbourhood solve compares schedules the same way.
+
+        Args:
+            time_limit: Total seconds, including the first solve
+            config: LNS settings (neighbourhoods, sizes, workers)
+            solver_config: CP-SAT parameters; the first solve and the
+                neighbourhood solves use the "lns" profile
+
+        Returns:
+            Solution dictionary with an additional "lns" entry holding the
+            improvement trajectory and per-neighbourhood statistics
+
+        """
+        from src.solver.core.lns import LnsConfig, run_lns
+
+        config = config or LnsConfig()
+        solver_config = self._get_solver_config(solver_config)
+        self.solver_parameters_used = {}
+        started = time.time()
+
+        self.build_model()
+        objective = self._create_lns_objective()
+        self.model.Minimize(objective)
+        self.add_search_strategy()
+
+        self.solver = self._new_phase_solver(
+            solver_config,
+            "lns_initial",
+            PHASE_LNS,
+            time_limit=min(config.initial_time_limit, time_limit),
+        )
+        status = self.solver.Solve(self.model)
+        logger.info(f"LNS initial status: {self.solver.StatusName(status)}")
+
+        # Nothing to improve without a schedule or with a proven optimum
+        if status != cp_model.FEASIBLE:
+            solution = extract_solution(
+                self.solver,
+                self.model,
+                self.problem,
+                self.task_starts,
+                self.task_ends,
+                self.task_assigned,
+                setup_times=self.setup_table,
+            )
+            objective_value = (
+                self.solver.Value(objective) if status == cp_model.OPTIMAL else None
+            )
+            solution["lns"] = {
+                "initial_objective": objective_value,
+                "best_objective": objective_value,
+                "trajectory": [],
+                "neighbourhoods": {},
+                "workers": 0,
+            }
+            solution["solver_parameters"] = self.solver_parameters_used
+            self._annotate_solution(solution)
+            return solution
+
+        neighbourhood_parameters = solver_config.parameters_for(PHASE_LNS)
+        self.solver_parameters_used["lns_neighbourhood"] = neighbourhood_parameters
+        result = run_lns(
+            self,
+            objective,
+            list(self.solver.ResponseProto().solution),
+            time_limit - (time.time() - started),
+            config,
+            neighbourhood_parameters,
+            lower_bound=self.solver.BestObjectiveBound(),
+        )
+
+        # Fix a clone of the base model to the best schedule so extract_solution
+        # can read it; the variables past the base snapshot only belong to the
+        # LNS objective. self.model stays unfixed for later solves.
+        fixed_model = clone_model(self.base_model, self._new_model())
+        for variable, value in zip(
+            fixed_model.Proto().variables, result.solution, strict=False
+        ):
+            del variable.domain[:]
+            variable.domain.extend([value, value])
+        self.solver = self._new_phase_solver(
+            solver_config,
+            "lns_final",
+            PHASE_LNS,
+            time_limit=max(time_limit - (time.time() - started), 1.0),
+        )
+        self.solver.Solve(fixed_model)
+
+        solution = extract_solution(
+            self.solver,
+            fixed_model,
+            self.problem,
+            self.task_starts,
+            self.task_ends,
+            self.task_assigned,
+            setup_times=self.setup_table,
+        )
+        solution["status"] = "FEASIBLE"
+        solution["solver_stats"].update(
+            status="FEASIBLE",
+            solve_time=time.time() - started,
+            objective_value=result.objective,
+        )
+        solution["lns"] = {
+            "initial_objective": result.trajectory[0]["objective"],
+            "best_objective": result.objective,
+            "trajectory": result.trajectory,
+            "neighbourhoods": result.neighbourhood_stats,
+            "workers": result.workers,
+        }
+        solution["solver_parameters"] = self.solver_parameters_used
+        self._annotate_solution(solution)
+        return solution
+
+    def _create_lns_objective(self) -> cp_model.IntVar:
+        """Create the single objective variable minimized by solve_lns()."""
+        if (
+            self.problem.is_optimized_mode
+            and self.problem.job_optimized_pattern
+            and self.problem.job_instances
+        ):
+            self._create_optimized_objective_variables()
+            self._add_template_objective_definitions()
+            lateness = self.objective_variables["total_lateness"]
+            makespan = self.objective_variables["makespan"]
+
+            # Weighting by horizon + 1 keeps lateness strictly more important
+            weight = self.horizon + 1
+            objective = self.model.NewIntVar(
+                0,
+                self.horizon * len(self.problem.job_instances) * weight + self.horizon,
+                "lns_objective",
+            )
+            self.model.Add(objective == lateness * weight + makespan)
+            return objective
+
+        makespan = self.model.NewIntVar(0, self.horizon, "makespan")
+        self.model.AddMaxEquality(makespan, list(self.task_ends.values()))
+        return makespan
+
 
 def main() -> dict:
     """Execute the solver testing workflow."""
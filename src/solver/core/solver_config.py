@@ -0,0 +1,164 @@
+"""CP-SAT solver configuration shared by every FreshSolver solve path.
+
+A SolverConfig holds base CP-SAT parameters plus optional per-phase profiles
+(e.g. a cheaper profile for the cost phase of hierarchical optimization).
+Defaults are resolved from the ParameterManager so blessed template parameters
+are used automatically.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+from ortools.sat.python import cp_model
+
+from src.solver.templates.parameter_manager import (
+    ParameterManager,
+    get_parameter_manager,
+)
+
+logger = logging.getLogger(__name__)
+
+# Parameters applied underneath the resolved template parameters
+BASE_SOLVER_PARAMETERS: dict[str, Any] = {
+    "log_search_progress": True,
+}
+
+# Phase names used by FreshSolver when looking up phase profiles
+PHASE_SOLVE = "solve"
+PHASE_STREAM = "stream"
+PHASE_FALLBACK = "fallback"
+PHASE_LEXICOGRAPHIC = "lexicographic"
+PHASE_HIERARCHICAL = "hierarchical"
+PHASE_LATENESS = "lateness"
+PHASE_MAKESPAN = "makespan"
+PHASE_COST = "cost"
+PHASE_PARETO = "pareto"
+PHASE_LNS = "lns"
+
+
+@dataclass
+class SolverConfig:
+    """CP-SAT parameters with per-phase profiles.
+
+    Profiles are looked up by phase name and layered over the base parameters
+    in the order the names are given, so a solve path can combine a generic
+    profile ("hierarchical") with a specific one ("makespan").
+    """
+
+    parameters: dict[str, Any] = field(
+        default_factory=lambda: BASE_SOLVER_PARAMETERS.copy()
+    )
+    phase_profiles: dict[str, dict[str, Any]] = field(default_factory=dict)
+    template_id: str | None = None
+
+    @classmethod
+    def from_parameter_manager(
+        cls,
+        template_id: str,
+        phase_profiles: dict[str, dict[str, Any]] | None = None,
+        overrides: dict[str, Any] | None = None,
+        parameter_manager: ParameterManager | None = None,
+    ) -> "SolverConfig":
+        """Build a config from blessed (or default) template parameters.
+
+        Args:
+            template_id: Template identifier passed to the ParameterManager
+            phase_profiles: Optional per-phase parameter overrides
+            overrides: Parameters that take precedence over the template ones
+            parameter_manager: Manager to query (default: global instance)
+
+        Returns:
+            SolverConfig with resolved base parameters
+
+        """
+        manager = parameter_manager or get_parameter_manager()
+        parameters = BASE_SOLVER_PARAMETERS.copy()
+        parameters.update(manager.get_solver_parameters(template_id))
+        parameters.update(overrides or {})
+
+        return cls(
+            parameters=parameters,
+            phase_profiles=phase_profiles or {},
+            template_id=template_id,
+        )
+
+    def parameters_for(
+        self, *phases: str, time_limit: float | None = None
+    ) -> dict[str, Any]:
+        """Resolve the parameters for a phase.
+
+        Args:
+            phases: Phase names whose profiles are layered over the base parameters
+            time_limit: Time limit of the solve path; overrides max_time_in_seconds
+
+        Returns:
+            Merged parameter dictionary
+
+        """
+        parameters = self.parameters.copy()
+        for phase in phases:
+            parameters.update(self.phase_profiles.get(phase, {}))
+        if time_limit is not None:
+            parameters["max_time_in_seconds"] = time_limit
+        return parameters
+
+    def configure(
+        self,
+        solver: cp_model.CpSolver,
+        *phases: str,
+        time_limit: float | None = None,
+    ) -> dict[str, Any]:
+        """Apply the parameters for a phase to a CP-SAT solver.
+
+        Args:
+            solver: Solver to configure
+            phases: Phase names (see parameters_for)
+            time_limit: Time limit of the solve path
+
+        Returns:
+            Dictionary of parameters actually applied
+
+        """
+        parameters = self.parameters_for(*phases, time_limit=time_limit)
+        return apply_solver_parameters(solver, parameters)
+
+
+def apply_solver_parameters(
+    solver: cp_model.CpSolver, parameters: dict[str, Any]
+) -> dict[str, Any]:
+    """Set CP-SAT parameters by name, skipping unknown ones.
+
+    Enum parameters accept their label, with the "_SEARCH" suffix optional for
+    search_branching (e.g. "AUTOMATIC" -> AUTOMATIC_SEARCH).
+
+    Args:
+        solver: Solver to configure
+        parameters: Parameter name -> value
+
+    Returns:
+        Dictionary of parameters actually applied
+
+    """
+    applied: dict[str, Any] = {}
+    fields_by_name = solver.parameters.DESCRIPTOR.fields_by_name
+
+    for param_name, param_value in parameters.items():
+        descriptor = fields_by_name.get(param_name)
+        if descriptor is None:
+            logger.warning(f"Unknown solver parameter: {param_name}")
+            continue
+
+        value = param_value
+        if descriptor.enum_type is not None and isinstance(value, str):
+            labels = descriptor.enum_type.values_by_name
+            label = value if value in labels else f"{value}_SEARCH"
+            if label not in labels:
+                logger.warning(f"Unknown value for {param_name}: {param_value}")
+                continue
+            value = labels[label].number
+
+        setattr(solver.parameters, param_name, value)
+        applied[param_name] = param_value
+
+    return applied
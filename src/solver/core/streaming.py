@@ -0,0 +1,150 @@
+"""Streaming of improving incumbent solutions from CP-SAT.
+
+IncumbentStreamCallback is a CpSolverSolutionCallback that turns every
+improving solution into an IncumbentEvent (objective, best bound, gap, wall
+time and optionally the schedule delta since the previous incumbent) and
+publishes it. FreshSolver.iter_incumbents() and
+FreshSolver.astream_incumbents() publish to a queue they consume while the
+search runs in a background thread, so callers can act on a good-enough
+schedule early or stop the search. FreshSolver.incumbent_listener receives the
+incumbents of every solve() phase instead.
+"""
+
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from ortools.sat.python import cp_model
+
+logger = logging.getLogger(__name__)
+
+# Type aliases following TEMPLATES.md centralized patterns
+TaskKey = tuple[str, str]  # (job_id/instance_id, task_id)
+TaskAssignmentKey = tuple[str, str, str]  # (job_id/instance_id, task_id, machine_id)
+TaskPlacement = tuple[int, int, str | None]  # (start, end, machine_id)
+
+
+@dataclass
+class IncumbentEvent:
+    """One improving solution reported during the search."""
+
+    solution_index: int
+    objective_value: float
+    best_bound: float
+    gap: float
+    wall_time: float
+    status: str = "FEASIBLE"
+    is_final: bool = False
+    phase: str | None = None  # Solve phase that found it, e.g. "phase1"
+    schedule_delta: list[dict[str, Any]] | None = None
+    changed_task_count: int = 0
+    solution: dict[str, Any] | None = field(default=None, repr=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the event for JSON transport."""
+        return asdict(self)
+
+
+def relative_gap(objective_value: float, best_bound: float) -> float:
+    """Relative optimality gap of an incumbent (0.0 means proven optimal)."""
+    return abs(objective_value - best_bound) / max(1.0, abs(objective_value))
+
+
+class IncumbentStreamCallback(cp_model.CpSolverSolutionCallback):
+    """Solution callback that publishes improving incumbents.
+
+    Args:
+        task_starts: Task start variables
+        task_ends: Task end variables
+        task_assigned: Task machine assignment variables
+        publish: Receives each IncumbentEvent, e.g. ``queue.put``; called from
+            the CP-SAT search thread
+        include_schedule: Compute the schedule delta for each incumbent
+        stop_event: When set, the search is stopped at the next solution
+        phase: Solve phase recorded on the events
+
+    """
+
+    def __init__(
+        self,
+        task_starts: dict[TaskKey, cp_model.IntVar],
+        task_ends: dict[TaskKey, cp_model.IntVar],
+        task_assigned: dict[TaskAssignmentKey, cp_model.IntVar],
+        publish: Callable[[IncumbentEvent], None],
+        include_schedule: bool = False,
+        stop_event: threading.Event | None = None,
+        phase: str | None = None,
+    ):
+        super().__init__()
+        self.task_starts = task_starts
+        self.task_ends = task_ends
+        self.publish = publish
+        self.phase = phase
+        self.include_schedule = include_schedule
+        self.stop_event = stop_event or threading.Event()
+        self.solution_count = 0
+        self._previous: dict[TaskKey, TaskPlacement] = {}
+
+        # Group assignment literals per task once instead of per solution
+        self._machine_options: dict[TaskKey, list[tuple[str, cp_model.IntVar]]] = {}
+        for (job_id, task_id, machine_id), var in task_assigned.items():
+            self._machine_options.setdefault((job_id, task_id), []).append(
+                (machine_id, var)
+            )
+
+    def on_solution_callback(self) -> None:
+        """Publish the new incumbent."""
+        self.solution_count += 1
+        objective_value = self.ObjectiveValue()
+        best_bound = self.BestObjectiveBound()
+
+        event = IncumbentEvent(
+            solution_index=self.solution_count,
+            objective_value=objective_value,
+            best_bound=best_bound,
+            gap=relative_gap(objective_value, best_bound),
+            wall_time=self.WallTime(),
+            phase=self.phase,
+        )
+
+        if self.include_schedule:
+            event.schedule_delta = self._schedule_delta()
+            event.changed_task_count = len(event.schedule_delta)
+
+        self.publish(event)
+
+        if self.stop_event.is_set():
+            logger.info(f"Stopping search after incumbent {self.solution_count}")
+            self.StopSearch()
+
+    def _schedule_delta(self) -> list[dict[str, Any]]:
+        """Tasks whose start, end or machine changed since the last incumbent."""
+        delta = []
+        for task_key, start_var in self.task_starts.items():
+            machine_id = next(
+                (
+                    m
+                    for m, var in self._machine_options.get(task_key, [])
+                    if self.Value(var)
+                ),
+                None,
+            )
+            placement = (
+                self.Value(start_var),
+                self.Value(self.task_ends[task_key]),
+                machine_id,
+            )
+            if self._previous.get(task_key) != placement:
+                self._previous[task_key] = placement
+                delta.append(
+                    {
+                        "job_id": task_key[0],
+                        "task_id": task_key[1],
+                        "start_time": placement[0],
+                        "end_time": placement[1],
+                        "machine_id": machine_id,
+                    }
+                )
+        return delta
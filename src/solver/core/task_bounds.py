@@ -0,0 +1,171 @@
+"""Critical-path bounds for task start and end variables.
+
+Task variables used to be created with start domains ``[0, horizon - ...]``,
+leaving CP-SAT to discover precedence chains by propagation. compute_task_bounds
+runs a forward and a backward longest-path pass over the precedence DAG of
+ProblemArrays using each task's shortest mode:
+
+- head: earliest start, the longest chain of predecessor durations
+- tail: the task's own duration plus the longest chain of successor durations
+
+A task then starts in ``[head, deadline - tail]`` and ends in
+``[head + min_duration, deadline - tail + min_duration]``, where the deadline of
+its job or instance is the horizon, or its hard due date when that is earlier.
+Both bounds are implied by the precedence and due date constraints, so
+tightening removes no feasible schedule.
+"""
+
+import logging
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.solver.models.problem_arrays import IndexArray, ProblemArrays
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TaskBounds:
+    """Earliest start and latest end of every task, by dense task index.
+
+    Args:
+        earliest_start: Earliest start per task in time units
+        latest_end: Latest end per task in time units
+        min_duration: Shortest mode duration per task in time units
+
+    """
+
+    earliest_start: IndexArray
+    latest_end: IndexArray
+    min_duration: IndexArray
+
+    def __post_init__(self) -> None:
+        if not (
+            len(self.earliest_start) == len(self.latest_end) == len(self.min_duration)
+        ):
+            raise ValueError("TaskBounds arrays need one entry per task")
+
+    @property
+    def latest_start(self) -> IndexArray:
+        """Latest start per task in time units."""
+        return self.latest_end - self.min_duration
+
+    def start_domain(self, task: int) -> tuple[int, int]:
+        """(lower, upper) bound of a task's start variable."""
+        return int(self.earliest_start[task]), int(self.latest_start[task])
+
+    def end_domain(self, task: int) -> tuple[int, int]:
+        """(lower, upper) bound of a task's end variable."""
+        return (
+            int(self.earliest_start[task] + self.min_duration[task]),
+            int(self.latest_end[task]),
+        )
+
+
+def _topological_order(arrays: ProblemArrays) -> list[int] | None:
+    """Tasks in precedence order, or None if the precedences contain a cycle."""
+    in_degree = np.diff(arrays.pred_indptr).tolist()
+    queue = deque(t for t, degree in enumerate(in_degree) if degree == 0)
+    order: list[int] = []
+    while queue:
+        task = queue.popleft()
+        order.append(task)
+        for succ in arrays.successors(task):
+            in_degree[succ] -= 1
+            if in_degree[succ] == 0:
+                queue.append(succ)
+    return order if len(order) == arrays.task_count else None
+
+
+def critical_path_lengths(arrays: ProblemArrays) -> tuple[list[int], list[int]] | None:
+    """Head and tail of every task over the precedence DAG.
+
+    Args:
+        arrays: Compiled problem arrays
+
+    Returns:
+        (heads, tails) in time units using each task's shortest mode; the tail
+        includes the task's own duration. None if the precedences contain a
+        cycle.
+
+    """
+    order = _topological_order(arrays)
+    if order is None:
+        return None
+
+    durations = arrays.min_duration.tolist()
+
+    # Forward pass: heads
+    head = [0] * arrays.task_count
+    for task in order:
+        finish = head[task] + durations[task]
+        for succ in arrays.successors(task):
+            if finish > head[succ]:
+                head[succ] = finish
+
+    # Backward pass: tails include the task's own duration
+    tail = list(durations)
+    for task in reversed(order):
+        for succ in arrays.successors(task):
+            if durations[task] + tail[succ] > tail[task]:
+                tail[task] = durations[task] + tail[succ]
+
+    return head, tail
+
+
+def compute_task_bounds(
+    arrays: ProblemArrays,
+    horizon: int,
+    unit_deadlines: list[int | None] | None = None,
+) -> TaskBounds:
+    """Derive head/tail bounds from the precedence DAG.
+
+    Args:
+        arrays: Compiled problem arrays
+        horizon: Scheduling horizon in time units
+        unit_deadlines: Hard completion deadline per job (instance in optimized
+            mode) in time units, None for no deadline
+
+    Returns:
+        TaskBounds for every task. Deadlines that the critical path cannot meet
+        leave the start domain at its earliest start; the due date constraint
+        then reports the problem as infeasible.
+
+    Performance: O(tasks + precedences), run once per model build
+
+    """
+    min_duration = arrays.min_duration.astype(np.int64)
+    task_count = arrays.task_count
+    lengths = critical_path_lengths(arrays)
+    if lengths is None:
+        logger.warning("Precedence graph contains a cycle; task bounds not tightened")
+        return TaskBounds(
+            earliest_start=np.zeros(task_count, dtype=np.int64),
+            latest_end=np.full(task_count, horizon, dtype=np.int64),
+            min_duration=min_duration,
+        )
+    head, tail = lengths
+
+    deadlines = np.full(len(arrays.unit_ids), horizon, dtype=np.int64)
+    for unit, deadline in enumerate(unit_deadlines or []):
+        if deadline is not None:
+            deadlines[unit] = min(horizon, deadline)
+
+    earliest_start = np.asarray(head, dtype=np.int64)
+    latest_start = deadlines[arrays.task_unit] - np.asarray(tail, dtype=np.int64)
+
+    missed = latest_start < earliest_start
+    if missed.any():
+        logger.warning(
+            f"{int(missed.sum())} tasks cannot meet their deadline on the critical "
+            "path"
+        )
+        latest_start = np.maximum(latest_start, earliest_start)
+
+    return TaskBounds(
+        earliest_start=earliest_start,
+        latest_end=latest_start + min_duration,
+        min_duration=min_duration,
+    )
@@ -0,0 +1,225 @@
+"""Warm start from a previously persisted schedule.
+
+Re-plans usually keep most of the previous schedule. OptimizedDatabaseLoader
+stores every solved schedule in ``instance_task_assignments``; this module maps
+those rows (or a previous solution dictionary) onto the dense task indices of a
+new problem so FreshSolver can hint CP-SAT with them:
+
+- tasks are matched by instance (or job) ID and task ID, so instances that
+  were added or completed since the last plan are simply not hinted
+- a previous machine is only kept if the task can still run on it
+- times are shifted by the time units elapsed since the previous plan
+
+With a stability weight, the solver also minimizes the perturbation of the
+schedule: the total start-time shift of hinted tasks plus a fixed penalty for
+every task that moves to another machine.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from src.solver.models.problem import SchedulingProblem
+from src.solver.models.problem_arrays import IndexArray, ProblemArrays, TaskKey
+
+logger = logging.getLogger(__name__)
+
+# Perturbation charged for moving a task to another machine, in time units of
+# start-time shift (one hour)
+MACHINE_CHANGE_PENALTY = 4
+
+MINUTES_PER_TIME_UNIT = 15
+
+
+@dataclass
+class PreviousAssignment:
+    """One task of a previously solved schedule.
+
+    Args:
+        unit_id: Job ID, or instance ID in optimized mode
+        task_id: Task ID, or instance task ID in optimized mode
+        machine_id: Machine the task was assigned to, if known
+        start_time: Start in time units, if known
+        end_time: End in time units, if known
+
+    """
+
+    unit_id: str
+    task_id: str
+    machine_id: str | None = None
+    start_time: int | None = None
+    end_time: int | None = None
+
+    def __post_init__(self) -> None:
+        if (
+            self.start_time is not None
+            and self.end_time is not None
+            and self.end_time < self.start_time
+        ):
+            raise ValueError(
+                f"Assignment of {self.task_id} ends before it starts: "
+                f"{self.start_time} > {self.end_time}"
+            )
+
+
+@dataclass
+class WarmStart:
+    """Previous assignments mapped onto the dense tasks of a problem.
+
+    Args:
+        start: Previous start per task in time units, -1 if not hinted
+        machine: Previous machine index per task, -1 if not hinted or no
+            longer eligible
+        task_keys: Task keys of the arrays the warm start was mapped onto
+        unmatched: Previous assignments whose task is not in the problem
+        reassigned: Matched tasks whose previous machine is no longer a mode
+
+    """
+
+    start: IndexArray
+    machine: IndexArray
+    task_keys: list[TaskKey]
+    unmatched: int = 0
+    reassigned: int = 0
+
+    def __post_init__(self) -> None:
+        if len(self.start) != len(self.machine):
+            raise ValueError("WarmStart arrays need one entry per task")
+
+    @property
+    def hinted_tasks(self) -> list[int]:
+        """Tasks with a previous start or machine."""
+        return np.flatnonzero((self.start >= 0) | (self.machine >= 0)).tolist()
+
+    def perturbation(self, schedule: list[dict], machine_ids: list[str]) -> dict:
+        """Compare a new schedule with the previous one.
+
+        Args:
+            schedule: Schedule entries in extract_solution() layout
+            machine_ids: Machine IDs of the arrays the warm start was mapped onto
+
+        Returns:
+            Tasks moved to another machine, tasks whose start changed and the
+            total start shift in time units
+
+        """
+        task_index = {key: t for t, key in enumerate(self.task_keys)}
+        moved = shifted = total_shift = 0
+        for entry in schedule:
+            task = task_index.get((entry.get("job_id"), entry.get("task_id")))
+            if task is None:
+                continue
+            machine = int(self.machine[task])
+            if machine >= 0 and entry.get("machine_id") != machine_ids[machine]:
+                moved += 1
+            start = int(self.start[task])
+            if start >= 0 and entry.get("start_time") != start:
+                shifted += 1
+                total_shift += abs(entry["start_time"] - start)
+        return {
+            "tasks_moved": moved,
+            "tasks_shifted": shifted,
+            "total_start_shift": total_shift,
+        }
+
+
+def assignments_from_rows(
+    rows: list[dict[str, Any]], problem: SchedulingProblem
+) -> list[PreviousAssignment]:
+    """Convert ``instance_task_assignments`` rows to previous assignments.
+
+    Args:
+        rows: Rows as written by OptimizedDatabaseLoader.save_solution_assignments
+        problem: Problem whose instance task IDs the rows are mapped to
+
+    Returns:
+        One PreviousAssignment per row; minutes are converted to time units,
+        rounding starts down and ends up
+
+    """
+    assignments = []
+    for row in rows:
+        start = row.get("start_time_minutes")
+        end = row.get("end_time_minutes")
+        if start is not None:
+            start //= MINUTES_PER_TIME_UNIT
+        if end is not None:
+            end = -(-end // MINUTES_PER_TIME_UNIT)
+        assignments.append(
+            PreviousAssignment(
+                unit_id=row["instance_id"],
+                task_id=problem.get_instance_task_id(
+                    row["instance_id"], row["optimized_task_id"]
+                ),
+                machine_id=row.get("assigned_machine_id"),
+                start_time=start,
+                end_time=end,
+            )
+        )
+    return assignments
+
+
+def assignments_from_solution(solution: dict) -> list[PreviousAssignment]:
+    """Previous assignments from a solution dictionary's schedule."""
+    return [
+        PreviousAssignment(
+            unit_id=entry["job_id"],
+            task_id=entry["task_id"],
+            machine_id=entry.get("machine_id"),
+            start_time=entry.get("start_time"),
+            end_time=entry.get("end_time"),
+        )
+        for entry in solution.get("schedule", [])
+    ]
+
+
+def map_previous_assignments(
+    arrays: ProblemArrays,
+    assignments: list[PreviousAssignment],
+    time_shift: int = 0,
+    machine_alias: dict[str, str] | None = None,
+) -> WarmStart:
+    """Map previous assignments onto the tasks of compiled problem arrays.
+
+    Args:
+        arrays: Compiled problem arrays of the new problem
+        assignments: Previous assignments
+        time_shift: Time units elapsed since the previous plan; subtracted
+            from previous times, which are clipped at 0
+        machine_alias: Machine ID replacements, e.g. pooled machines
+
+    Returns:
+        WarmStart over the arrays' tasks
+
+    Performance: O(assignments)
+
+    """
+    machine_alias = machine_alias or {}
+    start = np.full(arrays.task_count, -1, dtype=np.int64)
+    machine = np.full(arrays.task_count, -1, dtype=np.int64)
+    unmatched = reassigned = 0
+
+    for assignment in assignments:
+        task = arrays.task_index.get((assignment.unit_id, assignment.task_id))
+        if task is None:
+            unmatched += 1
+            continue
+        if assignment.start_time is not None:
+            start[task] = max(0, assignment.start_time - time_shift)
+        if assignment.machine_id is not None:
+            machine_id = machine_alias.get(assignment.machine_id, assignment.machine_id)
+            index = arrays.machine_index.get(machine_id)
+            if index is not None and arrays.eligible[task, index]:
+                machine[task] = index
+            else:
+                reassigned += 1
+
+    return WarmStart(
+        start=start,
+        machine=machine,
+        task_keys=arrays.task_keys,
+        unmatched=unmatched,
+        reassigned=reassigned,
+    )
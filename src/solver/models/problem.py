@@ -4,11 +4,32 @@ Provides type safety, validation, and computed properties.
 """
 
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime, time
 from enum import Enum
 from typing import Optional
 
 
+@dataclass
+class MachineDowntime:
+    """Planned maintenance or other time a machine is unavailable."""
+
+    start_time: datetime
+    end_time: datetime
+    reason: str = ""
+
+    def __post_init__(self) -> None:
+        # Make datetimes timezone-aware if they aren't already
+        if self.start_time.tzinfo is None:
+            self.start_time = self.start_time.replace(tzinfo=UTC)
+        if self.end_time.tzinfo is None:
+            self.end_time = self.end_time.replace(tzinfo=UTC)
+        if self.end_time <= self.start_time:
+            raise ValueError(
+                f"Downtime must end after it starts: {self.start_time} - "
+                f"{self.end_time}"
+            )
+
+
 @dataclass
 class Machine:
     """Represents a machine resource."""
@@ -18,6 +39,7 @@ class Machine:
     name: str
     capacity: int = 1
     cost_per_hour: float = 0.0
+    downtime: list[MachineDowntime] = field(default_factory=list)
 
     def __post_init__(self) -> None:
         if self.capacity < 0:
@@ -75,6 +97,9 @@ class Task:
     # Sequence resource reservation support
     sequence_id: str | None = None  # Optional sequence this task belongs to
 
+    # Product family for sequence-dependent setup times (see MachineSetupMatrix)
+    setup_family: str | None = None
+
     def __post_init__(self) -> None:
         if not self.modes and hasattr(self, "_post_init_complete"):
             raise ValueError(f"Task {self.name} must have at least one mode")
@@ -186,6 +211,9 @@ class WorkCell:
     target_utilization: float = 0.85  # Target utilization for adaptive WIP
     flow_priority: int = 1  # Priority for flow balancing (1=highest)
 
+    # Working calendar of the cell (defaults to problem.default_calendar_id)
+    calendar_id: str | None = None
+
     def __post_init__(self) -> None:
         if self.capacity <= 0:
             raise ValueError(f"Work cell capacity must be positive: {self.capacity}")
@@ -221,6 +249,32 @@ class WorkCell:
         return self.wip_limit if self.wip_limit is not None else self.capacity
 
 
+@dataclass
+class CalendarShift:
+    """Working window on one weekday.
+
+    An end at or before the start ends on the following day (night shift).
+    """
+
+    weekday: int  # 0 = Monday ... 6 = Sunday
+    start_time: time
+    end_time: time
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.weekday <= 6:
+            raise ValueError(f"Shift weekday must be 0-6: {self.weekday}")
+
+
+@dataclass
+class WorkingCalendar:
+    """Weekly shift pattern with holidays, repeated over the whole horizon."""
+
+    calendar_id: str
+    name: str
+    shifts: list[CalendarShift] = field(default_factory=list)
+    holidays: list[date] = field(default_factory=list)  # Days without shifts
+
+
 @dataclass
 class Precedence:
     """Represents a precedence constraint between tasks."""
@@ -270,6 +324,9 @@ class OptimizedTask:
     # Sequence resource reservation support
     sequence_id: str | None = None  # Optional sequence this task belongs to
 
+    # Product family for sequence-dependent setup times (see MachineSetupMatrix)
+    setup_family: str | None = None
+
     def __post_init__(self) -> None:
         if not self.modes and hasattr(self, "_optimized_post_init_complete"):
             raise ValueError(f"Optimized task {self.name} must have at least one mode")
@@ -604,6 +661,39 @@ class OperatorShift:
         )
 
 
+@dataclass
+class MachineSetupMatrix:
+    """Sequence-dependent setup times between product families on one machine.
+
+    setup_times[i][j] is the setup time in time units (15 minutes) when a task
+    of family families[j] directly follows a task of family families[i].
+    """
+
+    machine_resource_id: str
+    families: list[str]
+    setup_times: list[list[int]]
+
+    def __post_init__(self) -> None:
+        if len(set(self.families)) != len(self.families):
+            raise ValueError(
+                f"Setup matrix of machine {self.machine_resource_id} "
+                f"has duplicate families"
+            )
+        size = len(self.families)
+        if len(self.setup_times) != size or any(
+            len(row) != size for row in self.setup_times
+        ):
+            raise ValueError(
+                f"Setup matrix of machine {self.machine_resource_id} must be "
+                f"{size}x{size}"
+            )
+        if any(value < 0 for row in self.setup_times for value in row):
+            raise ValueError(
+                f"Setup matrix of machine {self.machine_resource_id} "
+                f"has negative setup times"
+            )
+
+
 @dataclass
 class SchedulingProblem:
     """Complete problem definition for the solver."""
@@ -619,29 +709,45 @@ class SchedulingProblem:
     task_skill_requirements: list[TaskSkillRequirement] = field(default_factory=list)
     operator_shifts: list[OperatorShift] = field(default_factory=list)
 
-    # Optimized mode architecture support
+    # Optimized mode architecture support. job_optimized_patterns holds every
+    # pattern of a multi-pattern problem; job_optimized_pattern is its first
     job_optimized_pattern: JobOptimizedPattern | None = None
     job_instances: list[JobInstance] = field(default_factory=list)
     is_optimized_mode: bool = False
+    job_optimized_patterns: list[JobOptimizedPattern] = field(default_factory=list)
 
     # Phase 3: Multi-objective optimization
     multi_objective_config: Optional["MultiObjectiveConfiguration"] = None
 
+    # Setup times by product family (Task/OptimizedTask.setup_family)
+    setup_matrices: list[MachineSetupMatrix] = field(default_factory=list)
+
+    # Working calendars of the work cells. calendar_origin is the wall-clock
+    # time of time unit 0; without it unit 0 is a Monday 00:00 and holidays
+    # cannot be placed. Machine downtime then counts from the time the solver
+    # is created, like the horizon and the extracted schedule
+    calendars: list[WorkingCalendar] = field(default_factory=list)
+    default_calendar_id: str | None = None
+    calendar_origin: datetime | None = None
+
     # Computed lookups for efficiency
     task_lookup: dict[str, Task] = field(init=False)
     machine_lookup: dict[str, Machine] = field(init=False)
     job_lookup: dict[str, Job] = field(init=False)
     optimized_task_lookup: dict[str, OptimizedTask] = field(init=False)
+    pattern_lookup: dict[str, JobOptimizedPattern] = field(init=False)
     job_instance_lookup: dict[str, JobInstance] = field(init=False)
     operator_lookup: dict[str, Operator] = field(init=False)
     skill_lookup: dict[str, Skill] = field(init=False)
     task_skill_lookup: dict[str, list[TaskSkillRequirement]] = field(init=False)
+    calendar_lookup: dict[str, WorkingCalendar] = field(init=False)
 
     def __post_init__(self) -> None:
         # Build lookup dictionaries
         self.task_lookup = {}
         self.job_lookup = {}
         self.optimized_task_lookup = {}
+        self.pattern_lookup = {}
         self.job_instance_lookup = {}
         self.operator_lookup = {}
         self.skill_lookup = {}
@@ -654,6 +760,7 @@ class SchedulingProblem:
                 self.task_lookup[task.task_id] = task
 
         self.machine_lookup = {m.resource_id: m for m in self.machines}
+        self.calendar_lookup = {c.calendar_id: c for c in self.calendars}
 
         # Build Phase 2 lookups
         self.operator_lookup = {op.operator_id: op for op in self.operators}
@@ -666,34 +773,69 @@ class SchedulingProblem:
             self.task_skill_lookup[req.task_id].append(req)
 
         # Handle optimized mode structure
+        if self.job_optimized_pattern and not self.job_optimized_patterns:
+            self.job_optimized_patterns = [self.job_optimized_pattern]
+        elif self.job_optimized_patterns:
+            if self.job_optimized_pattern is None:
+                self.job_optimized_pattern = self.job_optimized_patterns[0]
+            elif not any(
+                pattern is self.job_optimized_pattern
+                for pattern in self.job_optimized_patterns
+            ):
+                raise ValueError(
+                    "job_optimized_pattern must be one of job_optimized_patterns"
+                )
+
         if self.job_optimized_pattern:
             self.is_optimized_mode = True
-            # Build optimized task lookup
-            for optimized_task in self.job_optimized_pattern.optimized_tasks:
-                self.optimized_task_lookup[optimized_task.optimized_task_id] = (
-                    optimized_task
-                )
+            for pattern in self.job_optimized_patterns:
+                if pattern.optimized_pattern_id in self.pattern_lookup:
+                    raise ValueError(
+                        f"Duplicate optimized pattern {pattern.optimized_pattern_id}"
+                    )
+                self.pattern_lookup[pattern.optimized_pattern_id] = pattern
+
+                # Build optimized task lookup; instance task IDs and skill
+                # requirements key on optimized task IDs, so they are unique
+                # across patterns
+                for optimized_task in pattern.optimized_tasks:
+                    if optimized_task.optimized_task_id in self.optimized_task_lookup:
+                        raise ValueError(
+                            f"Optimized task {optimized_task.optimized_task_id} "
+                            f"appears in more than one pattern"
+                        )
+                    self.optimized_task_lookup[optimized_task.optimized_task_id] = (
+                        optimized_task
+                    )
 
             # Build job instance lookup
             for instance in self.job_instances:
                 self.job_instance_lookup[instance.instance_id] = instance
 
-        # Populate precedence relationships in tasks
+        # Populate precedence relationships in tasks (tasks may be shared with
+        # another problem, e.g. a rolling-horizon window, so skip known links)
         for prec in self.precedences:
-            if prec.predecessor_task_id in self.task_lookup:
-                self.task_lookup[prec.predecessor_task_id].precedence_successors.append(
-                    prec.successor_task_id
-                )
-            if prec.successor_task_id in self.task_lookup:
-                self.task_lookup[prec.successor_task_id].precedence_predecessors.append(
-                    prec.predecessor_task_id
-                )
+            predecessor = self.task_lookup.get(prec.predecessor_task_id)
+            if (
+                predecessor
+                and prec.successor_task_id not in predecessor.precedence_successors
+            ):
+                predecessor.precedence_successors.append(prec.successor_task_id)
+            successor = self.task_lookup.get(prec.successor_task_id)
+            if (
+                successor
+                and prec.predecessor_task_id not in successor.precedence_predecessors
+            ):
+                successor.precedence_predecessors.append(prec.predecessor_task_id)
 
     @property
     def total_task_count(self) -> int:
         """Get total number of tasks across all jobs."""
         if self.is_optimized_mode and self.job_optimized_pattern:
-            return len(self.job_instances) * self.job_optimized_pattern.task_count
+            return sum(
+                self.instance_pattern(instance).task_count
+                for instance in self.job_instances
+            )
         return sum(job.task_count for job in self.jobs)
 
     @property
@@ -708,10 +850,13 @@ class SchedulingProblem:
 
     @property
     def optimized_task_count(self) -> int:
-        """Get number of tasks in the pattern (for optimized mode problems)."""
-        if self.job_optimized_pattern:
-            return self.job_optimized_pattern.task_count
-        return 0
+        """Get number of tasks in the patterns (for optimized mode problems)."""
+        return sum(pattern.task_count for pattern in self.job_optimized_patterns)
+
+    @property
+    def is_multi_pattern(self) -> bool:
+        """Check whether instances of several patterns share this problem."""
+        return len(self.job_optimized_patterns) > 1
 
     def get_task(self, task_id: str) -> Task | None:
         """Get task by ID."""
@@ -733,6 +878,42 @@ class SchedulingProblem:
         """Get job instance by ID (for optimized mode problems)."""
         return self.job_instance_lookup.get(instance_id)
 
+    def get_pattern(self, optimized_pattern_id: str) -> JobOptimizedPattern | None:
+        """Get optimized pattern by ID (for optimized mode problems)."""
+        return self.pattern_lookup.get(optimized_pattern_id)
+
+    def instance_pattern(self, instance: JobInstance) -> JobOptimizedPattern:
+        """Get the pattern a job instance is scheduled with.
+
+        Single-pattern problems schedule every instance with their pattern.
+
+        Raises:
+            ValueError: If a multi-pattern problem does not hold the instance's
+                pattern
+
+        """
+        if not self.is_multi_pattern and self.job_optimized_pattern:
+            return self.job_optimized_pattern
+        pattern = self.pattern_lookup.get(instance.optimized_pattern_id)
+        if pattern is None:
+            raise ValueError(
+                f"Job instance {instance.instance_id} references unknown "
+                f"pattern {instance.optimized_pattern_id}"
+            )
+        return pattern
+
+    def pattern_instances(self, pattern: JobOptimizedPattern) -> list[JobInstance]:
+        """Get the job instances scheduled with a pattern, in problem order."""
+        return [
+            instance
+            for instance in self.job_instances
+            if self.instance_pattern(instance) is pattern
+        ]
+
+    def get_calendar(self, calendar_id: str | None) -> WorkingCalendar | None:
+        """Get calendar by ID."""
+        return self.calendar_lookup.get(calendar_id) if calendar_id else None
+
     def get_operator(self, operator_id: str) -> Operator | None:
         """Get operator by ID."""
         return self.operator_lookup.get(operator_id)
@@ -924,22 +1105,24 @@ class SchedulingProblem:
 
         if self.is_optimized_mode and self.job_optimized_pattern:
             # Optimized mode validation
-            pattern_issues = self.job_optimized_pattern.validate_pattern()
-            issues.extend([f"Optimized Pattern: {issue}" for issue in pattern_issues])
-
-            # Check optimized task machines exist
-            for optimized_task in self.job_optimized_pattern.optimized_tasks:
-                for mode in optimized_task.modes:
-                    if mode.machine_resource_id not in self.machine_lookup:
-                        issues.append(
-                            f"Optimized task {optimized_task.name} references "
-                            f"non-existent machine {mode.machine_resource_id}"
-                        )
+            for pattern in self.job_optimized_patterns:
+                pattern_issues = pattern.validate_pattern()
+                issues.extend(
+                    [f"Optimized Pattern: {issue}" for issue in pattern_issues]
+                )
+
+                # Check optimized task machines exist
+                for optimized_task in pattern.optimized_tasks:
+                    for mode in optimized_task.modes:
+                        if mode.machine_resource_id not in self.machine_lookup:
+                            issues.append(
+                                f"Optimized task {optimized_task.name} references "
+                                f"non-existent machine {mode.machine_resource_id}"
+                            )
 
             # Validate job instances reference valid pattern
             for instance in self.job_instances:
-                pattern_id = self.job_optimized_pattern.optimized_pattern_id
-                if instance.optimized_pattern_id != pattern_id:
+                if instance.optimized_pattern_id not in self.pattern_lookup:
                     issues.append(
                         f"Job instance {instance.instance_id} references "
                         f"invalid pattern {instance.optimized_pattern_id}"
@@ -978,6 +1161,15 @@ class SchedulingProblem:
             if prec.predecessor_task_id == prec.successor_task_id:
                 issues.append(f"Circular precedence on task {prec.predecessor_task_id}")
 
+        # Check calendar references
+        calendar_ids = [
+            self.default_calendar_id,
+            *(cell.calendar_id for cell in self.work_cells),
+        ]
+        for calendar_id in calendar_ids:
+            if calendar_id and calendar_id not in self.calendar_lookup:
+                issues.append(f"Reference to non-existent calendar {calendar_id}")
+
         return issues
 
     @classmethod
@@ -1015,6 +1207,42 @@ class SchedulingProblem:
             is_optimized_mode=True,
         )
 
+    @classmethod
+    def create_from_optimized_patterns(
+        cls,
+        job_optimized_patterns: list[JobOptimizedPattern],
+        job_instances: list[JobInstance],
+        machines: list[Machine],
+        work_cells: list[WorkCell],
+    ) -> "SchedulingProblem":
+        """Create an optimized mode problem over several product patterns.
+
+        Every instance is scheduled with the pattern its optimized_pattern_id
+        names; machines and work cells are shared by all patterns.
+
+        Args:
+            job_optimized_patterns: Patterns defining the task structures
+            job_instances: Job instances of any of the patterns
+            machines: Available machines
+            work_cells: Work cell definitions
+
+        Returns:
+            SchedulingProblem configured for multi-pattern optimized mode
+
+        """
+        if not job_optimized_patterns:
+            raise ValueError("At least one optimized pattern is required")
+        return cls(
+            jobs=[],
+            machines=machines,
+            work_cells=work_cells,
+            precedences=[],
+            job_optimized_pattern=job_optimized_patterns[0],
+            job_instances=job_instances,
+            is_optimized_mode=True,
+            job_optimized_patterns=list(job_optimized_patterns),
+        )
+
 
 # Phase 3: Multi-Objective Optimization Models
 
@@ -0,0 +1,425 @@
+"""Integer-indexed arrays compiled from a SchedulingProblem.
+
+Constraint builders used to rebuild UUID string keys such as
+``(instance_id, instance_task_id, machine_id)`` inside nested
+instance x task x machine loops and test eligibility by scanning mode lists.
+ProblemArrays is compiled once per problem and gives every task, machine, work
+cell and operator a dense integer index:
+
+- Tasks are numbered unit by unit (job, or job instance in optimized mode), in
+  problem order. In optimized mode task ``unit_indptr[i] + p`` is pattern task
+  ``p`` of instance ``i``; when every instance shares one pattern that is
+  ``i * pattern_size + p``.
+- Machines of ``problem.machines`` come first; machines only referenced by task
+  modes or work cells are appended with capacity 0, so no machine constraint is
+  built for them.
+- Mode durations (time units) are a task x machine matrix with -1 where the task
+  cannot run, next to a boolean eligibility matrix.
+- Precedences, modes, cell membership and qualified operators are CSR lists
+  (``indptr`` / ``indices``).
+
+Variable dictionaries stay keyed by the original string tuples, which the
+model cache, solution extraction and the API read. Builders take those keys from
+``task_keys`` instead of formatting them.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from src.solver.models.problem import SchedulingProblem
+
+# Type aliases following TEMPLATES.md centralized patterns
+TaskKey = tuple[str, str]  # (job_id, task_id) or (instance_id, instance_task_id)
+AssignmentKey = tuple[str, str, str]  # TaskKey + machine_id
+IndexArray = np.ndarray  # 1-D int32 array
+
+INELIGIBLE = -1  # durations entry for machines a task cannot run on
+
+
+def _csr(rows: list[list[int]]) -> tuple[IndexArray, IndexArray]:
+    """Pack per-row index lists into (indptr, indices) arrays."""
+    indptr = np.zeros(len(rows) + 1, dtype=np.int32)
+    indptr[1:] = np.cumsum([len(row) for row in rows], dtype=np.int64)
+    indices = np.fromiter(
+        (value for row in rows for value in row), dtype=np.int32, count=indptr[-1]
+    )
+    return indptr, indices
+
+
+def duration_bounds(
+    durations: np.ndarray, eligible: np.ndarray
+) -> tuple[IndexArray, IndexArray]:
+    """Shortest and longest eligible mode duration per task.
+
+    Tasks without modes get 0/0 bounds.
+    """
+    no_mode = np.iinfo(np.int32).max
+    masked = np.where(eligible, durations, no_mode)
+    min_duration = masked.min(axis=1, initial=no_mode)
+    min_duration[min_duration == no_mode] = 0
+    max_duration = np.where(eligible, durations, 0).max(axis=1, initial=0)
+    return min_duration, max_duration
+
+
+def _row(indptr: IndexArray, indices: IndexArray, row: int) -> list[int]:
+    """One CSR row as a list of Python ints."""
+    return indices[indptr[row] : indptr[row + 1]].tolist()
+
+
+@dataclass
+class ProblemArrays:
+    """Dense integer view of a scheduling problem.
+
+    Args:
+        unit_ids: Job IDs, or instance IDs in optimized mode
+        task_ids: Task IDs, or instance task IDs in optimized mode
+        task_unit: Unit index of every task
+        task_position: Index of every task within its job or the pattern
+        machine_ids: Machine IDs; the first ``known_machine_count`` come from
+            problem.machines
+        known_machine_count: Number of machines listed in problem.machines
+        machine_capacity: Capacity per machine (0 for unlisted machines)
+        machine_cell: Work cell index per machine (-1 if the cell is unknown)
+        cell_ids: Work cell IDs
+        cell_capacity: Capacity per work cell
+        cell_indptr: CSR row pointers of the machines of every work cell
+        cell_machines: CSR machine indices of every work cell
+        operator_ids: Operator IDs
+        durations: Task x machine durations in time units, -1 if ineligible
+        eligible: Task x machine eligibility
+        mode_indptr: CSR row pointers of the modes of every task
+        mode_machines: Machine index of every mode, in mode order
+        precedence_pairs: (predecessor, successor) task index pairs in
+            problem order, shape (n, 2)
+        operator_indptr: CSR row pointers of qualified operators per task
+            (empty when the problem has no operators)
+        operator_indices: CSR operator indices per task
+        pattern_size: Tasks per instance in single-pattern optimized mode, 0
+            otherwise
+        pattern_ids: Optimized pattern IDs in optimized mode, empty otherwise
+        unit_pattern: Pattern index per instance in optimized mode
+        optimized_task_ids: Optimized task ID of every task in optimized mode
+
+    """
+
+    unit_ids: list[str]
+    task_ids: list[str]
+    task_unit: IndexArray
+    task_position: IndexArray
+    machine_ids: list[str]
+    known_machine_count: int
+    machine_capacity: IndexArray
+    machine_cell: IndexArray
+    cell_ids: list[str]
+    cell_capacity: IndexArray
+    cell_indptr: IndexArray
+    cell_machines: IndexArray
+    operator_ids: list[str]
+    durations: np.ndarray
+    eligible: np.ndarray
+    mode_indptr: IndexArray
+    mode_machines: IndexArray
+    precedence_pairs: np.ndarray
+    operator_indptr: IndexArray
+    operator_indices: IndexArray
+    pattern_size: int = 0
+    pattern_ids: list[str] = field(default_factory=list)
+    unit_pattern: IndexArray = field(
+        default_factory=lambda: np.zeros(0, dtype=np.int32)
+    )
+    optimized_task_ids: list[str] = field(default_factory=list)
+
+    # Derived lookups
+    task_keys: list[TaskKey] = field(init=False)
+    task_index: dict[TaskKey, int] = field(init=False)
+    machine_index: dict[str, int] = field(init=False)
+    cell_index: dict[str, int] = field(init=False)
+    operator_index: dict[str, int] = field(init=False)
+    min_duration: IndexArray = field(init=False)
+    max_duration: IndexArray = field(init=False)
+    succ_indptr: IndexArray = field(init=False)
+    succ_indices: IndexArray = field(init=False)
+    pred_indptr: IndexArray = field(init=False)
+    pred_indices: IndexArray = field(init=False)
+    unit_indptr: IndexArray = field(init=False)
+
+    def __post_init__(self) -> None:
+        n_tasks = len(self.task_ids)
+        n_machines = len(self.machine_ids)
+        if self.durations.shape != (n_tasks, n_machines):
+            raise ValueError(
+                f"durations shape {self.durations.shape} does not match "
+                f"{n_tasks} tasks x {n_machines} machines"
+            )
+        if len(self.task_unit) != n_tasks or len(self.task_position) != n_tasks:
+            raise ValueError("task_unit and task_position need one entry per task")
+
+        self.task_keys = [
+            (self.unit_ids[unit], task_id)
+            for unit, task_id in zip(
+                self.task_unit.tolist(), self.task_ids, strict=True
+            )
+        ]
+        self.task_index = {key: t for t, key in enumerate(self.task_keys)}
+        self.machine_index = {m: i for i, m in enumerate(self.machine_ids)}
+        self.cell_index = {c: i for i, c in enumerate(self.cell_ids)}
+        self.operator_index = {o: i for i, o in enumerate(self.operator_ids)}
+
+        self.min_duration, self.max_duration = duration_bounds(
+            self.durations, self.eligible
+        )
+
+        self.succ_indptr, self.succ_indices = self._adjacency(0, 1)
+        self.pred_indptr, self.pred_indices = self._adjacency(1, 0)
+
+        # Tasks are numbered unit by unit, so each unit is a contiguous range
+        self.unit_indptr = np.zeros(len(self.unit_ids) + 1, dtype=np.int32)
+        self.unit_indptr[1:] = np.cumsum(
+            np.bincount(self.task_unit, minlength=len(self.unit_ids))
+        )
+
+    def _adjacency(self, source: int, target: int) -> tuple[IndexArray, IndexArray]:
+        """CSR adjacency of precedence_pairs from one column to the other."""
+        n_tasks = len(self.task_ids)
+        pairs = self.precedence_pairs
+        order = np.argsort(pairs[:, source], kind="stable")
+        counts = np.bincount(pairs[:, source], minlength=n_tasks)
+        indptr = np.zeros(n_tasks + 1, dtype=np.int32)
+        indptr[1:] = np.cumsum(counts)
+        return indptr, pairs[order, target].astype(np.int32)
+
+    @property
+    def task_count(self) -> int:
+        """Number of tasks."""
+        return len(self.task_ids)
+
+    @property
+    def is_optimized_mode(self) -> bool:
+        """Whether the tasks are pattern tasks of job instances."""
+        return bool(self.pattern_ids)
+
+    @property
+    def machine_count(self) -> int:
+        """Number of machines, including machines outside problem.machines."""
+        return len(self.machine_ids)
+
+    def assignment_key(self, task: int, machine: int) -> AssignmentKey:
+        """String key of the assignment variable of ``task`` on ``machine``."""
+        unit_id, task_id = self.task_keys[task]
+        return (unit_id, task_id, self.machine_ids[machine])
+
+    def unit_tasks(self, unit: int) -> range:
+        """Task indices of one job or instance, in job or pattern order."""
+        return range(self.unit_indptr[unit], self.unit_indptr[unit + 1])
+
+    def pattern_units(self, pattern: int) -> list[int]:
+        """Instances of one pattern, in problem order."""
+        return np.flatnonzero(self.unit_pattern == pattern).tolist()
+
+    def task_machines(self, task: int) -> list[int]:
+        """Machine indices of a task's modes, in mode order."""
+        return _row(self.mode_indptr, self.mode_machines, task)
+
+    def machine_tasks(self, machine: int) -> list[int]:
+        """Indices of the tasks that can run on a machine, in task order."""
+        return np.flatnonzero(self.eligible[:, machine]).tolist()
+
+    def duration(self, task: int, machine: int) -> int:
+        """Duration of a task on a machine in time units (-1 if ineligible)."""
+        return int(self.durations[task, machine])
+
+    def successors(self, task: int) -> list[int]:
+        """Direct successors of a task."""
+        return _row(self.succ_indptr, self.succ_indices, task)
+
+    def predecessors(self, task: int) -> list[int]:
+        """Direct predecessors of a task."""
+        return _row(self.pred_indptr, self.pred_indices, task)
+
+    def cell_machine_indices(self, cell: int) -> list[int]:
+        """Machine indices of a work cell."""
+        return _row(self.cell_indptr, self.cell_machines, cell)
+
+    def qualified_operators(self, task: int) -> list[int]:
+        """Operator indices qualified for a task."""
+        if len(self.operator_indptr) <= task + 1:
+            return []
+        return _row(self.operator_indptr, self.operator_indices, task)
+
+
+def compile_problem_arrays(problem: SchedulingProblem) -> ProblemArrays:
+    """Compile a problem into its integer-indexed representation.
+
+    Args:
+        problem: The scheduling problem
+
+    Returns:
+        ProblemArrays for the problem's jobs, or its job instances in optimized
+        mode
+
+    Performance: O(tasks x modes + precedences), run once per solver
+
+    """
+    unit_ids: list[str] = []
+    task_ids: list[str] = []
+    task_unit: list[int] = []
+    task_position: list[int] = []
+    task_modes: list[list[tuple[str, int]]] = []
+    pairs: list[tuple[int, int]] = []
+    pattern_size = 0
+    pattern_ids: list[str] = []
+    unit_pattern: list[int] = []
+    optimized_task_ids: list[str] = []
+
+    if problem.is_optimized_mode and problem.job_optimized_pattern:
+        patterns = problem.job_optimized_patterns
+        pattern_ids = [pattern.optimized_pattern_id for pattern in patterns]
+        pattern_number = {id(pattern): p for p, pattern in enumerate(patterns)}
+        pattern_modes = []
+        pattern_pairs = []
+        for pattern in patterns:
+            pattern_modes.append(
+                [
+                    [(m.machine_resource_id, m.duration_time_units) for m in t.modes]
+                    for t in pattern.optimized_tasks
+                ]
+            )
+            pattern_index = {
+                t.optimized_task_id: p for p, t in enumerate(pattern.optimized_tasks)
+            }
+            pattern_pairs.append(
+                [
+                    (
+                        pattern_index[prec.predecessor_optimized_task_id],
+                        pattern_index[prec.successor_optimized_task_id],
+                    )
+                    for prec in pattern.optimized_precedences
+                    if prec.predecessor_optimized_task_id in pattern_index
+                    and prec.successor_optimized_task_id in pattern_index
+                ]
+            )
+        if len(patterns) == 1:
+            pattern_size = len(patterns[0].optimized_tasks)
+
+        for unit, instance in enumerate(problem.job_instances):
+            pattern = problem.instance_pattern(instance)
+            number = pattern_number[id(pattern)]
+            unit_ids.append(instance.instance_id)
+            unit_pattern.append(number)
+            base = len(task_ids)
+            for position, optimized_task in enumerate(pattern.optimized_tasks):
+                task_ids.append(
+                    problem.get_instance_task_id(
+                        instance.instance_id, optimized_task.optimized_task_id
+                    )
+                )
+                task_unit.append(unit)
+                task_position.append(position)
+                optimized_task_ids.append(optimized_task.optimized_task_id)
+            task_modes.extend(pattern_modes[number])
+            pairs.extend(
+                (base + pred, base + succ) for pred, succ in pattern_pairs[number]
+            )
+    else:
+        task_by_id: dict[str, int] = {}
+        for unit, job in enumerate(problem.jobs):
+            unit_ids.append(job.job_id)
+            for position, task in enumerate(job.tasks):
+                task_by_id[task.task_id] = len(task_ids)
+                task_ids.append(task.task_id)
+                task_unit.append(unit)
+                task_position.append(position)
+                task_modes.append(
+                    [(m.machine_resource_id, m.duration_time_units) for m in task.modes]
+                )
+        pairs = [
+            (task_by_id[prec.predecessor_task_id], task_by_id[prec.successor_task_id])
+            for prec in problem.precedences
+            if prec.predecessor_task_id in task_by_id
+            and prec.successor_task_id in task_by_id
+        ]
+
+    # Machines: listed machines first, then cell-only and mode-only machines
+    machine_ids = [machine.resource_id for machine in problem.machines]
+    machine_index = {m: i for i, m in enumerate(machine_ids)}
+    known_machine_count = len(machine_ids)
+    extra_ids = [m.resource_id for cell in problem.work_cells for m in cell.machines]
+    extra_ids += [m for modes in task_modes for m, _ in modes]
+    for machine_id in extra_ids:
+        if machine_id not in machine_index:
+            machine_index[machine_id] = len(machine_ids)
+            machine_ids.append(machine_id)
+
+    cell_ids = [cell.cell_id for cell in problem.work_cells]
+    cell_index = {c: i for i, c in enumerate(cell_ids)}
+    machine_capacity = np.zeros(len(machine_ids), dtype=np.int32)
+    machine_cell = np.full(len(machine_ids), -1, dtype=np.int32)
+    for i, machine in enumerate(problem.machines):
+        machine_capacity[i] = machine.capacity
+        machine_cell[i] = cell_index.get(machine.cell_id, -1)
+
+    cell_indptr, cell_machines = _csr(
+        [
+            [machine_index[m.resource_id] for m in cell.machines]
+            for cell in problem.work_cells
+        ]
+    )
+
+    # Mode durations; a repeated machine keeps its first mode like the lookups
+    durations = np.full((len(task_ids), len(machine_ids)), INELIGIBLE, dtype=np.int32)
+    mode_rows: list[list[int]] = []
+    for t, modes in enumerate(task_modes):
+        row = []
+        for machine_id, duration in modes:
+            m = machine_index[machine_id]
+            if durations[t, m] == INELIGIBLE:
+                durations[t, m] = duration
+                row.append(m)
+        mode_rows.append(row)
+    mode_indptr, mode_machines = _csr(mode_rows)
+
+    operator_ids = [op.operator_id for op in problem.operators]
+    if problem.operators:
+        operator_index = {o: i for i, o in enumerate(operator_ids)}
+        operator_indptr, operator_indices = _csr(
+            [
+                [
+                    operator_index[op.operator_id]
+                    for op in problem.get_qualified_operators(task_id)
+                ]
+                for task_id in task_ids
+            ]
+        )
+    else:
+        operator_indptr = np.zeros(1, dtype=np.int32)
+        operator_indices = np.zeros(0, dtype=np.int32)
+
+    return ProblemArrays(
+        unit_ids=unit_ids,
+        task_ids=task_ids,
+        task_unit=np.asarray(task_unit, dtype=np.int32),
+        task_position=np.asarray(task_position, dtype=np.int32),
+        machine_ids=machine_ids,
+        known_machine_count=known_machine_count,
+        machine_capacity=machine_capacity,
+        machine_cell=machine_cell,
+        cell_ids=cell_ids,
+        cell_capacity=np.asarray(
+            [cell.capacity for cell in problem.work_cells], dtype=np.int32
+        ),
+        cell_indptr=cell_indptr,
+        cell_machines=cell_machines,
+        operator_ids=operator_ids,
+        durations=durations,
+        eligible=durations != INELIGIBLE,
+        mode_indptr=mode_indptr,
+        mode_machines=mode_machines,
+        precedence_pairs=np.asarray(pairs, dtype=np.int32).reshape(-1, 2),
+        operator_indptr=operator_indptr,
+        operator_indices=operator_indices,
+        pattern_size=pattern_size,
+        pattern_ids=pattern_ids,
+        unit_pattern=np.asarray(unit_pattern, dtype=np.int32),
+        optimized_task_ids=optimized_task_ids,
+    )
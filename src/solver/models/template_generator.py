@@ -282,6 +282,49 @@ def create_optimized_problem(
     return problem
 
 
+def create_optimized_mode_problem(
+    pattern: JobOptimizedPattern,
+    num_instances: int,
+    base_due_hours: float = 24.0,
+    due_hour_increment: float = 2.0,
+    reference_time: datetime | None = None,
+) -> SchedulingProblem:
+    """Create a native optimized mode problem (pattern + job instances).
+
+    Unlike create_optimized_problem(), which expands instances into unique-mode
+    jobs, this keeps the pattern/instance structure used by FreshSolver's
+    optimized mode path.
+
+    Args:
+        pattern: The job optimized pattern to instantiate
+        num_instances: Number of identical job instances to create
+        base_due_hours: Hours after reference_time for first job due date
+        due_hour_increment: Hours to add between job due dates
+        reference_time: Time due dates are measured from (default: now)
+
+    Returns:
+        SchedulingProblem with is_optimized_mode=True
+
+    """
+    start = reference_time or datetime.now(UTC)
+    job_instances = [
+        JobInstance(
+            instance_id=f"job_instance_{i:03d}",
+            optimized_pattern_id=pattern.optimized_pattern_id,
+            description=f"Manufacturing Job Instance {i + 1}",
+            due_date=start + timedelta(hours=base_due_hours + (i * due_hour_increment)),
+        )
+        for i in range(num_instances)
+    ]
+
+    return SchedulingProblem.create_from_optimized_pattern(
+        job_optimized_pattern=pattern,
+        job_instances=job_instances,
+        machines=create_test_machines(),
+        work_cells=create_test_work_cells(),
+    )
+
+
 def create_small_optimized_problem() -> SchedulingProblem:
     """Create a small optimized mode problem for testing (5 identical jobs)."""
     pattern = create_manufacturing_job_optimized_pattern()
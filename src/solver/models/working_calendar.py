@@ -0,0 +1,232 @@
+"""Working calendars compiled into start-time domains.
+
+Setup work for unattended processes needs an operator, so it has to fit inside
+working time. Business hours used to be hard-coded (Mon-Fri 7am-4pm, one
+96-unit day, first week only) and modelled with five reified day booleans per
+task. A WorkingCalendar instead describes a weekly shift pattern with holidays;
+every work cell can have its own (WorkCell.calendar_id, falling back to
+problem.default_calendar_id and then to BUSINESS_HOURS_CALENDAR).
+
+compile_task_calendars() expands each calendar over the whole horizon into
+merged working windows and turns them into ``cp_model.Domain`` objects of the
+start times at which a task of a given duration fits in one window. The solver
+creates the start variables of calendar-bound tasks directly from these
+domains, so the calendar costs no booleans and no constraints; only a task
+whose machines have different domains gets one enforced domain constraint per
+machine, on its existing assignment literal.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta
+
+from ortools.sat.python import cp_model
+
+from src.solver.models.problem import (
+    CalendarShift,
+    SchedulingProblem,
+    WorkingCalendar,
+)
+from src.solver.models.problem_arrays import ProblemArrays
+
+logger = logging.getLogger(__name__)
+
+# Type aliases following TEMPLATES.md centralized patterns
+Window = tuple[int, int]  # (start, end) in time units, end exclusive
+TaskCalendars = dict[int, "TaskCalendar"]  # ProblemArrays task index -> domains
+
+UNITS_PER_DAY = 96  # 24 hours x 4 fifteen-minute units
+
+# Default when neither the work cell nor the problem names a calendar
+BUSINESS_HOURS_CALENDAR = WorkingCalendar(
+    calendar_id="business_hours",
+    name="Mon-Fri 7am-4pm",
+    shifts=[CalendarShift(day, time(7), time(16)) for day in range(5)],
+)
+
+
+@dataclass
+class TaskCalendar:
+    """Allowed start times of one calendar-bound task.
+
+    Args:
+        start_domain: Start times allowed on at least one eligible machine
+        machine_domains: Start times per machine index; only set when the
+            machines of the task do not all allow the same start times
+
+    """
+
+    start_domain: cp_model.Domain
+    machine_domains: dict[int, cp_model.Domain] = field(default_factory=dict)
+
+
+def calendar_windows(
+    calendar: WorkingCalendar, horizon: int, origin: datetime | None = None
+) -> list[Window]:
+    """Working windows of a calendar within [0, horizon].
+
+    Args:
+        calendar: The working calendar
+        horizon: Last time unit of the schedule
+        origin: Wall-clock time of time unit 0; None means a Monday 00:00, in
+            which case holidays are ignored
+
+    Returns:
+        Sorted, merged (start, end) windows; touching shifts form one window
+
+    Performance: O(days x shifts) for days = horizon / 96
+
+    """
+    if origin is None:
+        first_weekday, offset, first_date = 0, 0, None
+    else:
+        first_weekday = origin.weekday()
+        midnight = datetime.combine(origin.date(), time(), origin.tzinfo)
+        offset = -((origin - midnight) // timedelta(minutes=15))
+        first_date = origin.date()
+
+    if origin is None and calendar.holidays:
+        logger.warning(
+            f"Calendar {calendar.calendar_id}: holidays ignored without "
+            f"problem.calendar_origin"
+        )
+
+    holidays = set(calendar.holidays)
+    shifts_by_weekday: dict[int, list[Window]] = {}
+    for shift in calendar.shifts:
+        start = _time_units(shift.start_time, round_up=True)
+        end = _time_units(shift.end_time, round_up=False)
+        if end <= start:
+            end += UNITS_PER_DAY  # Night shift ends on the next day
+        shifts_by_weekday.setdefault(shift.weekday, []).append((start, end))
+
+    windows: list[Window] = []
+    # The day before unit 0 may hold a night shift reaching past midnight
+    for day in range(-1, (horizon - offset) // UNITS_PER_DAY + 1):
+        if first_date is not None and first_date + timedelta(days=day) in holidays:
+            continue
+        day_start = offset + day * UNITS_PER_DAY
+        for start, end in shifts_by_weekday.get((first_weekday + day) % 7, []):
+            start, end = max(0, day_start + start), min(horizon, day_start + end)
+            if start < end:
+                windows.append((start, end))
+
+    merged: list[Window] = []
+    for start, end in sorted(windows):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def start_domain(windows: list[Window], duration: int) -> cp_model.Domain:
+    """Start times at which a task of the given duration fits in one window."""
+    return cp_model.Domain.FromIntervals(
+        [[start, end - duration] for start, end in windows if end - start >= duration]
+    )
+
+
+def compile_task_calendars(
+    problem: SchedulingProblem, arrays: ProblemArrays, horizon: int
+) -> TaskCalendars:
+    """Start domains of every calendar-bound task.
+
+    Setup tasks of unattended processes (is_setup and is_unattended) follow
+    the calendar of the work cell of the machine they run on.
+
+    Args:
+        problem: The scheduling problem the arrays were compiled from
+        arrays: Compiled problem arrays
+        horizon: Schedule horizon in time units
+
+    Returns:
+        TaskCalendar per ProblemArrays task index of every calendar-bound task
+
+    Performance: O(calendars x days x shifts + bound tasks x modes); windows
+    and domains are computed once per calendar and (calendar, duration)
+
+    """
+    tasks = [
+        task
+        for task, bound in enumerate(_calendar_bound_tasks(problem))
+        if bound and arrays.task_machines(task)
+    ]
+    if not tasks:
+        return {}
+
+    cell_calendars = {cell.cell_id: cell.calendar_id for cell in problem.work_cells}
+    default_id = problem.default_calendar_id
+    machine_calendar: dict[int, WorkingCalendar] = {}
+    machine_cells = arrays.machine_cell.tolist()
+    for machine in range(arrays.machine_count):
+        cell = machine_cells[machine]
+        calendar_id = (
+            cell_calendars.get(arrays.cell_ids[cell]) if cell >= 0 else None
+        ) or default_id
+        machine_calendar[machine] = (
+            problem.get_calendar(calendar_id) or BUSINESS_HOURS_CALENDAR
+        )
+
+    windows: dict[str, list[Window]] = {}
+    domains: dict[tuple[str, int], cp_model.Domain] = {}
+
+    def domain_of(calendar: WorkingCalendar, duration: int) -> cp_model.Domain:
+        key = (calendar.calendar_id, duration)
+        if key not in domains:
+            if calendar.calendar_id not in windows:
+                windows[calendar.calendar_id] = calendar_windows(
+                    calendar, horizon, problem.calendar_origin
+                )
+            domains[key] = start_domain(windows[calendar.calendar_id], duration)
+        return domains[key]
+
+    task_calendars: TaskCalendars = {}
+    empty = 0
+    for task in tasks:
+        machine_domains = {
+            machine: domain_of(
+                machine_calendar[machine], arrays.duration(task, machine)
+            )
+            for machine in arrays.task_machines(task)
+        }
+        distinct = {id(domain): domain for domain in machine_domains.values()}
+        union = cp_model.Domain.FromValues([])
+        for domain in distinct.values():
+            union = union.union_with(domain)
+        empty += union.is_empty()
+        task_calendars[task] = TaskCalendar(
+            start_domain=union,
+            machine_domains=machine_domains if len(distinct) > 1 else {},
+        )
+
+    logger.info(
+        f"Calendars: {len(task_calendars)} calendar-bound tasks, "
+        f"{len(windows)} calendar(s), {len(domains)} start domains"
+    )
+    if empty:
+        logger.warning(
+            f"Calendars: {empty} task(s) fit in no working window of the horizon"
+        )
+    return task_calendars
+
+
+def _calendar_bound_tasks(problem: SchedulingProblem) -> list[bool]:
+    """Whether each task (in ProblemArrays order) follows a working calendar."""
+    if problem.is_optimized_mode and problem.job_optimized_pattern:
+        return [
+            optimized_task.is_setup and optimized_task.is_unattended
+            for instance in problem.job_instances
+            for optimized_task in problem.instance_pattern(instance).optimized_tasks
+        ]
+    return [
+        task.is_setup and task.is_unattended
+        for job in problem.jobs
+        for task in job.tasks
+    ]
+
+
+def _time_units(value: time, round_up: bool) -> int:
+    """Time of day in 15-minute units, rounded into the working window."""
+    minutes = value.hour * 60 + value.minute
+    return -(-minutes // 15) if round_up else minutes // 15
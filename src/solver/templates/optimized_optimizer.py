@@ -190,15 +190,21 @@ class OptimizedOptimizer:
             return 0
 
         constraints_added = 0
-        instances = sorted(problem.job_instances, key=lambda x: x.instance_id)
 
-        for i in range(len(instances) - 1):
-            curr_instance = instances[i]
-            next_instance = instances[i + 1]
+        # Only instances of the same pattern are identical
+        for pattern in problem.job_optimized_patterns:
+            if not pattern.optimized_tasks:
+                continue
+            instances = sorted(
+                problem.pattern_instances(pattern), key=lambda x: x.instance_id
+            )
+
+            for i in range(len(instances) - 1):
+                curr_instance = instances[i]
+                next_instance = instances[i + 1]
 
-            # Get first template task for ordering
-            if problem.job_optimized_pattern.optimized_tasks:
-                first_optimized_task = problem.job_optimized_pattern.optimized_tasks[0]
+                # Get first template task for ordering
+                first_optimized_task = pattern.optimized_tasks[0]
                 curr_key = (
                     curr_instance.instance_id,
                     first_optimized_task.optimized_task_id,
@@ -10,14 +10,23 @@ from ortools.sat.python import cp_model
 
 # Type annotations - OR-Tools types
 from src.solver.models.problem import Job, SchedulingProblem, Task
+from src.solver.models.setup_matrix import SetupTable, as_setup_table
 
 logger = logging.getLogger(__name__)
 
 
-def calculate_horizon(problem: SchedulingProblem) -> int:
+def calculate_horizon(
+    problem: SchedulingProblem, schedule_makespan: int | None = None
+) -> int:
     """Calculate a reasonable horizon for the scheduling problem.
 
     Returns time units (15-minute intervals) from now to latest due date plus buffer.
+
+    Args:
+        problem: The scheduling problem
+        schedule_makespan: Makespan of a known schedule, e.g. from a dispatch
+            heuristic. Replaces the 2x total work estimate when given.
+
     """
     if problem.is_optimized_mode:
         # Optimized mode horizon calculation
@@ -33,17 +42,27 @@ def calculate_horizon(problem: SchedulingProblem) -> int:
         ]
         if due_dates:
             latest_due = max(due_dates)
-        else:
+        elif schedule_makespan is None:
             # No due dates, use default horizon
             return 100
+        else:
+            latest_due = None
 
-        # Calculate total work content from optimized pattern
+        # Calculate total work content from the optimized patterns
         if problem.job_optimized_pattern:
-            pattern_work_minutes = sum(
-                optimized_task.min_duration
-                for optimized_task in problem.job_optimized_pattern.optimized_tasks
+            pattern_work_minutes = {
+                pattern.optimized_pattern_id: sum(
+                    optimized_task.min_duration
+                    for optimized_task in pattern.optimized_tasks
+                )
+                for pattern in problem.job_optimized_patterns
+            }
+            total_work_minutes = sum(
+                pattern_work_minutes[
+                    problem.instance_pattern(instance).optimized_pattern_id
+                ]
+                for instance in problem.job_instances
             )
-            total_work_minutes = pattern_work_minutes * len(problem.job_instances)
         else:
             total_work_minutes = 0
     else:
@@ -55,9 +74,11 @@ def calculate_horizon(problem: SchedulingProblem) -> int:
         due_dates = [job.due_date for job in problem.jobs if job.due_date is not None]
         if due_dates:
             latest_due = max(due_dates)
-        else:
+        elif schedule_makespan is None:
             # No due dates, use default horizon
             return 100
+        else:
+            latest_due = None
 
         # Calculate total work content (sum of all minimum durations)
         total_work_minutes = sum(
@@ -69,12 +90,19 @@ def calculate_horizon(problem: SchedulingProblem) -> int:
 
     # Calculate time from now to latest due date
     now = datetime.now(UTC)
-    time_to_due = latest_due - now
-    available_units = int(time_to_due.total_seconds() / 900)  # 900 seconds = 15 minutes
+    if latest_due is not None:
+        time_to_due = latest_due - now
+        available_units = int(time_to_due.total_seconds() / 900)  # 900s = 15 minutes
+    else:
+        available_units = 0
 
-    # Use the larger of available time or 2x total work (to allow for machine conflicts)
+    # Use the larger of available time or 2x total work (to allow for machine conflicts),
+    # or the makespan of a known schedule instead of the work estimate
     # Add 20% buffer
-    horizon = int(max(available_units, total_work_units * 2) * 1.2)
+    work_estimate = (
+        schedule_makespan if schedule_makespan is not None else total_work_units * 2
+    )
+    horizon = int(max(available_units, work_estimate) * 1.2)
 
     # Ensure minimum horizon
     MIN_HORIZON = 100  # At least 25 hours
@@ -127,13 +155,14 @@ def calculate_latest_start(task: Task, job: Job, horizon: int) -> int:
 
 
 def calculate_setup_time_metrics(
-    schedule: list[dict], setup_times: dict[tuple[str, str, str], int]
+    schedule: list[dict], setup_times: dict[tuple[str, str, str], int] | SetupTable
 ) -> dict:
     """Calculate setup time metrics from the schedule.
 
     Args:
         schedule: List of scheduled tasks with machine assignments
-        setup_times: Dictionary of setup times between tasks on machines
+        setup_times: Compiled SetupTable, or a dictionary of setup times
+            between tasks on machines
 
     Returns:
         Dictionary with setup time metrics
@@ -152,6 +181,13 @@ def calculate_setup_time_metrics(
     for machine_id in machine_tasks:
         machine_tasks[machine_id].sort(key=lambda t: t["start_time"])
 
+    if isinstance(setup_times, SetupTable):
+        setup_time_of = setup_times.setup_time
+    else:
+
+        def setup_time_of(pred_task_id: str, succ_task_id: str, machine_id: str) -> int:
+            return setup_times.get((pred_task_id, succ_task_id, machine_id), 0)
+
     # Calculate setup times
     total_setup_time = 0
     setup_instances = []
@@ -165,8 +201,9 @@ def calculate_setup_time_metrics(
             next_task = tasks[i + 1]
 
             # Check if there's a setup time between these tasks
-            setup_key = (current_task["task_id"], next_task["task_id"], machine_id)
-            setup_time = setup_times.get(setup_key, 0)
+            setup_time = setup_time_of(
+                current_task["task_id"], next_task["task_id"], machine_id
+            )
 
             if setup_time > 0:
                 total_setup_time += setup_time
@@ -215,7 +252,7 @@ def extract_solution(
     task_ends: dict[tuple[str, str], cp_model.IntVar],
     task_assigned: dict[tuple[str, str, str], cp_model.IntVar],
     _task_modes_selected: dict[tuple[str, str], cp_model.IntVar] | None = None,
-    setup_times: dict[tuple[str, str, str], int] | None = None,
+    setup_times: dict[tuple[str, str, str], int] | SetupTable | None = None,
 ) -> dict:
     """Extract solution from solved model.
 
@@ -251,7 +288,7 @@ def extract_solution(
         for instance in problem.job_instances:
             instance_end_time = 0
 
-            for optimized_task in problem.job_optimized_pattern.optimized_tasks:
+            for optimized_task in problem.instance_pattern(instance).optimized_tasks:
                 instance_task_id = problem.get_instance_task_id(
                     instance.instance_id, optimized_task.optimized_task_id
                 )
@@ -377,7 +414,9 @@ def extract_solution(
             makespan = max(makespan, job_end_time)
 
     # Calculate setup time metrics
-    setup_time_metrics = calculate_setup_time_metrics(schedule, setup_times or {})
+    setup_time_metrics = calculate_setup_time_metrics(
+        schedule, as_setup_table(problem, setup_times)
+    )
 
     return {
         "status": solver.StatusName(),
@@ -11,6 +11,8 @@ from pathlib import Path
 from typing import Any
 
 from src.solver.models.problem import SchedulingProblem
+from src.solver.models.setup_matrix import SetupTable, as_setup_table
+from src.solver.utils.time_utils import calculate_setup_time_metrics
 
 
 @dataclass
@@ -66,16 +68,25 @@ class ScheduleVisualization:
 class ScheduleExporter:
     """Export scheduling solutions to various formats for visualization."""
 
-    def __init__(self, problem: SchedulingProblem, solution: dict[str, Any]):
+    def __init__(
+        self,
+        problem: SchedulingProblem,
+        solution: dict[str, Any],
+        setup_times: dict[tuple[str, str, str], int] | SetupTable | None = None,
+    ):
         """Initialize the schedule exporter.
 
         Args:
             problem: The scheduling problem
             solution: The solution dictionary from extract_solution
+            setup_times: Setup times of the solve (e.g. FreshSolver.setup_table);
+                used with problem.setup_matrices when the solution carries no
+                setup_time_metrics
 
         """
         self.problem = problem
         self.solution = solution
+        self.setup_table = as_setup_table(problem, setup_times)
         self.color_palette = [
             "#FF6B6B",
             "#4ECDC4",
@@ -318,16 +329,20 @@ class ScheduleExporter:
             },
         }
 
-        # Add setup time metrics if available
-        if "setup_time_metrics" in self.solution:
-            metadata["setup_time_metrics"] = self.solution["setup_time_metrics"]
+        # Add setup time metrics if available, else derive them from the setup
+        # table
+        setup_time_metrics = self.solution.get("setup_time_metrics")
+        if setup_time_metrics is None and self.setup_table:
+            setup_time_metrics = calculate_setup_time_metrics(
+                self.solution.get("schedule", []), self.setup_table
+            )
+        if setup_time_metrics is not None:
+            metadata["setup_time_metrics"] = setup_time_metrics
 
         # Create setup visualizations if setup times are present
         setups: list[SetupVisualization] = []
-        if "setup_time_metrics" in self.solution:
-            setup_instances = self.solution["setup_time_metrics"].get(
-                "setup_instances", []
-            )
+        if setup_time_metrics is not None:
+            setup_instances = setup_time_metrics.get("setup_instances", [])
             for setup in setup_instances:
                 setups.append(
                     SetupVisualization(
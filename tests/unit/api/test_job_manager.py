@@ -0,0 +1,210 @@
+"""Tests for the process-pool solve job manager with stub workers."""
+
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from src.api.rest.job_manager import JobStatus, SolveJobManager
+
+# Seconds a test waits for a worker process to reach a state
+WAIT_TIMEOUT = 30.0
+
+
+# Workers run in spawned processes, so they must be module-level functions
+def _mark_running(job_id: str, time_limit: int, progress: Any) -> None:
+    progress[job_id] = {
+        "state": JobStatus.RUNNING.value,
+        "started_at": datetime.now(UTC).isoformat(),
+        "time_limit_seconds": time_limit,
+    }
+
+
+def _quick_worker(
+    job_id: str,
+    pattern_id: str,
+    max_instances: int,
+    time_limit: int,
+    cancel_event: Any,
+    progress: Any,
+) -> dict:
+    _mark_running(job_id, time_limit, progress)
+    return {
+        "status": "OPTIMAL",
+        "cancelled": False,
+        "solution": {"pattern_id": pattern_id, "instances": max_instances},
+    }
+
+
+def _blocking_worker(
+    job_id: str,
+    pattern_id: str,
+    max_instances: int,
+    time_limit: int,
+    cancel_event: Any,
+    progress: Any,
+) -> dict:
+    """Run until cancelled or for ``time_limit`` seconds."""
+    _mark_running(job_id, time_limit, progress)
+    cancelled = cancel_event.wait(time_limit)
+    return {"status": "FEASIBLE", "cancelled": cancelled, "solution": {}}
+
+
+def _failing_worker(
+    job_id: str,
+    pattern_id: str,
+    max_instances: int,
+    time_limit: int,
+    cancel_event: Any,
+    progress: Any,
+) -> dict:
+    _mark_running(job_id, time_limit, progress)
+    raise ValueError(f"pattern {pattern_id} not found")
+
+
+def _wait_for_status(manager: SolveJobManager, job_id: str, status: str) -> dict:
+    deadline = time.monotonic() + WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        job = manager.get_status(job_id)
+        if job is not None and job["status"] == status:
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"Job {job_id} did not reach {status}: {job}")
+
+
+@pytest.fixture
+def make_manager():
+    managers = []
+
+    def make(**options) -> SolveJobManager:
+        manager = SolveJobManager(**options)
+        managers.append(manager)
+        return manager
+
+    yield make
+    for manager in managers:
+        manager.shutdown()
+
+
+class TestSubmit:
+    """Submitted jobs run in the pool and report their result."""
+
+    def test_completed_job_has_its_result(self, make_manager):
+        manager = make_manager(worker=_quick_worker)
+
+        job_id = manager.submit("pattern_1", 3, 10)
+        status = _wait_for_status(manager, job_id, JobStatus.COMPLETED)
+
+        assert status["result"]["solution"] == {
+            "pattern_id": "pattern_1",
+            "instances": 3,
+        }
+        assert status["queue_position"] is None
+        assert status["finished_at"] is not None
+        assert status["progress"] == {}
+
+    def test_failed_job_reports_the_error(self, make_manager):
+        manager = make_manager(worker=_failing_worker)
+
+        job_id = manager.submit("missing", 1, 10)
+        status = _wait_for_status(manager, job_id, JobStatus.FAILED)
+
+        assert status["error"] == "pattern missing not found"
+        assert status["result"] is None
+        assert manager.get_stats()["jobs"][JobStatus.FAILED] == 1
+
+    def test_unknown_job(self, make_manager):
+        manager = make_manager(worker=_quick_worker)
+
+        assert manager.get_status("unknown") is None
+        assert manager.cancel("unknown") is False
+
+    def test_max_concurrent_jobs_must_be_positive(self):
+        with pytest.raises(ValueError, match="must be positive"):
+            SolveJobManager(max_concurrent_jobs=0)
+
+
+class TestQueue:
+    """Jobs beyond max_concurrent_jobs wait in submission order."""
+
+    def test_queue_positions_follow_submission_order(self, make_manager):
+        manager = make_manager(max_concurrent_jobs=1, worker=_blocking_worker)
+        running = manager.submit("p", 1, 30)
+        _wait_for_status(manager, running, JobStatus.RUNNING)
+
+        first = manager.submit("p", 1, 30)
+        second = manager.submit("p", 1, 30)
+
+        assert manager.get_status(running)["queue_position"] is None
+        assert manager.get_status(first)["queue_position"] == 1
+        assert manager.get_status(second)["queue_position"] == 2
+
+    def test_queue_advances_when_the_running_job_finishes(self, make_manager):
+        manager = make_manager(max_concurrent_jobs=1, worker=_blocking_worker)
+        running = manager.submit("p", 1, 30)
+        _wait_for_status(manager, running, JobStatus.RUNNING)
+        first = manager.submit("p", 1, 30)
+        second = manager.submit("p", 1, 30)
+
+        manager.cancel(running)
+        _wait_for_status(manager, first, JobStatus.RUNNING)
+
+        # Read the later job first: positions must not depend on read order
+        assert manager.get_status(second)["queue_position"] == 1
+        assert manager.get_status(first)["queue_position"] is None
+
+
+class TestCancel:
+    """Queued jobs never run; running jobs stop their search."""
+
+    def test_cancel_queued_job(self, make_manager):
+        manager = make_manager(max_concurrent_jobs=1, worker=_blocking_worker)
+        running = manager.submit("p", 1, 30)
+        _wait_for_status(manager, running, JobStatus.RUNNING)
+        queued = manager.submit("p", 1, 30)
+
+        assert manager.cancel(queued) is True
+        _wait_for_status(manager, queued, JobStatus.CANCELLED)
+        assert manager.get_status(running)["status"] == JobStatus.RUNNING
+
+    def test_cancel_running_job(self, make_manager):
+        manager = make_manager(worker=_blocking_worker)
+        job_id = manager.submit("p", 1, 30)
+        _wait_for_status(manager, job_id, JobStatus.RUNNING)
+
+        assert manager.cancel(job_id) is True
+        status = _wait_for_status(manager, job_id, JobStatus.CANCELLED)
+
+        assert status["result"]["cancelled"] is True
+        assert status["started_at"] is not None
+
+    def test_finished_job_cannot_be_cancelled(self, make_manager):
+        manager = make_manager(worker=_quick_worker)
+        job_id = manager.submit("p", 1, 10)
+        _wait_for_status(manager, job_id, JobStatus.COMPLETED)
+
+        assert manager.cancel(job_id) is False
+
+
+class TestEviction:
+    """Finished jobs are dropped once their retention TTL has passed."""
+
+    def test_expired_job_is_evicted(self, make_manager):
+        manager = make_manager(worker=_quick_worker, result_ttl_seconds=0.5)
+        job_id = manager.submit("p", 1, 10)
+        _wait_for_status(manager, job_id, JobStatus.COMPLETED)
+
+        time.sleep(0.6)
+
+        assert manager.get_status(job_id) is None
+        assert sum(manager.get_stats()["jobs"].values()) == 0
+
+    def test_unfinished_job_is_kept(self, make_manager):
+        manager = make_manager(worker=_blocking_worker, result_ttl_seconds=0)
+        job_id = manager.submit("p", 1, 30)
+        _wait_for_status(manager, job_id, JobStatus.RUNNING)
+
+        time.sleep(0.1)
+
+        assert manager.get_status(job_id)["status"] == JobStatus.RUNNING
@@ -0,0 +1,187 @@
+"""Tests for independent-component decomposition and the merged solution."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.solver.core import decomposition
+from src.solver.core.decomposition import (
+    create_component_problem,
+    find_independent_components,
+    solve_decomposed,
+)
+from src.solver.core.solver import FreshSolver
+from src.solver.models.problem import (
+    Job,
+    Machine,
+    Operator,
+    Precedence,
+    SchedulingProblem,
+    Task,
+    TaskMode,
+    WorkCell,
+)
+
+
+def _problem(
+    job_machines: dict[str, list[str]],
+    cells: dict[str, list[str]] | None = None,
+    sequences: dict[str, str] | None = None,
+    operators: int = 0,
+    precedences: list[tuple[str, str]] | None = None,
+    durations: dict[str, int] | None = None,
+) -> SchedulingProblem:
+    """Two-task jobs whose tasks run on the machines listed per job.
+
+    Args:
+        job_machines: Job ID -> machines of both its tasks
+        cells: Cell ID -> machine IDs (default: one cell per machine)
+        sequences: Job ID -> sequence of its first task
+        operators: Number of operators (qualified for every task)
+        precedences: Extra (predecessor, successor) task pairs
+        durations: Job ID -> task duration in minutes (default 60)
+
+    """
+    machine_ids = sorted({m for ids in job_machines.values() for m in ids})
+    cells = cells or {f"C_{m}": [m] for m in machine_ids}
+    cell_of = {m: cell for cell, ids in cells.items() for m in ids}
+    machines = {
+        m: Machine(m, cell_of[m], m, cost_per_hour=10.0 * (i + 1))
+        for i, m in enumerate(machine_ids)
+    }
+    sequences = sequences or {}
+    durations = durations or {}
+
+    jobs = []
+    for job_id, ids in job_machines.items():
+        duration = durations.get(job_id, 60)
+        jobs.append(
+            Job(
+                job_id,
+                job_id,
+                tasks=[
+                    Task(
+                        f"{job_id}_{position}",
+                        job_id,
+                        f"{job_id}_{position}",
+                        modes=[
+                            TaskMode(f"{job_id}_{position}_{m}", "", m, duration)
+                            for m in ids
+                        ],
+                        sequence_id=sequences.get(job_id) if position == 0 else None,
+                    )
+                    for position in range(2)
+                ],
+            )
+        )
+    pairs = [(f"{job}_0", f"{job}_1") for job in job_machines]
+    return SchedulingProblem(
+        jobs=jobs,
+        machines=list(machines.values()),
+        work_cells=[
+            WorkCell(cell, cell, len(ids), [machines[m] for m in ids])
+            for cell, ids in cells.items()
+        ],
+        precedences=[Precedence(a, b) for a, b in pairs + (precedences or [])],
+        operators=[Operator(f"OP{k}", f"Op {k}", f"E{k}") for k in range(operators)],
+    )
+
+
+class TestIndependentComponents:
+    """Jobs are linked by any resource they can both use."""
+
+    def test_disjoint_machines_are_independent(self):
+        problem = _problem({"A": ["M1"], "B": ["M2"]})
+
+        assert find_independent_components(problem) == [["A"], ["B"]]
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            pytest.param({"job_machines": {"A": ["M1"], "B": ["M1"]}}, id="machine"),
+            pytest.param(
+                {"job_machines": {"A": ["M1", "M2"], "B": ["M2", "M3"]}},
+                id="alternative_machine",
+            ),
+            pytest.param(
+                {
+                    "job_machines": {"A": ["M1"], "B": ["M2"]},
+                    "cells": {"C": ["M1", "M2"]},
+                },
+                id="cell",
+            ),
+            pytest.param(
+                {"job_machines": {"A": ["M1"], "B": ["M2"]}, "operators": 1},
+                id="operator",
+            ),
+            pytest.param(
+                {
+                    "job_machines": {"A": ["M1"], "B": ["M2"]},
+                    "sequences": {"A": "S1", "B": "S1"},
+                },
+                id="sequence",
+            ),
+            pytest.param(
+                {
+                    "job_machines": {"A": ["M1"], "B": ["M2"]},
+                    "precedences": [("A_1", "B_0")],
+                },
+                id="precedence",
+            ),
+        ],
+    )
+    def test_shared_resource_links_jobs(self, options):
+        problem = _problem(**options)
+
+        assert find_independent_components(problem) == [["A", "B"]]
+
+    def test_links_are_transitive(self):
+        problem = _problem({"A": ["M1"], "B": ["M1", "M2"], "C": ["M2"], "D": ["M3"]})
+
+        assert find_independent_components(problem) == [["A", "B", "C"], ["D"]]
+
+
+class TestMergedSolution:
+    """Makespan merges as the maximum, cost as the sum of the components."""
+
+    @pytest.fixture
+    def problem(self) -> SchedulingProblem:
+        return _problem(
+            {"A": ["M1"], "B": ["M2"], "C": ["M3"], "D": ["M3"]},
+            durations={"A": 60, "B": 150, "C": 45, "D": 30},
+        )
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_makespan_is_max_and_cost_is_sum(self, problem, max_workers):
+        components = find_independent_components(problem)
+        component_solutions = [
+            FreshSolver(create_component_problem(problem, unit_ids)).solve(10)
+            for unit_ids in components
+        ]
+
+        solution = solve_decomposed(problem, time_limit=10, max_workers=max_workers)
+
+        assert components == [["A"], ["B"], ["C", "D"]]
+        assert solution["status"] == "OPTIMAL"
+        assert solution["makespan"] == max(s["makespan"] for s in component_solutions)
+        assert solution["total_cost"] == pytest.approx(
+            sum(
+                decomposition._schedule_cost(problem, s["schedule"])
+                for s in component_solutions
+            )
+        )
+        # 2 tasks x (1h at 10 + 2.5h at 20 + 0.75h at 30 + 0.5h at 30)
+        assert solution["total_cost"] == pytest.approx(195.0)
+        assert [c["makespan"] for c in solution["decomposition"]["components"]] == [
+            s["makespan"] for s in component_solutions
+        ]
+        assert len(solution["schedule"]) == 8
+
+    def test_failed_component_uses_the_solution_keys(self, problem):
+        with patch.object(FreshSolver, "solve", return_value={"status": "INFEASIBLE"}):
+            solution = solve_decomposed(problem, time_limit=10, max_workers=1)
+
+        assert solution["status"] == "INFEASIBLE"
+        assert solution["schedule"] == []
+        assert solution["total_lateness_minutes"] == 0
+        assert "lateness" not in solution
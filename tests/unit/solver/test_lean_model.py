@@ -0,0 +1,55 @@
+"""Tests that lean models skip variable names."""
+
+import pytest
+from ortools.sat.python import cp_model
+
+from src.solver.core.lean_model import LeanCpModel, keeps_names
+from src.solver.core.solver import FreshSolver
+from tests.unit.solver.test_setup_times import _random_setups, _single_machine_problem
+
+
+def _build(lean: bool) -> FreshSolver:
+    """Build a problem with a setup circuit and fixed intervals."""
+    solver = FreshSolver(
+        _single_machine_problem(6, 2),
+        setup_times=_random_setups(6, seed=0),
+        lean_model=lean,
+    )
+    solver.fixed_intervals = {"M0": [(0, 2)]}
+    solver.build_model()
+    return solver
+
+
+class TestKeepsNames:
+    """Builders format names only for models that keep them."""
+
+    def test_regular_model_keeps_names(self):
+        assert keeps_names(cp_model.CpModel())
+
+    def test_lean_model_drops_names(self):
+        assert not keeps_names(LeanCpModel())
+
+
+class TestLeanBuild:
+    """A lean build creates the same model without any name."""
+
+    @pytest.fixture
+    def builds(self) -> tuple[FreshSolver, FreshSolver]:
+        return _build(lean=False), _build(lean=True)
+
+    def test_same_model_without_names(self, builds):
+        named, lean = (solver.model.Proto() for solver in builds)
+
+        assert len(lean.variables) == len(named.variables)
+        assert len(lean.constraints) == len(named.constraints)
+        assert all(variable.name for variable in named.variables)
+        assert not any(variable.name for variable in lean.variables)
+
+    def test_intervals_are_unnamed(self, builds):
+        named, lean = (solver.model.Proto() for solver in builds)
+
+        def interval_names(proto):
+            return [c.name for c in proto.constraints if c.HasField("interval")]
+
+        assert all(interval_names(named))
+        assert not any(interval_names(lean))
@@ -0,0 +1,85 @@
+"""Tests for the Large Neighbourhood Search solve path."""
+
+import pytest
+
+from src.solver.core.lns import LnsConfig
+from src.solver.core.solver import FreshSolver
+from src.solver.core.solver_config import SolverConfig
+from src.solver.models.problem import (
+    Job,
+    Machine,
+    Precedence,
+    SchedulingProblem,
+    Task,
+    TaskMode,
+    WorkCell,
+)
+
+
+def _problem(jobs: int) -> SchedulingProblem:
+    """Two-task jobs that can run on M1 or M2."""
+    machines = [Machine("M1", "cell", "M1"), Machine("M2", "cell", "M2")]
+
+    def task(job_id: str, position: int, m1: int, m2: int) -> Task:
+        task_id = f"{job_id}_{position}"
+        modes = [
+            TaskMode(f"{task_id}_m1", task_id, "M1", m1),
+            TaskMode(f"{task_id}_m2", task_id, "M2", m2),
+        ]
+        return Task(task_id, job_id, task_id, modes=modes)
+
+    job_ids = [f"J{j}" for j in range(jobs)]
+    return SchedulingProblem(
+        jobs=[
+            Job(
+                job_id, job_id, tasks=[task(job_id, 0, 30, 45), task(job_id, 1, 60, 45)]
+            )
+            for job_id in job_ids
+        ],
+        machines=machines,
+        work_cells=[WorkCell("cell", "Cell", 2, machines)],
+        precedences=[Precedence(f"{job_id}_0", f"{job_id}_1") for job_id in job_ids],
+    )
+
+
+class TestSolveLns:
+    """LNS improves the first schedule and leaves the solver reusable."""
+
+    @pytest.fixture
+    def solved(self) -> tuple[FreshSolver, dict]:
+        solver = FreshSolver(_problem(8))
+        # Stop the first solve early so the neighbourhood loop runs
+        solution = solver.solve_lns(
+            time_limit=3,
+            config=LnsConfig(
+                max_workers=1, neighbourhood_time_limit=0.2, initial_time_limit=1
+            ),
+            solver_config=SolverConfig(
+                parameters={"stop_after_first_solution": True, "num_search_workers": 1}
+            ),
+        )
+        return solver, solution
+
+    def test_solution_is_the_best_lns_schedule(self, solved):
+        _, solution = solved
+
+        assert solution["status"] == "FEASIBLE"
+        assert solution["makespan"] == solution["lns"]["best_objective"]
+        assert solution["lns"]["best_objective"] <= solution["lns"]["initial_objective"]
+        assert len(solution["schedule"]) == 16
+
+    def test_final_extraction_uses_the_lns_phase_parameters(self, solved):
+        solver, _ = solved
+
+        final = solver.solver_parameters_used["lns_final"]
+        assert final["max_time_in_seconds"] > 0
+        assert final["num_search_workers"] == 1
+
+    def test_model_is_not_fixed_to_the_lns_schedule(self, solved):
+        solver, _ = solved
+
+        assert any(
+            variable.domain[0] != variable.domain[-1]
+            for variable in solver.model.Proto().variables
+        )
+        assert solver.solve(time_limit=10)["status"] == "OPTIMAL"
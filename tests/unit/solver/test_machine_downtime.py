@@ -0,0 +1,199 @@
+"""Tests that machine downtime blocks the machine in the compiled model."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from postgrest.exceptions import APIError
+
+from src.data.loaders.optimized_database import OptimizedDatabaseLoader
+from src.solver.core.machine_downtime import compile_machine_downtime
+from src.solver.core.solver import FreshSolver
+from src.solver.models.problem import (
+    Job,
+    Machine,
+    MachineDowntime,
+    SchedulingProblem,
+    Task,
+    TaskMode,
+    WorkCell,
+)
+
+ORIGIN = datetime(2030, 1, 7, 8, 0, tzinfo=UTC)
+
+
+def _at(units: float) -> datetime:
+    """Wall-clock time ``units`` time units (15 minutes) after ORIGIN."""
+    return ORIGIN + timedelta(minutes=15 * units)
+
+
+def _problem(
+    machines: list[Machine], cell_capacity: int, tasks: dict[str, list[str]]
+) -> SchedulingProblem:
+    """One-task jobs of 60 minutes; ``tasks`` maps task ID to its machines."""
+    jobs = [
+        Job(
+            f"J_{task_id}",
+            task_id,
+            tasks=[
+                Task(
+                    task_id,
+                    f"J_{task_id}",
+                    task_id,
+                    modes=[
+                        TaskMode(f"{task_id}_{m}", task_id, m, 60) for m in machine_ids
+                    ],
+                )
+            ],
+        )
+        for task_id, machine_ids in tasks.items()
+    ]
+    return SchedulingProblem(
+        jobs=jobs,
+        machines=machines,
+        work_cells=[WorkCell("cell", "Cell", cell_capacity, machines)],
+        precedences=[],
+        calendar_origin=ORIGIN,
+    )
+
+
+def _solve(problem: SchedulingProblem) -> dict[str, dict]:
+    solver = FreshSolver(problem)
+    solver.horizon = 100
+    solution = solver.solve(time_limit=10)
+    assert solution["status"] == "OPTIMAL"
+    return {entry["task_id"]: entry for entry in solution["schedule"]}
+
+
+class TestCompileMachineDowntime:
+    """Downtime windows become merged, horizon-clipped spans in time units."""
+
+    def test_spans_round_out_merge_and_clip(self):
+        machine = Machine(
+            "M1",
+            "cell",
+            "M1",
+            downtime=[
+                MachineDowntime(_at(10), _at(20)),
+                # Overlaps the first window and ends mid-unit
+                MachineDowntime(_at(18), _at(30) + timedelta(minutes=3)),
+                # Started before the origin
+                MachineDowntime(_at(-50), _at(2)),
+                # Beyond the horizon
+                MachineDowntime(_at(500), _at(600)),
+            ],
+        )
+        problem = _problem([machine], 1, {"T": ["M1"]})
+
+        downtime = compile_machine_downtime(problem, horizon=200)
+
+        assert downtime == {"M1": [(0, 2), (10, 31)]}
+
+    def test_origin_defaults_to_the_calendar_origin(self):
+        machine = Machine(
+            "M1", "cell", "M1", downtime=[MachineDowntime(_at(4), _at(8))]
+        )
+        problem = _problem([machine], 1, {"T": ["M1"]})
+
+        assert compile_machine_downtime(problem) == {"M1": [(4, 8)]}
+        assert compile_machine_downtime(problem, origin=_at(2)) == {"M1": [(2, 6)]}
+
+    def test_machines_without_downtime_are_left_out(self):
+        problem = _problem([Machine("M1", "cell", "M1")], 1, {"T": ["M1"]})
+
+        assert compile_machine_downtime(problem, horizon=100) == {}
+
+
+class TestDowntimeBlocksTasks:
+    """Solved schedules never use a machine while it is down."""
+
+    def test_task_waits_for_the_machine(self):
+        machine = Machine(
+            "M1", "cell", "M1", downtime=[MachineDowntime(_at(0), _at(20))]
+        )
+
+        schedule = _solve(_problem([machine], 1, {"T": ["M1"]}))
+
+        assert schedule["T"]["start_time"] == 20
+
+    def test_downtime_blocks_full_machine_capacity(self):
+        machine = Machine(
+            "M1", "cell", "M1", capacity=2, downtime=[MachineDowntime(_at(0), _at(8))]
+        )
+
+        schedule = _solve(_problem([machine], 2, {"A": ["M1"], "B": ["M1"]}))
+
+        assert schedule["A"]["start_time"] == schedule["B"]["start_time"] == 8
+
+    def test_task_fits_in_the_gap_between_windows(self):
+        machine = Machine(
+            "M1",
+            "cell",
+            "M1",
+            downtime=[
+                MachineDowntime(_at(0), _at(4)),
+                MachineDowntime(_at(8), _at(40)),
+            ],
+        )
+
+        schedule = _solve(_problem([machine], 1, {"T": ["M1"]}))
+
+        assert (schedule["T"]["start_time"], schedule["T"]["end_time"]) == (4, 8)
+
+    def test_task_moves_to_an_available_machine(self):
+        machines = [
+            Machine("M1", "cell", "M1", downtime=[MachineDowntime(_at(0), _at(20))]),
+            Machine("M2", "cell", "M2"),
+        ]
+
+        schedule = _solve(_problem(machines, 2, {"T": ["M1", "M2"]}))
+
+        assert schedule["T"]["machine_id"] == "M2"
+        assert schedule["T"]["start_time"] == 0
+
+    def test_downtime_takes_a_work_cell_slot(self):
+        machines = [
+            Machine("M1", "cell", "M1", downtime=[MachineDowntime(_at(0), _at(12))]),
+            Machine("M2", "cell", "M2"),
+        ]
+
+        # A cell of capacity 1 has no free slot while M1 is down
+        schedule = _solve(_problem(machines, 1, {"T": ["M2"]}))
+
+        assert schedule["T"]["start_time"] == 12
+
+    def test_dispatch_heuristic_respects_downtime(self):
+        machine = Machine(
+            "M1", "cell", "M1", downtime=[MachineDowntime(_at(0), _at(20))]
+        )
+        solver = FreshSolver(_problem([machine], 1, {"A": ["M1"], "B": ["M1"]}))
+        solver.horizon = 100
+
+        solution = solver.solve_dispatch()
+
+        assert min(e["start_time"] for e in solution["schedule"]) >= 20
+
+
+class TestDowntimeLoading:
+    """Databases without the downtime table load machines without downtime."""
+
+    def _loader(self, error: APIError) -> OptimizedDatabaseLoader:
+        client = MagicMock()
+        client.table.return_value.select.return_value.execute.side_effect = error
+        with patch(
+            "src.data.loaders.optimized_database.get_database_client",
+            return_value=client,
+        ):
+            return OptimizedDatabaseLoader()
+
+    @pytest.mark.parametrize("code", ["42P01", "PGRST205"])
+    def test_missing_table_means_no_downtime(self, code):
+        loader = self._loader(APIError({"code": code, "message": "missing"}))
+
+        assert loader._load_machine_downtime() == {}
+
+    def test_other_errors_are_raised(self):
+        loader = self._loader(APIError({"code": "42501", "message": "denied"}))
+
+        with pytest.raises(APIError):
+            loader._load_machine_downtime()
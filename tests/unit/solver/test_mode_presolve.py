@@ -0,0 +1,190 @@
+"""Tests for mode presolve dominance and infeasibility pruning."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.solver.core.mode_presolve import active_objectives, prune_task_modes
+from src.solver.core.solver import FreshSolver
+from src.solver.models.problem import (
+    Job,
+    Machine,
+    MachineDowntime,
+    MultiObjectiveConfiguration,
+    ObjectiveType,
+    ObjectiveWeight,
+    OptimizationStrategy,
+    Precedence,
+    SchedulingProblem,
+    Task,
+    TaskMode,
+    WorkCell,
+)
+from src.solver.models.problem_arrays import compile_problem_arrays
+
+MAKESPAN = ObjectiveType.MINIMIZE_MAKESPAN
+COST = ObjectiveType.MINIMIZE_TOTAL_COST
+UTILIZATION = ObjectiveType.MAXIMIZE_MACHINE_UTILIZATION
+
+
+def _two_mode_problem(
+    fast_cost: float,
+    slow_cost: float,
+    objectives: list[ObjectiveType] | None = None,
+    tasks: int = 1,
+) -> SchedulingProblem:
+    """Tasks that run 60 minutes on FAST or 1500 minutes on SLOW, one cell."""
+    fast = Machine("FAST", "cell", "Fast", cost_per_hour=fast_cost)
+    slow = Machine("SLOW", "cell", "Slow", cost_per_hour=slow_cost)
+    job_tasks = [
+        Task(
+            f"T{t}",
+            "J",
+            f"Task {t}",
+            modes=[
+                TaskMode(f"T{t}_fast", f"T{t}", "FAST", 60),
+                TaskMode(f"T{t}_slow", f"T{t}", "SLOW", 1500),
+            ],
+        )
+        for t in range(tasks)
+    ]
+    config = (
+        MultiObjectiveConfiguration(
+            OptimizationStrategy.PARETO_OPTIMAL,
+            [ObjectiveWeight(objective, 1.0) for objective in objectives],
+            pareto_iterations=2,
+        )
+        if objectives
+        else None
+    )
+    return SchedulingProblem(
+        jobs=[Job("J", "Job", tasks=job_tasks)],
+        machines=[fast, slow],
+        work_cells=[WorkCell("cell", "Cell", 2, [fast, slow])],
+        precedences=[],
+        multi_objective_config=config,
+    )
+
+
+def _pruned(problem: SchedulingProblem, **options) -> set[tuple[str, str]]:
+    """(machine_id, reason) of every mode the presolve removes."""
+    result = prune_task_modes(compile_problem_arrays(problem), problem, **options)
+    return {(mode.machine_id, mode.reason) for mode in result.pruned}
+
+
+class TestDominanceByObjectives:
+    """Whether a slow mode is dominated depends on what the model optimizes."""
+
+    @pytest.mark.parametrize(
+        ("objectives", "fast_cost", "pruned"),
+        [
+            # Time-only objectives: an expensive fast machine still dominates
+            ({MAKESPAN}, 30000.0, {("SLOW", "dominated")}),
+            ({ObjectiveType.MINIMIZE_TOTAL_LATENESS}, 30000.0, {("SLOW", "dominated")}),
+            # Cost counts: the cheap slow mode is a trade-off, not dominated
+            ({MAKESPAN, COST}, 30000.0, set()),
+            ({COST}, 30000.0, set()),
+            # Faster and cheaper dominates under cost too
+            ({MAKESPAN, COST}, 10.0, {("SLOW", "dominated")}),
+            # Utilization can prefer the slower mode
+            ({MAKESPAN, UTILIZATION}, 10.0, set()),
+        ],
+    )
+    def test_objective_set(self, objectives, fast_cost, pruned):
+        problem = _two_mode_problem(fast_cost=fast_cost, slow_cost=24.0)
+
+        assert _pruned(problem, objectives=objectives) == pruned
+
+    def test_objectives_default_to_the_problem_configuration(self):
+        problem = _two_mode_problem(30000.0, 24.0, objectives=[MAKESPAN, COST])
+
+        assert active_objectives(problem) == {MAKESPAN, COST}
+        assert _pruned(problem) == set()
+
+    def test_contended_machine_does_not_dominate(self):
+        # Two tasks compete for FAST (capacity 1): SLOW can shorten the schedule
+        problem = _two_mode_problem(10.0, 24.0, tasks=2)
+
+        assert _pruned(problem, objectives={MAKESPAN}) == set()
+
+    def test_machine_with_downtime_does_not_dominate(self):
+        problem = _two_mode_problem(10.0, 24.0)
+        start = datetime(2030, 1, 1, tzinfo=UTC)
+        problem.machines[0].downtime = [
+            MachineDowntime(start, start + timedelta(hours=1))
+        ]
+
+        assert _pruned(problem, objectives={MAKESPAN}) == set()
+
+    def test_fixed_intervals_make_a_machine_contended(self):
+        problem = _two_mode_problem(10.0, 24.0)
+
+        pruned = _pruned(
+            problem, objectives={MAKESPAN}, fixed_intervals={"FAST": [(0, 4)]}
+        )
+
+        assert pruned == set()
+
+    def test_durations_follow_the_surviving_modes(self):
+        problem = _two_mode_problem(10.0, 24.0)
+        arrays = compile_problem_arrays(problem)
+
+        result = prune_task_modes(arrays, problem, objectives={MAKESPAN})
+
+        assert arrays.max_duration.tolist() == [100]
+        assert result.arrays.min_duration.tolist() == [4]
+        assert result.arrays.max_duration.tolist() == [4]
+        assert result.modes_after == 1
+
+
+class TestInfeasibleModes:
+    """Modes that cannot meet the job's hard deadline are removed."""
+
+    def _chain_problem(self) -> SchedulingProblem:
+        machines = [Machine("A", "cell", "A"), Machine("B", "cell", "B")]
+        first = Task("T1", "J", "First", modes=[TaskMode("T1_a", "T1", "A", 60)])
+        second = Task(
+            "T2",
+            "J",
+            "Second",
+            modes=[TaskMode("T2_a", "T2", "A", 60), TaskMode("T2_b", "T2", "B", 300)],
+        )
+        return SchedulingProblem(
+            jobs=[Job("J", "Job", tasks=[first, second])],
+            machines=machines,
+            work_cells=[WorkCell("cell", "Cell", 2, machines)],
+            precedences=[Precedence("T1", "T2")],
+        )
+
+    def test_mode_missing_the_deadline_is_pruned(self):
+        # T1 takes 4 units, so T2 on B (20 units) cannot end by 10
+        pruned = _pruned(
+            self._chain_problem(), unit_deadlines=[10], objectives={UTILIZATION}
+        )
+
+        assert pruned == {("B", "infeasible")}
+
+    def test_task_keeps_a_mode_when_every_mode_misses(self):
+        pruned = _pruned(
+            self._chain_problem(), unit_deadlines=[5], objectives={UTILIZATION}
+        )
+
+        assert pruned == set()
+
+
+class TestParetoKeepsTradeOffModes:
+    """Regression: Pareto presolve pruned the cheap slow mode of the frontier."""
+
+    def test_frontier_keeps_both_extremes(self):
+        problem = _two_mode_problem(30000.0, 24.0, objectives=[MAKESPAN, COST])
+        solver = FreshSolver(problem, presolve_modes=True)
+        solver.horizon = 200
+
+        result = solver.solve_pareto_optimal(5, max_workers=1)
+
+        points = {
+            (s["objectives"]["makespan"], s["objectives"]["total_cost"])
+            for s in result["pareto_frontier"]["solutions"]
+        }
+        assert points == {(4, 30000.0), (100, 600.0)}
+        assert solver.mode_presolve.pruned == []
@@ -0,0 +1,178 @@
+"""Tests for the compiled-model cache across problems and solver options."""
+
+import pytest
+
+from src.solver.core.model_cache import ModelCache, compute_problem_fingerprint
+from src.solver.core.solver import FreshSolver
+from src.solver.models.problem import SchedulingProblem
+from tests.fixtures.template_problem_factory import create_optimized_test_problem
+
+
+def _problem(instance_prefix: str = "instance") -> SchedulingProblem:
+    problem = create_optimized_test_problem(num_instances=3)
+    for i, instance in enumerate(problem.job_instances):
+        instance.instance_id = f"{instance_prefix}_{i}"
+    return problem
+
+
+def _build(
+    cache: ModelCache,
+    problem: SchedulingProblem | None = None,
+    fixed_intervals: dict[str, list[tuple[int, int]]] | None = None,
+    **options,
+) -> FreshSolver:
+    solver = FreshSolver(problem or _problem(), model_cache=cache, **options)
+    if fixed_intervals:
+        solver.fixed_intervals = fixed_intervals
+    solver.build_model()
+    return solver
+
+
+def _all_pair_setup_times(
+    problem: SchedulingProblem,
+) -> dict[tuple[str, str, str], int]:
+    """A setup of 2 between every ordered pair of instance tasks on every machine."""
+    task_ids = [
+        problem.get_instance_task_id(instance.instance_id, task.optimized_task_id)
+        for instance in problem.job_instances
+        for task in problem.job_optimized_pattern.optimized_tasks
+    ]
+    return {
+        (pred, succ, machine.resource_id): 2
+        for pred in task_ids
+        for succ in task_ids
+        if pred != succ
+        for machine in problem.machines
+    }
+
+
+# Solver options that change the structural model of the same problem
+MODEL_OPTIONS = [
+    pytest.param({"presolve_modes": False}, id="presolve_modes"),
+    pytest.param({"pool_machines": True}, id="pool_machines"),
+    pytest.param({"lean_model": True}, id="lean_model"),
+    pytest.param({"report_monitoring": True}, id="report_monitoring"),
+    pytest.param({"fixed_intervals": {"machine_0": [(0, 8)]}}, id="fixed_intervals"),
+    pytest.param(
+        {"setup_times": {("optimized_task_0", "optimized_task_1", "machine_0"): 2}},
+        id="setup_times",
+    ),
+]
+
+
+class TestModelCacheHits:
+    """Same structure hits the cache, any model-changing option misses."""
+
+    def test_same_problem_hits(self):
+        cache = ModelCache()
+        miss = _build(cache)
+        hit = _build(cache)
+
+        assert not miss.model_cache_hit
+        assert hit.model_cache_hit
+        assert cache.get_stats()["hits"] == 1
+        assert len(hit.model.Proto().variables) == len(miss.model.Proto().variables)
+
+    def test_new_instance_ids_hit_and_rebind_variables(self):
+        cache = ModelCache()
+        _build(cache, _problem("first"))
+        hit = _build(cache, _problem("second"))
+
+        assert hit.model_cache_hit
+        assert {key[0] for key in hit.task_starts} == {
+            "second_0",
+            "second_1",
+            "second_2",
+        }
+
+    @pytest.mark.parametrize("options", MODEL_OPTIONS)
+    def test_model_option_misses_then_hits(self, options):
+        cache = ModelCache()
+        _build(cache)
+        changed = _build(cache, **options)
+        repeated = _build(cache, **options)
+
+        assert not changed.model_cache_hit
+        assert repeated.model_cache_hit
+        assert len(cache) == 2
+
+    def test_hit_solves_like_a_fresh_build(self):
+        cache = ModelCache()
+        fresh = _build(cache)
+        cached = _build(cache)
+
+        fresh_solution = fresh.solve(time_limit=10)
+        cached_solution = cached.solve(time_limit=10)
+
+        assert cached.model_cache_hit
+        assert cached_solution["status"] == fresh_solution["status"]
+        assert cached_solution["makespan"] == fresh_solution["makespan"]
+
+    def test_hit_restores_setup_terms(self):
+        cache = ModelCache()
+        problem = _problem()
+        setup_times = _all_pair_setup_times(problem)
+        miss = _build(cache, problem, setup_times=setup_times)
+        hit = _build(cache, problem, setup_times=setup_times)
+
+        assert hit.model_cache_hit
+        assert miss.setup_terms
+        assert len(hit.setup_terms) == len(miss.setup_terms)
+        assert [time for _, time in hit.setup_terms] == [
+            time for _, time in miss.setup_terms
+        ]
+
+
+class TestDiskTier:
+    """Entries survive a new cache over the same directory, tampered ones don't."""
+
+    def test_disk_hit_after_restart(self, tmp_path):
+        _build(ModelCache(cache_dir=tmp_path))
+        cache = ModelCache(cache_dir=tmp_path)
+        hit = _build(cache)
+
+        assert hit.model_cache_hit
+        assert cache.disk_hits == 1
+        assert sorted(path.suffix for path in tmp_path.iterdir()) == [".json", ".pb"]
+
+    def test_disk_hit_restores_setup_terms(self, tmp_path):
+        problem = _problem()
+        setup_times = _all_pair_setup_times(problem)
+        miss = _build(ModelCache(cache_dir=tmp_path), problem, setup_times=setup_times)
+        hit = _build(ModelCache(cache_dir=tmp_path), problem, setup_times=setup_times)
+
+        assert hit.model_cache_hit
+        assert miss.setup_terms
+        assert len(hit.setup_terms) == len(miss.setup_terms)
+
+    def test_tampered_proto_misses(self, tmp_path):
+        _build(ModelCache(cache_dir=tmp_path))
+        proto_path = next(tmp_path.glob("*.pb"))
+        proto_path.write_bytes(proto_path.read_bytes() + b"\x00")
+
+        rebuilt = _build(ModelCache(cache_dir=tmp_path))
+
+        assert not rebuilt.model_cache_hit
+
+
+class TestFingerprint:
+    """Every model-changing solver option is part of the fingerprint."""
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"presolve_modes": True},
+            {"pool_machines": True},
+            {"lean_model": True},
+            {"monitoring": ["wip_monitoring"]},
+            {"fixed_intervals": {"machine_0": [(0, 8)]}},
+            {"downtime": {"machine_0": [(4, 6)]}},
+            {"objectives": ["minimize_total_cost"]},
+        ],
+    )
+    def test_option_changes_fingerprint(self, options):
+        problem = _problem()
+        base = compute_problem_fingerprint(problem, 100)
+
+        assert compute_problem_fingerprint(problem, 100) == base
+        assert compute_problem_fingerprint(problem, 100, **options) != base
@@ -0,0 +1,98 @@
+"""Tests for the model manifest and the monitoring it keeps across cache hits."""
+
+import dataclasses
+
+import pytest
+
+from src.solver.core.model_cache import ModelCache
+from src.solver.core.solver import FreshSolver
+from src.solver.models.problem import SchedulingProblem
+from tests.fixtures.template_problem_factory import create_optimized_test_problem
+
+MONITORING_ATTRIBUTES = (
+    "wip_monitoring_vars",
+    "wip_adjustment_vars",
+    "flow_balance_vars",
+)
+
+
+def _wip_limited_problem() -> SchedulingProblem:
+    """Optimized problem whose work cell lists its machines and has a WIP limit."""
+    problem = create_optimized_test_problem(num_instances=3)
+    for cell in problem.work_cells:
+        cell.wip_limit = 1
+        cell.machines = [m for m in problem.machines if m.cell_id == cell.cell_id]
+    return problem
+
+
+def _build(cache: ModelCache, report_monitoring: bool) -> FreshSolver:
+    solver = FreshSolver(
+        _wip_limited_problem(), model_cache=cache, report_monitoring=report_monitoring
+    )
+    solver.build_model()
+    return solver
+
+
+def _variable_indices(value) -> list[int]:
+    """Proto indices of every variable in a (nested) variable container."""
+    if isinstance(value, dict):
+        return [i for v in value.values() for i in _variable_indices(v)]
+    if isinstance(value, list):
+        return [i for v in value for i in _variable_indices(v)]
+    return [value.Index()]
+
+
+class TestMonitoringOnCacheHit:
+    """report_monitoring must survive a compiled-model cache hit."""
+
+    @pytest.mark.parametrize("disk", [False, True])
+    def test_monitoring_restored_from_cached_entry(self, tmp_path, disk):
+        cache_dir = tmp_path if disk else None
+        miss = _build(ModelCache(cache_dir=cache_dir), report_monitoring=True)
+        # A fresh cache over the same directory only has the disk tier
+        cache = ModelCache(cache_dir=cache_dir) if disk else miss.model_cache
+        hit = _build(cache, report_monitoring=True)
+
+        assert not miss.model_cache_hit
+        assert hit.model_cache_hit
+        assert miss.wip_monitoring_vars
+        assert miss.wip_adjustment_vars
+        for name in MONITORING_ATTRIBUTES:
+            built, restored = getattr(miss, name), getattr(hit, name)
+            assert restored.keys() == built.keys(), name
+            assert _variable_indices(restored) == _variable_indices(built), name
+
+        proto = hit.model.Proto()
+        for index in _variable_indices(hit.wip_monitoring_vars):
+            assert index < len(proto.variables)
+
+    def test_monitoring_left_out_without_report(self):
+        cache = ModelCache()
+        reported = _build(cache, report_monitoring=True)
+        lean = _build(cache, report_monitoring=False)
+
+        assert not lean.model_cache_hit
+        assert not lean.wip_monitoring_vars
+        assert not lean.wip_adjustment_vars
+        assert lean.model_manifest.variables_eliminated > 0
+        assert len(lean.model.Proto().variables) < len(reported.model.Proto().variables)
+
+    def test_entry_without_monitoring_is_rebuilt(self, monkeypatch):
+        cache = ModelCache()
+        store = cache.put
+
+        def put_without_monitoring(entry, template_id=None):
+            index = {
+                name: encoded
+                for name, encoded in entry.variable_index.items()
+                if name not in MONITORING_ATTRIBUTES
+            }
+            store(dataclasses.replace(entry, variable_index=index), template_id)
+
+        monkeypatch.setattr(cache, "put", put_without_monitoring)
+        miss = _build(cache, report_monitoring=True)
+        rebuilt = _build(cache, report_monitoring=True)
+
+        assert len(cache) == 1
+        assert not rebuilt.model_cache_hit
+        assert rebuilt.wip_monitoring_vars.keys() == miss.wip_monitoring_vars.keys()
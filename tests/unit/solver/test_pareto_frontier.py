@@ -0,0 +1,110 @@
+"""Tests for the in-process Pareto frontier exploration."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.solver.constraints.phase3 import pareto_optimizer
+from src.solver.core.solver import FreshSolver
+from src.solver.core.solver_config import SolverConfig
+from src.solver.models.problem import (
+    Job,
+    Machine,
+    MultiObjectiveConfiguration,
+    ObjectiveType,
+    ObjectiveWeight,
+    OptimizationStrategy,
+    SchedulingProblem,
+    Task,
+    TaskMode,
+    WorkCell,
+)
+
+OBJECTIVES = ("makespan", "total_cost")
+
+
+def _problem(jobs: int, pareto_iterations: int) -> SchedulingProblem:
+    """Single-task jobs on a fast expensive or a slow cheap machine."""
+    machines = [
+        Machine("M1", "cell", "M1", cost_per_hour=100.0),
+        Machine("M2", "cell", "M2", cost_per_hour=10.0),
+    ]
+
+    def task(job_id: str) -> Task:
+        task_id = f"{job_id}_0"
+        modes = [
+            TaskMode(f"{task_id}_m1", task_id, "M1", 30),
+            TaskMode(f"{task_id}_m2", task_id, "M2", 60),
+        ]
+        return Task(task_id, job_id, task_id, modes=modes)
+
+    return SchedulingProblem(
+        jobs=[Job(f"J{j}", f"J{j}", tasks=[task(f"J{j}")]) for j in range(jobs)],
+        machines=machines,
+        work_cells=[WorkCell("cell", "Cell", 2, machines)],
+        precedences=[],
+        multi_objective_config=MultiObjectiveConfiguration(
+            OptimizationStrategy.PARETO_OPTIMAL,
+            [
+                ObjectiveWeight(ObjectiveType.MINIMIZE_MAKESPAN, 0.5),
+                ObjectiveWeight(ObjectiveType.MINIMIZE_TOTAL_COST, 0.5),
+            ],
+            pareto_iterations=pareto_iterations,
+        ),
+    )
+
+
+def _dominates(a: tuple, b: tuple) -> bool:
+    return all(x <= y for x, y in zip(a, b, strict=True)) and a != b
+
+
+@pytest.fixture(scope="module")
+def explored() -> tuple[list[tuple], list[tuple]]:
+    """Frontier points and every solved point, as (makespan, cost) tuples."""
+    solved = []
+    solve_point = pareto_optimizer._solve_frontier_point
+
+    def record(*args, **kwargs):
+        result = solve_point(*args, **kwargs)
+        solved.append(result)
+        return result
+
+    with patch.object(pareto_optimizer, "_solve_frontier_point", record):
+        result = FreshSolver(_problem(4, 6)).solve_pareto_optimal(
+            time_limit_per_solve=2,
+            solver_config=SolverConfig(parameters={"num_search_workers": 1}),
+            max_workers=1,
+        )
+
+    frontier = [
+        tuple(solution["objectives"][name] for name in OBJECTIVES)
+        for solution in result["pareto_frontier"]["solutions"]
+    ]
+    points = [
+        (r["values"]["makespan"], r["values"]["total_cost"] / 100.0)
+        for r in solved
+        if r["values"]
+    ]
+    return frontier, points
+
+
+class TestInProcessFrontier:
+    """With one worker every point is solved here and filtered for dominance."""
+
+    def test_every_point_is_solved_in_process(self, explored):
+        _, points = explored
+
+        assert len(points) == 6
+
+    def test_frontier_is_non_dominated(self, explored):
+        frontier, _ = explored
+
+        assert len(frontier) > 1
+        assert len(set(frontier)) == len(frontier)
+        assert not any(_dominates(a, b) for a in frontier for b in frontier)
+
+    def test_frontier_covers_every_solved_point(self, explored):
+        frontier, points = explored
+
+        for point in points:
+            assert point in frontier or any(_dominates(f, point) for f in frontier)
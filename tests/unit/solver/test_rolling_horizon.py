@@ -0,0 +1,127 @@
+"""Tests for rolling-horizon solving and the stitched schedule."""
+
+import itertools
+from collections import Counter, defaultdict
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from src.solver.core.rolling_horizon import (
+    RollingHorizonConfig,
+    solve_rolling_horizon,
+)
+from src.solver.core.solver import FreshSolver
+from src.solver.models.problem import (
+    Job,
+    Machine,
+    Precedence,
+    SchedulingProblem,
+    Task,
+    TaskMode,
+    WorkCell,
+)
+
+DUE = datetime(2030, 1, 1, tzinfo=UTC)
+
+
+def _problem(jobs: int, cell_capacity: int = 2) -> SchedulingProblem:
+    """Two-task jobs on M1 or M2; later job IDs are due earlier."""
+    machines = [Machine("M1", "cell", "M1"), Machine("M2", "cell", "M2")]
+
+    def task(job_id: str, position: int, m1: int, m2: int) -> Task:
+        task_id = f"{job_id}_{position}"
+        modes = [
+            TaskMode(f"{task_id}_m1", task_id, "M1", m1),
+            TaskMode(f"{task_id}_m2", task_id, "M2", m2),
+        ]
+        return Task(task_id, job_id, task_id, modes=modes)
+
+    job_ids = [f"J{j}" for j in range(jobs)]
+    return SchedulingProblem(
+        jobs=[
+            Job(
+                job_id,
+                job_id,
+                due_date=DUE - timedelta(hours=j),
+                tasks=[task(job_id, 0, 30, 45), task(job_id, 1, 60, 45)],
+            )
+            for j, job_id in enumerate(job_ids)
+        ],
+        machines=machines,
+        work_cells=[WorkCell("cell", "Cell", cell_capacity, machines)],
+        precedences=[Precedence(f"{job_id}_0", f"{job_id}_1") for job_id in job_ids],
+    )
+
+
+def _overlapping_pairs(entries: list[dict]) -> list[tuple[str, str]]:
+    return [
+        (a["task_id"], b["task_id"])
+        for a, b in itertools.combinations(entries, 2)
+        if a["start_time"] < b["end_time"] and b["start_time"] < a["end_time"]
+    ]
+
+
+def _max_concurrency(entries: list[dict]) -> int:
+    events = sorted(
+        [(e["start_time"], 1) for e in entries] + [(e["end_time"], -1) for e in entries]
+    )
+    running = peak = 0
+    for _, change in events:
+        running += change
+        peak = max(peak, running)
+    return peak
+
+
+CONFIG = RollingHorizonConfig(window_size=3, overlap=1, time_limit_per_window=10)
+
+
+class TestCommittedWindows:
+    """Committed tasks block the machines and cells of later windows."""
+
+    def test_windows_never_share_a_machine(self):
+        solution = solve_rolling_horizon(_problem(8), CONFIG)
+
+        assert solution["status"] == "FEASIBLE"
+        assert len(solution["rolling_horizon"]["windows"]) > 2
+        by_machine = defaultdict(list)
+        for entry in solution["schedule"]:
+            by_machine[entry["machine_id"]].append(entry)
+        assert set(by_machine) == {"M1", "M2"}
+        for entries in by_machine.values():
+            assert _overlapping_pairs(entries) == []
+
+    def test_windows_respect_the_cell_capacity(self):
+        solution = solve_rolling_horizon(_problem(6, cell_capacity=1), CONFIG)
+
+        assert solution["status"] == "FEASIBLE"
+        assert _max_concurrency(solution["schedule"]) == 1
+
+
+class TestStitchedSchedule:
+    """Overlapping jobs are committed by exactly one window."""
+
+    @pytest.mark.parametrize(
+        ("jobs", "window_size", "overlap"), [(7, 3, 1), (8, 4, 2), (5, 5, 4)]
+    )
+    def test_every_job_appears_once(self, jobs, window_size, overlap):
+        config = RollingHorizonConfig(window_size, overlap, time_limit_per_window=10)
+
+        solution = solve_rolling_horizon(_problem(jobs), config)
+
+        tasks = Counter(entry["task_id"] for entry in solution["schedule"])
+        assert set(tasks) == {f"J{j}_{t}" for j in range(jobs) for t in range(2)}
+        assert set(tasks.values()) == {1}
+        committed = sum(
+            w["committed_jobs"] for w in solution["rolling_horizon"]["windows"]
+        )
+        assert committed == jobs
+
+    def test_failed_window_uses_the_solution_keys(self):
+        with patch.object(FreshSolver, "solve", return_value={"status": "INFEASIBLE"}):
+            solution = solve_rolling_horizon(_problem(4), CONFIG)
+
+        assert solution["status"] == "INFEASIBLE"
+        assert solution["schedule"] == []
+        assert solution["total_lateness_minutes"] == 0
+        assert "lateness" not in solution
@@ -0,0 +1,182 @@
+"""Tests that sequence-dependent setup gaps are enforced by the machine circuit."""
+
+import itertools
+import random
+
+import pytest
+
+from src.solver.core.solver import FreshSolver
+from src.solver.models.problem import (
+    Job,
+    Machine,
+    MultiObjectiveConfiguration,
+    ObjectiveType,
+    ObjectiveWeight,
+    OptimizationStrategy,
+    SchedulingProblem,
+    Task,
+    TaskMode,
+    WorkCell,
+)
+
+SetupTimes = dict[tuple[str, str, str], int]
+
+
+def _single_machine_problem(
+    tasks: int,
+    capacity: int,
+    duration_minutes: int = 30,
+    multi_objective_config: MultiObjectiveConfiguration | None = None,
+) -> SchedulingProblem:
+    """One-task jobs T0..Tn-1 that all run on machine M0."""
+    machines = [Machine("M0", "cell", "M0", capacity=capacity)]
+    jobs = [
+        Job(
+            f"J{k}",
+            f"Job {k}",
+            tasks=[
+                Task(
+                    f"T{k}",
+                    f"J{k}",
+                    f"Task {k}",
+                    modes=[TaskMode(f"T{k}_m", f"T{k}", "M0", duration_minutes)],
+                )
+            ],
+        )
+        for k in range(tasks)
+    ]
+    return SchedulingProblem(
+        jobs=jobs,
+        machines=machines,
+        work_cells=[WorkCell("cell", "Cell", capacity, machines)],
+        precedences=[],
+        multi_objective_config=multi_objective_config,
+    )
+
+
+def _random_setups(tasks: int, seed: int) -> SetupTimes:
+    rng = random.Random(seed)
+    return {
+        (f"T{i}", f"T{j}", "M0"): rng.randint(1, 4)
+        for i in range(tasks)
+        for j in range(tasks)
+        if i != j
+    }
+
+
+def _lane_respects_setups(lane: list[dict], setup_times: SetupTimes) -> bool:
+    ordered = sorted(lane, key=lambda entry: entry["start_time"])
+    return all(
+        b["start_time"]
+        >= a["end_time"] + setup_times.get((a["task_id"], b["task_id"], "M0"), 0)
+        for a, b in itertools.pairwise(ordered)
+    )
+
+
+def _fits_in_lanes(schedule: list[dict], lanes: int, setup_times: SetupTimes) -> bool:
+    """Whether the schedule splits into ``lanes`` sequences that keep every gap."""
+    for assignment in itertools.product(range(lanes), repeat=len(schedule)):
+        split = [
+            [
+                entry
+                for entry, lane in zip(schedule, assignment, strict=True)
+                if lane == k
+            ]
+            for k in range(lanes)
+        ]
+        if all(_lane_respects_setups(lane, setup_times) for lane in split):
+            return True
+    return False
+
+
+class TestSetupGapEnforced:
+    """Consecutive tasks on a machine are separated by their setup time."""
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_capacity_one(self, seed):
+        setup_times = _random_setups(6, seed)
+        solver = FreshSolver(_single_machine_problem(6, 1), setup_times=setup_times)
+
+        solution = solver.solve(time_limit=10)
+
+        assert solution["status"] == "OPTIMAL"
+        assert _lane_respects_setups(solution["schedule"], setup_times)
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_capacity_two_splits_into_lanes(self, seed):
+        setup_times = _random_setups(6, seed)
+        solver = FreshSolver(_single_machine_problem(6, 2), setup_times=setup_times)
+
+        solution = solver.solve(time_limit=10)
+
+        assert solution["status"] == "OPTIMAL"
+        assert _fits_in_lanes(solution["schedule"], 2, setup_times)
+        # Two tasks start together, so the gaps are not simply serialized
+        starts = [entry["start_time"] for entry in solution["schedule"]]
+        assert len(set(starts)) < len(starts)
+
+    @pytest.mark.parametrize(
+        ("tasks", "capacity", "makespan"),
+        [
+            # 3 x 2 units plus two setups of 1 in one lane
+            (3, 1, 8),
+            # Two lanes of two tasks: 2 + 1 + 2
+            (4, 2, 5),
+            # Three lanes of one task: no setup at all
+            (3, 3, 2),
+        ],
+    )
+    def test_uniform_setup_makespan(self, tasks, capacity, makespan):
+        setup_times = {
+            (f"T{i}", f"T{j}", "M0"): 1
+            for i in range(tasks)
+            for j in range(tasks)
+            if i != j
+        }
+        solver = FreshSolver(
+            _single_machine_problem(tasks, capacity), setup_times=setup_times
+        )
+
+        solution = solver.solve(time_limit=10)
+
+        assert solution["status"] == "OPTIMAL"
+        assert solution["makespan"] == makespan
+
+    def test_asymmetric_setup_picks_the_cheap_order(self):
+        setup_times = {("T0", "T1", "M0"): 0, ("T1", "T0", "M0"): 4}
+        solver = FreshSolver(_single_machine_problem(2, 1), setup_times=setup_times)
+
+        solution = solver.solve(time_limit=10)
+
+        order = [
+            entry["task_id"]
+            for entry in sorted(solution["schedule"], key=lambda e: e["start_time"])
+        ]
+        assert solution["makespan"] == 4
+        assert order == ["T0", "T1"]
+
+
+class TestSetupTimeObjective:
+    """total_setup_time is the sum of the setups the circuit actually uses."""
+
+    def test_total_setup_time_matches_the_sequence(self):
+        setup_times = _random_setups(5, seed=7)
+        config = MultiObjectiveConfiguration(
+            strategy=OptimizationStrategy.LEXICOGRAPHICAL,
+            objectives=[
+                ObjectiveWeight(ObjectiveType.MINIMIZE_SETUP_TIME, 1.0, 1),
+                ObjectiveWeight(ObjectiveType.MINIMIZE_MAKESPAN, 1.0, 2),
+            ],
+        )
+        problem = _single_machine_problem(5, 1, multi_objective_config=config)
+
+        solution = FreshSolver(problem, setup_times=setup_times).solve(time_limit=10)
+
+        ordered = sorted(solution["schedule"], key=lambda e: e["start_time"])
+        used = sum(
+            setup_times[(a["task_id"], b["task_id"], "M0")]
+            for a, b in itertools.pairwise(ordered)
+        )
+        assert solution["multi_objective"]["total_setup_time"] == used
+        # Only the first task starts a sequence, so 4 setups are unavoidable
+        assert used >= 4 * min(setup_times.values())
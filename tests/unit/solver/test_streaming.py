@@ -0,0 +1,106 @@
+"""Tests for streaming improving incumbents from CP-SAT."""
+
+import threading
+
+import pytest
+from ortools.sat.python import cp_model
+
+from src.solver.core.solver import FreshSolver
+from src.solver.core.solver_config import SolverConfig
+from src.solver.core.streaming import IncumbentEvent, IncumbentStreamCallback
+from tests.unit.solver.test_lns import _problem
+
+# One worker finds a chain of improving incumbents instead of one good one
+SINGLE_WORKER = SolverConfig(parameters={"num_search_workers": 1})
+
+
+def _search(stop_event: threading.Event, publish) -> tuple[int, int]:
+    """Solve a built model with the callback, returning status and count."""
+    solver = FreshSolver(_problem(10))
+    solver.build_model()
+    solver.set_objective()
+    callback = IncumbentStreamCallback(
+        solver.task_starts,
+        solver.task_ends,
+        solver.task_assigned,
+        publish,
+        stop_event=stop_event,
+    )
+    cp_solver = cp_model.CpSolver()
+    cp_solver.parameters.num_search_workers = 1
+    cp_solver.parameters.max_time_in_seconds = 30
+    status = cp_solver.Solve(solver.model, callback)
+    return status, callback.solution_count
+
+
+class TestIncumbents:
+    """Incumbents improve monotonically and end with the final solution."""
+
+    @pytest.fixture
+    def events(self) -> list[IncumbentEvent]:
+        solver = FreshSolver(_problem(10))
+        return list(
+            solver.iter_incumbents(
+                time_limit=30, include_schedule=True, solver_config=SINGLE_WORKER
+            )
+        )
+
+    def test_objective_never_increases(self, events):
+        incumbents = [event for event in events if not event.is_final]
+        objectives = [event.objective_value for event in incumbents]
+
+        assert len(incumbents) > 1
+        assert objectives == sorted(objectives, reverse=True)
+        assert [event.solution_index for event in incumbents] == list(
+            range(1, len(incumbents) + 1)
+        )
+
+    def test_final_event_carries_the_best_solution(self, events):
+        final = events[-1]
+
+        assert [event.is_final for event in events].count(True) == 1
+        assert final.is_final
+        assert final.status == "OPTIMAL"
+        assert final.objective_value == events[-2].objective_value
+        assert final.solution["status"] == "OPTIMAL"
+
+    def test_first_delta_covers_every_task(self, events):
+        assert events[0].changed_task_count == 20
+        assert all(
+            event.changed_task_count == len(event.schedule_delta)
+            for event in events[:-1]
+        )
+
+
+class TestStopEvent:
+    """A set stop event ends the search at the next incumbent."""
+
+    def test_unset_event_lets_the_search_finish(self):
+        status, count = _search(threading.Event(), [].append)
+
+        assert status == cp_model.OPTIMAL
+        assert count > 1
+
+    def test_set_event_stops_at_the_first_incumbent(self):
+        stop_event = threading.Event()
+        stop_event.set()
+
+        status, count = _search(stop_event, [].append)
+
+        assert status == cp_model.FEASIBLE
+        assert count == 1
+
+    def test_publisher_can_stop_the_search(self):
+        stop_event = threading.Event()
+        published = []
+
+        def publish(event: IncumbentEvent) -> None:
+            published.append(event)
+            if event.solution_index == 2:
+                stop_event.set()
+
+        status, count = _search(stop_event, publish)
+
+        assert status == cp_model.FEASIBLE
+        assert count == 2
+        assert [event.solution_index for event in published] == [1, 2]
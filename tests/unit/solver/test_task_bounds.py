@@ -0,0 +1,165 @@
+"""Tests that critical-path task bounds never cut off a feasible schedule."""
+
+import random
+
+import pytest
+from ortools.sat.python import cp_model
+
+from src.solver.core.task_bounds import TaskBounds, compute_task_bounds
+from src.solver.models.problem import (
+    Job,
+    Machine,
+    Precedence,
+    SchedulingProblem,
+    Task,
+    TaskMode,
+    WorkCell,
+)
+from src.solver.models.problem_arrays import ProblemArrays, compile_problem_arrays
+
+MACHINES = ["m1", "m2", "m3"]
+
+
+def _random_problem(rng: random.Random, jobs: int = 2, tasks: int = 4):
+    """Jobs with random modes and a random precedence DAG inside each job."""
+    job_list, precedences = [], []
+    for j in range(jobs):
+        task_ids = [f"j{j}_t{t}" for t in range(tasks)]
+        job_tasks = [
+            Task(
+                task_id,
+                f"j{j}",
+                task_id,
+                modes=[
+                    TaskMode(f"{task_id}_{m}", task_id, m, 15 * rng.randint(1, 6))
+                    for m in rng.sample(MACHINES, rng.randint(1, len(MACHINES)))
+                ],
+            )
+            for task_id in task_ids
+        ]
+        job_list.append(Job(f"j{j}", f"Job {j}", tasks=job_tasks))
+        precedences += [
+            Precedence(task_ids[a], task_ids[b])
+            for a in range(tasks)
+            for b in range(a + 1, tasks)
+            if rng.random() < 0.4
+        ]
+    return SchedulingProblem(
+        jobs=job_list,
+        machines=[Machine(m, "cell", m) for m in MACHINES],
+        work_cells=[WorkCell("cell", "Cell", capacity=len(MACHINES))],
+        precedences=precedences,
+    )
+
+
+def _relaxed_model(
+    arrays: ProblemArrays, horizon: int, deadlines: list[int | None]
+) -> tuple[cp_model.CpModel, list[cp_model.IntVar], list[cp_model.IntVar]]:
+    """Precedences, mode choice and deadlines only, with untightened domains.
+
+    Resource constraints only remove schedules, so bounds that hold for every
+    schedule of this relaxation hold for the full model too.
+    """
+    model = cp_model.CpModel()
+    starts, ends = [], []
+    for task in range(arrays.task_count):
+        start = model.NewIntVar(0, horizon, f"start_{task}")
+        end = model.NewIntVar(0, horizon, f"end_{task}")
+        machines = arrays.task_machines(task)
+        literals = [model.NewBoolVar(f"mode_{task}_{m}") for m in machines]
+        model.AddExactlyOne(literals)
+        for machine, literal in zip(machines, literals, strict=True):
+            duration = int(arrays.durations[task, machine])
+            model.Add(end == start + duration).OnlyEnforceIf(literal)
+        deadline = deadlines[int(arrays.task_unit[task])]
+        if deadline is not None:
+            model.Add(end <= deadline)
+        starts.append(start)
+        ends.append(end)
+    for pred, succ in arrays.precedence_pairs.tolist():
+        model.Add(ends[pred] <= starts[succ])
+    return model, starts, ends
+
+
+def _extreme(model: cp_model.CpModel, variable: cp_model.IntVar, maximize: bool):
+    if maximize:
+        model.Maximize(variable)
+    else:
+        model.Minimize(variable)
+    solver = cp_model.CpSolver()
+    solver.parameters.num_search_workers = 1
+    status = solver.Solve(model)
+    if status == cp_model.INFEASIBLE:
+        return None
+    assert status == cp_model.OPTIMAL
+    return solver.Value(variable)
+
+
+def _assert_bounds_keep_every_schedule(
+    arrays: ProblemArrays,
+    bounds: TaskBounds,
+    horizon: int,
+    deadlines: list[int | None],
+) -> bool:
+    """Check the bounds against the extreme feasible values of every task.
+
+    Returns:
+        False if the relaxation has no schedule at all
+
+    """
+    model, starts, ends = _relaxed_model(arrays, horizon, deadlines)
+    for task in range(arrays.task_count):
+        first_start = _extreme(model, starts[task], maximize=False)
+        if first_start is None:
+            return False
+        last_start = _extreme(model, starts[task], maximize=True)
+        first_end = _extreme(model, ends[task], maximize=False)
+        last_end = _extreme(model, ends[task], maximize=True)
+
+        start_low, start_high = bounds.start_domain(task)
+        end_low, end_high = bounds.end_domain(task)
+        assert start_low <= first_start and last_start <= start_high, task
+        assert end_low <= first_end and last_end <= end_high, task
+        # Heads and tails are exact without resources: the bounds are tight
+        assert start_low == first_start and end_high == last_end, task
+    return True
+
+
+class TestTaskBoundsKeepFeasibleSchedules:
+    """Every schedule of the precedence/deadline relaxation stays in bounds."""
+
+    @pytest.mark.parametrize("seed", range(8))
+    def test_horizon_only(self, seed):
+        arrays = compile_problem_arrays(_random_problem(random.Random(seed)))
+        horizon = int(arrays.max_duration.sum())
+        deadlines = [None] * len(arrays.unit_ids)
+
+        bounds = compute_task_bounds(arrays, horizon, deadlines)
+
+        assert _assert_bounds_keep_every_schedule(arrays, bounds, horizon, deadlines)
+
+    @pytest.mark.parametrize("seed", range(8))
+    def test_tight_and_slack_deadlines(self, seed):
+        rng = random.Random(seed)
+        arrays = compile_problem_arrays(_random_problem(rng))
+        horizon = int(arrays.max_duration.sum())
+        unbounded = compute_task_bounds(arrays, horizon)
+        # Deadline per job at its critical path length plus 0-3 units of slack
+        finish = unbounded.earliest_start + arrays.min_duration
+        deadlines = [
+            int(finish[arrays.unit_indptr[u] : arrays.unit_indptr[u + 1]].max())
+            + rng.randint(0, 3)
+            for u in range(len(arrays.unit_ids))
+        ]
+
+        bounds = compute_task_bounds(arrays, horizon, deadlines)
+
+        assert _assert_bounds_keep_every_schedule(arrays, bounds, horizon, deadlines)
+
+    def test_missed_deadline_keeps_start_domain_non_empty(self):
+        arrays = compile_problem_arrays(_random_problem(random.Random(0)))
+        horizon = int(arrays.max_duration.sum())
+
+        bounds = compute_task_bounds(arrays, horizon, [1] * len(arrays.unit_ids))
+
+        assert (bounds.latest_start >= bounds.earliest_start).all()
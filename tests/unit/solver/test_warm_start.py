@@ -0,0 +1,192 @@
+"""Tests for warm starts from a previous schedule."""
+
+import numpy as np
+import pytest
+
+from src.solver.core.solver import FreshSolver
+from src.solver.core.warm_start import (
+    PreviousAssignment,
+    WarmStart,
+    assignments_from_rows,
+    assignments_from_solution,
+    map_previous_assignments,
+)
+from src.solver.models.problem import (
+    Job,
+    Machine,
+    Precedence,
+    SchedulingProblem,
+    Task,
+    TaskMode,
+    WorkCell,
+)
+from src.solver.models.problem_arrays import compile_problem_arrays
+from tests.fixtures.template_problem_factory import create_optimized_test_problem
+
+
+def _problem(job_ids: list[str], m2_jobs: list[str] | None = None) -> SchedulingProblem:
+    """Two-task jobs that can run on M1 or M2 (M2 only for ``m2_jobs``)."""
+    machines = [Machine("M1", "cell", "M1"), Machine("M2", "cell", "M2")]
+    m2_jobs = job_ids if m2_jobs is None else m2_jobs
+
+    def task(job_id: str, position: int, m1: int, m2: int) -> Task:
+        task_id = f"{job_id}_{position}"
+        modes = [TaskMode(f"{task_id}_m1", task_id, "M1", m1)]
+        if job_id in m2_jobs:
+            modes.append(TaskMode(f"{task_id}_m2", task_id, "M2", m2))
+        return Task(task_id, job_id, task_id, modes=modes)
+
+    return SchedulingProblem(
+        jobs=[
+            Job(
+                job_id, job_id, tasks=[task(job_id, 0, 30, 45), task(job_id, 1, 60, 45)]
+            )
+            for job_id in job_ids
+        ],
+        machines=machines,
+        work_cells=[WorkCell("cell", "Cell", 2, machines)],
+        precedences=[Precedence(f"{job_id}_0", f"{job_id}_1") for job_id in job_ids],
+    )
+
+
+class TestMapPreviousAssignments:
+    """Previous assignments are matched by task key and shifted in time."""
+
+    def test_matches_by_unit_and_task(self):
+        arrays = compile_problem_arrays(_problem(["J1", "J2"]))
+        assignments = [
+            PreviousAssignment("J1", "J1_0", "M2", 0, 3),
+            PreviousAssignment("J2", "J2_1", "M1", 5, 9),
+            PreviousAssignment("J9", "J9_0", "M1", 0, 2),  # Completed since
+        ]
+
+        warm_start = map_previous_assignments(arrays, assignments)
+
+        j1, j2 = arrays.task_index[("J1", "J1_0")], arrays.task_index[("J2", "J2_1")]
+        assert warm_start.hinted_tasks == sorted([j1, j2])
+        assert warm_start.start[j1] == 0 and warm_start.start[j2] == 5
+        assert arrays.machine_ids[warm_start.machine[j1]] == "M2"
+        assert arrays.machine_ids[warm_start.machine[j2]] == "M1"
+        assert warm_start.unmatched == 1
+        assert warm_start.reassigned == 0
+
+    def test_time_shift_is_subtracted_and_clipped(self):
+        arrays = compile_problem_arrays(_problem(["J1"]))
+        assignments = [
+            PreviousAssignment("J1", "J1_0", "M1", 2, 4),
+            PreviousAssignment("J1", "J1_1", "M1", 10, 14),
+        ]
+
+        warm_start = map_previous_assignments(arrays, assignments, time_shift=4)
+
+        assert warm_start.start.tolist() == [0, 6]
+
+    def test_machine_no_longer_eligible_keeps_start_only(self):
+        arrays = compile_problem_arrays(_problem(["J1"], m2_jobs=[]))
+
+        warm_start = map_previous_assignments(
+            arrays, [PreviousAssignment("J1", "J1_0", "M2", 3, 6)]
+        )
+
+        task = arrays.task_index[("J1", "J1_0")]
+        assert warm_start.machine[task] == -1
+        assert warm_start.start[task] == 3
+        assert warm_start.reassigned == 1
+        assert warm_start.hinted_tasks == [task]
+
+    def test_machine_alias_maps_pooled_machines(self):
+        arrays = compile_problem_arrays(_problem(["J1"]))
+
+        warm_start = map_previous_assignments(
+            arrays,
+            [PreviousAssignment("J1", "J1_0", "M2_old", 0, 3)],
+            machine_alias={"M2_old": "M2"},
+        )
+
+        assert arrays.machine_ids[warm_start.machine[0]] == "M2"
+
+    def test_assignment_ending_before_start_is_rejected(self):
+        with pytest.raises(ValueError, match="ends before it starts"):
+            PreviousAssignment("J1", "J1_0", "M1", 5, 4)
+
+
+class TestPreviousScheduleSources:
+    """Persisted rows and solution dictionaries become previous assignments."""
+
+    def test_rows_round_starts_down_and_ends_up(self):
+        problem = create_optimized_test_problem(num_instances=2)
+        rows = [
+            {
+                "instance_id": "instance_1",
+                "optimized_task_id": "optimized_task_0",
+                "assigned_machine_id": "machine_1",
+                "start_time_minutes": 29,
+                "end_time_minutes": 61,
+            }
+        ]
+
+        (assignment,) = assignments_from_rows(rows, problem)
+
+        assert assignment.unit_id == "instance_1"
+        assert assignment.task_id == "instance_1_optimized_task_0"
+        assert (assignment.start_time, assignment.end_time) == (1, 5)
+        arrays = compile_problem_arrays(problem)
+        warm_start = map_previous_assignments(arrays, [assignment])
+        assert warm_start.unmatched == 0
+
+    def test_perturbation_counts_moves_and_shifts(self):
+        warm_start = WarmStart(
+            start=np.array([0, 4, -1]),
+            machine=np.array([0, 1, -1]),
+            task_keys=[("J1", "a"), ("J1", "b"), ("J1", "c")],
+        )
+        schedule = [
+            {"job_id": "J1", "task_id": "a", "machine_id": "M1", "start_time": 0},
+            {"job_id": "J1", "task_id": "b", "machine_id": "M1", "start_time": 7},
+            {"job_id": "J1", "task_id": "c", "machine_id": "M2", "start_time": 9},
+        ]
+
+        assert warm_start.perturbation(schedule, ["M1", "M2"]) == {
+            "tasks_moved": 1,
+            "tasks_shifted": 1,
+            "total_start_shift": 3,
+        }
+
+
+class TestSolverWarmStart:
+    """Re-plans hint the matching tasks and can keep the previous schedule."""
+
+    @pytest.fixture
+    def previous(self) -> dict:
+        return FreshSolver(_problem(["J1", "J2", "J3"])).solve(time_limit=10)
+
+    def test_stable_replan_keeps_the_schedule(self, previous):
+        solver = FreshSolver(_problem(["J1", "J2", "J3"]))
+        solver.set_warm_start(assignments_from_solution(previous), stability_weight=100)
+
+        solution = solver.solve(time_limit=10)
+
+        assert solution["warm_start"]["hinted_tasks"] == 6
+        assert solution["warm_start"]["tasks_moved"] == 0
+        assert solution["warm_start"]["total_start_shift"] == 0
+
+    def test_new_and_completed_jobs(self, previous):
+        # J1 is done, J4 arrived
+        solver = FreshSolver(_problem(["J2", "J3", "J4"]))
+        solver.set_warm_start(assignments_from_solution(previous), stability_weight=100)
+
+        solution = solver.solve(time_limit=10)
+
+        warm_start = solution["warm_start"]
+        assert warm_start["hinted_tasks"] == 4
+        assert warm_start["unmatched"] == 2
+        assert warm_start["tasks_moved"] == 0
+        assert {entry["job_id"] for entry in solution["schedule"]} == {
+            "J2",
+            "J3",
+            "J4",
+        }
+
+    def test_negative_stability_weight_is_rejected(self):
+        with pytest.raises(ValueError, match="cannot be negative"):
+            FreshSolver(_problem(["J1"])).set_warm_start([], stability_weight=-1)